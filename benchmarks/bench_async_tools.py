@@ -0,0 +1,63 @@
+"""Concurrency of getPRDiff tool calls on one event loop.
+
+Compares the old blocking tool body (PyGithub called directly inside the
+coroutine) with the thread-offloaded tool, against a local fake GitHub
+endpoint with injected latency:
+
+    PYTHONPATH=mcp_github python benchmarks/bench_async_tools.py --calls 20 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_github"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_github import FakeGitHub  # noqa: E402
+from tools_read import get_pr_diff  # noqa: E402
+
+
+async def blocking(calls: int) -> None:
+    # 이전 동작: async def 안에서 PyGithub을 직접 호출
+    async def call() -> None:
+        get_pr_diff.__wrapped__("owner", "repo", 1)
+
+    await asyncio.gather(*(call() for _ in range(calls)))
+
+
+async def offloaded(calls: int) -> None:
+    await asyncio.gather(*(get_pr_diff("owner", "repo", 1) for _ in range(calls)))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    with FakeGitHub(latency=args.latency) as fake:
+        os.environ["GITHUB_API_URL"] = fake.base_url
+        os.environ.setdefault("GITHUB_TOKEN", "bench-token")
+        os.environ["GITHUB_HTTP_CACHE"] = "0"
+
+        for label, scenario in (
+            ("blocking", blocking),
+            ("offloaded", offloaded),
+        ):
+            requests_before = fake.requests
+            started = time.perf_counter()
+            await scenario(args.calls)
+            elapsed = time.perf_counter() - started
+            print(
+                f"{label:<10} calls={args.calls} total={elapsed * 1000:.0f}ms "
+                f"per-call={elapsed * 1000 / args.calls:.1f}ms "
+                f"requests={fake.requests - requests_before}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""Record a real tool session into a cassette, or replay it offline.
+
+Record once against GitHub (needs GITHUB_TOKEN and network access):
+
+    PYTHONPATH=mcp_github python benchmarks/bench_cassette.py record session.json.gz
+
+Replay without network, with original timing or scaled by a factor:
+
+    PYTHONPATH=mcp_github python benchmarks/bench_cassette.py replay session.json.gz --time-scale 0.5
+
+``--write-branch`` adds createBranch/createOrUpdateFile calls on a scratch
+branch to the session (the branch is created on the recorded repository).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_github"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from cassette import Cassette, CassetteServer  # noqa: E402
+
+Step = Tuple[str, Callable[[], Awaitable[Any]]]
+
+
+def session_steps(owner: str, repo: str, write_branch: Optional[str]) -> List[Step]:
+    """Tool calls of the benchmark session, in order."""
+    from tools_read import get_file, get_pr_diff, get_repo, list_pull_requests
+    from tools_write import create_branch, create_or_update_file
+
+    async def first_pr_diff() -> Any:
+        listed = await list_pull_requests(owner, repo, "all")
+        prs = json.loads(listed["data"] or "[]")
+        return await get_pr_diff(owner, repo, prs[0]["number"]) if prs else listed
+
+    steps: List[Step] = [
+        ("getRepo", lambda: get_repo(owner, repo)),
+        ("listPullRequests", lambda: list_pull_requests(owner, repo, "all")),
+        ("listPullRequests(rest)", lambda: list_pull_requests(owner, repo, "all", backend="rest")),
+        ("getPRDiff", first_pr_diff),
+        ("getFile(README.md)", lambda: get_file(owner, repo, "README.md")),
+        ("getFile(/)", lambda: get_file(owner, repo, "")),
+    ]
+    if write_branch:
+        steps += [
+            ("createBranch", lambda: create_branch(owner, repo, write_branch)),
+            (
+                "createOrUpdateFile",
+                lambda: create_or_update_file(
+                    owner, repo, "bench/cassette.txt", "recorded\n",
+                    "Add cassette benchmark file", write_branch,
+                ),
+            ),
+        ]
+    return steps
+
+
+async def run_session(steps: List[Step]) -> float:
+    total = 0.0
+    for label, step in steps:
+        started = time.perf_counter()
+        result = await step()
+        elapsed = time.perf_counter() - started
+        total += elapsed
+        status = "ok" if result.get("success") else f"error: {result.get('error')}"
+        print(f"  {label:<24} {elapsed * 1000:8.1f}ms  {status}")
+    return total
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("cassette")
+    parser.add_argument("--repo", default="J-nowcow/github-MCP-practice")
+    parser.add_argument("--upstream", default="https://api.github.com")
+    parser.add_argument("--time-scale", type=float, default=1.0)
+    parser.add_argument("--write-branch", default=None)
+    args = parser.parse_args()
+
+    if args.mode == "record":
+        server = CassetteServer(Cassette(), upstream=args.upstream)
+    else:
+        server = CassetteServer(Cassette.load(args.cassette), time_scale=args.time_scale)
+        os.environ.setdefault("GITHUB_TOKEN", "replay-token")
+
+    with server:
+        os.environ["GITHUB_API_URL"] = server.base_url
+        # 기록과 재생에서 같은 요청이 나가도록 프로세스 밖에 남는 캐시는 끈다
+        os.environ["GITHUB_HTTP_CACHE"] = "0"
+        owner, repo = args.repo.split("/", 1)
+        print(f"{args.mode} {args.repo}")
+        total = await run_session(session_steps(owner, repo, args.write_branch))
+
+    print(f"total={total * 1000:.0f}ms requests={server.requests} misses={server.misses}")
+    if args.mode == "record":
+        server.cassette.save(args.cassette)
+        stats = server.cassette.stats()
+        print(
+            f"saved {args.cassette}: {stats['interactions']} interactions, "
+            f"{stats['unique_bodies']} unique bodies, "
+            f"{os.path.getsize(args.cassette)} bytes compressed"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
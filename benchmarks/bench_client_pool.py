@@ -0,0 +1,68 @@
+"""Per-call overhead of a fresh GitHubClient vs. the pooled client registry.
+
+Runs against a local fake GitHub endpoint, so no token or network is needed:
+
+    PYTHONPATH=mcp_github python benchmarks/bench_client_pool.py --calls 200
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_github"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from client_pool import ClientRegistry  # noqa: E402
+from fake_github import FakeGitHub  # noqa: E402
+from github_client import GitHubClient  # noqa: E402
+
+
+def measure(label: str, calls: int, fake: FakeGitHub, make_client) -> None:
+    """Time ``calls`` get_repository calls and print the per-call latency."""
+    connections_before = fake.connections
+    timings = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        make_client().get_repository("owner", "repo")
+        timings.append((time.perf_counter() - started) * 1000)
+
+    print(
+        f"{label:<10} calls={calls} "
+        f"mean={statistics.mean(timings):.3f}ms "
+        f"p50={statistics.median(timings):.3f}ms "
+        f"p95={sorted(timings)[int(len(timings) * 0.95) - 1]:.3f}ms "
+        f"connections={fake.connections - connections_before}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    with FakeGitHub() as fake:
+        measure(
+            "per-call",
+            args.calls,
+            fake,
+            lambda: GitHubClient("bench-token", base_url=fake.base_url),
+        )
+
+        # 저장소/HTTP 캐시는 끄고 커넥션 재사용 효과만 측정
+        os.environ["GITHUB_REPO_CACHE_TTL"] = "0"
+        os.environ["GITHUB_HTTP_CACHE"] = "0"
+        registry = ClientRegistry()
+        measure(
+            "pooled",
+            args.calls,
+            fake,
+            lambda: registry.get("bench-token", base_url=fake.base_url),
+        )
+        registry.close_all()
+
+
+if __name__ == "__main__":
+    main()
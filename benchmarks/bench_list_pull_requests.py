@@ -0,0 +1,46 @@
+"""Requests and wall time of listPullRequests with the GraphQL and REST backends.
+
+    PYTHONPATH=mcp_github python benchmarks/bench_list_pull_requests.py --pulls 500 --latency 0.01 --limit 100
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_github"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_github import FakeGitHub  # noqa: E402
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pulls", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--limit", type=int, default=100, help="PRs returned per call")
+    args = parser.parse_args()
+
+    with FakeGitHub(latency=args.latency, pulls=args.pulls) as fake:
+        os.environ["GITHUB_API_URL"] = fake.base_url
+        os.environ.setdefault("GITHUB_TOKEN", "bench-token")
+        os.environ["GITHUB_HTTP_CACHE"] = "0"
+        from tools_read import list_pull_requests
+
+        for backend in ("graphql", "rest"):
+            requests_before = fake.requests
+            started = time.perf_counter()
+            result = await list_pull_requests(
+                "owner", "repo", "all", backend=backend, limit=args.limit
+            )
+            elapsed = time.perf_counter() - started
+            print(
+                f"{backend:<8} prs={result['count']} has_more={result['has_more']} "
+                f"total={elapsed * 1000:.0f}ms requests={fake.requests - requests_before}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
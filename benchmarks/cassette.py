@@ -0,0 +1,351 @@
+"""Record/replay of GitHub API traffic for offline benchmarks.
+
+A ``CassetteServer`` in record mode is a reverse proxy: point
+``GITHUB_API_URL`` at it and every request the tools make is forwarded to
+the real API and stored together with its response and latency. In replay
+mode the same server answers from the cassette without network access,
+optionally sleeping for the recorded latency scaled by ``time_scale``.
+
+Cassettes are gzip-compressed JSON; identical response bodies are stored
+once. The upstream API URL inside bodies and headers is replaced by a
+placeholder, so replayed pagination links and object URLs point back at
+the replay server. Request headers (and so tokens) are never stored.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import requests
+
+BASE_URL_PLACEHOLDER = "{{base_url}}"
+CASSETTE_VERSION = 1
+
+# 프록시가 다시 계산하거나 전달하면 안 되는 헤더
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "transfer-encoding",
+    "content-length",
+    "content-encoding",
+    "host",
+}
+
+MatchKey = Tuple[str, str, str, str]
+
+
+def body_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+class Cassette:
+    """Recorded interactions with deduplicated response bodies."""
+
+    def __init__(self) -> None:
+        self.interactions: List[Dict[str, Any]] = []
+        self.bodies: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._queues: Optional[Dict[MatchKey, Deque[Dict[str, Any]]]] = None
+        self._last: Dict[MatchKey, Dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """Load a cassette written by ``save``.
+
+        Args:
+            path: Path of the ``.json.gz`` cassette
+
+        Returns:
+            Loaded Cassette
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            document = json.load(f)
+        if document.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {document.get('version')}")
+
+        cassette = cls()
+        cassette.interactions = document["interactions"]
+        for digest, stored in document["bodies"].items():
+            if "text" in stored:
+                cassette.bodies[digest] = stored["text"].encode("utf-8")
+            else:
+                cassette.bodies[digest] = base64.b64decode(stored["base64"])
+        return cassette
+
+    def save(self, path: str) -> None:
+        """Write the cassette as gzip-compressed JSON.
+
+        Args:
+            path: Destination path (conventionally ``*.json.gz``)
+        """
+        bodies = {}
+        for digest, body in self.bodies.items():
+            try:
+                bodies[digest] = {"text": body.decode("utf-8")}
+            except UnicodeDecodeError:
+                bodies[digest] = {"base64": base64.b64encode(body).decode()}
+        document = {
+            "version": CASSETTE_VERSION,
+            "interactions": self.interactions,
+            "bodies": bodies,
+        }
+        with gzip.open(path, "wt", encoding="utf-8", compresslevel=9) as f:
+            json.dump(document, f, separators=(",", ":"))
+
+    def record(
+        self,
+        key: MatchKey,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        elapsed: float,
+    ) -> None:
+        """Store one request/response pair.
+
+        Args:
+            key: Match key of the request (see ``match_key``)
+            status: Response status code
+            headers: Response headers to replay
+            body: Response body (with the upstream URL already replaced)
+            elapsed: Upstream latency in seconds
+        """
+        digest = body_hash(body)
+        with self._lock:
+            self.bodies.setdefault(digest, body)
+            self.interactions.append(
+                {
+                    "method": key[0],
+                    "path": key[1],
+                    "accept": key[2],
+                    "request_body": key[3],
+                    "status": status,
+                    "headers": headers,
+                    "body": digest,
+                    "elapsed": round(elapsed, 6),
+                }
+            )
+
+    def match(self, key: MatchKey) -> Optional[Dict[str, Any]]:
+        """Find the recorded response for a request.
+
+        Identical requests are answered in recording order; once the
+        recorded answers are used up the last one is repeated.
+
+        Args:
+            key: Match key of the request
+
+        Returns:
+            Recorded interaction, or None if the request was never recorded
+        """
+        with self._lock:
+            if self._queues is None:
+                self._queues = defaultdict(deque)
+                for interaction in self.interactions:
+                    recorded = (
+                        interaction["method"],
+                        interaction["path"],
+                        interaction["accept"],
+                        interaction["request_body"],
+                    )
+                    self._queues[recorded].append(interaction)
+
+            queue = self._queues.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+            return self._last.get(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Return cassette size statistics.
+
+        Returns:
+            Dictionary with interaction count, unique bodies and stored bytes
+        """
+        return {
+            "interactions": len(self.interactions),
+            "unique_bodies": len(self.bodies),
+            "body_bytes": sum(len(body) for body in self.bodies.values()),
+        }
+
+
+def match_key(method: str, path: str, accept: str, body: bytes) -> MatchKey:
+    """Build the key identical requests are matched by.
+
+    Args:
+        method: HTTP method
+        path: Path including the (sorted) query string
+        accept: Accept header (the media type changes the response)
+        body: Request body
+
+    Returns:
+        Tuple of method, path, Accept and request body hash
+    """
+    return (method, path, accept, body_hash(body) if body else "")
+
+
+class CassetteServer:
+    """HTTP server that records GitHub API traffic or replays a cassette.
+
+    Usage:
+        with CassetteServer(Cassette(), upstream="https://api.github.com") as proxy:
+            os.environ["GITHUB_API_URL"] = proxy.base_url
+            ...  # run tools
+        proxy.cassette.save("session.json.gz")
+
+        with CassetteServer(Cassette.load("session.json.gz"), time_scale=0) as replay:
+            os.environ["GITHUB_API_URL"] = replay.base_url
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        upstream: Optional[str] = None,
+        time_scale: float = 1.0,
+    ):
+        """Initialize cassette server.
+
+        Args:
+            cassette: Cassette to record into or replay from
+            upstream: API base URL to forward to; records when set, replays otherwise
+            time_scale: Factor applied to recorded latencies when replaying
+                (1.0 = original timing, 0 = no delay)
+        """
+        self.cassette = cassette
+        self.upstream = upstream.rstrip("/") if upstream else None
+        self.time_scale = time_scale
+        self.requests = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def recording(self) -> bool:
+        return self.upstream is not None
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None, "server not started"
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "CassetteServer":
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                proxy._handle(self)
+
+            do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = do_GET
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 128
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self._session.close()
+
+    def __enter__(self) -> "CassetteServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        with self._lock:
+            self.requests += 1
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else b""
+        path = _normalize_path(handler.path)
+        key = match_key(handler.command, path, handler.headers.get("Accept", ""), body)
+
+        if self.recording:
+            status, headers, response_body = self._forward(handler, path, body, key)
+        else:
+            status, headers, response_body = self._replay(handler, key)
+
+        response_body = response_body.replace(BASE_URL_PLACEHOLDER.encode(), self.base_url.encode())
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value.replace(BASE_URL_PLACEHOLDER, self.base_url))
+        handler.send_header("Content-Length", str(len(response_body)))
+        handler.end_headers()
+        if handler.command != "HEAD":
+            handler.wfile.write(response_body)
+
+    def _forward(
+        self, handler: BaseHTTPRequestHandler, path: str, body: bytes, key: MatchKey
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        # 요청 헤더(토큰 포함)는 전달만 하고 카세트에는 저장하지 않음
+        request_headers = {
+            name: value
+            for name, value in handler.headers.items()
+            if name.lower() not in HOP_BY_HOP_HEADERS
+        }
+        started = time.perf_counter()
+        response = self._session.request(
+            handler.command,
+            self.upstream + path,
+            headers=request_headers,
+            data=body or None,
+            allow_redirects=False,
+        )
+        elapsed = time.perf_counter() - started
+
+        # 응답 안의 upstream URL은 재생 서버 주소로 바꿀 수 있도록 placeholder로 저장
+        response_body = response.content.replace(
+            self.upstream.encode(), BASE_URL_PLACEHOLDER.encode()
+        )
+        headers = {
+            name: value.replace(self.upstream, BASE_URL_PLACEHOLDER)
+            for name, value in response.headers.items()
+            if name.lower() not in HOP_BY_HOP_HEADERS
+        }
+        self.cassette.record(key, response.status_code, headers, response_body, elapsed)
+        return response.status_code, headers, response_body
+
+    def _replay(
+        self, handler: BaseHTTPRequestHandler, key: MatchKey
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        interaction = self.cassette.match(key)
+        if interaction is None:
+            with self._lock:
+                self.misses += 1
+            message = json.dumps({"message": f"Not recorded: {key[0]} {key[1]}"})
+            return 404, {"Content-Type": "application/json"}, message.encode()
+
+        if self.time_scale:
+            time.sleep(interaction["elapsed"] * self.time_scale)
+        headers = dict(interaction["headers"])
+        etag = headers.get("ETag") or headers.get("etag")
+        if etag and handler.headers.get("If-None-Match") == etag:
+            return 304, headers, b""
+        return interaction["status"], headers, self.cassette.bodies[interaction["body"]]
+
+
+def _normalize_path(path: str) -> str:
+    """Sort query parameters so equivalent requests match."""
+    base, _, query = path.partition("?")
+    if not query:
+        return base
+    return base + "?" + "&".join(sorted(query.split("&")))
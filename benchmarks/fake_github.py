@@ -0,0 +1,1002 @@
+"""Local fake GitHub REST/GraphQL service for offline benchmarks and tests.
+
+The server keeps an in-memory git object store per repository (blobs, trees
+and commits hashed exactly like git, so SHAs match ``git hash-object``),
+branches, pull requests and per-token rate-limit budgets. Latency, jitter,
+random server errors and the generated dataset size are configurable:
+
+    with FakeGitHub(latency=0.05, jitter=0.01, files=500, pulls=200) as fake:
+        os.environ["GITHUB_API_URL"] = fake.base_url
+        ...
+"""
+
+import base64
+import hashlib
+import io
+import json
+import random
+import re
+import tarfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlencode, urlparse
+
+REPO = r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)"
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+BLOB_MODE = "100644"
+TREE_MODE = "040000"
+
+Reply = Tuple[int, Any, Dict[str, str]]
+
+
+def git_hash(kind: str, data: bytes) -> str:
+    """Hash an object the way ``git hash-object -t <kind>`` does."""
+    return hashlib.sha1(f"{kind} {len(data)}\0".encode() + data).hexdigest()
+
+
+def _tar_dir(name: str) -> tarfile.TarInfo:
+    info = tarfile.TarInfo(name)
+    info.type = tarfile.DIRTYPE
+    info.mode = 0o755
+    return info
+
+
+def iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class FakeRequest:
+    """Parsed request handed to route views."""
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        body: Any,
+    ):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    @property
+    def token(self) -> str:
+        authorization = self.headers.get("authorization", "")
+        return authorization.split(" ", 1)[-1] if authorization else ""
+
+    def accepts(self, media_type: str) -> bool:
+        return media_type in self.headers.get("accept", "")
+
+
+class FakeRepo:
+    """Git objects, refs and pull requests of one fake repository."""
+
+    def __init__(self, owner: str, name: str, default_branch: str = "main"):
+        self.owner = owner
+        self.name = name
+        self.default_branch = default_branch
+        self.blobs: Dict[str, bytes] = {}
+        self.trees: Dict[str, List[Dict[str, str]]] = {}
+        self.commits: Dict[str, Dict[str, Any]] = {}
+        self.refs: Dict[str, str] = {}
+        self.pulls: List[Dict[str, Any]] = []
+        self.pull_files: Dict[int, List[Dict[str, Any]]] = {}
+        self._clock = EPOCH
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.owner}/{self.name}"
+
+    # git objects
+
+    def put_blob(self, data: bytes) -> str:
+        sha = git_hash("blob", data)
+        self.blobs[sha] = data
+        return sha
+
+    def put_tree(self, entries: List[Dict[str, str]]) -> str:
+        # git 정렬 규칙: 디렉토리는 이름 뒤에 "/"가 붙은 것으로 비교
+        entries = sorted(
+            entries, key=lambda e: e["path"] + ("/" if e["type"] == "tree" else "")
+        )
+        data = b"".join(
+            f"{e['mode'].lstrip('0')} {e['path']}".encode() + b"\0" + bytes.fromhex(e["sha"])
+            for e in entries
+        )
+        sha = git_hash("tree", data)
+        self.trees[sha] = entries
+        return sha
+
+    def build_tree(self, files: Dict[str, Tuple[str, str]]) -> str:
+        """Build nested trees from ``path -> (mode, blob sha)``."""
+        children: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        entries = []
+        for path, (mode, sha) in files.items():
+            head, sep, rest = path.partition("/")
+            if sep:
+                children.setdefault(head, {})[rest] = (mode, sha)
+            else:
+                entries.append({"path": head, "mode": mode, "type": "blob", "sha": sha})
+        for name, subfiles in children.items():
+            entries.append(
+                {"path": name, "mode": TREE_MODE, "type": "tree", "sha": self.build_tree(subfiles)}
+            )
+        return self.put_tree(entries)
+
+    def walk(self, tree_sha: str, prefix: str = "") -> Iterable[Dict[str, str]]:
+        """Yield every entry below a tree with its full path, depth first."""
+        for entry in self.trees[tree_sha]:
+            path = prefix + entry["path"]
+            yield {**entry, "path": path}
+            if entry["type"] == "tree":
+                yield from self.walk(entry["sha"], path + "/")
+
+    def files(self, tree_sha: str) -> Dict[str, Tuple[str, str]]:
+        return {
+            e["path"]: (e["mode"], e["sha"]) for e in self.walk(tree_sha) if e["type"] == "blob"
+        }
+
+    def lookup(self, tree_sha: str, path: str) -> Optional[Dict[str, str]]:
+        """Find the tree entry at ``path`` (the root tree for an empty path)."""
+        entry: Optional[Dict[str, str]] = {"path": "", "mode": TREE_MODE, "type": "tree", "sha": tree_sha}
+        for part in [p for p in path.strip("/").split("/") if p]:
+            if entry is None or entry["type"] != "tree":
+                return None
+            entry = next((e for e in self.trees[entry["sha"]] if e["path"] == part), None)
+        return entry
+
+    def apply_tree(self, base_tree: Optional[str], changes: List[Dict[str, Any]]) -> str:
+        """Create a tree from a base tree and ``POST /git/trees`` style changes."""
+        files = self.files(base_tree) if base_tree else {}
+        for change in changes:
+            path = change["path"]
+            if "content" in change and change["content"] is not None:
+                files[path] = (change.get("mode", BLOB_MODE), self.put_blob(change["content"].encode()))
+            elif change.get("sha") is None:
+                # null SHA는 파일이나 디렉터리 전체를 제거
+                files = {p: v for p, v in files.items() if p != path and not p.startswith(path + "/")}
+            elif change.get("type") == "tree":
+                files = {p: v for p, v in files.items() if p != path and not p.startswith(path + "/")}
+                for subpath, value in self.files(change["sha"]).items():
+                    files[f"{path}/{subpath}"] = value
+            else:
+                files[path] = (change.get("mode", BLOB_MODE), change["sha"])
+        return self.build_tree(files)
+
+    def commit(
+        self,
+        tree: str,
+        parents: List[str],
+        message: str,
+        author: Optional[Dict[str, str]] = None,
+    ) -> str:
+        self._clock += timedelta(minutes=1)
+        author = {"name": "Octo Cat", "email": "octocat@example.com", "date": iso(self._clock), **(author or {})}
+        data = (
+            f"tree {tree}\n"
+            + "".join(f"parent {p}\n" for p in parents)
+            + f"author {author['name']} <{author['email']}> {int(self._clock.timestamp())} +0000\n"
+            + f"committer {author['name']} <{author['email']}> {int(self._clock.timestamp())} +0000\n"
+            + f"\n{message}"
+        ).encode()
+        sha = git_hash("commit", data)
+        self.commits[sha] = {
+            "tree": tree,
+            "parents": parents,
+            "message": message,
+            "author": author,
+            "committer": author,
+        }
+        return sha
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """Resolve HEAD, a branch, a tag or a (possibly abbreviated) commit SHA."""
+        if ref in ("", "HEAD"):
+            ref = self.default_branch
+        for candidate in (ref, f"heads/{ref}", f"tags/{ref}"):
+            name = candidate[len("refs/"):] if candidate.startswith("refs/") else candidate
+            if name in self.refs:
+                return self.refs[name]
+        if re.fullmatch(r"[0-9a-f]{4,40}", ref):
+            matches = [sha for sha in self.commits if sha.startswith(ref)]
+            if len(matches) == 1:
+                return matches[0]
+        return None
+
+    def is_ancestor(self, ancestor: str, sha: str) -> bool:
+        pending = [sha]
+        seen = set()
+        while pending:
+            current = pending.pop()
+            if current == ancestor:
+                return True
+            if current in seen or current not in self.commits:
+                continue
+            seen.add(current)
+            pending.extend(self.commits[current]["parents"])
+        return False
+
+
+class FakeGitHub:
+    """Threaded HTTP server emulating the GitHub endpoints the tools use.
+
+    Usage:
+        with FakeGitHub(latency=0.05) as fake:
+            client = GitHubClient("token", base_url=fake.base_url)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        repos: Iterable[str] = ("owner/repo",),
+        files: int = 20,
+        file_size: int = 1024,
+        pulls: int = 5,
+        pr_files: int = 5,
+        patch_lines: int = 4,
+        rate_limit: int = 5000,
+        tree_limit: int = 100000,
+    ):
+        """Initialize fake server and generate its dataset.
+
+        Args:
+            latency: Seconds added to every response
+            jitter: Maximum random deviation from ``latency`` in seconds
+            error_rate: Probability of answering any request with a 502
+            seed: Seed for jitter and error injection
+            repos: ``owner/name`` of the repositories to generate
+            files: Number of files on the default branch of each repository
+            file_size: Approximate size of each generated file in bytes
+            pulls: Number of pull requests per repository
+            pr_files: Number of changed files per pull request
+            patch_lines: Added lines in the patch of each changed file
+            rate_limit: Hourly budget per token and rate-limit bucket
+            tree_limit: Entries after which recursive tree listings are truncated
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.tree_limit = tree_limit
+        self.requests = 0
+        self.connections = 0
+        self.hits: Counter = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._budgets: Dict[Tuple[str, str], List[int]] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self.repos: Dict[str, FakeRepo] = {}
+        for full_name in repos:
+            owner, name = full_name.split("/", 1)
+            self.repos[full_name.lower()] = self._generate(
+                owner, name, files, file_size, pulls, pr_files, patch_lines
+            )
+
+        self._routes: List[Tuple[str, "re.Pattern[str]", Callable[..., Reply]]] = [
+            (method, re.compile(f"^{pattern}$"), view)
+            for method, pattern, view in [
+                ("GET", "/rate_limit", self._rate_limit),
+                ("POST", "/graphql", self._graphql),
+                ("GET", REPO, self._repo),
+                ("GET", REPO + "/topics", self._topics),
+                ("GET", REPO + "/branches/(?P<branch>.+)", self._branch),
+                ("GET", REPO + "/commits/(?P<ref>[^/]+)", self._rest_commit),
+                ("GET", REPO + "/contents(?:/(?P<path>.*))?", self._get_contents),
+                ("PUT", REPO + "/contents/(?P<path>.+)", self._put_contents),
+                ("DELETE", REPO + "/contents/(?P<path>.+)", self._delete_contents),
+                ("GET", REPO + "/pulls", self._list_pulls),
+                ("GET", REPO + r"/pulls/(?P<number>\d+)", self._pull),
+                ("GET", REPO + r"/pulls/(?P<number>\d+)/files", self._pull_files),
+                ("POST", REPO + "/git/blobs", self._create_blob),
+                ("GET", REPO + "/git/blobs/(?P<sha>[0-9a-f]{40})", self._blob),
+                ("POST", REPO + "/git/trees", self._create_tree),
+                ("GET", REPO + "/git/trees/(?P<ref>.+)", self._tree),
+                ("GET", REPO + "/tarball/(?P<ref>.+)", self._tarball),
+                ("POST", REPO + "/git/commits", self._create_commit),
+                ("GET", REPO + "/git/commits/(?P<sha>[0-9a-f]{40})", self._git_commit),
+                ("GET", REPO + "/git/refs?/(?P<ref>.+)", self._ref),
+                ("POST", REPO + "/git/refs", self._create_ref),
+                ("PATCH", REPO + "/git/refs/(?P<ref>.+)", self._update_ref),
+            ]
+        ]
+        self._graphql_operations: Dict[str, Callable[[FakeRepo, Dict[str, Any]], Any]] = {
+            "ListPullRequests": self._gql_list_pull_requests,
+        }
+
+    # server lifecycle
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None, "server not started"
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "FakeGitHub":
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with fake._lock:
+                    fake.connections += 1
+
+            def do_GET(self) -> None:
+                fake._dispatch(self)
+
+            do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = do_GET
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            # 동시 연결이 많을 때 기본 backlog(5)로는 SYN 재전송 지연이 생김
+            request_queue_size = 128
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeGitHub":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def repo(self, owner: str, name: str) -> FakeRepo:
+        """Get a generated repository (for assertions in tests)."""
+        return self.repos[f"{owner}/{name}".lower()]
+
+    # request handling
+
+    def _dispatch(self, handler: BaseHTTPRequestHandler) -> None:
+        method = handler.command
+        length = int(handler.headers.get("Content-Length") or 0)
+        raw_body = handler.rfile.read(length) if length else b""
+        parsed = urlparse(handler.path)
+        request = FakeRequest(
+            method="GET" if method == "HEAD" else method,
+            path=parsed.path,
+            query={key: values[-1] for key, values in parse_qs(parsed.query).items()},
+            headers={name.lower(): value for name, value in handler.headers.items()},
+            body=json.loads(raw_body) if raw_body.strip() else None,
+        )
+
+        with self._lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+            fail = self.error_rate and self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+
+        if fail:
+            status, payload, headers = 502, {"message": "Server Error"}, {}
+        else:
+            status, payload, headers = self._route(request)
+
+        if isinstance(payload, bytes):
+            body = payload
+            content_type = "application/octet-stream"
+        elif isinstance(payload, str):
+            body = payload.encode()
+            content_type = "text/plain; charset=utf-8"
+        else:
+            body = json.dumps(payload).encode()
+            content_type = "application/json; charset=utf-8"
+
+        resource = "graphql" if request.path == "/graphql" else "core"
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if status == 200 and request.method == "GET" and request.headers.get("if-none-match") == etag:
+            # 조건부 요청의 304 응답은 rate limit을 차감하지 않음
+            status, body = 304, b""
+        rate_headers = self._charge(request.token, resource, charge=status != 304)
+        if rate_headers["X-RateLimit-Remaining"] == "-1":
+            status = 403
+            body = json.dumps({"message": "API rate limit exceeded"}).encode()
+            rate_headers["X-RateLimit-Remaining"] = "0"
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        if status in (200, 304) and request.method == "GET":
+            handler.send_header("ETag", etag)
+        for name, value in {**rate_headers, **headers}.items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        if method != "HEAD":
+            handler.wfile.write(body)
+
+    def _route(self, request: FakeRequest) -> Reply:
+        for method, pattern, view in self._routes:
+            match = pattern.match(request.path)
+            if method != request.method or not match:
+                continue
+            params = {k: unquote(v) for k, v in match.groupdict().items() if v is not None}
+            repo = None
+            if "owner" in params:
+                repo = self.repos.get(f"{params.pop('owner')}/{params.pop('repo')}".lower())
+                if repo is None:
+                    return 404, {"message": "Not Found"}, {}
+            with self._lock:
+                self.hits[view.__name__.lstrip("_")] += 1
+                result = view(request, repo, **params) if repo else view(request, **params)
+            return result if len(result) == 3 else (*result, {})
+        return 404, {"message": "Not Found"}, {}
+
+    def _charge(self, token: str, resource: str, charge: bool) -> Dict[str, str]:
+        with self._lock:
+            now = int(time.time())
+            budget = self._budgets.get((token, resource))
+            if budget is None or budget[1] <= now:
+                budget = self._budgets[(token, resource)] = [self.rate_limit, now + 3600]
+            if charge:
+                budget[0] -= 1
+            remaining = budget[0]
+            if remaining < 0:
+                budget[0] = 0
+        return {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(remaining, -1)),
+            "X-RateLimit-Used": str(self.rate_limit - max(remaining, 0)),
+            "X-RateLimit-Reset": str(budget[1]),
+            "X-RateLimit-Resource": resource,
+        }
+
+    def _url(self, repo: FakeRepo, path: str = "") -> str:
+        return f"{self.base_url}/repos/{repo.full_name}{path}"
+
+    def _paginate(self, request: FakeRequest, items: List[Any]) -> Reply:
+        per_page = min(int(request.query.get("per_page", 30)), 100)
+        page = int(request.query.get("page", 1))
+        last = max(1, -(-len(items) // per_page))
+        links = []
+        for rel, number in (("next", page + 1), ("last", last)):
+            if page < last:
+                query = urlencode({**request.query, "page": number})
+                links.append(f'<{self.base_url}{request.path}?{query}>; rel="{rel}"')
+        headers = {"Link": ", ".join(links)} if links else {}
+        return 200, items[(page - 1) * per_page : page * per_page], headers
+
+    # dataset
+
+    def _generate(
+        self,
+        owner: str,
+        name: str,
+        files: int,
+        file_size: int,
+        pulls: int,
+        pr_files: int,
+        patch_lines: int,
+    ) -> FakeRepo:
+        repo = FakeRepo(owner, name)
+        contents = {"README.md": f"# {name}\n\nFake repository.\n".encode()}
+        for i in range(files):
+            line = f"value_{i} = {i}  # generated line\n"
+            contents[f"src/pkg{i % 4}/module_{i}.py"] = (line * max(1, file_size // len(line))).encode()
+        tree = repo.build_tree({path: (BLOB_MODE, repo.put_blob(data)) for path, data in contents.items()})
+        root = repo.commit(tree, [], "Initial commit")
+        repo.refs[f"heads/{repo.default_branch}"] = root
+
+        for number in range(1, pulls + 1):
+            merged = number % 6 == 0
+            state = "open" if number % 3 else "closed"
+            created = EPOCH + timedelta(hours=number)
+            changed = [
+                {
+                    "filename": f"src/pkg{(number + i) % 4}/changed_{number}_{i}.py",
+                    "status": "modified" if i % 2 else "added",
+                    "additions": patch_lines,
+                    "deletions": 1,
+                    "changes": patch_lines + 1,
+                    "patch": "@@ -1,1 +1,%d @@\n-old\n" % patch_lines
+                    + "".join(f"+new line {n}\n" for n in range(patch_lines)),
+                }
+                for i in range(pr_files)
+            ]
+            repo.pull_files[number] = changed
+            repo.pulls.append(
+                {
+                    "number": number,
+                    "title": f"Pull request {number}",
+                    "state": state,
+                    "draft": number % 5 == 0,
+                    "user": {"login": f"user{number % 3}"},
+                    "created_at": iso(created),
+                    "updated_at": iso(created + timedelta(hours=1)),
+                    "closed_at": iso(created + timedelta(hours=2)) if state == "closed" else None,
+                    "merged_at": iso(created + timedelta(hours=2)) if merged and state == "closed" else None,
+                    "head": {"ref": f"feature-{number}", "sha": root},
+                    "base": {"ref": repo.default_branch, "sha": root},
+                }
+            )
+        return repo
+
+    # payloads
+
+    def _repo_payload(self, repo: FakeRepo) -> Dict[str, Any]:
+        return {
+            "id": abs(hash(repo.full_name)) % 10**8,
+            "name": repo.name,
+            "full_name": repo.full_name,
+            "owner": {"login": repo.owner},
+            "description": "Fake repository",
+            "language": "Python",
+            "stargazers_count": 0,
+            "forks_count": 0,
+            "open_issues_count": sum(1 for p in repo.pulls if p["state"] == "open"),
+            "default_branch": repo.default_branch,
+            "created_at": iso(EPOCH),
+            "updated_at": iso(repo._clock),
+            "pushed_at": iso(repo._clock),
+            "private": False,
+            "fork": False,
+            "archived": False,
+            "disabled": False,
+            "size": sum(len(data) for data in repo.blobs.values()) // 1024,
+            "license": None,
+            "homepage": None,
+            "topics": [],
+            "url": self._url(repo),
+            "html_url": f"https://github.com/{repo.full_name}",
+            "clone_url": f"https://github.com/{repo.full_name}.git",
+            "ssh_url": f"git@github.com:{repo.full_name}.git",
+        }
+
+    def _git_commit_payload(self, repo: FakeRepo, sha: str) -> Dict[str, Any]:
+        commit = repo.commits[sha]
+        return {
+            "sha": sha,
+            "url": self._url(repo, f"/git/commits/{sha}"),
+            "message": commit["message"],
+            "author": commit["author"],
+            "committer": commit["committer"],
+            "tree": {"sha": commit["tree"], "url": self._url(repo, f"/git/trees/{commit['tree']}")},
+            "parents": [
+                {"sha": parent, "url": self._url(repo, f"/git/commits/{parent}")}
+                for parent in commit["parents"]
+            ],
+        }
+
+    def _rest_commit_payload(self, repo: FakeRepo, sha: str) -> Dict[str, Any]:
+        git_commit = self._git_commit_payload(repo, sha)
+        commit = repo.commits[sha]
+        before = repo.files(repo.commits[commit["parents"][0]]["tree"]) if commit["parents"] else {}
+        after = repo.files(commit["tree"])
+        files = []
+        for path in sorted(before.keys() | after.keys()):
+            if before.get(path) == after.get(path):
+                continue
+            status = "added" if path not in before else "removed" if path not in after else "modified"
+            files.append({
+                "sha": (after.get(path) or before[path])[1],
+                "filename": path,
+                "status": status,
+                "additions": 0,
+                "deletions": 0,
+                "changes": 0,
+            })
+        return {
+            "sha": sha,
+            "url": self._url(repo, f"/commits/{sha}"),
+            "html_url": f"https://github.com/{repo.full_name}/commit/{sha}",
+            "commit": {key: value for key, value in git_commit.items() if key != "sha"},
+            "parents": git_commit["parents"],
+            "stats": {"additions": 0, "deletions": 0, "total": 0},
+            "files": files,
+        }
+
+    def _content_payload(self, repo: FakeRepo, path: str, entry: Dict[str, str], ref: str) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "name": path.rsplit("/", 1)[-1],
+            "path": path,
+            "sha": entry["sha"],
+            "type": "dir" if entry["type"] == "tree" else "file",
+            "size": len(repo.blobs[entry["sha"]]) if entry["type"] == "blob" else 0,
+            "url": self._url(repo, f"/contents/{quote(path)}?ref={ref}"),
+            "git_url": self._url(repo, f"/git/{entry['type']}s/{entry['sha']}"),
+            "html_url": f"https://github.com/{repo.full_name}/blob/{ref}/{path}",
+            "download_url": (
+                f"{self.base_url}/raw/{repo.full_name}/{ref}/{quote(path)}"
+                if entry["type"] == "blob"
+                else None
+            ),
+        }
+        return payload
+
+    def _pull_payload(self, repo: FakeRepo, pull: Dict[str, Any], detail: bool) -> Dict[str, Any]:
+        payload = {
+            **pull,
+            "url": self._url(repo, f"/pulls/{pull['number']}"),
+            "html_url": f"https://github.com/{repo.full_name}/pull/{pull['number']}",
+        }
+        if detail:
+            # 목록 응답에는 없는 필드 (PyGithub이 PR마다 상세 조회를 하게 되는 원인)
+            changed = repo.pull_files[pull["number"]]
+            payload.update(
+                {
+                    "merged": pull["merged_at"] is not None,
+                    "mergeable": True if pull["state"] == "open" else None,
+                    "mergeable_state": "clean" if pull["state"] == "open" else "unknown",
+                    "comments": pull["number"] % 4,
+                    "commits": 1,
+                    "additions": sum(f["additions"] for f in changed),
+                    "deletions": sum(f["deletions"] for f in changed),
+                    "changed_files": len(changed),
+                }
+            )
+        return payload
+
+    # views
+
+    def _rate_limit(self, request: FakeRequest) -> Reply:
+        resources = {}
+        for resource in ("core", "search", "graphql"):
+            headers = self._charge(request.token, resource, charge=False)
+            resources[resource] = {
+                "limit": int(headers["X-RateLimit-Limit"]),
+                "remaining": max(0, int(headers["X-RateLimit-Remaining"])),
+                "reset": int(headers["X-RateLimit-Reset"]),
+                "used": int(headers["X-RateLimit-Used"]),
+            }
+        return 200, {"resources": resources, "rate": resources["core"]}
+
+    def _repo(self, request: FakeRequest, repo: FakeRepo) -> Reply:
+        return 200, self._repo_payload(repo)
+
+    def _topics(self, request: FakeRequest, repo: FakeRepo) -> Reply:
+        return 200, {"names": ["python", "mcp"]}
+
+    def _branch(self, request: FakeRequest, repo: FakeRepo, branch: str) -> Reply:
+        sha = repo.refs.get(f"heads/{branch}")
+        if sha is None:
+            return 404, {"message": "Branch not found"}
+        return 200, {
+            "name": branch,
+            "commit": self._rest_commit_payload(repo, sha),
+            "protected": False,
+        }
+
+    def _rest_commit(self, request: FakeRequest, repo: FakeRepo, ref: str) -> Reply:
+        sha = repo.resolve(ref)
+        if sha is None:
+            return 422, {"message": f"No commit found for SHA: {ref}"}
+        if request.accepts("application/vnd.github.sha"):
+            return 200, sha
+        return 200, self._rest_commit_payload(repo, sha)
+
+    def _get_contents(self, request: FakeRequest, repo: FakeRepo, path: str = "") -> Reply:
+        ref = request.query.get("ref") or repo.default_branch
+        sha = repo.resolve(ref)
+        if sha is None:
+            return 404, {"message": f"No commit found for the ref {ref}"}
+        entry = repo.lookup(repo.commits[sha]["tree"], path)
+        if entry is None:
+            return 404, {"message": "Not Found"}
+        path = path.strip("/")
+
+        if entry["type"] == "tree":
+            return 200, [
+                self._content_payload(repo, f"{path}/{child['path']}".lstrip("/"), child, ref)
+                for child in repo.trees[entry["sha"]]
+            ]
+        data = repo.blobs[entry["sha"]]
+        if request.accepts("application/vnd.github.raw"):
+            return 200, data
+        payload = self._content_payload(repo, path, entry, ref)
+        if len(data) <= 1024 * 1024:
+            payload.update(encoding="base64", content=base64.b64encode(data).decode())
+        else:
+            # GitHub은 1MB가 넘는 파일의 본문을 contents API로 주지 않음
+            payload.update(encoding="none", content="")
+        return 200, payload
+
+    def _write_file(
+        self, request: FakeRequest, repo: FakeRepo, path: str, content: Optional[bytes]
+    ) -> Reply:
+        body = request.body or {}
+        branch = body.get("branch") or repo.default_branch
+        head = repo.refs.get(f"heads/{branch}")
+        if head is None:
+            return 404, {"message": f"Branch {branch} not found"}
+        tree = repo.commits[head]["tree"]
+        existing = repo.lookup(tree, path)
+        if existing is not None and existing["type"] == "blob":
+            if not body.get("sha"):
+                return 422, {"message": '"sha" wasn\'t supplied.'}
+            if body["sha"] != existing["sha"]:
+                return 409, {"message": f"{path} does not match {body['sha']}"}
+        elif content is None:
+            return 404, {"message": "Not Found"}
+
+        if content is None:
+            change: Dict[str, Any] = {"path": path, "sha": None}
+        else:
+            change = {"path": path, "mode": BLOB_MODE, "type": "blob", "sha": repo.put_blob(content)}
+        new_tree = repo.apply_tree(tree, [change])
+        sha = repo.commit(new_tree, [head], body.get("message", ""), body.get("committer"))
+        repo.refs[f"heads/{branch}"] = sha
+
+        entry = repo.lookup(new_tree, path)
+        return (200 if existing else 201), {
+            "content": self._content_payload(repo, path, entry, branch) if entry else None,
+            "commit": self._git_commit_payload(repo, sha),
+        }
+
+    def _put_contents(self, request: FakeRequest, repo: FakeRepo, path: str) -> Reply:
+        content = base64.b64decode((request.body or {}).get("content", ""))
+        return self._write_file(request, repo, path, content)
+
+    def _delete_contents(self, request: FakeRequest, repo: FakeRepo, path: str) -> Reply:
+        return self._write_file(request, repo, path, None)
+
+    def _list_pulls(self, request: FakeRequest, repo: FakeRepo) -> Reply:
+        state = request.query.get("state", "open")
+        pulls = [p for p in repo.pulls if state == "all" or p["state"] == state]
+        sort = request.query.get("sort", "created")
+        key = {"created": "created_at", "updated": "updated_at"}.get(sort, "created_at")
+        reverse = request.query.get("direction", "desc") == "desc"
+        pulls = sorted(pulls, key=lambda p: p[key], reverse=reverse)
+        return self._paginate(request, [self._pull_payload(repo, p, detail=False) for p in pulls])
+
+    def _find_pull(self, repo: FakeRepo, number: str) -> Optional[Dict[str, Any]]:
+        return next((p for p in repo.pulls if p["number"] == int(number)), None)
+
+    def _pull(self, request: FakeRequest, repo: FakeRepo, number: str) -> Reply:
+        pull = self._find_pull(repo, number)
+        if pull is None:
+            return 404, {"message": "Not Found"}
+        if request.accepts("application/vnd.github.diff") or request.accepts(
+            "application/vnd.github.v3.diff"
+        ):
+            return 200, "".join(
+                f"diff --git a/{f['filename']} b/{f['filename']}\n"
+                f"--- a/{f['filename']}\n+++ b/{f['filename']}\n{f['patch']}"
+                for f in repo.pull_files[pull["number"]]
+            )
+        return 200, self._pull_payload(repo, pull, detail=True)
+
+    def _pull_files(self, request: FakeRequest, repo: FakeRepo, number: str) -> Reply:
+        pull = self._find_pull(repo, number)
+        if pull is None:
+            return 404, {"message": "Not Found"}
+        files = [
+            {
+                **changed,
+                "sha": git_hash("blob", changed["patch"].encode()),
+                "raw_url": f"https://github.com/{repo.full_name}/raw/{pull['head']['sha']}/{changed['filename']}",
+                "blob_url": f"https://github.com/{repo.full_name}/blob/{pull['head']['sha']}/{changed['filename']}",
+            }
+            for changed in repo.pull_files[pull["number"]]
+        ]
+        return self._paginate(request, files)
+
+    def _create_blob(self, request: FakeRequest, repo: FakeRepo) -> Reply:
+        body = request.body or {}
+        content = body.get("content", "")
+        data = base64.b64decode(content) if body.get("encoding") == "base64" else content.encode()
+        sha = repo.put_blob(data)
+        return 201, {"sha": sha, "url": self._url(repo, f"/git/blobs/{sha}")}
+
+    def _blob(self, request: FakeRequest, repo: FakeRepo, sha: str) -> Reply:
+        data = repo.blobs.get(sha)
+        if data is None:
+            return 404, {"message": "Not Found"}
+        if request.accepts("application/vnd.github.raw"):
+            return 200, data
+        return 200, {
+            "sha": sha,
+            "size": len(data),
+            "url": self._url(repo, f"/git/blobs/{sha}"),
+            "encoding": "base64",
+            "content": base64.b64encode(data).decode(),
+        }
+
+    def _tree_payload(self, repo: FakeRepo, sha: str, recursive: bool) -> Dict[str, Any]:
+        entries = list(repo.walk(sha)) if recursive else list(repo.trees[sha])
+        truncated = len(entries) > self.tree_limit
+        return {
+            "sha": sha,
+            "url": self._url(repo, f"/git/trees/{sha}"),
+            "tree": [
+                {
+                    **entry,
+                    "url": self._url(repo, f"/git/{entry['type']}s/{entry['sha']}"),
+                    **({"size": len(repo.blobs[entry["sha"]])} if entry["type"] == "blob" else {}),
+                }
+                for entry in entries[: self.tree_limit]
+            ],
+            "truncated": truncated,
+        }
+
+    def _create_tree(self, request: FakeRequest, repo: FakeRepo) -> Reply:
+        body = request.body or {}
+        base_tree = body.get("base_tree")
+        if base_tree is not None and base_tree not in repo.trees:
+            return 422, {"message": "Invalid base_tree"}
+        for change in body.get("tree", []):
+            sha = change.get("sha")
+            if sha is not None and sha not in repo.blobs and sha not in repo.trees:
+                return 422, {"message": f"Invalid sha {sha} for {change['path']}"}
+        sha = repo.apply_tree(base_tree, body.get("tree", []))
+        return 201, self._tree_payload(repo, sha, recursive=False)
+
+    def _tree(self, request: FakeRequest, repo: FakeRepo, ref: str) -> Reply:
+        sha = ref if ref in repo.trees else None
+        if sha is None:
+            commit = repo.resolve(ref)
+            sha = repo.commits[commit]["tree"] if commit else None
+        if sha is None:
+            return 404, {"message": "Not Found"}
+        recursive = request.query.get("recursive") not in (None, "", "0", "false")
+        return 200, self._tree_payload(repo, sha, recursive)
+
+    def _tarball(self, request: FakeRequest, repo: FakeRepo, ref: str) -> Reply:
+        sha = repo.resolve(ref)
+        if sha is None:
+            return 404, {"message": "Not Found"}
+        prefix = f"{repo.owner}-{repo.name}-{sha[:7]}/"
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            archive.addfile(_tar_dir(prefix))
+            for entry in repo.walk(repo.commits[sha]["tree"]):
+                if entry["type"] == "tree":
+                    archive.addfile(_tar_dir(prefix + entry["path"]))
+                elif entry["mode"] == "120000":
+                    info = tarfile.TarInfo(prefix + entry["path"])
+                    info.type = tarfile.SYMTYPE
+                    info.linkname = repo.blobs[entry["sha"]].decode()
+                    archive.addfile(info)
+                else:
+                    data = repo.blobs[entry["sha"]]
+                    info = tarfile.TarInfo(prefix + entry["path"])
+                    info.size = len(data)
+                    info.mode = 0o755 if entry["mode"] == "100755" else 0o644
+                    archive.addfile(info, io.BytesIO(data))
+        return 200, buffer.getvalue()
+
+    def _create_commit(self, request: FakeRequest, repo: FakeRepo) -> Reply:
+        body = request.body or {}
+        tree = body.get("tree")
+        parents = body.get("parents", [])
+        if tree not in repo.trees or any(p not in repo.commits for p in parents):
+            return 422, {"message": "Tree or parent SHA does not exist"}
+        sha = repo.commit(tree, parents, body.get("message", ""), body.get("author"))
+        return 201, self._git_commit_payload(repo, sha)
+
+    def _git_commit(self, request: FakeRequest, repo: FakeRepo, sha: str) -> Reply:
+        if sha not in repo.commits:
+            return 404, {"message": "Not Found"}
+        return 200, self._git_commit_payload(repo, sha)
+
+    def _ref_payload(self, repo: FakeRepo, name: str) -> Dict[str, Any]:
+        return {
+            "ref": f"refs/{name}",
+            "url": self._url(repo, f"/git/refs/{name}"),
+            "object": {
+                "sha": repo.refs[name],
+                "type": "commit",
+                "url": self._url(repo, f"/git/commits/{repo.refs[name]}"),
+            },
+        }
+
+    def _ref(self, request: FakeRequest, repo: FakeRepo, ref: str) -> Reply:
+        name = ref[len("refs/"):] if ref.startswith("refs/") else ref
+        if name not in repo.refs:
+            return 404, {"message": "Not Found"}
+        return 200, self._ref_payload(repo, name)
+
+    def _create_ref(self, request: FakeRequest, repo: FakeRepo) -> Reply:
+        body = request.body or {}
+        name = body.get("ref", "")
+        name = name[len("refs/"):] if name.startswith("refs/") else name
+        if name in repo.refs:
+            return 422, {"message": "Reference already exists"}
+        if body.get("sha") not in repo.commits:
+            return 422, {"message": "Object does not exist"}
+        repo.refs[name] = body["sha"]
+        return 201, self._ref_payload(repo, name)
+
+    def _update_ref(self, request: FakeRequest, repo: FakeRepo, ref: str) -> Reply:
+        body = request.body or {}
+        name = ref[len("refs/"):] if ref.startswith("refs/") else ref
+        if name not in repo.refs:
+            return 422, {"message": "Reference does not exist"}
+        sha = body.get("sha")
+        if sha not in repo.commits:
+            return 422, {"message": "Object does not exist"}
+        if not body.get("force") and not repo.is_ancestor(repo.refs[name], sha):
+            return 422, {"message": "Update is not a fast forward"}
+        repo.refs[name] = sha
+        return 200, self._ref_payload(repo, name)
+
+    def _graphql(self, request: FakeRequest) -> Reply:
+        body = request.body or {}
+        operation = body.get("operationName")
+        if not operation:
+            match = re.search(r"\b(?:query|mutation)\s+(\w+)", body.get("query", ""))
+            operation = match.group(1) if match else None
+        view = self._graphql_operations.get(operation or "")
+        if view is None:
+            return 200, {"errors": [{"message": f"Unsupported operation {operation}"}]}
+
+        variables = body.get("variables") or {}
+        repo = self.repos.get(f"{variables.get('owner')}/{variables.get('repo')}".lower())
+        if repo is None:
+            return 200, {
+                "data": {"repository": None},
+                "errors": [{"type": "NOT_FOUND", "message": "Could not resolve to a Repository"}],
+            }
+        return 200, {"data": {"repository": view(repo, variables)}}
+
+    def _gql_list_pull_requests(self, repo: FakeRepo, variables: Dict[str, Any]) -> Dict[str, Any]:
+        states = variables.get("states")
+        order = variables.get("orderBy") or {}
+        key = {"CREATED_AT": "created_at", "UPDATED_AT": "updated_at"}.get(
+            order.get("field", "CREATED_AT"), "created_at"
+        )
+        reverse = order.get("direction", "DESC") == "DESC"
+        pulls = []
+        for pull in sorted(repo.pulls, key=lambda p: p[key], reverse=reverse):
+            state = "MERGED" if pull["merged_at"] else pull["state"].upper()
+            if not states or state in states:
+                pulls.append((pull, state))
+
+        start = int(base64.b64decode(variables["after"])) if variables.get("after") else 0
+        page = pulls[start : start + min(int(variables.get("first", 100)), 100)]
+        end = start + len(page)
+        nodes = []
+        for pull, state in page:
+            detail = self._pull_payload(repo, pull, detail=True)
+            nodes.append(
+                {
+                    "number": pull["number"],
+                    "title": pull["title"],
+                    "author": {"login": pull["user"]["login"]},
+                    "state": state,
+                    "createdAt": pull["created_at"],
+                    "updatedAt": pull["updated_at"],
+                    "mergedAt": pull["merged_at"],
+                    "closedAt": pull["closed_at"],
+                    "isDraft": pull["draft"],
+                    "mergeable": "MERGEABLE" if detail["mergeable"] else "UNKNOWN",
+                    "mergeStateStatus": detail["mergeable_state"].upper(),
+                    "comments": {"totalCount": detail["comments"]},
+                    "commits": {"totalCount": detail["commits"]},
+                    "additions": detail["additions"],
+                    "deletions": detail["deletions"],
+                    "changedFiles": detail["changed_files"],
+                    "url": detail["html_url"],
+                }
+            )
+        return {
+            "nameWithOwner": repo.full_name,
+            "pullRequests": {
+                "totalCount": len(pulls),
+                "pageInfo": {
+                    "hasNextPage": end < len(pulls),
+                    "endCursor": base64.b64encode(str(end).encode()).decode() if page else None,
+                },
+                "nodes": nodes,
+            },
+        }
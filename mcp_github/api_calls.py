@@ -0,0 +1,55 @@
+"""Count of GitHub API round trips made on behalf of one tool call."""
+
+import functools
+import threading
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+_current: ContextVar[Optional["ApiCallCounter"]] = ContextVar("github_api_calls", default=None)
+
+
+class ApiCallCounter:
+    """Number of HTTP requests sent to GitHub while the counter is active."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def increment(self) -> None:
+        with self._lock:
+            self.count += 1
+
+
+def record_api_call() -> None:
+    """Count one request against the tool call running in this context.
+
+    Called by the transports for every request actually sent; requests
+    answered by single-flight sharing are not counted.
+    """
+    counter = _current.get()
+    if counter is not None:
+        counter.increment()
+
+
+def count_api_calls(func: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """Add the number of API requests a tool made to its result as ``api_calls``.
+
+    Args:
+        func: Tool body returning a result dictionary
+
+    Returns:
+        Wrapped tool body
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        counter = ApiCallCounter()
+        token = _current.set(counter)
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            _current.reset(token)
+        result["api_calls"] = counter.count
+        return result
+
+    return wrapper
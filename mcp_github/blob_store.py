@@ -0,0 +1,275 @@
+"""On-disk content-addressed store of git blobs keyed by blob SHA."""
+
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from dotenv import load_dotenv
+
+CHUNK_SIZE = 64 * 1024
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Compute the SHA git assigns to a blob (``git hash-object``).
+
+    Args:
+        data: Blob content
+
+    Returns:
+        Hex SHA-1 of the blob object
+    """
+    digest = hashlib.sha1(b"blob %d\0" % len(data))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+class BlobStore:
+    """Size-bounded directory of blob contents with LRU eviction.
+
+    Blob content at a SHA never changes, so entries never need
+    revalidation and are shared by every repository, ref and process
+    using the same directory. Every write is checked against its SHA.
+    Recency is kept in file modification times, so the LRU order
+    survives restarts. Entries of ``mmap_threshold`` bytes or more are
+    read through ``mmap``, so slicing a large blob only pages in the
+    requested range.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 1024 * 1024 * 1024,
+        mmap_threshold: int = 1024 * 1024,
+    ):
+        """Initialize blob store.
+
+        Args:
+            directory: Directory holding the blobs (created if missing)
+            max_bytes: Maximum total size of stored blobs
+            mmap_threshold: Entries at least this large are read via mmap
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.mmap_threshold = mmap_threshold
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.evicted = 0
+        self.rejected = 0
+
+        found = []
+        for path in self.directory.glob("??/*"):
+            if path.is_file() and len(path.parent.name + path.name) == 40:
+                stat = path.stat()
+                found.append((stat.st_mtime, path.parent.name + path.name, stat.st_size))
+        for _, sha, size in sorted(found):
+            self._entries[sha] = size
+            self._total_bytes += size
+
+    @classmethod
+    def from_env(cls) -> Optional["BlobStore"]:
+        """Create a blob store configured from environment variables.
+
+        Reads GITHUB_BLOB_CACHE (set to 0 to disable), GITHUB_BLOB_CACHE_DIR
+        and GITHUB_BLOB_CACHE_MAX_BYTES.
+
+        Returns:
+            Configured BlobStore, or None if the store is disabled
+        """
+        load_dotenv()
+        if os.getenv("GITHUB_BLOB_CACHE", "1").lower() in ("0", "false", "no"):
+            return None
+
+        directory = os.getenv("GITHUB_BLOB_CACHE_DIR") or str(
+            Path.home() / ".cache" / "mcp-github" / "blobs"
+        )
+        max_bytes = int(os.getenv("GITHUB_BLOB_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))
+        return cls(directory, max_bytes=max_bytes)
+
+    @property
+    def max_entry_bytes(self) -> int:
+        """Largest blob worth storing; bigger blobs would flush most of the store."""
+        return self.max_bytes // 4
+
+    def _path(self, sha: str) -> Path:
+        return self.directory / sha[:2] / sha[2:]
+
+    def size(self, sha: str) -> Optional[int]:
+        """Look up a stored blob, counting a hit or miss.
+
+        Args:
+            sha: Git blob SHA
+
+        Returns:
+            Size of the stored blob, or None if it is not stored
+        """
+        with self._lock:
+            size = self._entries.get(sha)
+            if size is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(sha)
+            self.hits += 1
+        try:
+            os.utime(self._path(sha))
+        except FileNotFoundError:
+            # 다른 프로세스가 같은 디렉터리에서 제거함
+            with self._lock:
+                if self._entries.pop(sha, None) is not None:
+                    self._total_bytes -= size
+            return None
+        return size
+
+    def read(self, sha: str) -> Optional[bytes]:
+        """Read a whole stored blob.
+
+        Args:
+            sha: Git blob SHA
+
+        Returns:
+            Blob content, or None if it is not stored
+        """
+        if self.size(sha) is None:
+            return None
+        try:
+            return self._path(sha).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def iter_chunks(self, sha: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterate over a stored blob in chunks.
+
+        Large blobs are mapped into memory, so chunks that are never
+        requested are never read from disk. The caller must check with
+        ``size`` that the blob is stored first.
+
+        Args:
+            sha: Git blob SHA
+            chunk_size: Bytes per chunk
+
+        Yields:
+            Consecutive chunks of the blob
+        """
+        with open(self._path(sha), "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < self.mmap_threshold:
+                while chunk := f.read(chunk_size):
+                    yield chunk
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for start in range(0, size, chunk_size):
+                    yield mapped[start : start + chunk_size]
+
+    def put(self, sha: str, data: bytes) -> bool:
+        """Store a blob.
+
+        Args:
+            sha: Git blob SHA the content is expected to have
+            data: Blob content
+
+        Returns:
+            True if the blob is stored, False if it was rejected
+        """
+        return self.put_stream(sha, [data], len(data))
+
+    def put_stream(self, sha: str, chunks: Iterable[bytes], size: int) -> bool:
+        """Store a blob from a stream of chunks without holding it in memory.
+
+        The content is written to a temporary file and only moved into
+        place once its git SHA matches ``sha``.
+
+        Args:
+            sha: Git blob SHA the content is expected to have
+            chunks: Blob content as byte chunks
+            size: Blob size in bytes (part of the git SHA)
+
+        Returns:
+            True if the blob is stored, False if it was too large or did not match
+        """
+        if size > self.max_entry_bytes:
+            return False
+        with self._lock:
+            if sha in self._entries:
+                return True
+
+        digest = hashlib.sha1(b"blob %d\0" % size)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+                written = f.tell()
+            if written != size or digest.hexdigest() != sha:
+                with self._lock:
+                    self.rejected += 1
+                os.unlink(temp_path)
+                return False
+            target = self._path(sha)
+            target.parent.mkdir(exist_ok=True)
+            os.replace(temp_path, target)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        with self._lock:
+            if sha not in self._entries:
+                self._entries[sha] = size
+                self._total_bytes += size
+                self.stored += 1
+            self._evict_locked()
+        return True
+
+    def _evict_locked(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            sha, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evicted += 1
+            try:
+                self._path(sha).unlink()
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        """Return store statistics.
+
+        Returns:
+            Dictionary with entry count, sizes and hit/miss/eviction counters
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stored": self.stored,
+                "evicted": self.evicted,
+                "rejected": self.rejected,
+            }
+
+
+_store: Optional[BlobStore] = None
+_store_loaded = False
+_store_lock = threading.Lock()
+
+
+def get_blob_store() -> Optional[BlobStore]:
+    """Get the process-wide blob store, or None if it is disabled."""
+    global _store, _store_loaded
+    if not _store_loaded:
+        with _store_lock:
+            if not _store_loaded:
+                _store = BlobStore.from_env()
+                _store_loaded = True
+    return _store
@@ -0,0 +1,331 @@
+"""Process-wide registry of pooled GitHub clients shared by all tools."""
+
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+from urllib.parse import urlparse
+
+from dotenv import load_dotenv
+from github.Consts import DEFAULT_BASE_URL
+
+from github_client import GitHubClient
+from http_cache import ConditionalCache
+from rate_limit import RateLimitScheduler
+from ref_resolver import RefCache
+from repo_cache import RepositoryCache
+from single_flight import SingleFlight
+from token_pool import TokenPool
+from transport import GitHubTransport
+
+T = TypeVar("T")
+
+# 현재 lease 범위에서 빌린 (registry, entry) 목록
+_leases: ContextVar[Optional[List[Tuple["ClientRegistry", "_PoolEntry"]]]] = ContextVar(
+    "github_client_leases", default=None
+)
+
+
+def parse_host_limits(value: Optional[str]) -> Dict[str, int]:
+    """Parse per-host connection limits.
+
+    Args:
+        value: Comma separated ``host=limit`` pairs (e.g. "api.github.com=20,ghe.local=4")
+
+    Returns:
+        Dictionary mapping host name to maximum connections
+    """
+    limits: Dict[str, int] = {}
+    if not value:
+        return limits
+
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, limit = item.partition("=")
+        try:
+            limits[host.strip().lower()] = int(limit)
+        except ValueError:
+            raise ValueError(f"Invalid host limit '{item}', expected host=number")
+    return limits
+
+
+class _PoolEntry:
+    """Registry slot holding one client, its last use time and active leases."""
+
+    def __init__(self, client: GitHubClient):
+        self.client = client
+        self.last_used = time.monotonic()
+        self.borrows = 0
+        self.active = 0
+
+
+class ClientRegistry:
+    """Thread-safe registry of GitHubClient instances.
+
+    One client (and one keep-alive connection pool) is kept per token and
+    base URL. Clients that have not been used for ``idle_timeout`` seconds
+    are closed and dropped on the next borrow. A client borrowed inside a
+    ``client_lease()`` scope counts as in use until the scope exits, so a
+    long stream or download never has its client closed underneath it.
+    Each client gets its
+    own RateLimitScheduler since rate-limit budgets are per token, and its
+    own RepositoryCache since repository visibility is per token.
+
+    When a ``token_pool`` is configured, the default client (no explicit
+    token) balances its requests across the pooled tokens and authenticates
+    as the pool's write token.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        idle_timeout: float = 300.0,
+        host_limits: Optional[Dict[str, int]] = None,
+        cache: Optional[ConditionalCache] = None,
+        token_pool: Optional[TokenPool] = None,
+        single_flight: bool = True,
+    ):
+        """Initialize registry.
+
+        Args:
+            pool_size: Keep-alive connections per client and host
+            idle_timeout: Seconds after which an unused client is evicted
+            host_limits: Per-host caps on the connection pool size
+            cache: Conditional-request cache shared by all clients (optional)
+            token_pool: Tokens balanced by the default client (optional)
+            single_flight: Coalesce identical concurrent GETs of each client
+        """
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.host_limits = host_limits or {}
+        self.cache = cache
+        self.token_pool = token_pool
+        self.single_flight = single_flight
+        self._entries: Dict[Tuple[str, str], _PoolEntry] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.evicted = 0
+
+    @classmethod
+    def from_env(cls) -> "ClientRegistry":
+        """Create a registry configured from environment variables.
+
+        Reads GITHUB_POOL_SIZE, GITHUB_POOL_IDLE_TIMEOUT, GITHUB_POOL_HOST_LIMITS and
+        GITHUB_SINGLE_FLIGHT (0 disables request coalescing), plus the settings read by ConditionalCache.from_env, TokenPool.from_env
+        and RepositoryCache.from_env.
+
+        Returns:
+            Configured ClientRegistry
+        """
+        load_dotenv()
+        return cls(
+            pool_size=int(os.getenv("GITHUB_POOL_SIZE", "10")),
+            idle_timeout=float(os.getenv("GITHUB_POOL_IDLE_TIMEOUT", "300")),
+            host_limits=parse_host_limits(os.getenv("GITHUB_POOL_HOST_LIMITS")),
+            cache=ConditionalCache.from_env(),
+            token_pool=TokenPool.from_env(),
+            single_flight=os.getenv("GITHUB_SINGLE_FLIGHT", "1") != "0",
+        )
+
+    def pool_size_for(self, base_url: str) -> int:
+        """Get the connection pool size for an API base URL.
+
+        Args:
+            base_url: GitHub API base URL
+
+        Returns:
+            Pool size capped by the per-host limit
+        """
+        host = (urlparse(base_url).hostname or "").lower()
+        limit = self.host_limits.get(host)
+        if limit is None:
+            return self.pool_size
+        return max(1, min(self.pool_size, limit))
+
+    def get(
+        self, token: Optional[str] = None, base_url: Optional[str] = None
+    ) -> GitHubClient:
+        """Borrow the shared client for a token and base URL.
+
+        Inside a ``client_lease()`` scope the client is leased until the
+        scope exits and is not evicted before that.
+
+        Args:
+            token: GitHub token. If None, uses the token pool or GITHUB_TOKEN env var.
+            base_url: API base URL. If None, uses GITHUB_API_URL env var or api.github.com.
+
+        Returns:
+            Shared GitHubClient instance
+
+        Raises:
+            ValueError: If no token is configured
+        """
+        token_pool = self.token_pool if token is None else None
+        if token_pool is not None:
+            token = token_pool.write_state.token
+        token = token or os.getenv("GITHUB_TOKEN")
+        base_url = base_url or os.getenv("GITHUB_API_URL") or DEFAULT_BASE_URL
+        key = (token or "", base_url)
+
+        with self._lock:
+            self._evict_idle_locked()
+
+            entry = self._entries.get(key)
+            if entry is None:
+                transport = GitHubTransport(
+                    pool_size=self.pool_size_for(base_url),
+                    cache=self.cache,
+                    scheduler=None if token_pool else RateLimitScheduler.from_env(),
+                    token_pool=token_pool,
+                    single_flight=SingleFlight() if self.single_flight else None,
+                )
+                client = GitHubClient(
+                    token,
+                    base_url=base_url,
+                    transport=transport,
+                    load_env=False,
+                    repo_cache=RepositoryCache.from_env(),
+                    ref_cache=RefCache.from_env(),
+                )
+                entry = _PoolEntry(client)
+                self._entries[key] = entry
+                self.created += 1
+
+            entry.last_used = time.monotonic()
+            entry.borrows += 1
+            leases = _leases.get()
+            if leases is not None:
+                entry.active += 1
+                leases.append((self, entry))
+            return entry.client
+
+    def _release(self, entry: _PoolEntry) -> None:
+        with self._lock:
+            entry.active -= 1
+            entry.last_used = time.monotonic()
+
+    def evict_idle(self) -> int:
+        """Close clients that have been idle longer than ``idle_timeout``.
+
+        Returns:
+            Number of evicted clients
+        """
+        with self._lock:
+            return self._evict_idle_locked()
+
+    def _evict_idle_locked(self) -> int:
+        now = time.monotonic()
+        # 사용 중인(lease가 남은) 클라이언트는 유휴 시간과 관계없이 유지
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if entry.active == 0 and now - entry.last_used > self.idle_timeout
+        ]
+        for key in expired:
+            self._entries.pop(key).client.close()
+        self.evicted += len(expired)
+        return len(expired)
+
+    def close_all(self) -> None:
+        """Close and drop every pooled client."""
+        with self._lock:
+            for entry in self._entries.values():
+                entry.client.close()
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return registry statistics.
+
+        Returns:
+            Dictionary with client counts, per-client transport, repository and
+            ref cache counters, and HTTP cache counters
+        """
+        with self._lock:
+            clients = [
+                {
+                    "base_url": base_url,
+                    "borrows": entry.borrows,
+                    "active": entry.active,
+                    "idle_seconds": round(time.monotonic() - entry.last_used, 1),
+                    **entry.client.transport.stats(),
+                    "repo_cache": (
+                        entry.client.repo_cache.stats() if entry.client.repo_cache else None
+                    ),
+                    "ref_cache": (
+                        entry.client.ref_cache.stats() if entry.client.ref_cache else None
+                    ),
+                }
+                for (_, base_url), entry in self._entries.items()
+            ]
+            return {
+                "clients": len(self._entries),
+                "created": self.created,
+                "evicted": self.evicted,
+                "pool": clients,
+                "http_cache": self.cache.stats() if self.cache else None,
+            }
+
+
+_registry: Optional[ClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Get the process-wide client registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ClientRegistry.from_env()
+    return _registry
+
+
+def get_github_client(token: Optional[str] = None) -> GitHubClient:
+    """Borrow a pooled GitHub client.
+
+    Args:
+        token: GitHub token. If None, uses the token pool or GITHUB_TOKEN env var.
+
+    Returns:
+        Shared GitHubClient instance
+    """
+    return get_client_registry().get(token)
+
+
+@contextmanager
+def client_lease() -> Iterator[None]:
+    """Hold every client borrowed inside the block until the block exits.
+
+    Scopes nest; each releases only the clients borrowed directly in it.
+    """
+    leases: List[Tuple[ClientRegistry, _PoolEntry]] = []
+    token = _leases.set(leases)
+    try:
+        yield
+    finally:
+        _leases.reset(token)
+        for registry, entry in leases:
+            registry._release(entry)
+
+
+def lease_clients(func: Callable[..., T]) -> Callable[..., T]:
+    """Run a tool body inside ``client_lease()``.
+
+    Args:
+        func: Tool body borrowing clients with get_github_client
+
+    Returns:
+        Wrapped tool body
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with client_lease():
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,118 @@
+"""Contents API lookups at resolved commit SHAs."""
+
+from typing import Any, Dict, List, Optional, Union
+
+from github.Repository import Repository
+
+from ref_resolver import ShaCache
+from snapshot_store import SYMLINK_MODE, Snapshot
+
+CONTENT_FIELDS = ("name", "path", "type", "size", "sha", "encoding", "html_url", "download_url")
+
+
+class ContentInfo:
+    """Metadata of a contents API entry, detached from the response.
+
+    Stands in for ``ContentFile`` in results cached under a commit SHA.
+    The body is not kept; it is fetched again only if ``decoded_content``
+    is read, which callers avoid by consulting the blob store first.
+    """
+
+    def __init__(self, repository: Repository, ref: str, **fields: Any):
+        self._repository = repository
+        self._ref = ref
+        for name in CONTENT_FIELDS:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def from_content_file(cls, repository: Repository, ref: str, content_file: Any) -> "ContentInfo":
+        return cls(
+            repository, ref, **{name: getattr(content_file, name) for name in CONTENT_FIELDS}
+        )
+
+    @property
+    def decoded_content(self) -> bytes:
+        return self._repository.get_contents(self.path, ref=self._ref).decoded_content
+
+
+class LocalContentInfo(ContentInfo):
+    """Contents entry of a file in a local snapshot, read from disk."""
+
+    def __init__(self, repository: Repository, ref: str, local_path: Any, **fields: Any):
+        super().__init__(repository, ref, **fields)
+        self.local_path = local_path
+
+    @property
+    def decoded_content(self) -> bytes:
+        return self.local_path.read_bytes()
+
+
+def _snapshot_contents(
+    repository: Repository, snapshot: Snapshot, path: str
+) -> Union[None, ContentInfo, List[ContentInfo]]:
+    """Build contents entries from a snapshot, or None if it cannot answer."""
+
+    def info(entry: Dict[str, Any]) -> ContentInfo:
+        name = entry["path"].rpartition("/")[2]
+        if entry["type"] == "tree":
+            return ContentInfo(
+                repository, snapshot.sha, name=name, path=entry["path"], type="dir", size=0,
+                sha=entry["sha"], html_url=f"{repository.html_url}/tree/{snapshot.sha}/{entry['path']}",
+            )
+        return LocalContentInfo(
+            repository, snapshot.sha, snapshot.file_path(entry["path"]), name=name,
+            path=entry["path"], type="file", size=entry["size"], sha=entry["sha"],
+            encoding="base64", html_url=f"{repository.html_url}/blob/{snapshot.sha}/{entry['path']}",
+        )
+
+    entry = snapshot.entry(path)
+    # 심볼릭 링크는 contents API가 대상에 따라 다르게 응답하므로 API에 맡김
+    if entry is None or entry.get("mode") == SYMLINK_MODE:
+        return None
+    if entry["type"] != "tree":
+        return info(entry)
+    children = snapshot.children(path)
+    if any(child["mode"] == SYMLINK_MODE for child in children):
+        return None
+    return [info(child) for child in children]
+
+
+def get_contents_at(
+    repository: Repository,
+    path: str,
+    sha: str,
+    cache: Optional[ShaCache] = None,
+    snapshot: Optional[Snapshot] = None,
+) -> Union[Any, List[Any]]:
+    """Get a file or directory at a commit SHA, caching its metadata for good.
+
+    Args:
+        repository: Repository to read
+        path: File or directory path
+        sha: Resolved commit SHA
+        cache: SHA-keyed cache to consult and fill (optional)
+        snapshot: Local snapshot of the commit to serve from (optional);
+            paths it cannot answer fall back to the API
+
+    Returns:
+        ContentFile (or ContentInfo when cached or local) for a file, list of
+        them for a directory
+    """
+    if snapshot is not None:
+        local = _snapshot_contents(repository, snapshot, path)
+        if local is not None:
+            return local
+
+    key = ("contents", repository.url.lower(), sha, path.strip("/"))
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    result = repository.get_contents(path, ref=sha)
+    if cache is not None:
+        if isinstance(result, list):
+            cache.put(key, [ContentInfo.from_content_file(repository, sha, item) for item in result])
+        else:
+            cache.put(key, ContentInfo.from_content_file(repository, sha, result))
+    return result
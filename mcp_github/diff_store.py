@@ -0,0 +1,560 @@
+"""On-disk store of full pull request diffs with a per-file byte-offset index."""
+
+import atexit
+import codecs
+import os
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from dotenv import load_dotenv
+
+DIFF_MEDIA_TYPE = "application/vnd.github.diff"
+CHUNK_SIZE = 64 * 1024
+
+# 헤더 판별에는 줄의 앞부분만 필요하므로 긴 줄은 이 길이까지만 보관
+MAX_HEADER_LINE = 8192
+MAX_HUNK_HEADER = 200
+
+# hunk 본문이 끝나는 줄 (다음 파일 또는 다음 hunk)
+_SECTION_START = re.compile(rb"^(?:diff --git |@@)", re.MULTILINE)
+
+
+class DiffHunk:
+    """Byte range of one ``@@`` hunk inside the stored diff."""
+
+    def __init__(self, offset: int, header: str):
+        self.offset = offset
+        self.length = 0
+        self.header = header
+
+    def to_dict(self, index: int) -> Dict[str, Any]:
+        return {
+            "index": index,
+            "header": self.header,
+            "offset": self.offset,
+            "length": self.length,
+        }
+
+
+class DiffFile:
+    """Byte range and statistics of one file section of a unified diff."""
+
+    def __init__(self, index: int, path: str, old_path: str, offset: int):
+        self.index = index
+        self.path = path
+        self.old_path = old_path
+        self.status = "modified"
+        self.binary = False
+        self.offset = offset
+        self.length = 0
+        self.additions = 0
+        self.deletions = 0
+        self.hunks: List[DiffHunk] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "path": self.path,
+            "old_path": self.old_path if self.old_path != self.path else None,
+            "status": self.status,
+            "binary": self.binary,
+            "offset": self.offset,
+            "length": self.length,
+            "additions": self.additions,
+            "deletions": self.deletions,
+            "hunks": len(self.hunks),
+        }
+
+
+class DiffIndexer:
+    """Incremental parser that indexes a unified diff while it streams by.
+
+    Only the current line's head (at most ``MAX_HEADER_LINE`` bytes) is
+    buffered, so memory use does not depend on the size of the diff.
+    """
+
+    def __init__(self) -> None:
+        self.files: List[DiffFile] = []
+        self.size = 0
+        self._line = bytearray()
+        self._line_start = 0
+        self._in_hunk = False
+
+    def feed(self, chunk: bytes) -> None:
+        """Index the next chunk of the diff.
+
+        Args:
+            chunk: Raw diff bytes following the previously fed ones
+        """
+        base = self.size
+        self.size = base + len(chunk)
+
+        # 이전 청크에서 이어지는 줄부터 마무리
+        newline = chunk.find(b"\n")
+        if newline < 0:
+            self._buffer(chunk, 0, len(chunk))
+            return
+        self._buffer(chunk, 0, newline + 1)
+        self._finish_line(base + newline + 1)
+
+        pos = newline + 1
+        complete = chunk.rfind(b"\n") + 1
+        while pos < complete:
+            if self._in_hunk:
+                # hunk 본문은 줄 단위로 보지 않고 +/- 줄 수만 한 번에 센다
+                match = _SECTION_START.search(chunk, pos, complete)
+                end = match.start() if match else complete
+                current = self.files[-1]
+                current.additions += chunk.count(b"\n+", pos, end) + (chunk[pos : pos + 1] == b"+")
+                current.deletions += chunk.count(b"\n-", pos, end) + (chunk[pos : pos + 1] == b"-")
+                pos = end
+                if match is None:
+                    break
+            newline = chunk.find(b"\n", pos)
+            self._line_start = base + pos
+            self._buffer(chunk, pos, newline + 1)
+            self._finish_line(base + newline + 1)
+            pos = newline + 1
+
+        self._line_start = base + complete
+        self._buffer(chunk, complete, len(chunk))
+
+    def _buffer(self, chunk: bytes, start: int, end: int) -> None:
+        room = MAX_HEADER_LINE - len(self._line)
+        if room > 0:
+            self._line += chunk[start : min(end, start + room)]
+
+    def close(self) -> List[DiffFile]:
+        """Finish indexing after the last chunk.
+
+        Returns:
+            Indexed files in diff order
+        """
+        if self._line:
+            self._finish_line(self.size)
+        self._close_file(self.size)
+        return self.files
+
+    @property
+    def _current(self) -> Optional[DiffFile]:
+        return self.files[-1] if self.files else None
+
+    def _finish_line(self, end: int) -> None:
+        line = bytes(self._line)
+        start = self._line_start
+        self._line.clear()
+        self._line_start = end
+
+        if line.startswith(b"diff --git "):
+            self._close_file(start)
+            old_path, path = _parse_git_header(line)
+            self.files.append(DiffFile(len(self.files), path, old_path, start))
+            self._in_hunk = False
+            return
+
+        current = self._current
+        if current is None:
+            return
+        if line.startswith(b"@@"):
+            self._close_hunk(current, start)
+            header = line.rstrip(b"\r\n")[:MAX_HUNK_HEADER].decode("utf-8", errors="replace")
+            current.hunks.append(DiffHunk(start, header))
+            self._in_hunk = True
+        elif self._in_hunk:
+            if line.startswith(b"+"):
+                current.additions += 1
+            elif line.startswith(b"-"):
+                current.deletions += 1
+        else:
+            _apply_extended_header(current, line.rstrip(b"\r\n"))
+
+    def _close_hunk(self, current: DiffFile, end: int) -> None:
+        if current.hunks:
+            hunk = current.hunks[-1]
+            hunk.length = end - hunk.offset
+
+    def _close_file(self, end: int) -> None:
+        current = self._current
+        if current is not None and current.length == 0:
+            self._close_hunk(current, end)
+            current.length = end - current.offset
+
+
+def _apply_extended_header(current: DiffFile, line: bytes) -> None:
+    # git diff 확장 헤더 (new file mode, rename from, --- a/, +++ b/ ...)
+    if line.startswith(b"new file mode"):
+        current.status = "added"
+    elif line.startswith(b"deleted file mode"):
+        current.status = "removed"
+    elif line.startswith(b"rename from "):
+        current.status = "renamed"
+        current.old_path = _decode_path(line[len(b"rename from ") :])
+    elif line.startswith(b"rename to "):
+        current.path = _decode_path(line[len(b"rename to ") :])
+    elif line.startswith(b"copy from "):
+        current.status = "copied"
+        current.old_path = _decode_path(line[len(b"copy from ") :])
+    elif line.startswith(b"copy to "):
+        current.path = _decode_path(line[len(b"copy to ") :])
+    elif line.startswith(b"Binary files ") or line == b"GIT binary patch":
+        current.binary = True
+    elif line.startswith(b"--- ") and line[4:] != b"/dev/null":
+        current.old_path = _strip_prefix(_decode_path(line[4:]))
+    elif line.startswith(b"+++ ") and line[4:] != b"/dev/null":
+        current.path = _strip_prefix(_decode_path(line[4:]))
+
+
+def _parse_git_header(line: bytes) -> Tuple[str, str]:
+    """Extract both paths from a ``diff --git a/... b/...`` line."""
+    rest = line[len(b"diff --git ") :].rstrip(b"\r\n")
+    if rest.startswith(b'"'):
+        # 특수문자가 있는 경로는 C 스타일로 quote 된다
+        end = _closing_quote(rest)
+        old, new = rest[: end + 1], rest[end + 1 :].lstrip()
+    elif rest.endswith(b'"'):
+        start = rest.rfind(b' "')
+        old, new = rest[:start], rest[start + 1 :]
+    else:
+        # 같은 경로면 "a/X b/X"의 정확히 가운데에서 나뉜다
+        middle = (len(rest) - 1) // 2
+        if rest[middle : middle + 3] == b" b/" and rest[2:middle] == rest[middle + 3 :]:
+            old, new = rest[:middle], rest[middle + 1 :]
+        else:
+            split = rest.find(b" b/")
+            old, new = (rest[:split], rest[split + 1 :]) if split >= 0 else (rest, rest)
+    return _strip_prefix(_decode_path(old)), _strip_prefix(_decode_path(new))
+
+
+def _closing_quote(value: bytes) -> int:
+    index = 1
+    while index < len(value):
+        if value[index : index + 1] == b"\\":
+            index += 2
+            continue
+        if value[index : index + 1] == b'"':
+            return index
+        index += 1
+    return len(value) - 1
+
+
+def _decode_path(value: bytes) -> str:
+    value = value.split(b"\t", 1)[0]
+    if len(value) >= 2 and value.startswith(b'"') and value.endswith(b'"'):
+        value = codecs.escape_decode(value[1:-1])[0]
+    return value.decode("utf-8", errors="replace")
+
+
+def _strip_prefix(path: str) -> str:
+    return path[2:] if path.startswith(("a/", "b/")) else path
+
+
+class StoredDiff:
+    """A diff written to disk together with its index and validator."""
+
+    def __init__(self, path: str, etag: Optional[str], size: int, files: List[DiffFile]):
+        self.path = path
+        self.etag = etag
+        self.size = size
+        self.files = files
+
+    def find_file(self, file: Any) -> DiffFile:
+        """Look up a file section by index or path.
+
+        Args:
+            file: File index in the diff, or its (new or old) path
+
+        Returns:
+            Matching file section
+
+        Raises:
+            ValueError: If no file matches
+        """
+        if isinstance(file, int) or (isinstance(file, str) and file.isdigit()):
+            index = int(file)
+            if 0 <= index < len(self.files):
+                return self.files[index]
+            raise ValueError(f"File index {index} out of range (0-{len(self.files) - 1})")
+        for entry in self.files:
+            if file in (entry.path, entry.old_path):
+                return entry
+        raise ValueError(f"File '{file}' is not part of this diff")
+
+    def section(
+        self, file: Any, hunk_start: Optional[int] = None, hunk_end: Optional[int] = None
+    ) -> Tuple[DiffFile, int, int]:
+        """Locate a file section, or a range of its hunks, in the stored diff.
+
+        Args:
+            file: File index in the diff, or its path
+            hunk_start: First hunk to include (0-based, inclusive)
+            hunk_end: Last hunk to include (inclusive, default: last)
+
+        Returns:
+            Tuple of the file section and the start and end byte offsets
+
+        Raises:
+            ValueError: If the file or hunk range does not exist
+        """
+        entry = self.find_file(file)
+        if hunk_start is None and hunk_end is None:
+            return entry, entry.offset, entry.offset + entry.length
+        if not entry.hunks:
+            raise ValueError(f"File '{entry.path}' has no hunks")
+        first = hunk_start or 0
+        last = len(entry.hunks) - 1 if hunk_end is None else hunk_end
+        if not 0 <= first <= last < len(entry.hunks):
+            raise ValueError(
+                f"Invalid hunk range {first}-{last}, file has {len(entry.hunks)} hunks"
+            )
+        return entry, entry.hunks[first].offset, entry.hunks[last].offset + entry.hunks[last].length
+
+
+class DiffStore:
+    """Size-bounded directory of full diffs with LRU eviction.
+
+    Each diff is streamed straight to a file while it is indexed, so a
+    diff of hundreds of MB never has to fit in memory. Entries keep the
+    ETag of the response; callers revalidate with it and reuse the stored
+    file when GitHub answers 304.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 1024 * 1024 * 1024):
+        """Initialize store.
+
+        The index of a diff lives only in memory, so each store writes to
+        its own subdirectory of ``directory`` and removes it on close (and
+        at exit). Processes sharing ``directory`` never touch each other's
+        files.
+
+        Args:
+            directory: Parent directory for diff files (created if missing)
+            max_bytes: Maximum total size of stored diffs
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix=f"{os.getpid()}-", dir=directory)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, StoredDiff]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.stored = 0
+        self.reused = 0
+        self.evicted = 0
+        atexit.register(self.close)
+
+    @classmethod
+    def from_env(cls) -> "DiffStore":
+        """Create a store configured from GITHUB_DIFF_DIR and GITHUB_DIFF_MAX_BYTES.
+
+        Returns:
+            Configured DiffStore
+        """
+        load_dotenv()
+        return cls(
+            directory=os.getenv("GITHUB_DIFF_DIR")
+            or str(Path.home() / ".cache" / "mcp-github" / "diffs"),
+            max_bytes=int(os.getenv("GITHUB_DIFF_MAX_BYTES", str(1024 * 1024 * 1024))),
+        )
+
+    def get(self, key: Hashable) -> Optional[StoredDiff]:
+        """Get a stored diff and mark it as recently used.
+
+        Args:
+            key: Identity of the diff (e.g. base URL, repository and PR number)
+
+        Returns:
+            Stored diff, or None if it is not stored
+        """
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is None:
+                return None
+            if not os.path.exists(stored.path):
+                # 파일이 사라졌으면 (디렉터리 정리 등) 다시 받는다
+                del self._entries[key]
+                self._total_bytes -= stored.size
+                return None
+            self._entries.move_to_end(key)
+            return stored
+
+    def mark_reused(self) -> None:
+        """Count a revalidated (304) use of a stored diff."""
+        with self._lock:
+            self.reused += 1
+
+    def write(
+        self, key: Hashable, chunks: Iterable[bytes], etag: Optional[str] = None
+    ) -> StoredDiff:
+        """Stream a diff to disk while indexing it.
+
+        Args:
+            key: Identity of the diff
+            chunks: Raw diff bytes
+            etag: ETag of the response the chunks come from
+
+        Returns:
+            The stored diff
+        """
+        indexer = DiffIndexer()
+        fd, path = tempfile.mkstemp(suffix=".diff", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    if chunk:
+                        f.write(chunk)
+                        indexer.feed(chunk)
+        except BaseException:
+            os.unlink(path)
+            raise
+        stored = StoredDiff(path, etag, indexer.size, indexer.close())
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._remove(previous)
+            self._entries[key] = stored
+            self._total_bytes += stored.size
+            self.stored += 1
+            # 방금 저장한 diff는 한도를 넘더라도 유지
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                _, oldest = self._entries.popitem(last=False)
+                self._remove(oldest)
+                self.evicted += 1
+        return stored
+
+    def read(self, stored: StoredDiff, offset: int, length: int) -> bytes:
+        """Read a byte range of a stored diff.
+
+        Args:
+            stored: Stored diff
+            offset: Start offset
+            length: Number of bytes to read
+
+        Returns:
+            The requested bytes
+        """
+        # eviction과 겹치지 않도록 lock 안에서 읽는다 (호출자가 length를 제한)
+        with self._lock:
+            with open(stored.path, "rb") as f:
+                f.seek(offset)
+                return f.read(length)
+
+    def close(self) -> None:
+        """Drop every stored diff and remove this store's directory."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _remove(self, stored: StoredDiff) -> None:
+        self._total_bytes -= stored.size
+        try:
+            os.unlink(stored.path)
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Return store statistics.
+
+        Returns:
+            Dictionary with stored diffs, bytes on disk and counters
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "stored": self.stored,
+                "reused": self.reused,
+                "evicted": self.evicted,
+            }
+
+
+def fetch_diff(client: Any, store: DiffStore, owner: str, repo: str, number: int) -> StoredDiff:
+    """Get the full diff of a pull request, downloading it only when it changed.
+
+    A stored diff is revalidated with its ETag; on 304 the stored file is
+    reused, otherwise the response is streamed into the store.
+
+    Args:
+        client: GitHubClient used for the request
+        store: Store holding the diff files
+        owner: Repository owner
+        repo: Repository name
+        number: Pull request number
+
+    Returns:
+        The stored diff
+    """
+    key = (client.base_url, f"{owner}/{repo}".lower(), number)
+    stored = store.get(key)
+    headers = {"If-None-Match": stored.etag} if stored and stored.etag else None
+    with client.stream(f"/repos/{owner}/{repo}/pulls/{number}", DIFF_MEDIA_TYPE, headers) as response:
+        if response.status_code == 304 and stored is not None:
+            store.mark_reused()
+            return stored
+        return store.write(key, response.iter_content(CHUNK_SIZE), response.headers.get("ETag"))
+
+
+def read_diff_section(
+    client: Any,
+    store: DiffStore,
+    owner: str,
+    repo: str,
+    number: int,
+    file: Union[int, str],
+    hunk_start: Optional[int] = None,
+    hunk_end: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> Tuple[DiffFile, int, int, bytes]:
+    """Read one file section (or hunk range) of a pull request's full diff.
+
+    The stored file can be unlinked between fetching and reading it, by a
+    concurrent write of the same diff or an LRU eviction. The diff is then
+    fetched again and read once more.
+
+    Args:
+        client: GitHubClient used for the request
+        store: Store holding the diff files
+        owner: Repository owner
+        repo: Repository name
+        number: Pull request number
+        file: File index in the diff, or its path
+        hunk_start: First hunk to include (0-based, inclusive)
+        hunk_end: Last hunk to include (inclusive, default: last)
+        max_bytes: Maximum number of bytes to read (default: the whole section)
+
+    Returns:
+        Tuple of the file section, the section's start and end offsets and
+        the bytes read from its start
+    """
+
+    def read() -> Tuple[DiffFile, int, int, bytes]:
+        stored = fetch_diff(client, store, owner, repo, number)
+        entry, offset, end = stored.section(file, hunk_start, hunk_end)
+        length = end - offset if max_bytes is None else min(end - offset, max_bytes)
+        return entry, offset, end, store.read(stored, offset, length)
+
+    try:
+        return read()
+    except FileNotFoundError:
+        # 읽기 전에 파일이 지워졌으면 (get이 빠진 항목을 버리므로) 다시 받는다
+        return read()
+
+
+_store: Optional[DiffStore] = None
+_store_lock = threading.Lock()
+
+
+def get_diff_store() -> DiffStore:
+    """Get the process-wide diff store, creating it on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = DiffStore.from_env()
+    return _store
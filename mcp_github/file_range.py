@@ -0,0 +1,303 @@
+"""Byte and line range reads of repository files without loading them whole."""
+
+import base64
+from contextlib import closing
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from blob_store import BlobStore
+from contents import LocalContentInfo
+from snapshot_store import iter_file
+
+RAW_MEDIA_TYPE = "application/vnd.github.raw"
+CHUNK_SIZE = 64 * 1024
+
+# contents API가 본문을 함께 주는 최대 크기
+CONTENTS_API_LIMIT = 1024 * 1024
+
+DEFAULT_RANGE_BYTES = 64 * 1024
+MAX_RANGE_BYTES = 1024 * 1024
+
+# git과 같이 파일 앞부분에 NUL이 있으면 바이너리로 본다
+BINARY_SNIFF_BYTES = 8000
+
+
+def has_range(
+    offset: Optional[int] = None,
+    length: Optional[int] = None,
+    start_line: Optional[int] = None,
+    end_line: Optional[int] = None,
+) -> bool:
+    """Check whether any range parameter was given."""
+    return any(value is not None for value in (offset, length, start_line, end_line))
+
+
+def slice_content(
+    chunks: Iterable[bytes],
+    offset: Optional[int] = None,
+    length: Optional[int] = None,
+    start_line: Optional[int] = None,
+    end_line: Optional[int] = None,
+    max_bytes: int = MAX_RANGE_BYTES,
+) -> Dict[str, Any]:
+    """Cut a byte range or a line range out of streamed content.
+
+    Chunks are consumed only until the range is complete, and only the
+    bytes of the range are kept, so memory use is bounded by the slice
+    plus one chunk regardless of the size of the content.
+
+    Args:
+        chunks: Content as a stream of byte chunks
+        offset: First byte of a byte range (default 0)
+        length: Bytes in a byte range (default 64KB)
+        start_line: First line of a line range (1-based)
+        end_line: Last line of a line range (inclusive, default: end of content)
+        max_bytes: Upper bound on the returned bytes
+
+    Returns:
+        Dictionary with the sliced ``content`` bytes, its byte ``offset``,
+        ``start_line``/``end_line`` for line ranges, ``truncated`` when the
+        slice hit ``max_bytes`` and ``eof`` when it reached the end of the content
+
+    Raises:
+        ValueError: If the range parameters are invalid
+    """
+    line_mode = start_line is not None or end_line is not None
+    if line_mode and (offset is not None or length is not None):
+        raise ValueError("Use either offset/length or start_line/end_line, not both")
+    if line_mode:
+        return _slice_lines(chunks, start_line or 1, end_line, max_bytes)
+
+    offset = offset or 0
+    if offset < 0:
+        raise ValueError("offset must not be negative")
+    if length is not None and length < 1:
+        raise ValueError("length must be positive")
+    wanted = min(length or DEFAULT_RANGE_BYTES, max_bytes)
+
+    buffer = bytearray()
+    position = 0
+    eof = True
+    for chunk in chunks:
+        end = position + len(chunk)
+        if end > offset:
+            buffer += chunk[max(0, offset - position) : offset + wanted - position]
+        position = end
+        if len(buffer) >= wanted:
+            eof = False
+            break
+    return {
+        "content": bytes(buffer),
+        "offset": offset,
+        "truncated": length is not None and length > max_bytes,
+        "eof": eof and offset + len(buffer) >= position,
+    }
+
+
+def _slice_lines(
+    chunks: Iterable[bytes], start_line: int, end_line: Optional[int], max_bytes: int
+) -> Dict[str, Any]:
+    if start_line < 1:
+        raise ValueError("start_line must be 1 or greater")
+    if end_line is not None and end_line < start_line:
+        raise ValueError("end_line must not be before start_line")
+
+    buffer = bytearray()
+    line = 1  # 다음 바이트가 속한 줄 번호
+    position = 0
+    start_offset: Optional[int] = None
+    truncated = False
+    eof = True
+    for chunk in chunks:
+        index = 0
+        if start_offset is None:
+            # 시작 줄 이전은 줄바꿈 수만 세고 건너뜀
+            if line + chunk.count(b"\n") < start_line:
+                line += chunk.count(b"\n")
+                position += len(chunk)
+                continue
+            while line < start_line:
+                index = chunk.index(b"\n", index) + 1
+                line += 1
+            start_offset = position + index
+
+        stop = len(chunk)
+        done = False
+        while end_line is not None and line <= end_line:
+            newline = chunk.find(b"\n", index)
+            if newline < 0:
+                break
+            index = newline + 1
+            line += 1
+            if line > end_line:
+                stop, done = index, True
+        if end_line is None:
+            line += chunk.count(b"\n", index)
+
+        start = start_offset - position if position <= start_offset else 0
+        buffer += chunk[start:stop]
+        position += len(chunk)
+        if len(buffer) > max_bytes:
+            # 마지막 완전한 줄까지만 반환
+            cut = buffer.rfind(b"\n", 0, max_bytes)
+            del buffer[cut + 1 if cut >= 0 else max_bytes :]
+            truncated, eof = True, False
+            break
+        if done:
+            eof = False
+            break
+
+    if start_offset is None:
+        if start_line > 1:
+            raise ValueError(f"start_line {start_line} is beyond the end of the file ({line} lines)")
+        start_offset = 0  # 빈 파일
+    last_line = start_line + buffer.count(b"\n") - (1 if buffer.endswith(b"\n") else 0)
+    return {
+        "content": bytes(buffer),
+        "offset": start_offset,
+        "start_line": start_line,
+        "end_line": max(start_line, last_line),
+        "truncated": truncated,
+        "eof": eof,
+    }
+
+
+class _HeadRecorder:
+    """Chunk iterator that keeps the first ``BINARY_SNIFF_BYTES`` it yields."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self.head = bytearray()
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        chunk = next(self._chunks)
+        if len(self.head) < BINARY_SNIFF_BYTES:
+            self.head += chunk[: BINARY_SNIFF_BYTES - len(self.head)]
+        return chunk
+
+    def is_binary(self) -> bool:
+        """Whether the file is binary, judged by its head only.
+
+        The range may end before the head does, so the rest of the head is
+        read first; every range of a file then gets the same encoding.
+        """
+        while len(self.head) < BINARY_SNIFF_BYTES:
+            if next(self, None) is None:
+                break
+        return b"\x00" in self.head
+
+
+def read_contents(file_content: Any, store: Optional[BlobStore] = None) -> bytes:
+    """Get the content of a file that came with its contents API response.
+
+    The content is taken from the blob store when present and added to it
+    otherwise. Files of a local snapshot are read from disk.
+
+    Args:
+        file_content: ContentFile returned by ``get_contents`` (under 1MB)
+        store: Blob store to consult and fill (optional)
+
+    Returns:
+        File content
+    """
+    if isinstance(file_content, LocalContentInfo):
+        return file_content.decoded_content
+    if store is not None:
+        cached = store.read(file_content.sha)
+        if cached is not None:
+            return cached
+    content = file_content.decoded_content
+    if store is not None:
+        store.put(file_content.sha, content)
+    return content
+
+
+def read_file_range(
+    client: Any,
+    owner: str,
+    repo: str,
+    file_content: Any,
+    offset: Optional[int] = None,
+    length: Optional[int] = None,
+    start_line: Optional[int] = None,
+    end_line: Optional[int] = None,
+    max_bytes: int = MAX_RANGE_BYTES,
+    store: Optional[BlobStore] = None,
+) -> Dict[str, Any]:
+    """Read a range of a repository file.
+
+    Files of a local snapshot and blobs in the blob store are sliced from
+    disk without any request.
+    Files whose content came with the contents API response are sliced in
+    memory. Larger files are streamed from the blob with the raw media
+    type: into the blob store when they fit its budget, otherwise only as
+    far as the range reaches.
+
+    Args:
+        client: GitHubClient
+        owner: Repository owner
+        repo: Repository name
+        file_content: ContentFile returned by ``get_contents``
+        offset: First byte of a byte range
+        length: Bytes in a byte range
+        start_line: First line of a line range (1-based)
+        end_line: Last line of a line range (inclusive)
+        max_bytes: Upper bound on the returned bytes
+        store: Blob store to consult and fill (optional)
+
+    Returns:
+        Slice as returned by ``slice_content`` with ``content`` as text, or
+        base64 when the file is binary (see ``content_encoding``). Whether a
+        file is binary is decided from its first bytes, not from the slice,
+        so every range of a file comes back in the same encoding.
+    """
+    sha = file_content.sha
+    size = file_content.size
+    range_args = (offset, length, start_line, end_line, max_bytes)
+
+    inline = file_content.encoding == "base64" and size < CONTENTS_API_LIMIT
+    blob_path = f"/repos/{owner}/{repo}/git/blobs/{sha}"
+
+    local = isinstance(file_content, LocalContentInfo)
+    stored = not local and store is not None and store.size(sha) is not None
+    if store is not None and not local and not stored:
+        if inline:
+            stored = store.put(sha, file_content.decoded_content)
+        elif size <= store.max_entry_bytes:
+            # 한 번 전체를 받아 두면 이후 범위 읽기는 요청 없이 디스크에서 처리
+            with client.stream(blob_path, RAW_MEDIA_TYPE) as response:
+                stored = store.put_stream(sha, response.iter_content(CHUNK_SIZE), size)
+
+    if local:
+        with closing(iter_file(file_content.local_path, CHUNK_SIZE)) as chunks:
+            recorder = _HeadRecorder(chunks)
+            part = slice_content(recorder, *range_args)
+            binary = recorder.is_binary()
+    elif stored:
+        with closing(store.iter_chunks(sha, CHUNK_SIZE)) as chunks:
+            recorder = _HeadRecorder(chunks)
+            part = slice_content(recorder, *range_args)
+            binary = recorder.is_binary()
+    elif inline:
+        content = file_content.decoded_content
+        part = slice_content([content], *range_args)
+        binary = b"\x00" in content[:BINARY_SNIFF_BYTES]
+    else:
+        with client.stream(blob_path, RAW_MEDIA_TYPE) as response:
+            recorder = _HeadRecorder(response.iter_content(CHUNK_SIZE))
+            part = slice_content(recorder, *range_args)
+            binary = recorder.is_binary()
+
+    content = part["content"]
+    part["length"] = len(content)
+    part["eof"] = part["offset"] + len(content) >= size
+    if binary:
+        part["content"] = base64.b64encode(content).decode("ascii")
+        part["content_encoding"] = "base64"
+    else:
+        # 범위 경계에서 잘린 멀티바이트 문자는 대체 문자로 표시
+        part["content"] = content.decode("utf-8", errors="replace")
+        part["content_encoding"] = "utf-8"
+    return part
@@ -1,25 +1,51 @@
 """GitHub API client for MCP server."""
 
 import os
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from urllib.parse import quote
 
+import requests
 from dotenv import load_dotenv
 from github import Github
+from github.Consts import DEFAULT_BASE_URL, DEFAULT_TIMEOUT
 from github.Repository import Repository
-from github.GithubException import GithubException
+from github.GithubException import GithubException, RateLimitExceededException
+from requests.adapters import HTTPAdapter
+
+from ref_resolver import SHA_MEDIA_TYPE, RefCache, is_commit_sha
+from repo_cache import RepositoryCache
+from transport import install_transport
+
+# REST 목록 API의 페이지 크기 (GitHub 최대값)
+PER_PAGE = 100
 
 
 class GitHubClient:
     """GitHub API client wrapper with error handling."""
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        transport: Optional[HTTPAdapter] = None,
+        load_env: bool = True,
+        repo_cache: Optional[RepositoryCache] = None,
+        ref_cache: Optional[RefCache] = None,
+    ):
         """Initialize GitHub client.
 
         Args:
             token: GitHub personal access token. If None, tries to load from GITHUB_TOKEN env var.
+            base_url: GitHub API base URL. If None, uses GITHUB_API_URL env var or api.github.com.
+            transport: Shared HTTP adapter (connection pool) for all requests (optional)
+            load_env: Load the .env file before reading environment variables
+            repo_cache: Cache of resolved repositories (optional)
+            ref_cache: Cache of refs resolved to commit SHAs (optional)
         """
         # Load environment variables from .env file
-        load_dotenv()
+        if load_env:
+            load_dotenv()
 
         self.token = token or os.getenv("GITHUB_TOKEN")
         if not self.token:
@@ -29,7 +55,24 @@ class GitHubClient:
                 "https://github.com/settings/tokens"
             )
 
-        self.github = Github(self.token, per_page=100)
+        self.base_url = base_url or os.getenv("GITHUB_API_URL") or DEFAULT_BASE_URL
+        self.transport = transport
+        self.repo_cache = repo_cache
+        self.ref_cache = ref_cache
+
+        github_kwargs = {"per_page": PER_PAGE}
+        if self.base_url != DEFAULT_BASE_URL:
+            github_kwargs["base_url"] = self.base_url
+        if transport is not None:
+            # PyGithub은 인스턴스마다 요청 간격(0.25s)을 두므로 공유 클라이언트에서는 끈다
+            github_kwargs["seconds_between_requests"] = None
+            github_kwargs["seconds_between_writes"] = None
+        self.github = Github(self.token, **github_kwargs)
+
+        if transport is not None:
+            install_transport(self.github, transport)
+
+        self._stream_session: Optional[requests.Session] = None
 
     def get_repository(self, owner: str, repo: str) -> Repository:
         """Get repository information.
@@ -42,10 +85,23 @@ class GitHubClient:
             GitHub Repository object
 
         Raises:
-            ValueError: If repository not found or access denied
+            ValueError: If repository not found, access denied or rate limit exceeded
         """
+        if self.repo_cache is not None:
+            repository = self.repo_cache.get(owner, repo)
+            if repository is not None:
+                return repository
+
         try:
-            return self.github.get_repo(f"{owner}/{repo}")
+            repository = self.github.get_repo(f"{owner}/{repo}")
+        except RateLimitExceededException as e:
+            reset = (e.headers or {}).get("x-ratelimit-reset")
+            if reset:
+                reset_at = datetime.fromtimestamp(int(reset), tz=timezone.utc)
+                raise ValueError(
+                    f"GitHub API rate limit exceeded. Resets at {reset_at.isoformat()}"
+                )
+            raise ValueError("GitHub API rate limit exceeded")
         except GithubException as e:
             if e.status == 404:
                 raise ValueError(f"Repository '{owner}/{repo}' not found")
@@ -56,6 +112,152 @@ class GitHubClient:
             else:
                 raise ValueError(f"GitHub API error: {e.data.get('message', str(e))}")
 
+        if self.repo_cache is not None:
+            self.repo_cache.put(owner, repo, repository)
+        return repository
+
+    def invalidate_repository(self, owner: str, repo: str) -> None:
+        """Forget the cached repository after a write touched it.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+        """
+        if self.repo_cache is not None:
+            self.repo_cache.invalidate(owner, repo)
+        if self.ref_cache is not None:
+            self.ref_cache.invalidate(owner, repo)
+
+    def resolve_ref(self, owner: str, repo: str, ref: str) -> str:
+        """Resolve a branch, tag or other ref to the commit SHA it points at.
+
+        Full SHAs are returned as is. Other refs cost one request for the
+        bare SHA (``application/vnd.github.sha``), which is revalidated with
+        its ETag once the ref cache entry expires.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            ref: Branch, tag, commit SHA or ``HEAD``
+
+        Returns:
+            Commit SHA
+
+        Raises:
+            ValueError: If the ref does not exist or the request fails
+        """
+        if is_commit_sha(ref):
+            return ref.lower()
+        if self.ref_cache is not None:
+            sha = self.ref_cache.get(owner, repo, ref)
+            if sha is not None:
+                return sha
+
+        status, _, body = self.github.requester.requestJson(
+            "GET",
+            f"/repos/{owner}/{repo}/commits/{quote(ref, safe='')}",
+            headers={"Accept": SHA_MEDIA_TYPE},
+        )
+        if status in (404, 422):
+            raise ValueError(f"Ref '{ref}' not found in '{owner}/{repo}'")
+        if status == 401:
+            raise ValueError("Invalid GitHub token. Please check your token.")
+        if status != 200:
+            raise ValueError(f"GitHub API error resolving ref '{ref}': HTTP {status}")
+
+        sha = body.strip()
+        if self.ref_cache is not None:
+            self.ref_cache.put(owner, repo, ref, sha)
+        return sha
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL query through the pooled transport.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The ``data`` member of the response
+
+        Raises:
+            ValueError: If the query fails or the rate limit is exceeded
+        """
+        try:
+            _, body = self.github.requester.graphql_query(query, variables or {})
+        except RateLimitExceededException:
+            raise ValueError("GitHub GraphQL rate limit exceeded")
+        except GithubException as e:
+            errors = (e.data or {}).get("errors") if isinstance(e.data, dict) else None
+            if errors:
+                messages = "; ".join(error.get("message", "") for error in errors)
+                raise ValueError(f"GitHub GraphQL error: {messages}")
+            if e.status == 401:
+                raise ValueError("Invalid GitHub token. Please check your token.")
+            raise ValueError(f"GitHub API error: {str(e)}")
+        return body["data"]
+
+    def stream(
+        self, path: str, accept: str, headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """GET an API path without reading the response body into memory.
+
+        The request goes through the shared transport, so it is paced by the
+        rate-limit scheduler and token pool like every other call. Use the
+        response as a context manager and read it with ``iter_content``.
+
+        Args:
+            path: API path (e.g. "/repos/owner/repo/pulls/1")
+            accept: Media type to request
+            headers: Extra request headers (e.g. If-None-Match)
+
+        Returns:
+            Streaming response with status 200 or 304
+
+        Raises:
+            ValueError: If the request fails
+        """
+        if self._stream_session is None:
+            session = requests.Session()
+            session.headers["Authorization"] = f"token {self.token}"
+            session.headers["User-Agent"] = "PyGithub/Python"
+            if self.transport is not None:
+                session.mount("http://", self.transport)
+                session.mount("https://", self.transport)
+            self._stream_session = session
+
+        response = self._stream_session.get(
+            self.base_url.rstrip("/") + path,
+            headers={"Accept": accept, **(headers or {})},
+            stream=True,
+            timeout=DEFAULT_TIMEOUT,
+        )
+        if response.status_code in (200, 304):
+            return response
+
+        # 에러 응답은 작으므로 본문을 읽어 메시지를 만든다
+        try:
+            message = response.json().get("message", response.reason)
+        except ValueError:
+            message = response.reason
+        finally:
+            response.close()
+        if response.status_code == 404:
+            raise ValueError(f"Not found: {path}")
+        if response.status_code == 401:
+            raise ValueError("Invalid GitHub token. Please check your token.")
+        if response.status_code in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0":
+            raise ValueError("GitHub API rate limit exceeded")
+        raise ValueError(f"GitHub API error: {message}")
+
+    def close(self) -> None:
+        """Close the underlying HTTP connections."""
+        self.github.close()
+        if self._stream_session is not None:
+            self._stream_session.close()
+        if self.transport is not None:
+            self.transport.close()
+
     def test_connection(self) -> bool:
         """Test GitHub API connection.
 
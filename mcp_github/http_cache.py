@@ -0,0 +1,248 @@
+"""Persistent conditional-request (ETag / Last-Modified) cache for GitHub REST calls."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+
+# 캐시된 본문은 이미 디코딩된 상태라 전송 관련 헤더는 저장하지 않음
+_SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class CacheEntry:
+    """Cached response body with its validators."""
+
+    def __init__(
+        self,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        headers: Dict[str, str],
+        body: bytes,
+    ):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.headers = headers
+        self.body = body
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Get the headers that turn a GET into a conditional request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalCache:
+    """Size-bounded on-disk store of GET responses with LRU eviction.
+
+    Entries are revalidated on every use: the caller sends the stored
+    validators and serves the stored body when GitHub answers 304, which
+    does not count against the primary rate limit.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 100 * 1024 * 1024):
+        """Initialize cache.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Maximum total size of cached bodies
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed REAL NOT NULL
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._db.commit()
+        self._total_bytes = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+        self.misses = 0
+        self.not_modified = 0
+        self.changed = 0
+        self.stored = 0
+        self.evicted = 0
+        self.bytes_saved = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["ConditionalCache"]:
+        """Create a cache configured from environment variables.
+
+        Reads GITHUB_HTTP_CACHE (set to 0 to disable), GITHUB_HTTP_CACHE_DIR
+        and GITHUB_HTTP_CACHE_MAX_BYTES.
+
+        Returns:
+            Configured cache, or None if caching is disabled
+        """
+        load_dotenv()
+        if os.getenv("GITHUB_HTTP_CACHE", "1").lower() in ("0", "false", "no"):
+            return None
+
+        cache_dir = os.getenv("GITHUB_HTTP_CACHE_DIR") or str(
+            Path.home() / ".cache" / "mcp-github"
+        )
+        max_bytes = int(os.getenv("GITHUB_HTTP_CACHE_MAX_BYTES", str(100 * 1024 * 1024)))
+        return cls(str(Path(cache_dir) / "http_cache.sqlite3"), max_bytes=max_bytes)
+
+    @staticmethod
+    def make_key(method: str, url: str, headers: Any) -> str:
+        """Build the cache key for a request.
+
+        The key covers the credential (hashed) and the Accept header, since
+        both change what GitHub returns for the same URL.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            headers: Request headers
+
+        Returns:
+            Hex digest identifying the request
+        """
+        parts = [
+            method.upper(),
+            url,
+            headers.get("Accept", ""),
+            headers.get("Authorization", ""),
+        ]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Look up an entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached entry, or None on a miss
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, headers, body FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._db.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
+
+        etag, last_modified, headers, body = row
+        return CacheEntry(etag, last_modified, json.loads(headers), body)
+
+    def put(self, key: str, headers: Any, body: bytes) -> None:
+        """Store a 200 response if it carries a validator.
+
+        Args:
+            key: Cache key
+            headers: Response headers
+            body: Decoded response body
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        if len(body) > self.max_bytes:
+            return
+
+        stored_headers = {
+            name: value
+            for name, value in headers.items()
+            if name.lower() not in _SKIPPED_HEADERS
+        }
+
+        with self._lock:
+            previous = self._db.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if previous:
+                self._total_bytes -= previous[0]
+
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    etag,
+                    last_modified,
+                    json.dumps(stored_headers),
+                    body,
+                    len(body),
+                    time.time(),
+                ),
+            )
+            self._total_bytes += len(body)
+            self.stored += 1
+            self._evict_locked()
+            self._db.commit()
+
+    def record_not_modified(self, entry: CacheEntry) -> None:
+        """Count a 304 that was answered from the cache."""
+        with self._lock:
+            self.not_modified += 1
+            self.bytes_saved += len(entry.body)
+
+    def record_changed(self) -> None:
+        """Count a revalidation that returned a new body."""
+        with self._lock:
+            self.changed += 1
+
+    def _evict_locked(self) -> None:
+        while self._total_bytes > self.max_bytes:
+            row = self._db.execute(
+                "SELECT key, size FROM entries ORDER BY accessed LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._db.execute("DELETE FROM entries WHERE key = ?", (row[0],))
+            self._total_bytes -= row[1]
+            self.evicted += 1
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._db.execute("DELETE FROM entries")
+            self._db.commit()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters.
+
+        Returns:
+            Dictionary with hit/miss/304 counters and storage usage
+        """
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            return {
+                "entries": entries,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+                "changed": self.changed,
+                "stored": self.stored,
+                "evicted": self.evicted,
+                "bytes_saved": self.bytes_saved,
+            }
@@ -0,0 +1,103 @@
+"""Encoding of the ``data`` field of tool results."""
+
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json으로 직렬화
+    orjson = None
+
+# json: 들여쓴 JSON 문자열 (기존 형식)
+# compact: 공백 없는 JSON 문자열
+# native: 문자열로 감싸지 않은 구조화 데이터
+# columnar: native + 객체 목록은 columns/rows 형태
+OUTPUT_FORMATS = ("json", "compact", "native", "columnar")
+
+
+def resolve_output_format(output: Optional[str] = None) -> str:
+    """Validate an output format, falling back to GITHUB_OUTPUT_FORMAT.
+
+    Args:
+        output: Requested format, or None for the configured default
+
+    Returns:
+        One of ``OUTPUT_FORMATS``
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    output = output or get_default_output_format()
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{output}'. Use {', '.join(OUTPUT_FORMATS)}")
+    return output
+
+
+def dumps_compact(data: Any) -> str:
+    """Serialize data as JSON without any whitespace.
+
+    Uses orjson when it is installed, otherwise the standard library.
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def to_columns(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Turn a list of objects into column names and value rows.
+
+    Keys are not repeated per row, which shrinks long listings of objects
+    sharing the same fields. Keys missing from a row are filled with None.
+
+    Args:
+        rows: Objects to convert
+
+    Returns:
+        Dictionary with ``columns`` (key names in first-seen order) and ``rows``
+    """
+    columns: Dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    return {
+        "columns": list(columns),
+        "rows": [[row.get(name) for name in columns] for row in rows],
+    }
+
+
+def format_data(data: Any, output: str = "json") -> Any:
+    """Encode result data in an output format.
+
+    Args:
+        data: JSON-compatible result data
+        output: Format from ``resolve_output_format``
+
+    Returns:
+        JSON string for ``json``/``compact``, the data itself for ``native``,
+        and a columnar object for lists of objects with ``columnar``
+    """
+    if output == "json":
+        return json.dumps(data, indent=2)
+    if output == "compact":
+        return dumps_compact(data)
+    if output == "columnar" and isinstance(data, list) and all(isinstance(row, dict) for row in data):
+        return to_columns(data)
+    return data
+
+
+_default_output: Optional[str] = None
+_default_output_lock = threading.Lock()
+
+
+def get_default_output_format() -> str:
+    """Get the process-wide default output format from GITHUB_OUTPUT_FORMAT."""
+    global _default_output
+    if _default_output is None:
+        with _default_output_lock:
+            if _default_output is None:
+                load_dotenv()
+                _default_output = os.getenv("GITHUB_OUTPUT_FORMAT", "json")
+    return _default_output
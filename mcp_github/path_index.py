@@ -0,0 +1,189 @@
+"""Per-branch index of file paths to blob SHAs for writes without lookups."""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+
+
+def _parent(path: str) -> str:
+    return path.rsplit("/", 1)[0] if "/" in path else ""
+
+
+class _BranchIndex:
+    def __init__(self) -> None:
+        self.paths: Dict[str, str] = {}
+        # 전체 목록을 알고 있는 디렉터리 ("*"는 브랜치 전체)
+        self.listed: Set[str] = set()
+
+
+class PathIndex:
+    """Best-effort map of path -> blob SHA per repository branch.
+
+    Filled from tree and directory listings and updated from the responses
+    of single-file writes, so the Contents API ``sha`` of a file is known
+    without fetching the file first. A path is known to be absent when the
+    listing of its directory (or the whole branch) was seen without it.
+
+    Other clients can change a branch at any time, so entries may be
+    stale; writers fall back to a fresh lookup when GitHub rejects a SHA.
+    """
+
+    def __init__(self, max_branches: int = 64):
+        """Initialize path index.
+
+        Args:
+            max_branches: Maximum number of indexed branches
+        """
+        self.max_branches = max_branches
+        self._branches: "OrderedDict[Tuple[str, str], _BranchIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["PathIndex"]:
+        """Create a path index from GITHUB_PATH_INDEX_BRANCHES (0 disables it).
+
+        Returns:
+            Configured PathIndex, or None if disabled
+        """
+        load_dotenv()
+        max_branches = int(os.getenv("GITHUB_PATH_INDEX_BRANCHES", "64"))
+        if max_branches <= 0:
+            return None
+        return cls(max_branches=max_branches)
+
+    @staticmethod
+    def make_key(owner: str, repo: str, branch: str) -> Tuple[str, str]:
+        return f"{owner}/{repo}".lower(), branch
+
+    def _branch(self, owner: str, repo: str, branch: str, create: bool) -> Optional[_BranchIndex]:
+        key = self.make_key(owner, repo, branch)
+        index = self._branches.get(key)
+        if index is None and create:
+            index = self._branches[key] = _BranchIndex()
+            while len(self._branches) > self.max_branches:
+                self._branches.popitem(last=False)
+        if index is not None:
+            self._branches.move_to_end(key)
+        return index
+
+    def get(self, owner: str, repo: str, branch: str, path: str) -> Tuple[bool, Optional[str]]:
+        """Look up the blob SHA of a file.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name
+            path: File path
+
+        Returns:
+            Tuple of whether the path is known and its blob SHA
+            (None when it is known not to exist)
+        """
+        with self._lock:
+            index = self._branch(owner, repo, branch, create=False)
+            if index is not None:
+                if path in index.paths:
+                    self.hits += 1
+                    return True, index.paths[path]
+                if "*" in index.listed or _parent(path) in index.listed:
+                    self.hits += 1
+                    return True, None
+            self.misses += 1
+            return False, None
+
+    def fill(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        entries: Iterable[Dict[str, Any]],
+        directory: Optional[str] = None,
+    ) -> None:
+        """Record a listing of a branch.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name
+            entries: Tree or contents entries with ``path``, ``type`` and ``sha``
+            directory: Directory the entries are the complete listing of,
+                or None for a recursive listing of the whole branch
+        """
+        with self._lock:
+            index = self._branch(owner, repo, branch, create=True)
+            if directory is None:
+                index.paths.clear()
+                index.listed = {"*"}
+            else:
+                prefix = f"{directory}/" if directory else ""
+                for path in [p for p in index.paths if p.startswith(prefix) and "/" not in p[len(prefix):]]:
+                    del index.paths[path]
+                index.listed.add(directory)
+            for entry in entries:
+                # 파일(blob)만 Contents API의 sha로 쓰임
+                if entry["type"] in ("blob", "file", "symlink"):
+                    index.paths[entry["path"]] = entry["sha"]
+
+    def put(self, owner: str, repo: str, branch: str, path: str, sha: Optional[str]) -> None:
+        """Record the blob SHA of a file after a write (None after a delete).
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name
+            path: File path
+            sha: New blob SHA, or None if the file was deleted
+        """
+        with self._lock:
+            index = self._branch(owner, repo, branch, create=True)
+            if sha is None:
+                index.paths.pop(path, None)
+            else:
+                index.paths[path] = sha
+
+    def invalidate(self, owner: str, repo: str, branch: str) -> None:
+        """Forget a branch, e.g. after a commit that rewrote many paths.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name
+        """
+        with self._lock:
+            self._branches.pop(self.make_key(owner, repo, branch), None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return index statistics.
+
+        Returns:
+            Dictionary with size, limit and hit/miss counters
+        """
+        with self._lock:
+            return {
+                "branches": len(self._branches),
+                "max_branches": self.max_branches,
+                "paths": sum(len(index.paths) for index in self._branches.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_index: Optional[PathIndex] = None
+_index_loaded = False
+_index_lock = threading.Lock()
+
+
+def get_path_index() -> Optional[PathIndex]:
+    """Get the process-wide path index, or None if it is disabled."""
+    global _index, _index_loaded
+    if not _index_loaded:
+        with _index_lock:
+            if not _index_loaded:
+                _index = PathIndex.from_env()
+                _index_loaded = True
+    return _index
@@ -0,0 +1,267 @@
+"""Rate-limit-aware scheduling of GitHub API requests."""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from dotenv import load_dotenv
+
+SECONDARY_LIMIT_MARKERS = ("secondary rate limit", "abuse detection")
+
+
+class BucketBudget:
+    """Last known budget of one rate-limit resource bucket."""
+
+    def __init__(self) -> None:
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset: float = 0.0
+        self.next_slot: float = 0.0
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_in": max(0, round(self.reset - now)),
+        }
+
+
+class RateLimitScheduler:
+    """Track GitHub rate-limit budgets and pace requests accordingly.
+
+    Budgets are updated from the ``X-RateLimit-*`` headers of every response
+    and kept per resource bucket (core, search, graphql, ...). While a
+    bucket has plenty of budget requests go out immediately; once it drops
+    below ``reserve`` of its limit the remaining requests are spread evenly
+    until the reset time. Secondary (abuse) limits pause all requests for
+    the ``Retry-After`` period and the rejected request is retried instead
+    of failed.
+    """
+
+    def __init__(
+        self,
+        reserve: float = 0.1,
+        max_wait: float = 900.0,
+        secondary_backoff: float = 60.0,
+        max_retries: int = 5,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            reserve: Fraction of a bucket's limit below which requests are spread out
+            max_wait: Longest delay (seconds) to queue a request before failing it
+            secondary_backoff: Base delay when a secondary limit has no Retry-After
+            max_retries: Retries of a request rejected by a rate limit
+            clock: Wall clock returning epoch seconds
+            sleep: Sleep function
+        """
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.secondary_backoff = secondary_backoff
+        self.max_retries = max_retries
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, BucketBudget] = {}
+        self._paused_until = 0.0
+        self.throttled = 0
+        self.secondary_hits = 0
+        self.retries = 0
+
+    @classmethod
+    def from_env(cls) -> "RateLimitScheduler":
+        """Create a scheduler configured from environment variables.
+
+        Reads GITHUB_RATE_LIMIT_RESERVE and GITHUB_RATE_LIMIT_MAX_WAIT.
+
+        Returns:
+            Configured RateLimitScheduler
+        """
+        load_dotenv()
+        return cls(
+            reserve=float(os.getenv("GITHUB_RATE_LIMIT_RESERVE", "0.1")),
+            max_wait=float(os.getenv("GITHUB_RATE_LIMIT_MAX_WAIT", "900")),
+        )
+
+    @staticmethod
+    def resource_for(url: str) -> str:
+        """Guess the rate-limit bucket of a request URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Bucket name ("core", "search" or "graphql")
+        """
+        path = urlparse(url).path
+        # GHE는 /api/v3 prefix를 사용
+        for prefix in ("/api/v3", "/api"):
+            if path.startswith(prefix + "/"):
+                path = path[len(prefix):]
+                break
+        if path.startswith("/search/"):
+            return "search"
+        if path.startswith("/graphql"):
+            return "graphql"
+        return "core"
+
+    def reserve_slot(self, resource: str) -> float:
+        """Reserve the next send slot for a bucket.
+
+        Args:
+            resource: Bucket name
+
+        Returns:
+            Seconds the caller has to wait before sending
+        """
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._paused_until)
+
+            budget = self._buckets.get(resource)
+            if budget is not None and budget.remaining is not None and budget.reset > start:
+                if budget.remaining <= 0:
+                    start = budget.reset
+                elif budget.limit and budget.remaining < budget.limit * self.reserve:
+                    # 남은 예산을 reset 시각까지 균등하게 분배
+                    interval = (budget.reset - start) / budget.remaining
+                    start = max(start, budget.next_slot)
+                    budget.next_slot = start + interval
+                    budget.remaining -= 1
+
+            delay = start - now
+            if delay > 0:
+                self.throttled += 1
+            return delay
+
+    def wait(self, resource: str) -> None:
+        """Block until a request to the bucket may be sent.
+
+        Args:
+            resource: Bucket name
+        """
+        delay = self.reserve_slot(resource)
+        if delay > 0:
+            self._sleep(min(delay, self.max_wait))
+
+    def remaining(self, resource: str) -> Optional[int]:
+        """Get the last known remaining budget of a bucket.
+
+        Args:
+            resource: Bucket name
+
+        Returns:
+            Remaining requests, or None if no response has been seen yet
+        """
+        with self._lock:
+            budget = self._buckets.get(resource)
+            if budget is None or budget.reset <= self._clock():
+                return None
+            return budget.remaining
+
+    def available_at(self, resource: str) -> float:
+        """Get the earliest time a request to the bucket may be sent.
+
+        Args:
+            resource: Bucket name
+
+        Returns:
+            Epoch seconds; in the past when the bucket is usable now
+        """
+        with self._lock:
+            available = self._paused_until
+            budget = self._buckets.get(resource)
+            if budget is not None and budget.remaining is not None and budget.remaining <= 0:
+                available = max(available, budget.reset)
+            return available
+
+    def update(self, resource: str, headers: Any) -> None:
+        """Record the budget reported by a response.
+
+        Args:
+            resource: Bucket the request was sent to
+            headers: Response headers
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+
+        resource = headers.get("X-RateLimit-Resource") or resource
+        with self._lock:
+            budget = self._buckets.setdefault(resource, BucketBudget())
+            budget.remaining = int(remaining)
+            if headers.get("X-RateLimit-Limit"):
+                budget.limit = int(headers["X-RateLimit-Limit"])
+            if headers.get("X-RateLimit-Reset"):
+                reset = float(headers["X-RateLimit-Reset"])
+                if reset != budget.reset:
+                    budget.next_slot = 0.0
+                budget.reset = reset
+
+    def retry_delay(
+        self, status: int, headers: Any, body: str, attempt: int
+    ) -> Optional[float]:
+        """Decide whether a rate-limited response should be retried.
+
+        Args:
+            status: Response status code
+            headers: Response headers
+            body: Response body text
+            attempt: Number of retries already made for this request
+
+        Returns:
+            Seconds until the retry may be sent, or None to return the response
+        """
+        if status not in (403, 429) or attempt >= self.max_retries:
+            return None
+
+        now = self._clock()
+        retry_after = headers.get("Retry-After")
+        secondary = retry_after is not None or any(
+            marker in body.lower() for marker in SECONDARY_LIMIT_MARKERS
+        )
+
+        if secondary:
+            if retry_after is not None:
+                delay = float(retry_after)
+            else:
+                delay = self.secondary_backoff * (2**attempt)
+            with self._lock:
+                self.secondary_hits += 1
+        elif headers.get("X-RateLimit-Remaining") == "0" and headers.get("X-RateLimit-Reset"):
+            delay = float(headers["X-RateLimit-Reset"]) - now + 1
+        else:
+            # 권한 부족 등 rate limit과 무관한 403
+            return None
+
+        if delay > self.max_wait:
+            return None
+
+        with self._lock:
+            if secondary:
+                # secondary limit은 버킷과 무관하게 모든 요청을 멈춤
+                self._paused_until = max(self._paused_until, now + delay)
+            self.retries += 1
+        return max(0.0, delay)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current budget of every known bucket.
+
+        Returns:
+            Dictionary with per-bucket budgets and scheduler counters
+        """
+        with self._lock:
+            now = self._clock()
+            return {
+                "buckets": {
+                    name: budget.to_dict(now) for name, budget in self._buckets.items()
+                },
+                "paused_for": max(0, round(self._paused_until - now)),
+                "throttled": self.throttled,
+                "secondary_hits": self.secondary_hits,
+                "retries": self.retries,
+            }
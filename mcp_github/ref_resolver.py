@@ -0,0 +1,221 @@
+"""Resolution of branches and tags to commit SHAs, and caches keyed by them."""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from dotenv import load_dotenv
+
+SHA_MEDIA_TYPE = "application/vnd.github.sha"
+
+_COMMIT_SHA = re.compile(r"[0-9a-fA-F]{40}")
+
+
+def is_commit_sha(ref: str) -> bool:
+    """Check whether a ref is a full (immutable) object SHA."""
+    return bool(_COMMIT_SHA.fullmatch(ref))
+
+
+class RefCache:
+    """Short-lived cache of ref -> commit SHA per repository.
+
+    Branches move, so entries expire after ``ttl`` seconds; after that the
+    ref is looked up again, usually as a free conditional request. Write
+    tools drop the refs of the repository they changed.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize ref cache.
+
+        Args:
+            max_entries: Maximum number of cached refs
+            ttl: Seconds a resolved ref stays valid
+            clock: Monotonic clock returning seconds
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["RefCache"]:
+        """Create a ref cache from environment variables.
+
+        Reads GITHUB_REF_CACHE_TTL (0 disables the cache) and GITHUB_REF_CACHE_SIZE.
+
+        Returns:
+            Configured RefCache, or None if disabled
+        """
+        load_dotenv()
+        ttl = float(os.getenv("GITHUB_REF_CACHE_TTL", "10"))
+        if ttl <= 0:
+            return None
+        return cls(max_entries=int(os.getenv("GITHUB_REF_CACHE_SIZE", "1024")), ttl=ttl)
+
+    @staticmethod
+    def make_key(owner: str, repo: str, ref: str) -> Tuple[str, str]:
+        return f"{owner}/{repo}".lower(), ref
+
+    def get(self, owner: str, repo: str, ref: str) -> Optional[str]:
+        """Look up a resolved ref.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ref: Branch, tag or other ref expression
+
+        Returns:
+            Commit SHA, or None if missing or expired
+        """
+        key = self.make_key(owner, repo, ref)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None or self._clock() - item[0] > self.ttl:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def put(self, owner: str, repo: str, ref: str, sha: str) -> None:
+        """Store a resolved ref, evicting the least recently used entries.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ref: Branch, tag or other ref expression
+            sha: Commit SHA the ref points at
+        """
+        key = self.make_key(owner, repo, ref)
+        with self._lock:
+            self._entries[key] = (self._clock(), sha)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, owner: str, repo: str) -> None:
+        """Drop every resolved ref of a repository.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+        """
+        name = f"{owner}/{repo}".lower()
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == name]:
+                del self._entries[key]
+                self.invalidated += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics.
+
+        Returns:
+            Dictionary with size, limits and hit/miss/invalidation counters
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidated": self.invalidated,
+            }
+
+
+class ShaCache:
+    """LRU cache of results derived from content at an immutable SHA.
+
+    Keys include a commit (or blob/tree) SHA, so entries are never stale
+    and never expire; the cache is only bounded by its entry count.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """Initialize SHA-keyed cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "ShaCache":
+        """Create a SHA-keyed cache from GITHUB_SHA_CACHE_SIZE."""
+        load_dotenv()
+        return cls(max_entries=int(os.getenv("GITHUB_SHA_CACHE_SIZE", "4096")))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Look up a cached result.
+
+        Args:
+            key: Key containing the SHA the result was derived from
+
+        Returns:
+            Cached result, or None
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a result, evicting the least recently used entries.
+
+        Args:
+            key: Key containing the SHA the result was derived from
+            value: Result to cache
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache statistics.
+
+        Returns:
+            Dictionary with size, limit and hit/miss counters
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_sha_cache: Optional[ShaCache] = None
+_sha_cache_lock = threading.Lock()
+
+
+def get_sha_cache() -> ShaCache:
+    """Get the process-wide SHA-keyed cache, creating it on first use."""
+    global _sha_cache
+    if _sha_cache is None:
+        with _sha_cache_lock:
+            if _sha_cache is None:
+                _sha_cache = ShaCache.from_env()
+    return _sha_cache
@@ -0,0 +1,140 @@
+"""In-memory TTL/LRU cache of resolved Repository objects."""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+from github.Repository import Repository
+
+
+class RepositoryCache:
+    """Bounded cache of Repository objects keyed by ``owner/repo``.
+
+    Entries expire ``ttl`` seconds after they were stored; when the cache is
+    full the least recently used entry is dropped. Write tools invalidate
+    the repository they touched so metadata such as ``updated_at`` and
+    ``size`` is re-fetched on the next read.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize repository cache.
+
+        Args:
+            max_entries: Maximum number of cached repositories
+            ttl: Seconds a cached repository stays valid
+            clock: Monotonic clock returning seconds
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Repository]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        self.invalidated = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["RepositoryCache"]:
+        """Create a repository cache from environment variables.
+
+        Reads GITHUB_REPO_CACHE_TTL (0 disables the cache) and GITHUB_REPO_CACHE_SIZE.
+
+        Returns:
+            Configured RepositoryCache, or None if disabled
+        """
+        load_dotenv()
+        ttl = float(os.getenv("GITHUB_REPO_CACHE_TTL", "60"))
+        if ttl <= 0:
+            return None
+        return cls(max_entries=int(os.getenv("GITHUB_REPO_CACHE_SIZE", "128")), ttl=ttl)
+
+    @staticmethod
+    def make_key(owner: str, repo: str) -> str:
+        """Build the cache key of a repository (GitHub names are case-insensitive)."""
+        return f"{owner}/{repo}".lower()
+
+    def get(self, owner: str, repo: str) -> Optional[Repository]:
+        """Look up a cached repository.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            Cached Repository, or None if missing or expired
+        """
+        key = self.make_key(owner, repo)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            stored_at, repository = item
+            if self._clock() - stored_at > self.ttl:
+                del self._entries[key]
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return repository
+
+    def put(self, owner: str, repo: str, repository: Repository) -> None:
+        """Store a repository, evicting the least recently used entries.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            repository: Resolved Repository object
+        """
+        key = self.make_key(owner, repo)
+        with self._lock:
+            self._entries[key] = (self._clock(), repository)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+
+    def invalidate(self, owner: str, repo: str) -> None:
+        """Drop a repository from the cache.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+        """
+        with self._lock:
+            if self._entries.pop(self.make_key(owner, repo), None) is not None:
+                self.invalidated += 1
+
+    def clear(self) -> None:
+        """Drop every cached repository."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics.
+
+        Returns:
+            Dictionary with size, limits and hit/miss/eviction counters
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evicted": self.evicted,
+                "invalidated": self.invalidated,
+            }
@@ -2,9 +2,17 @@
 
 import json
 import re
-from typing import Any, Optional
-
-from github_client import GitHubClient
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlencode
+
+from blob_store import get_blob_store
+from client_pool import get_github_client, lease_clients
+from contents import get_contents_at
+from diff_store import fetch_diff, get_diff_store, read_diff_section
+from file_range import CONTENTS_API_LIMIT, has_range, read_contents, read_file_range
+from ref_resolver import get_sha_cache
+from snapshot_store import get_snapshot_store
+from tree_cache import fetch_tree, filter_tree, get_tree_cache
 from utils import is_text, format_file_size, is_binary_file
 
 
@@ -12,20 +20,30 @@ def parse_gh_uri(uri: str) -> tuple[str, str, str, Optional[str]]:
     """Parse GitHub URI to extract owner, repo, path, and optional ref.
 
     Args:
-        uri: GitHub URI (gh-file://owner/repo/path or gh-pr-diff://owner/repo/number)
+        uri: GitHub URI (gh-file://owner/repo/path, gh-tree://owner/repo[/path]
+            or gh-pr-diff://owner/repo/number)
 
     Returns:
         Tuple of (owner, repo, path, ref)
         """
-    # gh-file://owner/repo/path[?ref=branch]
-    file_pattern = r"^gh-file://([^/]+)/([^/]+)/(.+?)(?:\?ref=([^&]+))?$"
+    # gh-file://owner/repo/path[?ref=branch&offset=...]
+    file_pattern = r"^gh-file://([^/?]+)/([^/?]+)/([^?]+)(?:\?(.*))?$"
     file_match = re.match(file_pattern, uri)
     if file_match:
-        owner, repo, path, ref = file_match.groups()
-        return owner, repo, path, ref or "HEAD"
-
-    # gh-pr-diff://owner/repo/number
-    pr_pattern = r"^gh-pr-diff://([^/]+)/([^/]+)/(.+)$"
+        owner, repo, path, query = file_match.groups()
+        ref = parse_qs(query or "").get("ref", ["HEAD"])[0]
+        return owner, repo, path, ref
+
+    # gh-tree://owner/repo[/path][?ref=branch&pattern=...&depth=...]
+    tree_pattern = r"^gh-tree://([^/?]+)/([^/?]+)/?([^?]*)(?:\?(.*))?$"
+    tree_match = re.match(tree_pattern, uri)
+    if tree_match:
+        owner, repo, path, query = tree_match.groups()
+        ref = parse_qs(query or "").get("ref", ["HEAD"])[0]
+        return owner, repo, path.strip("/"), ref
+
+    # gh-pr-diff://owner/repo/number[?file=...&hunk_start=...&hunk_end=...]
+    pr_pattern = r"^gh-pr-diff://([^/?]+)/([^/?]+)/([^/?]+)(?:\?.*)?$"
     pr_match = re.match(pr_pattern, uri)
     if pr_match:
         owner, repo, number = pr_match.groups()
@@ -34,71 +52,211 @@ def parse_gh_uri(uri: str) -> tuple[str, str, str, Optional[str]]:
     raise ValueError(f"Unsupported URI scheme: {uri}")
 
 
-def get_pr_diff_resource(owner: str, repo: str, number: str) -> dict[str, Any]:
-    """Get PR diff as a resource.
+RANGE_PARAMS = ("offset", "length", "start_line", "end_line")
+
+
+def parse_gh_uri_range(uri: str) -> Dict[str, int]:
+    """Parse the byte or line range of a gh-file URI.
+
+    Args:
+        uri: GitHub file URI, e.g. gh-file://owner/repo/path?start_line=10&end_line=20
+
+    Returns:
+        Dictionary of the range parameters present in the URI
+
+    Raises:
+        ValueError: If a range parameter is not an integer
+    """
+    _, _, query = uri.partition("?")
+    params = parse_qs(query)
+    try:
+        return {name: int(params[name][0]) for name in RANGE_PARAMS if name in params}
+    except ValueError:
+        raise ValueError(f"Range parameters must be integers: {uri}") from None
+
+
+def parse_gh_tree_params(uri: str) -> Dict[str, Any]:
+    """Parse the ``pattern`` and ``depth`` filters of a gh-tree URI.
+
+    Args:
+        uri: GitHub tree URI, e.g. gh-tree://owner/repo/src?pattern=*.py&depth=2
+
+    Returns:
+        Dictionary of the filters present in the URI
+
+    Raises:
+        ValueError: If depth is not an integer
+    """
+    _, _, query = uri.partition("?")
+    params = parse_qs(query)
+    filters: Dict[str, Any] = {}
+    if "pattern" in params:
+        filters["pattern"] = params["pattern"][0]
+    if "depth" in params:
+        try:
+            filters["depth"] = int(params["depth"][0])
+        except ValueError:
+            raise ValueError(f"depth must be an integer: {uri}") from None
+    return filters
+
+
+def parse_gh_pr_diff_params(uri: str) -> Dict[str, Any]:
+    """Parse the file and hunk range of a gh-pr-diff URI.
+
+    Args:
+        uri: GitHub PR diff URI, e.g. gh-pr-diff://owner/repo/1?file=src/app.py&hunk_start=2
+
+    Returns:
+        Dictionary of the parameters present in the URI
+
+    Raises:
+        ValueError: If a hunk bound is not an integer
+    """
+    _, _, query = uri.partition("?")
+    params = parse_qs(query)
+    selection: Dict[str, Any] = {}
+    if "file" in params:
+        selection["file"] = params["file"][0]
+    try:
+        for name in ("hunk_start", "hunk_end"):
+            if name in params:
+                selection[name] = int(params[name][0])
+    except ValueError:
+        raise ValueError(f"Hunk bounds must be integers: {uri}") from None
+    return selection
+
+
+def gh_uri(scheme: str, owner: str, repo: str, path: str, **query: Any) -> str:
+    """Build a gh-* resource URI, leaving out query parameters that are None.
 
     Args:
+        scheme: URI scheme, e.g. ``gh-file``
         owner: Repository owner
         repo: Repository name
-        number: PR number
+        path: Path (or PR number) after the repository
+        **query: Query parameters such as ref or a range
+
+    Returns:
+        Resource URI
+    """
+    uri = f"{scheme}://{owner}/{repo}/{path}"
+    query = {name: value for name, value in query.items() if value is not None}
+    return f"{uri}?{urlencode(query)}" if query else uri
+
+
+def _file_uri(owner: str, repo: str, path: str, ref: str, **range_params: Any) -> str:
+    return gh_uri("gh-file", owner, repo, path, ref=ref, **range_params)
+
+
+def read_gh_resource(uri: str) -> dict[str, Any]:
+    """Read a resource by its full URI, including the query string.
+
+    The ref, any byte or line range (gh-file), the tree filters
+    (gh-tree) and the file and hunk range (gh-pr-diff) are parsed from the
+    query here and passed on to the handler, so a ranged URI never returns
+    the whole file.
+
+    Args:
+        uri: gh-file://, gh-tree:// or gh-pr-diff:// resource URI
 
     Returns:
         Resource data with content and metadata
+
+    Raises:
+        ValueError: If the URI scheme or its query parameters are invalid
     """
-    try:
-        client = GitHubClient()
-        repository = client.get_repository(owner, repo)
-        pull_request = repository.get_pull(int(number))
+    owner, repo, path, ref = parse_gh_uri(uri)
+    if uri.startswith("gh-file://"):
+        return get_file_resource(owner, repo, path, ref, **parse_gh_uri_range(uri))
+    if uri.startswith("gh-tree://"):
+        return get_tree_resource(owner, repo, path, ref, **parse_gh_tree_params(uri))
+    if uri.startswith("gh-pr-diff://"):
+        return get_pr_diff_resource(owner, repo, path, **parse_gh_pr_diff_params(uri))
+    raise ValueError(f"Unsupported URI scheme: {uri}")
 
-        # Get diff
-        diff = pull_request.get_files()
 
-        diff_data = []
-        total_additions = 0
-        total_deletions = 0
+@lease_clients
+def get_pr_diff_resource(
+    owner: str,
+    repo: str,
+    number: str,
+    file: Optional[str] = None,
+    hunk_start: Optional[int] = None,
+    hunk_end: Optional[int] = None,
+) -> dict[str, Any]:
+    """Get PR diff as a resource, backed by the stored full diff.
 
-        for file in diff:
-            # 트렁케이션 정보 추가
-            patch_content = file.patch[:2000] if file.patch else None
-            truncated = len(file.patch) > 2000 if file.patch else False
+    Without ``file`` the per-file index of the complete diff is returned,
+    each entry with the URI of its section. With ``file`` (index or path)
+    the untruncated diff text of that file, or of hunks
+    ``hunk_start``..``hunk_end`` of it, is returned.
 
-            file_data = {
-                "filename": file.filename,
-                "status": file.status,
-                "additions": file.additions,
-                "deletions": file.deletions,
-                "changes": file.changes,
-                "patch": patch_content,
-                "truncated": truncated,
-                "original_length": len(file.patch) if file.patch else 0,
-                "raw_url": file.raw_url,
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        number: PR number
+        file: File index in the diff, or its path
+        hunk_start: First hunk of the file (0-based, inclusive)
+        hunk_end: Last hunk of the file (inclusive, default: last)
+
+    Returns:
+        Resource data with content and metadata
+    """
+    uri = gh_uri(
+        "gh-pr-diff", owner, repo, str(number),
+        file=file, hunk_start=hunk_start, hunk_end=hunk_end,
+    )
+    try:
+        client = get_github_client()
+        store = get_diff_store()
+
+        if file is not None:
+            entry, offset, end, data = read_diff_section(
+                client, store, owner, repo, int(number), file, hunk_start, hunk_end
+            )
+            content = data.decode("utf-8", errors="replace")
+            metadata = {
+                "name": f"PR #{number} Diff: {entry.path}",
+                "description": f"Diff of {entry.path} in pull request #{number} of {owner}/{repo}",
+                "mime_type": "text/x-diff",
+                "size": end - offset,
+                "uri": uri,
+                "source": f"https://github.com/{owner}/{repo}/pull/{number}/files",
+                "file": entry.to_dict(),
+                "hunks": [hunk.to_dict(i) for i, hunk in enumerate(entry.hunks)],
             }
+            return {"content": content, "metadata": metadata}
+
+        stored = fetch_diff(client, store, owner, repo, int(number))
+        diff_data = []
+        for entry in stored.files:
+            file_data = entry.to_dict()
+            file_data["uri"] = gh_uri("gh-pr-diff", owner, repo, str(number), file=entry.index)
             diff_data.append(file_data)
-            total_additions += file.additions
-            total_deletions += file.deletions
+        total_additions = sum(entry.additions for entry in stored.files)
+        total_deletions = sum(entry.deletions for entry in stored.files)
 
         # Create summary
-        summary = f"""Pull Request #{number}: {pull_request.title}
-Repository: {repository.full_name}
-Author: @{pull_request.user.login}
-State: {pull_request.state}
-Files changed: {len(diff_data)}
+        summary = f"""Pull Request #{number} full diff: {len(diff_data)} files, {format_file_size(stored.size)}
+Repository: {owner}/{repo}
 Total additions: +{total_additions}
 Total deletions: -{total_deletions}
 
 Changed files:
 """
-        for file in diff_data[:10]:  # Show first 10 files
-            summary += f"  {file['filename']} ({file['status']}) +{file['additions']} -{file['deletions']}\n"
+        for file_data in diff_data[:10]:  # Show first 10 files
+            summary += f"  [{file_data['index']}] {file_data['path']} ({file_data['status']}) +{file_data['additions']} -{file_data['deletions']}\n"
 
         if len(diff_data) > 10:
             summary += f"\n... and {len(diff_data) - 10} more files"
+        summary += "\nRead a file's `uri` for its complete diff"
 
         data = {
             "summary": summary,
             "data": diff_data,
             "success": True,
             "file_count": len(diff_data),
+            "size": stored.size,
             "total_additions": total_additions,
             "total_deletions": total_deletions,
         }
@@ -111,7 +269,7 @@ Changed files:
             "description": f"Diff for pull request #{number} in {owner}/{repo}",
             "mime_type": "application/json",
             "size": len(resource_data),  # 실제 반환 크기
-            "uri": f"gh-pr-diff://{owner}/{repo}/{number}",
+            "uri": uri,
             "source": f"https://github.com/{owner}/{repo}/pull/{number}",
         }
 
@@ -121,7 +279,7 @@ Changed files:
         error_data = {
             "error": str(e),
             "success": False,
-            "uri": f"gh-pr-diff://{owner}/{repo}/{number}",
+            "uri": uri,
         }
 
         resource_data = json.dumps(error_data, indent=2)
@@ -131,15 +289,23 @@ Changed files:
             "description": f"Error retrieving diff for PR #{number}",
             "mime_type": "application/json",
             "size": len(resource_data),
-            "uri": f"gh-pr-diff://{owner}/{repo}/{number}",
+            "uri": uri,
             "error": True,
         }
 
         return {"content": resource_data, "metadata": metadata}
 
 
+@lease_clients
 def get_file_resource(
-    owner: str, repo: str, path: str, ref: str = "HEAD"
+    owner: str,
+    repo: str,
+    path: str,
+    ref: str = "HEAD",
+    offset: Optional[int] = None,
+    length: Optional[int] = None,
+    start_line: Optional[int] = None,
+    end_line: Optional[int] = None,
 ) -> dict[str, Any]:
     """Get file or directory as a resource.
 
@@ -148,16 +314,27 @@ def get_file_resource(
         repo: Repository name
         path: File path in repository
         ref: Git reference (branch, tag, or commit SHA)
+        offset: First byte of a byte range
+        length: Bytes in a byte range
+        start_line: First line of a line range (1-based)
+        end_line: Last line of a line range (inclusive)
 
     Returns:
         Resource data with content and metadata
     """
+    uri = _file_uri(
+        owner, repo, path, ref,
+        offset=offset, length=length, start_line=start_line, end_line=end_line,
+    )
     try:
-        client = GitHubClient()
+        client = get_github_client()
         repository = client.get_repository(owner, repo)
+        resolved = client.resolve_ref(owner, repo, ref)
+        snapshots = get_snapshot_store()
+        snapshot = snapshots.snapshot(client, repository, owner, repo, resolved) if snapshots else None
 
         # Get file content
-        file_content = repository.get_contents(path, ref=ref)
+        file_content = get_contents_at(repository, path, resolved, get_sha_cache(), snapshot)
 
         if isinstance(file_content, list):
             # Directory
@@ -208,14 +385,25 @@ Contents:
                 "uri": f"gh-file://{owner}/{repo}/{path}?ref={ref}",
                 "source": f"https://github.com/{owner}/{repo}/tree/{ref}/{path}",
                 "type": "directory",
+                "resolved_sha": resolved,
             }
 
             return {"content": resource_data, "metadata": metadata}
 
+        elif has_range(offset, length, start_line, end_line):
+            return _file_range_resource(
+                client, owner, repo, ref, resolved, uri, file_content,
+                offset, length, start_line, end_line,
+            )
+
         else:
             # Single file
-            content = file_content.decoded_content
-            is_text_content = is_text(content)
+            if file_content.size < CONTENTS_API_LIMIT:
+                content = read_contents(file_content, get_blob_store())
+                is_text_content = is_text(content)
+            else:
+                content = None
+                is_text_content = not is_binary_file(file_content.name)
 
             # 바이너리 감지 개선
             is_binary = is_binary_file(file_content.name) or (
@@ -237,7 +425,7 @@ Contents:
                 "is_binary": is_binary,
             }
 
-            if is_text_content and file_content.size < 1024 * 1024:  # Less than 1MB
+            if is_text_content and content is not None:
                 try:
                     file_data["content"] = content.decode("utf-8")
                     file_data["content_size"] = len(
@@ -249,8 +437,11 @@ Contents:
             else:
                 file_data["content"] = None
                 file_data["content_size"] = 0
-                if file_content.size >= 1024 * 1024:
-                    file_data["content_note"] = "File too large to display (>1MB)"
+                if content is None:
+                    file_data["content_note"] = (
+                        "File too large to display (>1MB); "
+                        "add offset/length or start_line/end_line to the URI to read a range"
+                    )
                 elif is_binary:
                     file_data["content_note"] = "Binary file - content not displayed"
                 else:
@@ -294,6 +485,7 @@ Type: {"Text" if is_text_content else "Binary"}
                 "type": "file",
                 "original_size": file_content.size,
                 "content_size": file_data["content_size"],
+                "resolved_sha": resolved,
             }
 
             return {"content": resource_data, "metadata": metadata}
@@ -302,7 +494,7 @@ Type: {"Text" if is_text_content else "Binary"}
         error_data = {
             "error": str(e),
             "success": False,
-            "uri": f"gh-file://{owner}/{repo}/{path}?ref={ref}",
+            "uri": uri,
         }
 
         resource_data = json.dumps(error_data, indent=2)
@@ -312,7 +504,143 @@ Type: {"Text" if is_text_content else "Binary"}
             "description": f"Error retrieving file {path}",
             "mime_type": "application/json",
             "size": len(resource_data),
-            "uri": f"gh-file://{owner}/{repo}/{path}?ref={ref}",
+            "uri": uri,
+            "error": True,
+        }
+
+        return {"content": resource_data, "metadata": metadata}
+
+
+def _file_range_resource(
+    client: Any,
+    owner: str,
+    repo: str,
+    ref: str,
+    resolved: str,
+    uri: str,
+    file_content: Any,
+    offset: Optional[int],
+    length: Optional[int],
+    start_line: Optional[int],
+    end_line: Optional[int],
+) -> dict[str, Any]:
+    """Build the resource for a byte or line range of a file."""
+    part = read_file_range(
+        client, owner, repo, file_content, offset, length, start_line, end_line,
+        store=get_blob_store(),
+    )
+    file_data = {
+        "name": file_content.name,
+        "path": file_content.path,
+        "type": file_content.type,
+        "original_size": file_content.size,
+        "size_formatted": format_file_size(file_content.size),
+        "sha": file_content.sha,
+        "url": file_content.html_url,
+        "download_url": file_content.download_url,
+        "is_binary": part["content_encoding"] == "base64",
+        **part,
+    }
+    data = {
+        "summary": f"File: {file_content.path} ({part['length']} bytes from offset {part['offset']})",
+        "data": file_data,
+        "success": True,
+        "type": "file",
+        "file_size": file_content.size,
+    }
+    resource_data = json.dumps(data, indent=2)
+
+    metadata = {
+        "name": f"File: {file_content.path}",
+        "description": f"File range of {file_content.path} in {owner}/{repo}",
+        "mime_type": "application/json",
+        "size": len(resource_data),
+        "uri": uri,
+        "source": f"https://github.com/{owner}/{repo}/blob/{ref}/{file_content.path}",
+        "type": "file",
+        "original_size": file_content.size,
+        "content_size": part["length"],
+        "resolved_sha": resolved,
+    }
+
+    return {"content": resource_data, "metadata": metadata}
+
+
+@lease_clients
+def get_tree_resource(
+    owner: str,
+    repo: str,
+    path: str = "",
+    ref: str = "HEAD",
+    pattern: Optional[str] = None,
+    depth: Optional[int] = None,
+) -> dict[str, Any]:
+    """Get the recursive tree listing of a directory as a resource.
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        path: Directory to list (default: repository root)
+        ref: Git reference (branch, tag, or commit SHA)
+        pattern: Glob matched against full paths
+        depth: Maximum depth below ``path``
+
+    Returns:
+        Resource data with content and metadata
+    """
+    query: Dict[str, Any] = {"ref": ref}
+    if pattern is not None:
+        query["pattern"] = pattern
+    if depth is not None:
+        query["depth"] = depth
+    uri = f"gh-tree://{owner}/{repo}/{path}?{urlencode(query)}"
+    try:
+        client = get_github_client()
+        repository = client.get_repository(owner, repo)
+        resolved = client.resolve_ref(owner, repo, ref)
+        snapshots = get_snapshot_store()
+        snapshot = snapshots.snapshot(client, repository, owner, repo, resolved) if snapshots else None
+        tree_sha, entries = fetch_tree(repository, resolved, get_tree_cache(), snapshot=snapshot)
+        selected = filter_tree(entries, path, pattern, depth)
+
+        data = {
+            "summary": f"Tree: {path or '/'} ({len(selected)} entries at tree {tree_sha[:7]})",
+            "data": selected,
+            "success": True,
+            "type": "tree",
+            "tree_sha": tree_sha,
+            "entry_count": len(selected),
+        }
+        resource_data = json.dumps(data, indent=2)
+
+        metadata = {
+            "name": f"Tree: {path or '/'}",
+            "description": f"Recursive tree listing of {path or '/'} in {owner}/{repo}",
+            "mime_type": "application/json",
+            "size": len(resource_data),
+            "uri": uri,
+            "source": f"https://github.com/{owner}/{repo}/tree/{ref}/{path}",
+            "type": "tree",
+            "resolved_sha": resolved,
+        }
+
+        return {"content": resource_data, "metadata": metadata}
+
+    except Exception as e:
+        error_data = {
+            "error": str(e),
+            "success": False,
+            "uri": uri,
+        }
+
+        resource_data = json.dumps(error_data, indent=2)
+
+        metadata = {
+            "name": f"Tree Error: {path or '/'}",
+            "description": f"Error retrieving tree {path or '/'}",
+            "mime_type": "application/json",
+            "size": len(resource_data),
+            "uri": uri,
             "error": True,
         }
 
@@ -4,13 +4,24 @@ import argparse
 from typing import Any
 
 from fastmcp import FastMCP
-from tools_read import get_repo, list_pull_requests, get_pr_diff, get_file
+from tools_read import (
+    get_repo,
+    list_pull_requests,
+    get_pr_diff,
+    get_pr_full_diff,
+    get_file,
+    get_files,
+    get_tree,
+)
 from tools_write import (
     create_or_update_file, 
     delete_file, 
     create_branch, 
     create_commit_with_multiple_files,
-    get_repository_status
+    get_repository_status,
+    sync_directory,
+    move_files,
+    copy_files
 )
 from tools_local_git import (
     get_git_status,
@@ -23,7 +34,14 @@ from tools_local_git import (
     get_current_branch,
     get_remote_info
 )
-from resources import get_pr_diff_resource, get_file_resource
+from resources import gh_uri, read_gh_resource
+from client_pool import get_client_registry
+from blob_store import get_blob_store
+from diff_store import get_diff_store
+from path_index import get_path_index
+from ref_resolver import get_sha_cache
+from snapshot_store import get_snapshot_store
+from tree_cache import get_tree_cache
 
 
 def main() -> None:
@@ -42,30 +60,181 @@ def main() -> None:
 
     # Register tools using decorators
     @server.tool
-    def health() -> dict[str, str]:
-        """Health check tool."""
-        return {"status": "ok"}
+    def health() -> dict[str, Any]:
+        """Health check tool with connection pool, cache and store statistics."""
+        blob_store = get_blob_store()
+        snapshot_store = get_snapshot_store()
+        path_index = get_path_index()
+        return {
+            "status": "ok",
+            "github": get_client_registry().stats(),
+            "diff_store": get_diff_store().stats(),
+            "tree_cache": get_tree_cache().stats(),
+            "sha_cache": get_sha_cache().stats(),
+            "blob_store": blob_store.stats() if blob_store else None,
+            "snapshot_store": snapshot_store.stats() if snapshot_store else None,
+            "path_index": path_index.stats() if path_index else None,
+        }
+
+    # Resources (쿼리 파라미터는 템플릿에 선언해야 전달되므로 URI를 다시 만들어 파싱)
+    @server.resource("gh-file://{owner}/{repo}/{path*}{?ref,offset,length,start_line,end_line}")
+    def ghFile(
+        owner: str,
+        repo: str,
+        path: str,
+        ref: str = "HEAD",
+        offset: str = None,
+        length: str = None,
+        start_line: str = None,
+        end_line: str = None
+    ) -> dict[str, Any]:
+        """File or directory at a ref, optionally a byte or line range of a file."""
+        return read_gh_resource(gh_uri(
+            "gh-file", owner, repo, path, ref=ref,
+            offset=offset, length=length, start_line=start_line, end_line=end_line,
+        ))
+
+    @server.resource("gh-tree://{owner}/{repo}{?ref,pattern,depth}")
+    def ghTreeRoot(
+        owner: str, repo: str, ref: str = "HEAD", pattern: str = None, depth: str = None
+    ) -> dict[str, Any]:
+        """Recursive tree listing of a repository, filtered by glob pattern and depth."""
+        return read_gh_resource(gh_uri("gh-tree", owner, repo, "", ref=ref, pattern=pattern, depth=depth))
+
+    @server.resource("gh-tree://{owner}/{repo}/{path*}{?ref,pattern,depth}")
+    def ghTree(
+        owner: str, repo: str, path: str, ref: str = "HEAD", pattern: str = None, depth: str = None
+    ) -> dict[str, Any]:
+        """Recursive tree listing of a directory, filtered by glob pattern and depth."""
+        return read_gh_resource(gh_uri("gh-tree", owner, repo, path, ref=ref, pattern=pattern, depth=depth))
+
+    @server.resource("gh-pr-diff://{owner}/{repo}/{number}{?file,hunk_start,hunk_end}")
+    def ghPRDiff(
+        owner: str, repo: str, number: str, file: str = None, hunk_start: str = None, hunk_end: str = None
+    ) -> dict[str, Any]:
+        """Index of a pull request's full diff, or the complete diff of one file or hunk range."""
+        return read_gh_resource(gh_uri(
+            "gh-pr-diff", owner, repo, number, file=file, hunk_start=hunk_start, hunk_end=hunk_end
+        ))
 
     # Read tools
     @server.tool
-    def getRepo(owner: str, repo: str) -> dict[str, Any]:
-        """Get repository information from GitHub."""
-        return get_repo(owner, repo)
+    def getRepo(
+        owner: str, repo: str, fields: list[str] = None, output: str = None
+    ) -> dict[str, Any]:
+        """Get repository information from GitHub (optionally only `fields`).
+
+        Read tools take `output`: "json" (indented string, default), "compact"
+        (unindented string), "native" (structured `data`) or "columnar" (native,
+        with lists of objects as `columns`/`rows`).
+        """
+        return get_repo(owner, repo, fields, output)
+
+    @server.tool
+    def listPullRequests(
+        owner: str,
+        repo: str,
+        state: str = "open",
+        backend: str = "graphql",
+        limit: int = 30,
+        cursor: str = None,
+        sort: str = "created",
+        direction: str = "desc",
+        fields: list[str] = None,
+        output: str = None,
+    ) -> dict[str, Any]:
+        """List pull requests for a repository, up to `limit` per call.
+
+        Pass the returned `next_cursor` as `cursor` to fetch the next page.
+        `fields` limits each PR to the given attributes.
+        """
+        return list_pull_requests(
+            owner, repo, state, backend, limit, cursor, sort, direction, fields, output
+        )
+
+    @server.tool
+    def getPRDiff(
+        owner: str,
+        repo: str,
+        number: int,
+        fields: list[str] = None,
+        mode: str = "files",
+        file: str = None,
+        hunk_start: int = None,
+        hunk_end: int = None,
+        max_bytes: int = 256 * 1024,
+        output: str = None,
+    ) -> dict[str, Any]:
+        """Get diff for a specific pull request.
+
+        mode="files" lists changed files with patches cut to 1000 characters
+        (optionally only per-file `fields`). mode="full" returns an index of the
+        complete diff; pass `file` (index or path) and optionally a hunk range
+        to read that part of the diff untruncated.
+        """
+        if mode == "full":
+            return get_pr_full_diff(
+                owner, repo, number, file, hunk_start, hunk_end, max_bytes, output
+            )
+        if mode != "files":
+            error = f"Unknown mode '{mode}'. Use 'files' or 'full'"
+            return {"summary": f"Error: {error}", "data": "", "success": False, "error": error}
+        return get_pr_diff(owner, repo, number, fields, output)
 
     @server.tool
-    def listPullRequests(owner: str, repo: str, state: str = "open") -> dict[str, Any]:
-        """List pull requests for a repository."""
-        return list_pull_requests(owner, repo, state)
+    def getFile(
+        owner: str,
+        repo: str,
+        path: str,
+        ref: str = "HEAD",
+        offset: int = None,
+        length: int = None,
+        start_line: int = None,
+        end_line: int = None,
+        output: str = None,
+    ) -> dict[str, Any]:
+        """Get file content from a repository.
+
+        Pass `offset`/`length` (bytes) or `start_line`/`end_line` to read only
+        part of a file; files over 1MB can only be read this way. The result
+        echoes `resolved_sha`; passing it as `ref` pins later reads to that commit.
+        """
+        return get_file(
+            owner, repo, path, ref, offset, length, start_line, end_line, output
+        )
 
     @server.tool
-    def getPRDiff(owner: str, repo: str, number: int) -> dict[str, Any]:
-        """Get diff for a specific pull request."""
-        return get_pr_diff(owner, repo, number)
+    def getFiles(
+        owner: str,
+        repo: str,
+        paths: list[str],
+        ref: str = "HEAD",
+        output: str = None,
+    ) -> dict[str, Any]:
+        """Get up to 100 files in one call, all at the same commit.
+
+        Each path gets its own result; a missing path is reported in its entry
+        without failing the others.
+        """
+        return get_files(owner, repo, paths, ref, output)
 
     @server.tool
-    def getFile(owner: str, repo: str, path: str, ref: str = "HEAD") -> dict[str, Any]:
-        """Get file content from a repository."""
-        return get_file(owner, repo, path, ref)
+    def getTree(
+        owner: str,
+        repo: str,
+        ref: str = "HEAD",
+        path: str = "",
+        pattern: str = None,
+        depth: int = None,
+        limit: int = 1000,
+        output: str = None,
+    ) -> dict[str, Any]:
+        """List files and directories below `path` recursively in one call.
+
+        `pattern` is a glob on full paths (e.g. "*.py"), `depth` limits how far
+        below `path` to list (1 = direct children).
+        """
+        return get_tree(owner, repo, ref, path, pattern, depth, limit, output)
 
     # Write tools
     @server.tool
@@ -119,11 +288,55 @@ def main() -> None:
         committer_name: str = None,
         committer_email: str = None
     ) -> dict[str, Any]:
-        """Create a commit with multiple file changes."""
+        """Create a commit with multiple file changes (operation: create, update or delete)."""
         return create_commit_with_multiple_files(
             owner, repo, files, message, branch, committer_name, committer_email
         )
 
+    @server.tool
+    def syncDirectory(
+        owner: str,
+        repo: str,
+        local_path: str,
+        remote_prefix: str = "",
+        branch: str = "main",
+        message: str = None,
+        delete_missing: bool = False,
+        committer_name: str = None,
+        committer_email: str = None
+    ) -> dict[str, Any]:
+        """Upload only new or changed files of a local directory in one commit."""
+        return sync_directory(
+            owner, repo, local_path, remote_prefix, branch, message,
+            delete_missing, committer_name, committer_email
+        )
+
+    @server.tool
+    def moveFiles(
+        owner: str,
+        repo: str,
+        files: list,
+        message: str,
+        branch: str = "main",
+        committer_name: str = None,
+        committer_email: str = None
+    ) -> dict[str, Any]:
+        """Move or rename files and directories in one commit without transferring content."""
+        return move_files(owner, repo, files, message, branch, committer_name, committer_email)
+
+    @server.tool
+    def copyFiles(
+        owner: str,
+        repo: str,
+        files: list,
+        message: str,
+        branch: str = "main",
+        committer_name: str = None,
+        committer_email: str = None
+    ) -> dict[str, Any]:
+        """Copy files and directories in one commit without transferring content."""
+        return copy_files(owner, repo, files, message, branch, committer_name, committer_email)
+
     @server.tool
     def getRepositoryStatus(
         owner: str, 
@@ -0,0 +1,80 @@
+"""Coalescing of identical concurrent requests into one in-flight call."""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """One in-flight call and the outcome shared with its followers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time across threads.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive with the same key while it is in flight wait for it and receive
+    the same result or exception instead of issuing their own request.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.collapsed = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> Tuple[T, bool]:
+        """Run ``func`` unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the call
+            func: Function performing the call
+
+        Returns:
+            Tuple of the result and whether it was shared from another caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.collapsed += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Return coalescing counters.
+
+        Returns:
+            Dictionary with calls made, calls collapsed into them and calls in flight
+        """
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "collapsed": self.collapsed,
+                "in_flight": len(self._calls),
+            }
+
@@ -0,0 +1,458 @@
+"""Local snapshots of mirrored repositories, unpacked from commit tarballs."""
+
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from dotenv import load_dotenv
+from github.Repository import Repository
+
+TARBALL_MEDIA_TYPE = "application/vnd.github+json"
+CHUNK_SIZE = 64 * 1024
+
+FILE_MODE = "100644"
+EXECUTABLE_MODE = "100755"
+SYMLINK_MODE = "120000"
+TREE_MODE = "040000"
+
+# 메모리에 올려 두는 스냅샷 인덱스 수
+LOADED_SNAPSHOTS = 8
+
+SnapshotKey = Tuple[str, str]
+
+
+def git_tree_sha(entries: Sequence[Dict[str, Any]]) -> str:
+    """Compute the SHA git assigns to a tree with the given direct entries.
+
+    Args:
+        entries: Entries with ``path`` (the name within the tree), ``mode``,
+            ``type`` and ``sha``
+
+    Returns:
+        Hex SHA-1 of the tree object
+    """
+    # git 정렬 규칙: 디렉터리는 이름 뒤에 "/"가 붙은 것으로 비교
+    ordered = sorted(
+        entries,
+        key=lambda e: e["path"].encode() + (b"/" if e["type"] == "tree" else b""),
+    )
+    data = b"".join(
+        f"{e['mode'].lstrip('0')} {e['path']}".encode() + b"\0" + bytes.fromhex(e["sha"])
+        for e in ordered
+    )
+    digest = hashlib.sha1(b"tree %d\0" % len(data))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+class Snapshot:
+    """Files of one commit on local disk with a git tree index."""
+
+    def __init__(self, root: Path, sha: str, tree_sha: str, entries: List[Dict[str, Any]]):
+        """Initialize snapshot.
+
+        Args:
+            root: Directory holding the files of the commit
+            sha: Commit SHA
+            tree_sha: Root tree SHA of the commit
+            entries: Every entry below the root tree, in ``fetch_tree`` format
+        """
+        self.root = root
+        self.sha = sha
+        self.tree_sha = tree_sha
+        self.entries = entries
+        self._index = {entry["path"]: entry for entry in entries}
+        self._children: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            self._children.setdefault(entry["path"].rpartition("/")[0], []).append(entry)
+
+    def entry(self, path: str) -> Optional[Dict[str, Any]]:
+        """Get the tree entry at a path (a tree entry for the root)."""
+        path = path.strip("/")
+        if not path:
+            return {"path": "", "type": "tree", "mode": TREE_MODE, "sha": self.tree_sha}
+        return self._index.get(path)
+
+    def children(self, path: str) -> List[Dict[str, Any]]:
+        """Get the direct entries of a directory."""
+        return self._children.get(path.strip("/"), [])
+
+    def file_path(self, path: str) -> Path:
+        """Get the location of a file of the snapshot on disk."""
+        return self.root.joinpath(*path.strip("/").split("/"))
+
+
+def _extract(archive_path: str, target: Path) -> List[Dict[str, Any]]:
+    """Unpack a GitHub tarball into ``target`` and list its entries.
+
+    The top-level ``owner-repo-sha/`` directory of the archive is dropped.
+    Blob SHAs are computed while the files are written; symlinks are
+    recorded in the index only.
+
+    Raises:
+        ValueError: If the archive contains unsafe paths
+    """
+    entries: Dict[str, Dict[str, Any]] = {}
+
+    def add_parents(path: str) -> None:
+        parent = path.rpartition("/")[0]
+        while parent and parent not in entries:
+            entries[parent] = {"path": parent, "type": "tree", "mode": TREE_MODE, "sha": None}
+            parent = parent.rpartition("/")[0]
+
+    with tarfile.open(archive_path, "r:gz") as archive:
+        for member in archive:
+            path = member.name.partition("/")[2].strip("/")
+            if not path:
+                continue
+            if path.startswith("/") or ".." in path.split("/"):
+                raise ValueError(f"Unsafe path in archive: {member.name}")
+            add_parents(path)
+
+            if member.isdir():
+                (target / path).mkdir(parents=True, exist_ok=True)
+                entries[path] = {"path": path, "type": "tree", "mode": TREE_MODE, "sha": None}
+            elif member.isfile():
+                destination = target / path
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                digest = hashlib.sha1(b"blob %d\0" % member.size)
+                source = archive.extractfile(member)
+                with open(destination, "wb") as f:
+                    for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                        f.write(chunk)
+                mode = EXECUTABLE_MODE if member.mode & 0o111 else FILE_MODE
+                entries[path] = {
+                    "path": path, "type": "blob", "mode": mode,
+                    "sha": digest.hexdigest(), "size": member.size,
+                }
+            elif member.issym():
+                data = member.linkname.encode()
+                digest = hashlib.sha1(b"blob %d\0" % len(data))
+                digest.update(data)
+                entries[path] = {
+                    "path": path, "type": "blob", "mode": SYMLINK_MODE,
+                    "sha": digest.hexdigest(), "size": len(data),
+                }
+    return list(entries.values())
+
+
+def _hash_trees(entries: List[Dict[str, Any]]) -> str:
+    """Fill in the SHAs of the tree entries and return the root tree SHA."""
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in entries:
+        children.setdefault(entry["path"].rpartition("/")[0], []).append(entry)
+
+    def named(entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {**entry, "path": entry["path"].rpartition("/")[2]}
+
+    # 깊은 디렉터리부터 계산해 상위 트리가 하위 트리 SHA를 쓸 수 있게 함
+    trees = sorted(
+        (entry for entry in entries if entry["type"] == "tree"),
+        key=lambda entry: entry["path"].count("/"),
+        reverse=True,
+    )
+    for tree in trees:
+        tree["sha"] = git_tree_sha([named(child) for child in children.get(tree["path"], [])])
+    return git_tree_sha([named(child) for child in children.get("", [])])
+
+
+class SnapshotStore:
+    """Size- and age-bounded directory of commit snapshots.
+
+    Each snapshot is the tarball of one commit of an allowlisted
+    repository, unpacked once and verified by recomputing its root tree
+    SHA. Commit content never changes, so snapshots are served without
+    revalidation until they are evicted: when unused for ``max_age``
+    seconds, or least recently used first when the total size exceeds
+    ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        repos: Sequence[str],
+        max_bytes: int = 2 * 1024 * 1024 * 1024,
+        max_age: float = 7 * 24 * 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize snapshot store.
+
+        Args:
+            directory: Directory holding the snapshots (created if missing)
+            repos: ``owner/repo`` names or glob patterns (e.g. ``org/*``) to mirror
+            max_bytes: Maximum total size of unpacked snapshots
+            max_age: Seconds an unused snapshot is kept
+            clock: Wall clock returning seconds (recency is kept in file times)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.repos = [pattern.strip().lower() for pattern in repos if pattern.strip()]
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (크기, 마지막 사용 시각), 오래 사용하지 않은 순
+        self._entries: "OrderedDict[SnapshotKey, Tuple[int, float]]" = OrderedDict()
+        self._loaded: "OrderedDict[SnapshotKey, Snapshot]" = OrderedDict()
+        self._fetching: Dict[SnapshotKey, threading.Lock] = {}
+        self._rejected: set = set()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.downloads = 0
+        self.evicted = 0
+        self.rejected = 0
+        self.failed = 0
+
+        found = []
+        for index_path in self.directory.glob("*/*/*.json"):
+            try:
+                size = json.loads(index_path.read_text())["bytes"]
+            except (OSError, ValueError, KeyError):
+                continue
+            key = (f"{index_path.parent.parent.name}/{index_path.parent.name}", index_path.stem)
+            found.append((index_path.stat().st_mtime, key, size))
+        for used, key, size in sorted(found):
+            self._entries[key] = (size, used)
+            self._total_bytes += size
+
+    @classmethod
+    def from_env(cls) -> Optional["SnapshotStore"]:
+        """Create a snapshot store configured from environment variables.
+
+        Reads GITHUB_SNAPSHOT_REPOS (comma separated; unset disables the
+        store), GITHUB_SNAPSHOT_DIR, GITHUB_SNAPSHOT_MAX_BYTES and
+        GITHUB_SNAPSHOT_MAX_AGE.
+
+        Returns:
+            Configured SnapshotStore, or None if no repository is mirrored
+        """
+        load_dotenv()
+        repos = [name for name in os.getenv("GITHUB_SNAPSHOT_REPOS", "").split(",") if name.strip()]
+        if not repos:
+            return None
+
+        directory = os.getenv("GITHUB_SNAPSHOT_DIR") or str(
+            Path.home() / ".cache" / "mcp-github" / "snapshots"
+        )
+        return cls(
+            directory,
+            repos,
+            max_bytes=int(os.getenv("GITHUB_SNAPSHOT_MAX_BYTES", str(2 * 1024 * 1024 * 1024))),
+            max_age=float(os.getenv("GITHUB_SNAPSHOT_MAX_AGE", str(7 * 24 * 3600))),
+        )
+
+    def mirrors(self, owner: str, repo: str) -> bool:
+        """Check whether a repository is on the allowlist."""
+        name = f"{owner}/{repo}".lower()
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in self.repos)
+
+    def _paths(self, key: SnapshotKey) -> Tuple[Path, Path]:
+        base = self.directory.joinpath(*key[0].split("/"))
+        return base / key[1], base / f"{key[1]}.json"
+
+    def get(self, owner: str, repo: str, sha: str) -> Optional[Snapshot]:
+        """Look up a stored snapshot, counting a hit or miss.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            sha: Commit SHA
+
+        Returns:
+            Snapshot, or None if the commit is not stored
+        """
+        key = (f"{owner}/{repo}".lower(), sha)
+        now = self._clock()
+        with self._lock:
+            self._expire_locked(now)
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self.hits += 1
+            size, _ = self._entries.pop(key)
+            self._entries[key] = (size, now)
+            snapshot = self._loaded.get(key)
+            if snapshot is not None:
+                self._loaded.move_to_end(key)
+                return snapshot
+
+        root, index_path = self._paths(key)
+        try:
+            os.utime(index_path, (now, now))
+            index = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            self._remove(key)
+            return None
+        snapshot = Snapshot(root, sha, index["tree_sha"], index["entries"])
+        with self._lock:
+            self._loaded[key] = snapshot
+            while len(self._loaded) > LOADED_SNAPSHOTS:
+                self._loaded.popitem(last=False)
+        return snapshot
+
+    def snapshot(
+        self, client: Any, repository: Repository, owner: str, repo: str, sha: str
+    ) -> Optional[Snapshot]:
+        """Get the snapshot of a commit, downloading it on first use.
+
+        Only allowlisted repositories are mirrored. Failed or unverifiable
+        downloads return None so that callers fall back to the API.
+
+        Args:
+            client: GitHubClient used to download the tarball
+            repository: Repository the commit belongs to
+            owner: Repository owner
+            repo: Repository name
+            sha: Resolved commit SHA
+
+        Returns:
+            Snapshot, or None if the repository is not mirrored or the
+            snapshot is unavailable
+        """
+        if not self.mirrors(owner, repo):
+            return None
+        key = (f"{owner}/{repo}".lower(), sha)
+        with self._lock:
+            if key in self._rejected:
+                return None
+            fetch_lock = self._fetching.setdefault(key, threading.Lock())
+
+        # 같은 커밋을 동시에 요청하면 한 번만 내려받음
+        with fetch_lock:
+            snapshot = self.get(owner, repo, sha)
+            if snapshot is None:
+                snapshot = self._download(client, repository, key)
+        with self._lock:
+            self._fetching.pop(key, None)
+        return snapshot
+
+    def _download(self, client: Any, repository: Repository, key: SnapshotKey) -> Optional[Snapshot]:
+        root, index_path = self._paths(key)
+        root.parent.mkdir(parents=True, exist_ok=True)
+        work = Path(tempfile.mkdtemp(dir=root.parent, suffix=".tmp"))
+        try:
+            archive_path = work / "archive.tar.gz"
+            with client.stream(f"/repos/{key[0]}/tarball/{key[1]}", TARBALL_MEDIA_TYPE) as response:
+                with open(archive_path, "wb") as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        f.write(chunk)
+            files = work / "files"
+            files.mkdir()
+            entries = _extract(str(archive_path), files)
+            archive_path.unlink()
+            tree_sha = _hash_trees(entries)
+            size = sum(entry.get("size", 0) for entry in entries if entry["mode"] != SYMLINK_MODE)
+
+            # 서브모듈 등으로 트리가 재현되지 않으면 스냅샷을 쓰지 않음
+            if tree_sha != repository.get_git_commit(key[1]).tree.sha or size > self.max_bytes:
+                with self._lock:
+                    self._rejected.add(key)
+                    self.rejected += 1
+                return None
+
+            entries.sort(key=lambda entry: entry["path"])
+            shutil.rmtree(root, ignore_errors=True)  # 인덱스 없이 남은 이전 시도
+            os.replace(files, root)
+            index = {"sha": key[1], "tree_sha": tree_sha, "bytes": size, "entries": entries}
+            index_path.write_text(json.dumps(index, separators=(",", ":")))
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            return None
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+        snapshot = Snapshot(root, key[1], tree_sha, entries)
+        with self._lock:
+            self.downloads += 1
+            self._entries[key] = (size, self._clock())
+            self._total_bytes += size
+            self._loaded[key] = snapshot
+            while len(self._loaded) > LOADED_SNAPSHOTS:
+                self._loaded.popitem(last=False)
+            self._evict_locked()
+        return snapshot
+
+    def _expire_locked(self, now: float) -> None:
+        while self._entries:
+            key, (_, used) = next(iter(self._entries.items()))
+            if now - used <= self.max_age:
+                break
+            self._drop_locked(key)
+
+    def _evict_locked(self) -> None:
+        # 방금 추가한 스냅샷(가장 최근)은 남김
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            self._drop_locked(next(iter(self._entries)))
+
+    def _drop_locked(self, key: SnapshotKey) -> None:
+        size, _ = self._entries.pop(key)
+        self._loaded.pop(key, None)
+        self._total_bytes -= size
+        self.evicted += 1
+        root, index_path = self._paths(key)
+        # 인덱스를 먼저 지워 재시작 후에도 반쯤 지워진 스냅샷을 쓰지 않게 함
+        try:
+            index_path.unlink()
+        except FileNotFoundError:
+            pass
+        shutil.rmtree(root, ignore_errors=True)
+
+    def _remove(self, key: SnapshotKey) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._drop_locked(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return store statistics.
+
+        Returns:
+            Dictionary with snapshot count, sizes and hit/miss/download counters
+        """
+        with self._lock:
+            return {
+                "repos": list(self.repos),
+                "snapshots": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "max_age": self.max_age,
+                "hits": self.hits,
+                "misses": self.misses,
+                "downloads": self.downloads,
+                "evicted": self.evicted,
+                "rejected": self.rejected,
+                "failed": self.failed,
+            }
+
+
+def iter_file(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a snapshot file in chunks."""
+    with open(path, "rb") as f:
+        yield from iter(lambda: f.read(chunk_size), b"")
+
+
+_store: Optional[SnapshotStore] = None
+_store_loaded = False
+_store_lock = threading.Lock()
+
+
+def get_snapshot_store() -> Optional[SnapshotStore]:
+    """Get the process-wide snapshot store, or None if nothing is mirrored."""
+    global _store, _store_loaded
+    if not _store_loaded:
+        with _store_lock:
+            if not _store_loaded:
+                _store = SnapshotStore.from_env()
+                _store_loaded = True
+    return _store
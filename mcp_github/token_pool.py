@@ -0,0 +1,179 @@
+"""Pool of GitHub tokens with budget-based load balancing."""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from rate_limit import RateLimitScheduler
+
+
+def parse_tokens(value: Optional[str]) -> List[str]:
+    """Parse a comma separated token list, dropping blanks and duplicates.
+
+    Args:
+        value: Comma separated tokens (e.g. GITHUB_TOKENS)
+
+    Returns:
+        List of tokens in configuration order
+    """
+    tokens: List[str] = []
+    for token in (value or "").split(","):
+        token = token.strip()
+        if token and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def token_label(token: str) -> str:
+    """Get a loggable label for a token.
+
+    Args:
+        token: GitHub token
+
+    Returns:
+        Token prefix and last four characters (e.g. "ghp_…a1b2")
+    """
+    prefix = token.split("_", 1)[0] + "_" if "_" in token else ""
+    return f"{prefix}…{token[-4:]}"
+
+
+class TokenState:
+    """One pooled token with its own rate-limit scheduler and usage counters."""
+
+    def __init__(self, token: str, scheduler: RateLimitScheduler):
+        self.token = token
+        self.label = token_label(token)
+        self.scheduler = scheduler
+        self.requests = 0
+        self.rejected = 0
+
+
+class TokenPool:
+    """Route requests to the token with the most remaining budget.
+
+    Read requests go to the usable token with the highest remaining budget
+    in the request's bucket; tokens whose budget is exhausted (or that hit
+    a secondary limit) are parked until their reset time. Write requests
+    always use ``write_token`` so commit authorship stays stable.
+    """
+
+    def __init__(
+        self,
+        tokens: List[str],
+        write_token: Optional[str] = None,
+        scheduler_factory: Callable[[], RateLimitScheduler] = RateLimitScheduler,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize token pool.
+
+        Args:
+            tokens: Tokens to balance reads across
+            write_token: Token pinned for writes (defaults to the first token)
+            scheduler_factory: Creates the rate-limit scheduler of each token
+            clock: Wall clock returning epoch seconds
+        """
+        write_token = write_token or (tokens[0] if tokens else None)
+        if not write_token:
+            raise ValueError("Token pool requires at least one token")
+        if write_token not in tokens:
+            tokens = [write_token] + list(tokens)
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._states = [TokenState(token, scheduler_factory()) for token in tokens]
+        self.write_state = next(s for s in self._states if s.token == write_token)
+
+    @classmethod
+    def from_env(cls) -> Optional["TokenPool"]:
+        """Create a token pool from environment variables.
+
+        Reads GITHUB_TOKENS (comma separated) and GITHUB_WRITE_TOKEN, which
+        defaults to GITHUB_TOKEN or the first pooled token.
+
+        Returns:
+            Configured TokenPool, or None if fewer than two tokens are configured
+        """
+        load_dotenv()
+        tokens = parse_tokens(os.getenv("GITHUB_TOKENS"))
+        write_token = os.getenv("GITHUB_WRITE_TOKEN") or os.getenv("GITHUB_TOKEN")
+        if write_token and write_token not in tokens:
+            tokens.insert(0, write_token)
+        if len(tokens) < 2:
+            return None
+        return cls(tokens, write_token=write_token, scheduler_factory=RateLimitScheduler.from_env)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def select(self, resource: str, write: bool = False) -> TokenState:
+        """Pick the token for a request.
+
+        Args:
+            resource: Rate-limit bucket of the request
+            write: Whether the request modifies data
+
+        Returns:
+            Selected token state
+        """
+        if write:
+            state = self.write_state
+        else:
+            now = self._clock()
+            usable = [s for s in self._states if s.scheduler.available_at(resource) <= now]
+            if usable:
+                # 아직 응답을 받지 못한 토큰은 예산이 가장 많은 것으로 간주
+                state = max(usable, key=lambda s: _remaining_or_max(s, resource))
+            else:
+                state = min(self._states, key=lambda s: s.scheduler.available_at(resource))
+
+        with self._lock:
+            state.requests += 1
+        return state
+
+    def has_alternative(self, resource: str, current: TokenState) -> bool:
+        """Check whether another token could serve a rejected read.
+
+        Args:
+            resource: Rate-limit bucket of the request
+            current: Token that was rejected
+
+        Returns:
+            True if some other token is usable now
+        """
+        now = self._clock()
+        return any(
+            s is not current and s.scheduler.available_at(resource) <= now
+            for s in self._states
+        )
+
+    def record_rejection(self, state: TokenState) -> None:
+        """Count a rate-limit rejection for a token."""
+        with self._lock:
+            state.rejected += 1
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return per-token usage statistics.
+
+        Returns:
+            List with label, request counts, write pinning and core budget per token
+        """
+        now = self._clock()
+        return [
+            {
+                "token": state.label,
+                "write": state is self.write_state,
+                "requests": state.requests,
+                "rejected": state.rejected,
+                "parked": state.scheduler.available_at("core") > now,
+                "rate_limit": state.scheduler.snapshot(),
+            }
+            for state in self._states
+        ]
+
+
+def _remaining_or_max(state: TokenState, resource: str) -> float:
+    remaining = state.scheduler.remaining(resource)
+    return float("inf") if remaining is None else remaining
@@ -1,24 +1,199 @@
 """GitHub read tools for MCP server."""
 
-import json
-from typing import Any, Dict, List
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-from github_client import GitHubClient
-from utils import summarize_diff, format_file_size, is_binary_file, is_text
+from github.GithubException import UnknownObjectException
+from github.PaginatedList import PaginatedList
+from github.PullRequest import PullRequest
 
+from api_calls import count_api_calls
+from blob_store import get_blob_store
+from client_pool import get_github_client, lease_clients
+from contents import get_contents_at
+from diff_store import fetch_diff, get_diff_store, read_diff_section
+from file_range import (
+    CONTENTS_API_LIMIT,
+    MAX_RANGE_BYTES,
+    has_range,
+    read_contents,
+    read_file_range,
+)
+from github_client import PER_PAGE
+from output import format_data, resolve_output_format
+from path_index import get_path_index
+from ref_resolver import get_sha_cache, is_commit_sha
+from snapshot_store import get_snapshot_store
+from tree_cache import fetch_tree, filter_tree, get_tree_cache
+from utils import (
+    decode_cursor,
+    encode_cursor,
+    format_file_size,
+    is_binary_file,
+    is_text,
+    run_in_thread,
+    select_fields,
+    summarize_diff,
+)
 
-async def get_repo(owner: str, repo: str) -> Dict[str, Any]:
+# GraphQL PR 상태 -> REST states 필터
+PR_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "all": None,
+}
+
+# REST sort -> GraphQL IssueOrderField
+PR_SORTS = {"created": "CREATED_AT", "updated": "UPDATED_AT"}
+
+PR_DIRECTIONS = ("asc", "desc")
+
+# 한 번의 호출로 반환하는 PR 수 상한
+MAX_PR_LIMIT = 1000
+
+# getTree가 한 번에 반환하는 항목 수 상한
+MAX_TREE_LIMIT = 10000
+
+# getFiles가 한 번에 받는 경로 수 상한과 동시 요청 수
+MAX_BATCH_PATHS = 100
+DEFAULT_FILE_WORKERS = 8
+
+# getPRDiff full 모드에서 한 번에 반환하는 diff 크기
+DEFAULT_DIFF_MAX_BYTES = 256 * 1024
+
+# GraphQL mergeable -> REST mergeable
+MERGEABLE = {"MERGEABLE": True, "CONFLICTING": False, "UNKNOWN": None}
+
+# {fields}에는 요청된 필드의 selection이 들어간다
+PULL_REQUESTS_QUERY = """
+query ListPullRequests(
+  $owner: String!, $repo: String!, $states: [PullRequestState!], $first: Int!,
+  $after: String, $orderBy: IssueOrder!
+) {
+  repository(owner: $owner, name: $repo) {
+    nameWithOwner
+    pullRequests(first: $first, after: $after, states: $states, orderBy: $orderBy) {
+      pageInfo { hasNextPage endCursor }
+      nodes { {fields} }
+    }
+  }
+}
+"""
+
+# getRepo 출력 필드. topics만 별도 요청이 필요하다
+REPO_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "id": lambda r: r.id,
+    "name": lambda r: r.name,
+    "full_name": lambda r: r.full_name,
+    "description": lambda r: r.description,
+    "language": lambda r: r.language,
+    "stargazers_count": lambda r: r.stargazers_count,
+    "forks_count": lambda r: r.forks_count,
+    "open_issues_count": lambda r: r.open_issues_count,
+    "created_at": lambda r: r.created_at.isoformat(),
+    "updated_at": lambda r: r.updated_at.isoformat(),
+    "default_branch": lambda r: r.default_branch,
+    "license": lambda r: r.license.name if r.license else None,
+    "homepage": lambda r: r.homepage,
+    "archived": lambda r: r.archived,
+    "disabled": lambda r: r.disabled,
+    "private": lambda r: r.private,
+    "fork": lambda r: r.fork,
+    "size": lambda r: r.size,
+    "topics": lambda r: list(r.get_topics()),
+    "url": lambda r: r.html_url,
+    "clone_url": lambda r: r.clone_url,
+    "ssh_url": lambda r: r.ssh_url,
+}
+
+# listPullRequests 출력 필드 (REST). mergeable부터 changed_files까지는
+# 목록 응답에 없어서 읽는 순간 PR마다 상세 요청이 나간다
+PR_REST_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "number": lambda pr: pr.number,
+    "title": lambda pr: pr.title,
+    "user": lambda pr: pr.user.login,
+    "state": lambda pr: pr.state,
+    "created_at": lambda pr: pr.created_at.isoformat(),
+    "updated_at": lambda pr: pr.updated_at.isoformat(),
+    "merged_at": lambda pr: pr.merged_at.isoformat() if pr.merged_at else None,
+    "closed_at": lambda pr: pr.closed_at.isoformat() if pr.closed_at else None,
+    "draft": lambda pr: pr.draft,
+    "mergeable": lambda pr: pr.mergeable,
+    "mergeable_state": lambda pr: pr.mergeable_state,
+    "comments": lambda pr: pr.comments,
+    "commits": lambda pr: pr.commits,
+    "additions": lambda pr: pr.additions,
+    "deletions": lambda pr: pr.deletions,
+    "changed_files": lambda pr: pr.changed_files,
+    "url": lambda pr: pr.html_url,
+}
+
+# listPullRequests 출력 필드 (GraphQL): (selection, 변환 함수)
+# REST 응답과 같은 형태로 변환 (MERGED -> closed, 탈퇴한 사용자 -> ghost)
+PR_GRAPHQL_FIELDS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Any]]] = {
+    "number": ("number", lambda n: n["number"]),
+    "title": ("title", lambda n: n["title"]),
+    "user": ("author { login }", lambda n: (n.get("author") or {}).get("login", "ghost")),
+    "state": ("state", lambda n: "open" if n["state"] == "OPEN" else "closed"),
+    "created_at": ("createdAt", lambda n: _graphql_datetime(n["createdAt"])),
+    "updated_at": ("updatedAt", lambda n: _graphql_datetime(n["updatedAt"])),
+    "merged_at": ("mergedAt", lambda n: _graphql_datetime(n["mergedAt"])),
+    "closed_at": ("closedAt", lambda n: _graphql_datetime(n["closedAt"])),
+    "draft": ("isDraft", lambda n: n["isDraft"]),
+    "mergeable": ("mergeable", lambda n: MERGEABLE.get(n["mergeable"])),
+    "mergeable_state": (
+        "mergeStateStatus",
+        lambda n: (n.get("mergeStateStatus") or "unknown").lower(),
+    ),
+    "comments": ("comments { totalCount }", lambda n: n["comments"]["totalCount"]),
+    "commits": ("commits { totalCount }", lambda n: n["commits"]["totalCount"]),
+    "additions": ("additions", lambda n: n["additions"]),
+    "deletions": ("deletions", lambda n: n["deletions"]),
+    "changed_files": ("changedFiles", lambda n: n["changedFiles"]),
+    "url": ("url", lambda n: n["url"]),
+}
+
+# getPRDiff 파일별 출력 필드
+PR_FILE_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "filename": lambda f: f.filename,
+    "status": lambda f: f.status,
+    "additions": lambda f: f.additions,
+    "deletions": lambda f: f.deletions,
+    "changes": lambda f: f.changes,
+    "patch": lambda f: f.patch[:1000] if f.patch else None,  # Limit patch size
+    "raw_url": lambda f: f.raw_url,
+}
+
+
+@run_in_thread
+@count_api_calls
+@lease_clients
+def get_repo(
+    owner: str,
+    repo: str,
+    fields: Optional[Union[str, Sequence[str]]] = None,
+    output: Optional[str] = None,
+) -> Dict[str, Any]:
     """Get repository information from GitHub.
 
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
+        fields: Fields to include in the data (default: all). Topics cost an
+            extra request and are only fetched when selected.
+        output: Encoding of the data: json (default), compact, native or columnar
 
     Returns:
-        Dictionary containing repository summary and full data
+        Dictionary containing repository summary, full data and the number
+        of API calls made
     """
     try:
-        client = GitHubClient()
+        selected = select_fields(fields, list(REPO_FIELDS))
+        output = resolve_output_format(output)
+        client = get_github_client()
         repository = client.get_repository(owner, repo)
 
         # Create summary
@@ -35,34 +210,11 @@ License: {repository.license.name if repository.license else "Not specified"}
 Homepage: {repository.homepage or "Not specified"}"""
 
         # Full repository data as JSON string
-        repo_data = {
-            "id": repository.id,
-            "name": repository.name,
-            "full_name": repository.full_name,
-            "description": repository.description,
-            "language": repository.language,
-            "stargazers_count": repository.stargazers_count,
-            "forks_count": repository.forks_count,
-            "open_issues_count": repository.open_issues_count,
-            "created_at": repository.created_at.isoformat(),
-            "updated_at": repository.updated_at.isoformat(),
-            "default_branch": repository.default_branch,
-            "license": repository.license.name if repository.license else None,
-            "homepage": repository.homepage,
-            "archived": repository.archived,
-            "disabled": repository.disabled,
-            "private": repository.private,
-            "fork": repository.fork,
-            "size": repository.size,
-            "topics": list(repository.get_topics()),
-            "url": repository.html_url,
-            "clone_url": repository.clone_url,
-            "ssh_url": repository.ssh_url,
-        }
+        repo_data = {name: REPO_FIELDS[name](repository) for name in selected}
 
         return {
             "summary": summary,
-            "data": json.dumps(repo_data, indent=2),
+            "data": format_data(repo_data, output),
             "success": True,
         }
 
@@ -82,67 +234,105 @@ Homepage: {repository.homepage or "Not specified"}"""
         }
 
 
-async def list_pull_requests(
-    owner: str, repo: str, state: str = "open"
+@run_in_thread
+@count_api_calls
+@lease_clients
+def list_pull_requests(
+    owner: str,
+    repo: str,
+    state: str = "open",
+    backend: str = "graphql",
+    limit: int = 30,
+    cursor: Optional[str] = None,
+    sort: str = "created",
+    direction: str = "desc",
+    fields: Optional[Union[str, Sequence[str]]] = None,
+    output: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """List pull requests for a repository.
+    """List pull requests for a repository, one bounded page at a time.
+
+    Only the pages needed for ``limit`` PRs are fetched. When more PRs are
+    available the result carries a ``next_cursor``; passing it back with the
+    same filters continues the listing where this call stopped.
+
+    The GraphQL backend fetches up to 100 PRs with their merge and size
+    fields per round trip. The REST backend lists PRs and then loads each
+    one lazily for those fields (one extra request per PR) unless ``fields``
+    leaves them out.
 
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
         state: PR state filter (open, closed, all)
+        backend: API used to fetch PRs ("graphql" or "rest")
+        limit: Maximum number of PRs to return (1-1000)
+        cursor: ``next_cursor`` of a previous call to continue from
+        sort: Sort field (created, updated)
+        direction: Sort direction (asc, desc)
+        fields: PR fields to include in the data (default: all)
+        output: Encoding of the data: json (default), compact, native or columnar
 
     Returns:
-        Dictionary containing PR list summary and data
+        Dictionary containing PR list summary, data, continuation cursor and
+        the number of API calls made
     """
     try:
-        client = GitHubClient()
-        repository = client.get_repository(owner, repo)
+        if state not in PR_STATES:
+            raise ValueError(f"Invalid state '{state}'. Use open, closed or all")
+        if sort not in PR_SORTS:
+            raise ValueError(f"Invalid sort '{sort}'. Use created or updated")
+        if direction not in PR_DIRECTIONS:
+            raise ValueError(f"Invalid direction '{direction}'. Use asc or desc")
+        if not 1 <= limit <= MAX_PR_LIMIT:
+            raise ValueError(f"Invalid limit {limit}. Use 1 to {MAX_PR_LIMIT}")
+        if backend not in ("graphql", "rest"):
+            raise ValueError(f"Unknown backend '{backend}'. Use 'graphql' or 'rest'")
+        selected = select_fields(fields, list(PR_REST_FIELDS))
+        output = resolve_output_format(output)
 
-        # Get pull requests
-        pull_requests = repository.get_pulls(state=state)
-
-        pr_list = []
-        for pr in pull_requests:
-            pr_data = {
-                "number": pr.number,
-                "title": pr.title,
-                "user": pr.user.login,
-                "state": pr.state,
-                "created_at": pr.created_at.isoformat(),
-                "updated_at": pr.updated_at.isoformat(),
-                "merged_at": pr.merged_at.isoformat() if pr.merged_at else None,
-                "closed_at": pr.closed_at.isoformat() if pr.closed_at else None,
-                "draft": pr.draft,
-                "mergeable": pr.mergeable,
-                "mergeable_state": pr.mergeable_state,
-                "comments": pr.comments,
-                "commits": pr.commits,
-                "additions": pr.additions,
-                "deletions": pr.deletions,
-                "changed_files": pr.changed_files,
-                "url": pr.html_url,
-            }
-            pr_list.append(pr_data)
+        # cursor는 만들어질 때의 조회 조건에 묶여 있어 다른 조건으로 재사용할 수 없다
+        query = {
+            "repo": f"{owner}/{repo}".lower(),
+            "state": state,
+            "backend": backend,
+            "sort": sort,
+            "direction": direction,
+        }
+        position = decode_cursor(cursor, query) if cursor else None
+
+        client = get_github_client()
+        if backend == "graphql":
+            full_name, pr_list, next_position = _list_pull_requests_graphql(
+                client, owner, repo, state, limit, position, sort, direction, selected
+            )
+        else:
+            full_name, pr_list, next_position = _list_pull_requests_rest(
+                client, owner, repo, state, limit, position or 0, sort, direction, selected
+            )
+        next_cursor = (
+            encode_cursor(query, next_position) if next_position is not None else None
+        )
 
         # Create summary
         summary = f"""Pull Requests ({state}): {len(pr_list)} found
-Repository: {repository.full_name}
+Repository: {full_name}
 
 """
         for pr in pr_list[:5]:  # Show first 5 PRs
-            summary += (
-                f"#{pr['number']}: {pr['title']} by @{pr['user']} ({pr['state']})\n"
-            )
+            summary += _pull_request_summary_line(pr) + "\n"
 
         if len(pr_list) > 5:
             summary += f"\n... and {len(pr_list) - 5} more PRs"
+        if next_cursor:
+            summary += "\n\nMore PRs available: call again with cursor=next_cursor"
 
         return {
             "summary": summary,
-            "data": json.dumps(pr_list, indent=2),
+            "data": format_data(pr_list, output),
             "success": True,
             "count": len(pr_list),
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
         }
 
     except ValueError as e:
@@ -161,65 +351,180 @@ Repository: {repository.full_name}
         }
 
 
-async def get_pr_diff(owner: str, repo: str, number: int) -> Dict[str, Any]:
+def _list_pull_requests_rest(
+    client: Any,
+    owner: str,
+    repo: str,
+    state: str,
+    limit: int,
+    offset: int,
+    sort: str,
+    direction: str,
+    fields: List[str],
+) -> Tuple[str, List[Dict[str, Any]], Optional[int]]:
+    repository = client.get_repository(owner, repo)
+    pulls = repository.get_pulls(state=state, sort=sort, direction=direction)
+
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("Invalid cursor")
+    if isinstance(pulls, PaginatedList):
+        # offset이 속한 페이지부터 필요한 페이지만 조회
+        page, skip = divmod(offset, PER_PAGE)
+        window: List[Any] = []
+        # limit보다 하나 더 모일 때까지 읽어야 다음 항목이 있는지 알 수 있다
+        # (마지막 페이지가 가득 찼으면 다음 페이지가 비어 있을 수 있음)
+        while True:
+            items = pulls.get_page(page)
+            window.extend(items[skip:])
+            if len(window) > limit or len(items) < PER_PAGE:
+                break
+            page, skip = page + 1, 0
+    else:
+        window = list(islice(pulls, offset, offset + limit + 1))
+    more = len(window) > limit
+
+    pr_list = [{name: PR_REST_FIELDS[name](pr) for name in fields} for pr in window[:limit]]
+    next_offset = offset + len(pr_list) if more else None
+    return repository.full_name, pr_list, next_offset
+
+
+def _list_pull_requests_graphql(
+    client: Any,
+    owner: str,
+    repo: str,
+    state: str,
+    limit: int,
+    after: Optional[str],
+    sort: str,
+    direction: str,
+    fields: List[str],
+) -> Tuple[str, List[Dict[str, Any]], Optional[str]]:
+    variables: Dict[str, Any] = {
+        "owner": owner,
+        "repo": repo,
+        "states": PR_STATES[state],
+        "after": after,
+        "orderBy": {"field": PR_SORTS[sort], "direction": direction.upper()},
+    }
+    query = PULL_REQUESTS_QUERY.replace(
+        "{fields}", " ".join(PR_GRAPHQL_FIELDS[name][0] for name in fields)
+    )
+    full_name = f"{owner}/{repo}"
+    pr_list: List[Dict[str, Any]] = []
+    while True:
+        variables["first"] = min(limit - len(pr_list), 100)
+        data = client.graphql(query, variables)
+        repository = data.get("repository")
+        if repository is None:
+            raise ValueError(f"Repository '{owner}/{repo}' not found")
+        full_name = repository["nameWithOwner"]
+        connection = repository["pullRequests"]
+        pr_list.extend(
+            {name: PR_GRAPHQL_FIELDS[name][1](node) for name in fields}
+            for node in connection["nodes"]
+        )
+
+        page_info = connection["pageInfo"]
+        if not page_info["hasNextPage"]:
+            return full_name, pr_list, None
+        if len(pr_list) >= limit:
+            return full_name, pr_list, page_info["endCursor"]
+        variables["after"] = page_info["endCursor"]
+
+
+def _pull_request_summary_line(pr: Dict[str, Any]) -> str:
+    # fields로 일부 필드만 조회했을 수 있으므로 있는 필드만 표시
+    line = f"#{pr['number']}" if "number" in pr else "-"
+    if "title" in pr:
+        line += f": {pr['title']}"
+    if "user" in pr:
+        line += f" by @{pr['user']}"
+    if "state" in pr:
+        line += f" ({pr['state']})"
+    return line
+
+
+def _graphql_datetime(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).isoformat()
+
+
+@run_in_thread
+@count_api_calls
+@lease_clients
+def get_pr_diff(
+    owner: str,
+    repo: str,
+    number: int,
+    fields: Optional[Union[str, Sequence[str]]] = None,
+    output: Optional[str] = None,
+) -> Dict[str, Any]:
     """Get diff for a specific pull request.
 
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
         number: Pull request number
+        fields: Per-file fields to include in the data (default: all). With a
+            projection the pull request itself is not fetched, so the summary
+            leaves out its title, author and state.
+        output: Encoding of the data: json (default), compact, native or columnar
 
     Returns:
-        Dictionary containing PR diff summary and data
+        Dictionary containing PR diff summary, data and the number of API
+        calls made
     """
     try:
-        client = GitHubClient()
+        selected = select_fields(fields, list(PR_FILE_FIELDS))
+        output = resolve_output_format(output)
+        client = get_github_client()
         repository = client.get_repository(owner, repo)
 
         # Get pull request
-        pull_request = repository.get_pull(number)
+        if fields:
+            # 파일 목록만 필요하므로 PR 상세를 조회하지 않는 lazy 객체 사용
+            pull_request = PullRequest(
+                repository.requester, url=f"{repository.url}/pulls/{number}", completed=False
+            )
+        else:
+            pull_request = repository.get_pull(number)
 
         # Get diff
-        diff = pull_request.get_files()
+        files = list(pull_request.get_files())
 
         diff_data = []
         total_additions = 0
         total_deletions = 0
 
-        for file in diff:
-            file_data = {
-                "filename": file.filename,
-                "status": file.status,
-                "additions": file.additions,
-                "deletions": file.deletions,
-                "changes": file.changes,
-                "patch": file.patch[:1000] if file.patch else None,  # Limit patch size
-                "raw_url": file.raw_url,
-            }
-            diff_data.append(file_data)
+        for file in files:
+            diff_data.append({name: PR_FILE_FIELDS[name](file) for name in selected})
             total_additions += file.additions
             total_deletions += file.deletions
 
         # Create summary
-        summary = f"""Pull Request #{number}: {pull_request.title}
+        summary = f"Pull Request #{number}\n"
+        if not fields:
+            summary = f"""Pull Request #{number}: {pull_request.title}
 Repository: {repository.full_name}
 Author: @{pull_request.user.login}
 State: {pull_request.state}
-Files changed: {len(diff_data)}
+"""
+        summary += f"""Files changed: {len(diff_data)}
 Total additions: +{total_additions}
 Total deletions: -{total_deletions}
 
 Changed files:
 """
-        for file in diff_data[:10]:  # Show first 10 files
-            summary += f"  {file['filename']} ({file['status']}) +{file['additions']} -{file['deletions']}\n"
+        for file in files[:10]:  # Show first 10 files
+            summary += f"  {file.filename} ({file.status}) +{file.additions} -{file.deletions}\n"
 
         if len(diff_data) > 10:
             summary += f"\n... and {len(diff_data) - 10} more files"
 
         return {
             "summary": summary,
-            "data": json.dumps(diff_data, indent=2),
+            "data": format_data(diff_data, output),
             "success": True,
             "file_count": len(diff_data),
             "total_additions": total_additions,
@@ -242,26 +547,168 @@ Changed files:
         }
 
 
-async def get_file(
-    owner: str, repo: str, path: str, ref: str = "HEAD"
+@run_in_thread
+@count_api_calls
+@lease_clients
+def get_pr_full_diff(
+    owner: str,
+    repo: str,
+    number: int,
+    file: Optional[Union[int, str]] = None,
+    hunk_start: Optional[int] = None,
+    hunk_end: Optional[int] = None,
+    max_bytes: int = DEFAULT_DIFF_MAX_BYTES,
+    output: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Get the complete unified diff of a pull request, one file at a time.
+
+    The whole diff is fetched in one request with the diff media type and
+    streamed to disk while a per-file index of byte offsets is built. Later
+    calls revalidate the stored diff with its ETag (a 304 costs no rate
+    limit) and read only the requested byte range from disk.
+
+    Without ``file`` the index is returned. With ``file`` the text of that
+    file section, or of hunks ``hunk_start``..``hunk_end`` of it, is
+    returned in full up to ``max_bytes``.
+
+    Args:
+        owner: Repository owner (username or organization)
+        repo: Repository name
+        number: Pull request number
+        file: File index in the diff, or its path
+        hunk_start: First hunk of the file to return (0-based, inclusive)
+        hunk_end: Last hunk of the file to return (inclusive, default: last)
+        max_bytes: Maximum number of diff bytes to return
+        output: Encoding of the file index: json (default), compact, native
+            or columnar (diff text is always returned as is)
+
+    Returns:
+        Dictionary containing the file index or diff text
+    """
+    try:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        output = resolve_output_format(output)
+        client = get_github_client()
+        store = get_diff_store()
+
+        if file is None:
+            stored = fetch_diff(client, store, owner, repo, number)
+            index = [entry.to_dict() for entry in stored.files]
+            summary = f"""Pull Request #{number} full diff: {len(index)} files, {format_file_size(stored.size)}
+Repository: {owner}/{repo}
+
+Files:
+"""
+            for entry in index[:10]:  # Show first 10 files
+                summary += f"  [{entry['index']}] {entry['path']} ({entry['status']}) +{entry['additions']} -{entry['deletions']}, {entry['hunks']} hunks\n"
+            if len(index) > 10:
+                summary += f"\n... and {len(index) - 10} more files"
+            summary += "\nPass file=<index or path> to read a file's diff"
+
+            return {
+                "summary": summary,
+                "data": format_data(index, output),
+                "success": True,
+                "file_count": len(index),
+                "size": stored.size,
+                "total_additions": sum(entry["additions"] for entry in index),
+                "total_deletions": sum(entry["deletions"] for entry in index),
+            }
+
+        entry, offset, end, content = read_diff_section(
+            client, store, owner, repo, number, file, hunk_start, hunk_end, max_bytes
+        )
+        truncated = end - offset > max_bytes
+        if truncated:
+            # 잘린 경우 마지막 완전한 줄까지만 반환
+            cut = content.rfind(b"\n")
+            if cut >= 0:
+                content = content[: cut + 1]
+
+        summary = f"""Pull Request #{number}: {entry.path} ({entry.status}) +{entry.additions} -{entry.deletions}
+Bytes {offset}-{offset + len(content)} of the diff ({format_file_size(len(content))})"""
+        if truncated:
+            summary += f"\nTruncated at max_bytes={max_bytes}; request a hunk range for the rest"
+
+        return {
+            "summary": summary,
+            "data": content.decode("utf-8", errors="replace"),
+            "success": True,
+            "file": entry.to_dict(),
+            "hunks": [hunk.to_dict(i) for i, hunk in enumerate(entry.hunks)],
+            "offset": offset,
+            "length": len(content),
+            "truncated": truncated,
+        }
+
+    except ValueError as e:
+        return {
+            "summary": f"Error: {str(e)}",
+            "data": "",
+            "success": False,
+            "error": str(e),
+        }
+    except Exception as e:
+        return {
+            "summary": f"Unexpected error: {str(e)}",
+            "data": "",
+            "success": False,
+            "error": str(e),
+        }
+
+
+@run_in_thread
+@lease_clients
+def get_file(
+    owner: str,
+    repo: str,
+    path: str,
+    ref: str = "HEAD",
+    offset: Optional[int] = None,
+    length: Optional[int] = None,
+    start_line: Optional[int] = None,
+    end_line: Optional[int] = None,
+    output: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Get file content from a repository.
 
+    Without a range, files up to 1MB are returned whole. With a byte range
+    (``offset``/``length``) or a line range (``start_line``/``end_line``)
+    only that slice is returned; files over the contents API limit are
+    then streamed from the raw blob and read only as far as the range
+    reaches, so files of any size can be read piecewise.
+
+    The ref is resolved to a commit SHA first (echoed as ``resolved_sha``);
+    file metadata is cached under that SHA, so repeated reads of an
+    unchanged branch cost at most the ref lookup.
+
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
         path: File path in repository
         ref: Git reference (branch, tag, or commit SHA)
+        offset: First byte of a byte range (default 0)
+        length: Bytes in a byte range (default 64KB, at most 1MB)
+        start_line: First line of a line range (1-based)
+        end_line: Last line of a line range (inclusive)
+        output: Encoding of the data: json (default), compact, native or columnar
 
     Returns:
         Dictionary containing file content and metadata
     """
     try:
-        client = GitHubClient()
+        ranged = has_range(offset, length, start_line, end_line)
+        output = resolve_output_format(output)
+        client = get_github_client()
         repository = client.get_repository(owner, repo)
+        # 브랜치/태그는 커밋 SHA로 고정해 그 SHA 기준으로 캐시
+        resolved = client.resolve_ref(owner, repo, ref)
+        snapshots = get_snapshot_store()
+        snapshot = snapshots.snapshot(client, repository, owner, repo, resolved) if snapshots else None
 
         # Get file content
-        file_content = repository.get_contents(path, ref=ref)
+        file_content = get_contents_at(repository, path, resolved, get_sha_cache(), snapshot)
 
         if isinstance(file_content, list):
             # Directory
@@ -280,7 +727,7 @@ async def get_file(
 
             summary = f"""Directory: {path}
 Repository: {repository.full_name}
-Reference: {ref}
+Reference: {ref} ({resolved})
 Files: {len(files)}
 
 Contents:
@@ -295,16 +742,28 @@ Contents:
 
             return {
                 "summary": summary,
-                "data": json.dumps(files, indent=2),
+                "data": format_data(files, output),
                 "success": True,
                 "type": "directory",
                 "file_count": len(files),
+                "resolved_sha": resolved,
             }
 
         else:
             # Single file
-            content = file_content.decoded_content
-            is_text_content = is_text(content)
+            if ranged:
+                return _file_range_result(
+                    client, owner, repo, repository.full_name, ref, resolved,
+                    file_content, offset, length, start_line, end_line, output,
+                )
+
+            # 1MB 이상은 contents API가 본문을 주지 않으므로 내려받지 않음
+            if file_content.size < CONTENTS_API_LIMIT:
+                content = read_contents(file_content, get_blob_store())
+                is_text_content = is_text(content)
+            else:
+                content = None
+                is_text_content = not is_binary_file(file_content.name)
 
             file_data = {
                 "name": file_content.name,
@@ -319,21 +778,24 @@ Contents:
                 "is_binary": is_binary_file(file_content.name),
             }
 
-            if is_text_content and file_content.size < 1024 * 1024:  # Less than 1MB
+            if is_text_content and content is not None:
                 try:
                     file_data["content"] = content.decode("utf-8")
                 except UnicodeDecodeError:
                     file_data["content"] = content.decode("utf-8", errors="replace")
             else:
                 file_data["content"] = None
-                if file_content.size >= 1024 * 1024:
-                    file_data["content_note"] = "File too large to display (>1MB)"
+                if content is None:
+                    file_data["content_note"] = (
+                        "File too large to display (>1MB); "
+                        "use offset/length or start_line/end_line to read a range"
+                    )
                 elif not is_text_content:
                     file_data["content_note"] = "Binary file - content not displayed"
 
             summary = f"""File: {path}
 Repository: {repository.full_name}
-Reference: {ref}
+Reference: {ref} ({resolved})
 Size: {file_data["size_formatted"]}
 Type: {"Text" if is_text_content else "Binary"}
 
@@ -349,10 +811,11 @@ Type: {"Text" if is_text_content else "Binary"}
 
             return {
                 "summary": summary,
-                "data": json.dumps(file_data, indent=2),
+                "data": format_data(file_data, output),
                 "success": True,
                 "type": "file",
                 "file_size": file_content.size,
+                "resolved_sha": resolved,
             }
 
     except ValueError as e:
@@ -369,3 +832,279 @@ Type: {"Text" if is_text_content else "Binary"}
             "success": False,
             "error": str(e),
         }
+
+
+def _file_range_result(
+    client: Any,
+    owner: str,
+    repo: str,
+    full_name: str,
+    ref: str,
+    resolved: str,
+    file_content: Any,
+    offset: Optional[int],
+    length: Optional[int],
+    start_line: Optional[int],
+    end_line: Optional[int],
+    output: str,
+) -> Dict[str, Any]:
+    """Build the get_file result for a byte or line range of a file."""
+    part = read_file_range(
+        client, owner, repo, file_content, offset, length, start_line, end_line,
+        store=get_blob_store(),
+    )
+    file_data = {
+        "name": file_content.name,
+        "path": file_content.path,
+        "type": file_content.type,
+        "size": file_content.size,
+        "size_formatted": format_file_size(file_content.size),
+        "sha": file_content.sha,
+        "url": file_content.html_url,
+        "download_url": file_content.download_url,
+        "is_binary": part["content_encoding"] == "base64",
+        **part,
+    }
+
+    if "start_line" in part:
+        range_text = f"lines {part['start_line']}-{part['end_line']}"
+    else:
+        range_text = f"bytes {part['offset']}-{part['offset'] + part['length']}"
+    summary = f"""File: {file_content.path}
+Repository: {full_name}
+Reference: {ref} ({resolved})
+Size: {file_data["size_formatted"]}
+Range: {range_text} ({format_file_size(part["length"])})
+"""
+    if part["truncated"]:
+        summary += f"Truncated to {format_file_size(MAX_RANGE_BYTES)}\n"
+    if not part["eof"]:
+        summary += "More content follows\n"
+
+    return {
+        "summary": summary,
+        "data": format_data(file_data, output),
+        "success": True,
+        "type": "file",
+        "file_size": file_content.size,
+        "resolved_sha": resolved,
+    }
+
+
+@run_in_thread
+@count_api_calls
+@lease_clients
+def get_files(
+    owner: str,
+    repo: str,
+    paths: Sequence[str],
+    ref: str = "HEAD",
+    output: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Get the contents of several files in one call.
+
+    The repository and the ref are looked up once; the paths are then
+    fetched concurrently at the resolved commit SHA, so every file comes
+    from the same commit. A failing path does not fail the batch: its
+    entry carries ``success: False`` and the error instead.
+
+    Args:
+        owner: Repository owner (username or organization)
+        repo: Repository name
+        paths: File paths in repository (at most 100)
+        ref: Git reference (branch, tag, or commit SHA)
+        output: Encoding of the data: json (default), compact, native or columnar
+
+    Returns:
+        Dictionary containing one result per path, in request order
+    """
+    try:
+        if isinstance(paths, str):
+            paths = [paths]
+        paths = list(dict.fromkeys(paths))
+        if not 1 <= len(paths) <= MAX_BATCH_PATHS:
+            raise ValueError(f"paths must contain 1 to {MAX_BATCH_PATHS} entries")
+        output = resolve_output_format(output)
+
+        client = get_github_client()
+        repository = client.get_repository(owner, repo)
+        resolved = client.resolve_ref(owner, repo, ref)
+        snapshots = get_snapshot_store()
+        snapshot = snapshots.snapshot(client, repository, owner, repo, resolved) if snapshots else None
+        cache = get_sha_cache()
+        store = get_blob_store()
+
+        def fetch(path: str) -> Dict[str, Any]:
+            return _batch_file_entry(repository, path, resolved, cache, store, snapshot)
+
+        with ThreadPoolExecutor(max_workers=min(DEFAULT_FILE_WORKERS, len(paths))) as executor:
+            # contextvars(API 호출 집계)를 작업 스레드로 전달
+            futures = [executor.submit(contextvars.copy_context().run, fetch, path) for path in paths]
+            files = [future.result() for future in futures]
+
+        failed = [entry for entry in files if not entry["success"]]
+        summary = f"""Files: {len(files)} ({len(files) - len(failed)} ok, {len(failed)} failed)
+Repository: {repository.full_name}
+Reference: {ref} ({resolved})
+
+"""
+        for entry in files:
+            if entry["success"]:
+                summary += f"  {entry['path']} ({entry['size_formatted']})\n"
+            else:
+                summary += f"  {entry['path']}: {entry['error']}\n"
+
+        return {
+            "summary": summary,
+            "data": format_data(files, output),
+            "success": True,
+            "resolved_sha": resolved,
+            "file_count": len(files),
+            "error_count": len(failed),
+        }
+
+    except ValueError as e:
+        return {
+            "summary": f"Error: {str(e)}",
+            "data": "",
+            "success": False,
+            "error": str(e),
+        }
+    except Exception as e:
+        return {
+            "summary": f"Unexpected error: {str(e)}",
+            "data": "",
+            "success": False,
+            "error": str(e),
+        }
+
+
+def _batch_file_entry(
+    repository: Any, path: str, resolved: str, cache: Any, store: Any, snapshot: Any
+) -> Dict[str, Any]:
+    """Fetch one path of a getFiles batch, reporting errors in the entry."""
+    try:
+        file_content = get_contents_at(repository, path, resolved, cache, snapshot)
+        if isinstance(file_content, list):
+            raise ValueError("Path is a directory")
+
+        file_data = {
+            "path": file_content.path,
+            "success": True,
+            "size": file_content.size,
+            "size_formatted": format_file_size(file_content.size),
+            "sha": file_content.sha,
+            "is_binary": is_binary_file(file_content.name),
+            "content": None,
+        }
+        if file_content.size >= CONTENTS_API_LIMIT:
+            file_data["content_note"] = (
+                "File too large to display (>1MB); "
+                "use getFile with offset/length or start_line/end_line"
+            )
+            return file_data
+
+        content = read_contents(file_content, store)
+        if is_text(content):
+            file_data["content"] = content.decode("utf-8", errors="replace")
+        else:
+            file_data["is_binary"] = True
+            file_data["content_note"] = "Binary file - content not displayed"
+        return file_data
+
+    except UnknownObjectException:
+        return {"path": path, "success": False, "error": f"File not found: {path}"}
+    except Exception as e:
+        return {"path": path, "success": False, "error": str(e)}
+
+
+@run_in_thread
+@count_api_calls
+@lease_clients
+def get_tree(
+    owner: str,
+    repo: str,
+    ref: str = "HEAD",
+    path: str = "",
+    pattern: Optional[str] = None,
+    depth: Optional[int] = None,
+    limit: int = 1000,
+    output: Optional[str] = None,
+) -> Dict[str, Any]:
+    """List the files and directories of a repository recursively.
+
+    The whole tree is fetched with the Git Trees API in one request (or,
+    for trees GitHub truncates, by walking subtrees concurrently) and
+    cached by tree SHA, so further listings of the same commit with other
+    filters only cost the ref lookup.
+
+    Args:
+        owner: Repository owner (username or organization)
+        repo: Repository name
+        ref: Git reference (branch, tag, or commit SHA)
+        path: Directory to list (default: repository root)
+        pattern: Glob matched against full paths, e.g. ``*.py`` or ``src/*/test_*``
+        depth: Maximum depth below ``path`` (1 = direct children only)
+        limit: Maximum number of entries to return
+        output: Encoding of the data: json (default), compact, native or columnar
+
+    Returns:
+        Dictionary containing the matching tree entries
+    """
+    try:
+        if not 1 <= limit <= MAX_TREE_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_TREE_LIMIT}")
+        output = resolve_output_format(output)
+
+        client = get_github_client()
+        repository = client.get_repository(owner, repo)
+        resolved = client.resolve_ref(owner, repo, ref)
+        snapshots = get_snapshot_store()
+        snapshot = snapshots.snapshot(client, repository, owner, repo, resolved) if snapshots else None
+        tree_sha, entries = fetch_tree(repository, resolved, get_tree_cache(), snapshot=snapshot)
+        index = get_path_index()
+        if index is not None and not is_commit_sha(ref) and ref != "HEAD":
+            # 이후 쓰기가 파일 SHA를 조회하지 않도록 브랜치 경로 색인을 채움
+            index.fill(owner, repo, ref, entries)
+
+        directory = path.strip("/")
+        matched = filter_tree(entries, directory, pattern, depth)
+        selected = matched[:limit]
+
+        files = sum(1 for entry in matched if entry["type"] == "blob")
+        summary = f"""Tree: {directory or "/"}
+Repository: {repository.full_name}
+Reference: {ref} (tree {tree_sha[:7]})
+Entries: {len(matched)} ({files} files, {len(matched) - files} directories)
+
+"""
+        for entry in selected[:20]:
+            suffix = "/" if entry["type"] == "tree" else ""
+            summary += f"  {entry['path']}{suffix}\n"
+        if len(matched) > 20:
+            summary += f"\n... and {len(matched) - 20} more entries"
+
+        return {
+            "summary": summary,
+            "data": format_data(selected, output),
+            "success": True,
+            "tree_sha": tree_sha,
+            "resolved_sha": resolved,
+            "entry_count": len(matched),
+            "truncated": len(matched) > limit,
+        }
+
+    except ValueError as e:
+        return {
+            "summary": f"Error: {str(e)}",
+            "data": "",
+            "success": False,
+            "error": str(e),
+        }
+    except Exception as e:
+        return {
+            "summary": f"Unexpected error: {str(e)}",
+            "data": "",
+            "success": False,
+            "error": str(e),
+        }
@@ -1,15 +1,114 @@
 """GitHub write tools for MCP server."""
 
-import json
 import base64
-from typing import Any, Dict, Optional
+import contextvars
+import json
+import os
+import random
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from github.GitCommit import GitCommit
+from github.GithubException import GithubException, UnknownObjectException
+from github.InputGitAuthor import InputGitAuthor
+from github.InputGitTreeElement import InputGitTreeElement
+
+from blob_store import get_blob_store, git_blob_sha
+from client_pool import get_github_client, lease_clients
+from path_index import PathIndex, get_path_index
+from ref_resolver import get_sha_cache, is_commit_sha
+from tree_cache import fetch_tree, get_tree_cache
+from utils import run_in_thread, validate_file_path
+
+COMMIT_OPERATIONS = ("create", "update", "delete")
+
+# 이 크기 이하의 텍스트는 blob을 따로 만들지 않고 트리 요청에 포함
+MAX_INLINE_CONTENT_BYTES = 64 * 1024
+
+# 큰 파일의 blob 생성 동시 요청 수
+DEFAULT_BLOB_WORKERS = 8
+
+# 브랜치가 먼저 움직였을 때(non-fast-forward) 다시 커밋하는 횟수와 첫 대기 시간(초)
+MAX_COMMIT_ATTEMPTS = 5
+COMMIT_RETRY_BACKOFF = 0.2
+
 
-from github_client import GitHubClient
-from utils import validate_file_path
+def _committer_args(committer_name: Optional[str], committer_email: Optional[str]) -> Dict[str, Any]:
+    if committer_name and committer_email:
+        return {"committer": InputGitAuthor(committer_name, committer_email)}
+    return {}
 
 
-async def create_or_update_file(
+def _file_sha(
+    client: Any,
+    repository: Any,
+    owner: str,
+    repo: str,
+    path: str,
+    branch: str,
+    index: Optional[PathIndex],
+    refresh: bool = False,
+) -> Optional[str]:
+    """Find the blob SHA a Contents API write of ``path`` has to name.
+
+    The path index answers without a request when it knows the path. For
+    an unknown path the parent directory is listed instead of fetching the
+    file, which indexes its siblings as well. With ``refresh`` (or without
+    an index) the file itself is looked up.
+
+    Args:
+        client: GitHub client
+        repository: PyGithub repository
+        owner: Repository owner
+        repo: Repository name
+        path: File path
+        branch: Branch name
+        index: Path index, or None
+        refresh: Skip the index after GitHub rejected its SHA
+
+    Returns:
+        Blob SHA, or None if the file does not exist
+    """
+    if index is not None and not refresh:
+        known, sha = index.get(owner, repo, branch, path)
+        if known:
+            return sha
+        directory = path.rsplit("/", 1)[0] if "/" in path else ""
+        try:
+            listing = repository.get_contents(directory, ref=branch)
+        except UnknownObjectException:
+            return None
+        if not isinstance(listing, list):
+            # 상위 경로가 파일이면 이 경로에는 파일이 있을 수 없음
+            return None
+        index.fill(
+            owner, repo, branch,
+            [{"path": item.path, "type": item.type, "sha": item.sha} for item in listing],
+            directory=directory,
+        )
+        return index.get(owner, repo, branch, path)[1]
+
+    try:
+        sha = repository.get_contents(path, ref=branch).sha
+    except UnknownObjectException:
+        sha = None
+    if index is not None:
+        index.put(owner, repo, branch, path, sha)
+    return sha
+
+
+def _is_sha_mismatch(error: GithubException) -> bool:
+    # 409: SHA가 현재 파일과 다름, 422: 있는 파일에 SHA 없이 쓰거나 잘못된 SHA
+    return error.status in (409, 422)
+
+
+@run_in_thread
+@lease_clients
+def create_or_update_file(
     owner: str, 
     repo: str, 
     path: str, 
@@ -21,6 +120,10 @@ async def create_or_update_file(
 ) -> Dict[str, Any]:
     """Create or update a file in a GitHub repository.
 
+    The SHA of an existing file comes from the path index when possible,
+    so the write usually goes straight to the ``PUT``. If GitHub rejects
+    the SHA as stale, it is looked up again and the write retried once.
+
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
@@ -43,42 +146,40 @@ async def create_or_update_file(
                 "summary": "File path contains invalid characters or is too long"
             }
 
-        client = GitHubClient()
+        client = get_github_client()
         repository = client.get_repository(owner, repo)
-        
-        # Check if file exists
-        try:
-            file = repository.get_contents(path, ref=branch)
-            sha = file.sha
-            operation = "updated"
-        except:
-            sha = None
-            operation = "created"
-
-        # Create or update file
-        if sha:
-            # File exists, update it
-            result = repository.update_file(
-                path=path,
-                message=message,
-                content=content,
-                sha=sha,
-                branch=branch
-            )
-            # PyGithub의 update_file은 딕셔너리를 반환: {'content': ContentFile, 'commit': Commit}
-            content_obj = result['content']
-            commit_obj = result['commit']
-        else:
-            # File doesn't exist, create it
-            result = repository.create_file(
-                path=path,
-                message=message,
-                content=content,
-                branch=branch
+        index = get_path_index()
+        committer = _committer_args(committer_name, committer_email)
+
+        def write(sha: Optional[str]) -> Dict[str, Any]:
+            # PyGithub의 create_file/update_file은 딕셔너리를 반환: {'content': ContentFile, 'commit': Commit}
+            if sha:
+                return repository.update_file(
+                    path=path, message=message, content=content, sha=sha, branch=branch, **committer
+                )
+            return repository.create_file(
+                path=path, message=message, content=content, branch=branch, **committer
             )
-            # PyGithub의 create_file은 딕셔너리를 반환: {'content': ContentFile, 'commit': Commit}
-            content_obj = result['content']
-            commit_obj = result['commit']
+
+        sha = _file_sha(client, repository, owner, repo, path, branch, index)
+        try:
+            result = write(sha)
+        except GithubException as e:
+            if index is None or not _is_sha_mismatch(e):
+                raise
+            sha = _file_sha(client, repository, owner, repo, path, branch, index, refresh=True)
+            result = write(sha)
+        operation = "updated" if sha else "created"
+        content_obj = result['content']
+        commit_obj = result['commit']
+        client.invalidate_repository(owner, repo)
+        if index is not None:
+            index.put(owner, repo, branch, path, content_obj.sha)
+
+        # 방금 쓴 내용은 이후 읽기에서 다시 받지 않도록 blob 저장소에 기록
+        store = get_blob_store()
+        if store is not None:
+            store.put(content_obj.sha, content.encode("utf-8"))
 
         return {
             "success": True,
@@ -101,7 +202,9 @@ async def create_or_update_file(
         }
 
 
-async def delete_file(
+@run_in_thread
+@lease_clients
+def delete_file(
     owner: str, 
     repo: str, 
     path: str, 
@@ -112,6 +215,9 @@ async def delete_file(
 ) -> Dict[str, Any]:
     """Delete a file from a GitHub repository.
 
+    Like ``create_or_update_file``, the file SHA comes from the path index
+    when possible and is looked up again if GitHub rejects it.
+
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
@@ -125,34 +231,27 @@ async def delete_file(
         Dictionary containing operation result
     """
     try:
-        client = GitHubClient()
+        client = get_github_client()
         repository = client.get_repository(owner, repo)
-        
-        # Get file to delete
-        file = repository.get_contents(path, ref=branch)
-        
-        # Prepare commit data
-        commit_data = {
-            "message": message,
-            "sha": file.sha,
-            "branch": branch
-        }
+        index = get_path_index()
+        committer = _committer_args(committer_name, committer_email)
 
-        # Add committer info if provided
-        if committer_name and committer_email:
-            commit_data["committer"] = {
-                "name": committer_name,
-                "email": committer_email
-            }
+        def delete(refresh: bool) -> Dict[str, Any]:
+            sha = _file_sha(client, repository, owner, repo, path, branch, index, refresh=refresh)
+            if sha is None:
+                raise ValueError(f"File not found: {path}")
+            return repository.delete_file(path=path, message=message, sha=sha, branch=branch, **committer)
 
-        # Delete file
-        result = repository.delete_file(
-            path=path,
-            message=message,
-            sha=file.sha,
-            branch=branch,
-            committer=commit_data.get("committer")
-        )
+        try:
+            result = delete(refresh=False)
+        except (GithubException, ValueError) as e:
+            # 색인이 오래되었을 수 있으므로 파일을 직접 조회해 한 번 더 시도
+            if index is None or (isinstance(e, GithubException) and not _is_sha_mismatch(e)):
+                raise
+            result = delete(refresh=True)
+        client.invalidate_repository(owner, repo)
+        if index is not None:
+            index.put(owner, repo, branch, path, None)
 
         return {
             "success": True,
@@ -160,7 +259,7 @@ async def delete_file(
             "data": {
                 "operation": "deleted",
                 "path": path,
-                "commit_sha": result.commit.sha,
+                "commit_sha": result["commit"].sha,
                 "commit_message": message,
                 "branch": branch
             }
@@ -174,7 +273,9 @@ async def delete_file(
         }
 
 
-async def create_branch(
+@run_in_thread
+@lease_clients
+def create_branch(
     owner: str, 
     repo: str, 
     new_branch: str, 
@@ -192,7 +293,7 @@ async def create_branch(
         Dictionary containing operation result
     """
     try:
-        client = GitHubClient()
+        client = get_github_client()
         repository = client.get_repository(owner, repo)
         
         # Get base branch reference
@@ -200,6 +301,7 @@ async def create_branch(
         
         # Create new branch
         repository.create_git_ref(f"refs/heads/{new_branch}", base_ref.commit.sha)
+        client.invalidate_repository(owner, repo)
 
         return {
             "success": True,
@@ -220,7 +322,200 @@ async def create_branch(
         }
 
 
-async def create_commit_with_multiple_files(
+def _blob_elements(
+    repository: Any, blobs: List[Tuple[str, str, bytes]], store: Any
+) -> Tuple[List[InputGitTreeElement], int]:
+    """Build tree entries for file contents.
+
+    Small text content is inlined into the tree payload so GitHub creates
+    the blob itself; larger, binary or NUL-containing content is uploaded
+    as blobs concurrently.
+
+    Args:
+        repository: PyGithub repository
+        blobs: ``(path, mode, data)`` for each file
+        store: Blob store to seed with the written contents, or None
+
+    Returns:
+        Tuple of tree entries (in input order) and the number of blobs created
+    """
+    elements: List[Optional[InputGitTreeElement]] = [None] * len(blobs)
+    uploads = []
+    for index, (path, mode, data) in enumerate(blobs):
+        if store is not None:
+            store.put(git_blob_sha(data), data)
+        text = _inline_text(data)
+        if text is not None:
+            elements[index] = InputGitTreeElement(path, mode, "blob", content=text)
+        else:
+            uploads.append((index, path, mode, data))
+
+    if uploads:
+        def upload(data: bytes) -> str:
+            try:
+                return repository.create_git_blob(data.decode("utf-8"), "utf-8").sha
+            except UnicodeDecodeError:
+                return repository.create_git_blob(base64.b64encode(data).decode("ascii"), "base64").sha
+
+        with ThreadPoolExecutor(max_workers=min(DEFAULT_BLOB_WORKERS, len(uploads))) as executor:
+            # contextvars(API 호출 집계)를 작업 스레드로 전달
+            futures = [
+                (index, path, mode, executor.submit(contextvars.copy_context().run, upload, data))
+                for index, path, mode, data in uploads
+            ]
+            for index, path, mode, future in futures:
+                elements[index] = InputGitTreeElement(path, mode, "blob", sha=future.result())
+
+    return elements, len(uploads)
+
+
+def _inline_text(data: bytes) -> Optional[str]:
+    """Return content small enough to inline into a tree request, else None."""
+    if len(data) > MAX_INLINE_CONTENT_BYTES or b"\0" in data:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def _change_elements(
+    repository: Any, files: List[Dict[str, Any]], store: Any
+) -> Tuple[List[InputGitTreeElement], int]:
+    """Build tree entries for file changes without any existence checks.
+
+    Deletions become entries with a null SHA; creates and updates go
+    through ``_blob_elements``.
+
+    Args:
+        repository: PyGithub repository
+        files: File changes (each with 'path', 'content', 'operation')
+        store: Blob store to seed with the written contents, or None
+
+    Returns:
+        Tuple of tree entries and the number of blobs created
+
+    Raises:
+        ValueError: If a change has an invalid path or operation
+    """
+    deletions = []
+    blobs = []
+    for file_info in files:
+        path = file_info.get("path", "")
+        operation = file_info.get("operation")
+        if not validate_file_path(path):
+            raise ValueError(f"Invalid file path: {path}")
+        if operation not in COMMIT_OPERATIONS:
+            raise ValueError(
+                f"Invalid operation '{operation}' for {path}. Use {', '.join(COMMIT_OPERATIONS)}"
+            )
+        if operation == "delete":
+            deletions.append(InputGitTreeElement(path, "100644", "blob", sha=None))
+        else:
+            blobs.append((path, "100644", file_info.get("content", "").encode("utf-8")))
+
+    elements, blobs_created = _blob_elements(repository, blobs, store)
+    return elements + deletions, blobs_created
+
+
+def _update_branch(repository: Any, branch: str, sha: str) -> None:
+    """Fast-forward a branch to a commit with a single ``PATCH`` request."""
+    repository.requester.requestJsonAndCheck(
+        "PATCH",
+        f"{repository.url}/git/refs/heads/{quote(branch)}",
+        input={"sha": sha, "force": False},
+    )
+
+
+def _is_non_fast_forward(error: GithubException) -> bool:
+    message = error.data.get("message", "") if isinstance(error.data, dict) else ""
+    return error.status == 422 and "fast forward" in message.lower()
+
+
+def _commit_tree(
+    repository: Any,
+    branch: str,
+    head: Any,
+    build: Callable[[Any], List[InputGitTreeElement]],
+    message: str,
+    committer_name: Optional[str],
+    committer_email: Optional[str],
+    timings: Dict[str, float],
+) -> Tuple[str, int]:
+    """Apply tree entries on top of a branch head and move the branch.
+
+    The branch is updated without force. When another commit landed in
+    the meantime the update is rejected as not a fast forward; the head
+    is then read again, the entries are rebuilt for it with ``build``
+    (reusing the blobs already created) and applied onto its tree, with
+    exponential backoff for up to ``MAX_COMMIT_ATTEMPTS`` attempts.
+
+    Args:
+        repository: PyGithub repository
+        branch: Branch to update
+        head: Head commit of the branch (``Branch.commit``)
+        build: Returns the tree entries for a head commit; may raise to
+            abort when the changes no longer apply to a newer head
+        message: Commit message
+        committer_name: Committer name (optional)
+        committer_email: Committer email (optional)
+        timings: Filled with the seconds spent on tree, commit and ref update
+            (summed over attempts)
+
+    Returns:
+        Tuple of the new commit SHA and the number of attempts
+
+    Raises:
+        GithubException: If the branch is still moving after the last attempt
+        ValueError: If ``build`` rejects a newer head
+    """
+    commit_args = _committer_args(committer_name, committer_email)
+
+    def timed(phase: str, started: float) -> None:
+        timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - started
+
+    for attempt in range(1, MAX_COMMIT_ATTEMPTS + 1):
+        elements = build(head)
+        started = time.perf_counter()
+        new_tree = repository.create_git_tree(elements, head.commit.tree)
+        timed("tree", started)
+
+        started = time.perf_counter()
+        # 부모는 SHA만 있으면 되므로 조회 없이 GitCommit 객체 생성
+        parent = GitCommit(repository.requester, {}, {"sha": head.sha}, completed=True)
+        new_commit = repository.create_git_commit(message, new_tree, [parent], **commit_args)
+        timed("commit", started)
+
+        started = time.perf_counter()
+        try:
+            _update_branch(repository, branch, new_commit.sha)
+            return new_commit.sha, attempt
+        except GithubException as e:
+            if not _is_non_fast_forward(e) or attempt == MAX_COMMIT_ATTEMPTS:
+                raise
+        finally:
+            timed("ref_update", started)
+
+        # 다른 커밋이 먼저 반영됨: 새 head 기준으로 항목을 다시 만들어 커밋
+        time.sleep(COMMIT_RETRY_BACKOFF * (2 ** (attempt - 1)) * random.uniform(0.5, 1.0))
+        head = repository.get_branch(branch).commit
+
+
+def _invalidate_branch(client: Any, owner: str, repo: str, branch: str) -> None:
+    """Drop cached state of a branch after a commit that rewrote its tree."""
+    client.invalidate_repository(owner, repo)
+    index = get_path_index()
+    if index is not None:
+        index.invalidate(owner, repo, branch)
+
+
+def _timings_ms(timings: Dict[str, float]) -> Dict[str, float]:
+    return {phase: round(seconds * 1000, 1) for phase, seconds in timings.items()}
+
+
+@run_in_thread
+@lease_clients
+def create_commit_with_multiple_files(
     owner: str,
     repo: str,
     files: list,
@@ -231,10 +526,14 @@ async def create_commit_with_multiple_files(
 ) -> Dict[str, Any]:
     """Create a commit with multiple file changes.
 
+    The commit is built from the branch head in four phases (blobs, tree,
+    commit, ref update) whose durations are reported in ``timings_ms``.
+
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
-        files: List of file changes (each with 'path', 'content', 'operation')
+        files: List of file changes (each with 'path', 'content', 'operation'
+            where operation is create, update or delete)
         message: Commit message
         branch: Target branch (default: main)
         committer_name: Committer name (optional)
@@ -244,74 +543,35 @@ async def create_commit_with_multiple_files(
         Dictionary containing operation result
     """
     try:
-        client = GitHubClient()
+        client = get_github_client()
         repository = client.get_repository(owner, repo)
-        
-        # Get current tree
-        branch_ref = repository.get_branch(branch)
-        base_tree = branch_ref.commit.commit.tree
-        
-        # Prepare tree elements
-        tree_elements = []
-        
-        for file_info in files:
-            path = file_info["path"]
-            operation = file_info["operation"]
-            content = file_info.get("content", "")
-            
-            if operation == "create" or operation == "update":
-                # Create or update file
-                try:
-                    existing_file = repository.get_contents(path, ref=branch)
-                    tree_elements.append({
-                        "path": path,
-                        "mode": "100644",
-                        "type": "blob",
-                        "sha": repository.create_git_blob(content, "utf-8").sha
-                    })
-                except:
-                    # File doesn't exist, create new
-                    tree_elements.append({
-                        "path": path,
-                        "mode": "100644",
-                        "type": "blob",
-                        "sha": repository.create_git_blob(content, "utf-8").sha
-                    })
-            
-            elif operation == "delete":
-                # Skip deleted files in tree creation
-                pass
-        
-        # Create new tree
-        new_tree = repository.create_git_tree(tree_elements, base_tree)
-        
-        # Create commit
-        commit_data = {
-            "message": message,
-            "tree": new_tree,
-            "parents": [branch_ref.commit.sha]
-        }
-        
-        if committer_name and committer_email:
-            commit_data["committer"] = {
-                "name": committer_name,
-                "email": committer_email
-            }
-        
-        new_commit = repository.create_git_commit(**commit_data)
-        
-        # Update branch reference
-        branch_ref.edit(sha=new_commit.sha)
-        
+
+        # Get current head and tree (브랜치 응답에 트리 SHA까지 포함)
+        head = repository.get_branch(branch).commit
+        timings = {}
+
+        started = time.perf_counter()
+        tree_elements, blobs_created = _change_elements(repository, files, get_blob_store())
+        timings["blobs"] = time.perf_counter() - started
+
+        commit_sha, attempts = _commit_tree(
+            repository, branch, head, lambda _: tree_elements,
+            message, committer_name, committer_email, timings,
+        )
+        _invalidate_branch(client, owner, repo, branch)
+
         return {
             "success": True,
             "summary": f"Commit created successfully with {len(files)} file changes",
             "data": {
                 "operation": "multi_file_commit",
-                "commit_sha": new_commit.sha,
+                "commit_sha": commit_sha,
                 "commit_message": message,
                 "branch": branch,
-                "files_processed": len(files)
+                "files_processed": len(files),
+                "blobs_created": blobs_created,
+                "attempts": attempts,
+                "timings_ms": _timings_ms(timings),
             }
         }
 
@@ -323,13 +583,329 @@ async def create_commit_with_multiple_files(
         }
 
 
-async def get_repository_status(
+def _list_head(repository: Any, head: Any) -> List[Dict[str, Any]]:
+    """List every tree entry of a branch head (``Branch.commit``).
+
+    The root tree SHA from the branch response is put into the tree cache
+    first, so the listing costs a single recursive tree request at most.
+    """
+    cache = get_tree_cache()
+    cache.put_root(cache.make_key(repository, head.sha), head.commit.tree.sha)
+    return fetch_tree(repository, head.sha, cache)[1]
+
+
+def _local_blobs(local_path: str) -> Dict[str, Tuple[str, str]]:
+    """Hash every file below a directory the way ``git hash-object`` does.
+
+    Args:
+        local_path: Directory to scan (``.git`` directories are skipped)
+
+    Returns:
+        Mapping of ``/``-separated relative path to ``(mode, blob SHA)``
+    """
+    blobs = {}
+    for root, dirs, names in os.walk(local_path):
+        # 디렉터리 심볼릭 링크는 따라가지 않고 링크 자체를 파일로 취급
+        links = [d for d in dirs if os.path.islink(os.path.join(root, d))]
+        dirs[:] = [d for d in dirs if d != ".git" and d not in links]
+        for name in names + links:
+            full_path = os.path.join(root, name)
+            mode, data = _read_local_file(full_path)
+            relative = os.path.relpath(full_path, local_path).replace(os.sep, "/")
+            blobs[relative] = (mode, git_blob_sha(data))
+    return blobs
+
+
+def _read_local_file(full_path: str) -> Tuple[str, bytes]:
+    """Read a local file as a git tree mode and blob content."""
+    if os.path.islink(full_path):
+        return "120000", os.readlink(full_path).encode("utf-8")
+    mode = "100755" if os.stat(full_path).st_mode & stat.S_IXUSR else "100644"
+    with open(full_path, "rb") as f:
+        return mode, f.read()
+
+
+@run_in_thread
+@lease_clients
+def sync_directory(
+    owner: str,
+    repo: str,
+    local_path: str,
+    remote_prefix: str = "",
+    branch: str = "main",
+    message: Optional[str] = None,
+    delete_missing: bool = False,
+    committer_name: Optional[str] = None,
+    committer_email: Optional[str] = None
+) -> Dict[str, Any]:
+    """Upload a local directory to a repository path in a single commit.
+
+    Local files are hashed like ``git hash-object`` and compared with the
+    blob SHAs (and modes) of one recursive listing of the branch tree, so
+    only new or changed files are read again and sent. Nothing is
+    committed when the directory already matches.
+
+    Args:
+        owner: Repository owner (username or organization)
+        repo: Repository name
+        local_path: Local directory to upload
+        remote_prefix: Repository directory to sync into (default: root)
+        branch: Target branch (default: main)
+        message: Commit message (default: "Sync {remote_prefix}")
+        delete_missing: Also delete remote files missing locally
+        committer_name: Committer name (optional)
+        committer_email: Committer email (optional)
+
+    Returns:
+        Dictionary containing operation result
+    """
+    try:
+        if not os.path.isdir(local_path):
+            raise ValueError(f"Not a directory: {local_path}")
+        prefix = remote_prefix.strip("/")
+        if prefix and not validate_file_path(prefix):
+            raise ValueError(f"Invalid remote prefix: {remote_prefix}")
+
+        client = get_github_client()
+        repository = client.get_repository(owner, repo)
+        timings = {}
+
+        started = time.perf_counter()
+        local = _local_blobs(local_path)
+        timings["hash"] = time.perf_counter() - started
+
+        head = repository.get_branch(branch).commit
+        entries = _list_head(repository, head)
+        base = f"{prefix}/" if prefix else ""
+        remote = {
+            entry["path"][len(base):]: (entry["mode"], entry["sha"])
+            for entry in entries
+            if entry["type"] == "blob" and entry["path"].startswith(base)
+        }
+
+        changed = sorted(path for path, blob in local.items() if remote.get(path) != blob)
+        deleted = sorted(set(remote) - set(local)) if delete_missing else []
+        data = {
+            "operation": "sync_directory",
+            "branch": branch,
+            "remote_prefix": prefix,
+            "files_scanned": len(local),
+            "files_changed": len(changed),
+            "files_deleted": len(deleted),
+            "unchanged": len(local) - len(changed),
+        }
+        if not changed and not deleted:
+            data["commit_sha"] = None
+            data["timings_ms"] = _timings_ms(timings)
+            return {
+                "success": True,
+                "summary": f"{local_path} is already in sync with {branch}:{prefix or '/'}",
+                "data": data,
+            }
+
+        started = time.perf_counter()
+        blobs = []
+        for path in changed:
+            mode, content = _read_local_file(os.path.join(local_path, *path.split("/")))
+            blobs.append((base + path, mode, content))
+        elements, data["blobs_created"] = _blob_elements(repository, blobs, get_blob_store())
+        elements += [InputGitTreeElement(base + path, "100644", "blob", sha=None) for path in deleted]
+        timings["blobs"] = time.perf_counter() - started
+
+        data["commit_sha"], data["attempts"] = _commit_tree(
+            repository, branch, head, lambda _: elements, message or f"Sync {prefix or '/'}",
+            committer_name, committer_email, timings,
+        )
+        data["timings_ms"] = _timings_ms(timings)
+        _invalidate_branch(client, owner, repo, branch)
+
+        return {
+            "success": True,
+            "summary": (
+                f"Synced {local_path} to {branch}:{prefix or '/'} "
+                f"({len(changed)} changed, {len(deleted)} deleted, {data['unchanged']} unchanged)"
+            ),
+            "data": data,
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "summary": f"Failed to sync directory: {str(e)}"
+        }
+
+
+def _relocate_files(
+    owner: str,
+    repo: str,
+    files: list,
+    message: str,
+    branch: str,
+    committer_name: Optional[str],
+    committer_email: Optional[str],
+    keep_source: bool,
+) -> Dict[str, Any]:
+    """Move or copy files and directories by rewriting tree entries.
+
+    Destinations point at the blob and tree SHAs already in the branch
+    tree, so no content is downloaded or uploaded; the cost is the same
+    handful of requests for one file or a whole directory.
+
+    Args:
+        owner: Repository owner (username or organization)
+        repo: Repository name
+        files: List of ``{"source": ..., "destination": ...}`` paths
+        message: Commit message
+        branch: Target branch
+        committer_name: Committer name (optional)
+        committer_email: Committer email (optional)
+        keep_source: True to copy, False to move
+
+    Returns:
+        Dictionary containing operation result
+    """
+    operation = "copy_files" if keep_source else "move_files"
+    try:
+        pairs = []
+        for item in files:
+            source = item.get("source", "").strip("/")
+            destination = item.get("destination", "").strip("/")
+            for path in (source, destination):
+                if not validate_file_path(path):
+                    raise ValueError(f"Invalid file path: {path}")
+            if destination == source or destination.startswith(source + "/"):
+                raise ValueError(f"Cannot {operation.split('_')[0]} {source} into itself")
+            pairs.append((source, destination))
+        if not pairs:
+            raise ValueError("files must contain at least one source/destination pair")
+        destinations = [destination for _, destination in pairs]
+        if len(set(destinations)) != len(destinations):
+            raise ValueError("Destinations must be unique")
+
+        client = get_github_client()
+        repository = client.get_repository(owner, repo)
+        head = repository.get_branch(branch).commit
+        timings = {}
+
+        def build(head: Any) -> List[InputGitTreeElement]:
+            # 재시도할 때마다 새 head의 목록으로 원본 SHA와 대상 경로를 다시 확인
+            started = time.perf_counter()
+            entries = {entry["path"]: entry for entry in _list_head(repository, head)}
+            elements = []
+            for source, destination in pairs:
+                entry = entries.get(source)
+                if entry is None:
+                    raise ValueError(f"File not found: {source}")
+                if destination in entries:
+                    raise ValueError(f"Destination already exists: {destination}")
+                elements.append(InputGitTreeElement(destination, entry["mode"], entry["type"], sha=entry["sha"]))
+                if not keep_source:
+                    elements.append(InputGitTreeElement(source, entry["mode"], entry["type"], sha=None))
+            timings["tree_listing"] = timings.get("tree_listing", 0.0) + time.perf_counter() - started
+            return elements
+
+        commit_sha, attempts = _commit_tree(
+            repository, branch, head, build, message, committer_name, committer_email, timings
+        )
+        _invalidate_branch(client, owner, repo, branch)
+
+        verb = "Copied" if keep_source else "Moved"
+        return {
+            "success": True,
+            "summary": f"{verb} {len(pairs)} path(s) in {repository.full_name} ({branch})",
+            "data": {
+                "operation": operation,
+                "commit_sha": commit_sha,
+                "commit_message": message,
+                "branch": branch,
+                "files": [{"source": s, "destination": d} for s, d in pairs],
+                "attempts": attempts,
+                "timings_ms": _timings_ms(timings),
+            }
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "summary": f"Failed to {operation.split('_')[0]} files: {str(e)}"
+        }
+
+
+@run_in_thread
+@lease_clients
+def move_files(
+    owner: str,
+    repo: str,
+    files: list,
+    message: str,
+    branch: str = "main",
+    committer_name: Optional[str] = None,
+    committer_email: Optional[str] = None
+) -> Dict[str, Any]:
+    """Move or rename files and directories in one commit without transferring content.
+
+    Args:
+        owner: Repository owner (username or organization)
+        repo: Repository name
+        files: List of ``{"source": ..., "destination": ...}`` paths
+        message: Commit message
+        branch: Target branch (default: main)
+        committer_name: Committer name (optional)
+        committer_email: Committer email (optional)
+
+    Returns:
+        Dictionary containing operation result
+    """
+    return _relocate_files(
+        owner, repo, files, message, branch, committer_name, committer_email, keep_source=False
+    )
+
+
+@run_in_thread
+@lease_clients
+def copy_files(
+    owner: str,
+    repo: str,
+    files: list,
+    message: str,
+    branch: str = "main",
+    committer_name: Optional[str] = None,
+    committer_email: Optional[str] = None
+) -> Dict[str, Any]:
+    """Copy files and directories in one commit without transferring content.
+
+    Args:
+        owner: Repository owner (username or organization)
+        repo: Repository name
+        files: List of ``{"source": ..., "destination": ...}`` paths
+        message: Commit message
+        branch: Target branch (default: main)
+        committer_name: Committer name (optional)
+        committer_email: Committer email (optional)
+
+    Returns:
+        Dictionary containing operation result
+    """
+    return _relocate_files(
+        owner, repo, files, message, branch, committer_name, committer_email, keep_source=True
+    )
+
+
+@run_in_thread
+@lease_clients
+def get_repository_status(
     owner: str, 
     repo: str, 
     ref: str = "HEAD"
 ) -> Dict[str, Any]:
     """Get repository status including last commit and branch info.
 
+    The ref is resolved to a commit SHA (echoed as ``resolved_sha``) and the
+    commit details are cached under it, so only the ref lookup and the
+    branch check are repeated for an unchanged branch.
+
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
@@ -339,35 +915,54 @@ async def get_repository_status(
         Dictionary containing repository status
     """
     try:
-        client = GitHubClient()
+        client = get_github_client()
         repository = client.get_repository(owner, repo)
-        
-        # Get commit
-        commit = repository.get_commit(ref)
-        
-        # Get branch info
-        try:
-            branch = repository.get_branch(ref)
-            branch_name = branch.name
-            is_default = branch.name == repository.default_branch
-        except:
-            branch_name = "detached HEAD"
-            is_default = False
-        
-        return {
-            "success": True,
-            "summary": f"Repository status for {ref}",
-            "data": {
+        resolved = client.resolve_ref(owner, repo, ref)
+
+        # Get commit (커밋 SHA 기준이므로 영구 캐시)
+        cache = get_sha_cache()
+        key = ("commit", repository.url.lower(), resolved)
+        commit_data = cache.get(key) if cache is not None else None
+        if commit_data is None:
+            commit = repository.get_commit(resolved)
+            commit_data = {
                 "commit_sha": commit.sha,
                 "commit_message": commit.commit.message,
                 "commit_author": commit.commit.author.name,
                 "commit_date": commit.commit.author.date.isoformat(),
-                "branch": branch_name,
-                "is_default_branch": is_default,
                 "files_changed": commit.files.totalCount if commit.files else 0,
                 "additions": commit.stats.additions,
-                "deletions": commit.stats.deletions
+                "deletions": commit.stats.deletions,
             }
+            if cache is not None:
+                cache.put(key, commit_data)
+
+        # Get branch info
+        branch_name = "detached HEAD"
+        is_default = False
+        if not is_commit_sha(ref):
+            try:
+                branch = repository.get_branch(ref)
+                branch_name = branch.name
+                is_default = branch.name == repository.default_branch
+            except:
+                pass
+
+        return {
+            "success": True,
+            "summary": f"Repository status for {ref}",
+            "data": {
+                "commit_sha": commit_data["commit_sha"],
+                "commit_message": commit_data["commit_message"],
+                "commit_author": commit_data["commit_author"],
+                "commit_date": commit_data["commit_date"],
+                "branch": branch_name,
+                "is_default_branch": is_default,
+                "files_changed": commit_data["files_changed"],
+                "additions": commit_data["additions"],
+                "deletions": commit_data["deletions"]
+            },
+            "resolved_sha": resolved,
         }
 
     except Exception as e:
@@ -0,0 +1,244 @@
+"""Shared HTTP transport for the PyGithub requester of a GitHubClient."""
+
+import threading
+from typing import Any, Dict, Optional
+
+from github import Github
+from github.GithubRetry import GithubRetry
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from api_calls import record_api_call
+from http_cache import CacheEntry, ConditionalCache
+from rate_limit import RateLimitScheduler
+from single_flight import SingleFlight
+from token_pool import TokenPool, TokenState
+
+READ_METHODS = ("GET", "HEAD")
+
+
+class GitHubTransport(HTTPAdapter):
+    """requests adapter that every GitHub call of a pooled client goes through.
+
+    The adapter owns a keep-alive connection pool. ``pool_block`` makes
+    ``pool_size`` a hard limit on concurrent connections per host instead of
+    opening (and then discarding) extra connections under load. With a
+    ``cache`` every GET is sent as a conditional request and 304 responses
+    are answered from the cache. With a ``scheduler`` every request waits
+    for rate-limit budget and rate-limited responses are retried. With a
+    ``token_pool`` the Authorization header is chosen per request and each
+    token is paced by its own scheduler. With ``single_flight`` identical
+    GETs issued concurrently from several threads share one request.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        pool_block: bool = True,
+        cache: Optional[ConditionalCache] = None,
+        scheduler: Optional[RateLimitScheduler] = None,
+        token_pool: Optional[TokenPool] = None,
+        single_flight: Optional[SingleFlight] = None,
+    ):
+        """Initialize transport.
+
+        Args:
+            pool_size: Maximum number of keep-alive connections per host
+            pool_block: Block instead of opening extra connections when the pool is busy
+            cache: Conditional-request cache for GET responses (optional)
+            scheduler: Rate-limit scheduler pacing all requests (optional)
+            token_pool: Tokens to balance requests across (optional)
+            single_flight: Coalescer for identical concurrent GETs (optional)
+        """
+        if scheduler is None and token_pool is None:
+            retry = GithubRetry()
+        else:
+            # rate limit 재시도는 scheduler가 담당하고, 여기서는 연결 오류만 재시도
+            retry = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5)
+        super().__init__(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+            pool_block=pool_block,
+        )
+        self.pool_size = pool_size
+        self.cache = cache
+        self.scheduler = scheduler
+        self.token_pool = token_pool
+        self.single_flight = single_flight
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        """Send a request through the shared connection pool."""
+        if request.method != "GET" or kwargs.get("stream"):
+            return self._send(request, **kwargs)
+        if self.single_flight is None:
+            return self._send_read(request, **kwargs)
+
+        # 토큰 선택/조건부 헤더가 붙기 전의 요청으로 키를 만든다
+        key = (
+            request.url,
+            request.headers.get("Accept", ""),
+            request.headers.get("Authorization", ""),
+        )
+
+        def fetch() -> Response:
+            response = self._send_read(request, **kwargs)
+            # 본문을 미리 읽어 두어야 다른 스레드와 공유할 수 있다
+            _ = response.content
+            return response
+
+        response, shared = self.single_flight.do(key, fetch)
+        return _copy_response(response, request) if shared else response
+
+    def _send_read(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        if self.cache is not None:
+            return self._send_conditional(request, **kwargs)
+        return self._send(request, **kwargs)
+
+    def _send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        if self.scheduler is None and self.token_pool is None:
+            return self._send_once(request, **kwargs)
+
+        resource = RateLimitScheduler.resource_for(request.url)
+        attempt = 0
+        while True:
+            state = self._select_token(request, resource)
+            scheduler = state.scheduler if state is not None else self.scheduler
+
+            scheduler.wait(resource)
+            response = self._send_once(request, **kwargs)
+            scheduler.update(resource, response.headers)
+
+            if response.status_code not in (403, 429):
+                return response
+            body = "" if kwargs.get("stream") else response.text
+            delay = scheduler.retry_delay(
+                response.status_code, response.headers, body, attempt
+            )
+            if state is not None and (delay is not None or _is_exhausted(response)):
+                self.token_pool.record_rejection(state)
+                # 읽기 요청은 다른 토큰으로 바로 재시도
+                if request.method in READ_METHODS and self.token_pool.has_alternative(
+                    resource, state
+                ):
+                    delay = 0.0
+            if delay is None or attempt >= scheduler.max_retries:
+                return response
+            # 거절된 요청은 실패시키지 않고 대기열에서 다시 보냄
+            _ = response.content
+            attempt += 1
+
+    def _select_token(
+        self, request: PreparedRequest, resource: str
+    ) -> Optional[TokenState]:
+        if self.token_pool is None:
+            return None
+        state = self.token_pool.select(
+            resource, write=request.method not in READ_METHODS
+        )
+        request.headers["Authorization"] = f"token {state.token}"
+        return state
+
+    def _send_once(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        with self._lock:
+            self.requests_sent += 1
+        record_api_call()
+        return super().send(request, **kwargs)
+
+    def _send_conditional(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        key = self.cache.make_key(request.method, request.url, request.headers)
+        entry = self.cache.get(key)
+        if entry is not None:
+            request.headers.update(entry.conditional_headers())
+
+        response = self._send(request, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.record_not_modified(entry)
+            # 빈 304 본문을 끝까지 읽어 커넥션을 keep-alive 풀로 돌려준다
+            _ = response.content
+            return _response_from_cache(request, entry, response.headers)
+
+        if response.status_code == 200:
+            if entry is not None:
+                self.cache.record_changed()
+            self.cache.put(key, response.headers, response.content)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Return transport counters.
+
+        Returns:
+            Dictionary with pool size, number of requests sent, rate-limit budget,
+            per-token usage and coalesced requests
+        """
+        return {
+            "pool_size": self.pool_size,
+            "requests_sent": self.requests_sent,
+            "rate_limit": self.scheduler.snapshot() if self.scheduler else None,
+            "tokens": self.token_pool.stats() if self.token_pool else None,
+            "single_flight": self.single_flight.stats() if self.single_flight else None,
+        }
+
+
+def _is_exhausted(response: Response) -> bool:
+    return response.headers.get("X-RateLimit-Remaining") == "0"
+
+
+def _response_from_cache(
+    request: PreparedRequest, entry: CacheEntry, fresh_headers: Any
+) -> Response:
+    """Build a 200 response from a cache entry after a 304."""
+    response = Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.headers = CaseInsensitiveDict(entry.headers)
+    # 304 응답의 rate limit 헤더 등 최신 값으로 갱신
+    for name, value in fresh_headers.items():
+        if name.lower() not in ("content-length", "content-encoding", "transfer-encoding"):
+            response.headers[name] = value
+    response._content = entry.body
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    return response
+
+
+def _copy_response(response: Response, request: PreparedRequest) -> Response:
+    """Copy a fully read response for a caller that shared its request."""
+    copy = Response()
+    copy.status_code = response.status_code
+    copy.reason = response.reason
+    copy.headers = CaseInsensitiveDict(response.headers)
+    copy._content = response.content
+    copy.encoding = response.encoding
+    copy.url = response.url
+    copy.request = request
+    return copy
+
+
+def install_transport(github: Github, transport: HTTPAdapter) -> None:
+    """Route all HTTP traffic of a Github instance through a transport.
+
+    PyGithub creates its own requests session lazily, so we swap the
+    connection class of the requester for one that mounts our adapter.
+
+    Args:
+        github: PyGithub instance
+        transport: Adapter to mount for http:// and https://
+    """
+    requester = github.requester
+    # PyGithub에는 세션 주입 API가 없어서 requester의 connection class를 교체
+    connection_class = requester._Requester__connectionClass
+
+    class _TransportConnection(connection_class):  # type: ignore[misc, valid-type]
+        def __init__(self, *args: Any, **kwargs: Any):
+            super().__init__(*args, **kwargs)
+            self.session.mount("http://", transport)
+            self.session.mount("https://", transport)
+
+    requester._Requester__connectionClass = _TransportConnection
@@ -0,0 +1,284 @@
+"""Recursive git tree listings, cached by tree SHA."""
+
+import contextvars
+import fnmatch
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from github.Repository import Repository
+
+from ref_resolver import is_commit_sha
+from snapshot_store import Snapshot
+
+# truncated 트리를 하위 트리로 나눠 받을 때의 동시 요청 수
+DEFAULT_TREE_WORKERS = 8
+
+TreeKey = Tuple[str, str]
+
+
+class TreeCache:
+    """LRU cache of full recursive tree listings keyed by tree SHA.
+
+    A tree SHA names immutable content, so entries never expire; the cache
+    is only bounded by the total number of listed entries it holds.
+    Listings store paths relative to their tree, which lets subtrees
+    fetched during a truncated-tree walk be reused on their own.
+    """
+
+    def __init__(self, max_entries: int = 500_000):
+        """Initialize tree cache.
+
+        Args:
+            max_entries: Maximum number of tree entries kept across all listings
+        """
+        self.max_entries = max_entries
+        self._trees: "OrderedDict[TreeKey, List[Dict[str, Any]]]" = OrderedDict()
+        self._size = 0
+        # 커밋 SHA -> 루트 트리 SHA (불변)
+        self._roots: "OrderedDict[TreeKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    @classmethod
+    def from_env(cls) -> "TreeCache":
+        """Create a tree cache from GITHUB_TREE_CACHE_ENTRIES."""
+        load_dotenv()
+        return cls(max_entries=int(os.getenv("GITHUB_TREE_CACHE_ENTRIES", "500000")))
+
+    @staticmethod
+    def make_key(repository: Repository, tree_sha: str) -> TreeKey:
+        """Build the cache key of a tree (the API URL keeps hosts apart)."""
+        return repository.url.lower(), tree_sha
+
+    def get(self, key: TreeKey) -> Optional[List[Dict[str, Any]]]:
+        """Look up a cached tree listing.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            Cached entries, or None if the tree is not cached
+        """
+        with self._lock:
+            entries = self._trees.get(key)
+            if entries is None:
+                self.misses += 1
+                return None
+            self._trees.move_to_end(key)
+            self.hits += 1
+            return entries
+
+    def put(self, key: TreeKey, entries: List[Dict[str, Any]]) -> None:
+        """Store a tree listing, evicting the least recently used listings.
+
+        Listings larger than the whole budget are not stored.
+
+        Args:
+            key: Key from ``make_key``
+            entries: Every entry below the tree, paths relative to it
+        """
+        if len(entries) > self.max_entries:
+            return
+        with self._lock:
+            previous = self._trees.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._trees[key] = entries
+            self._size += len(entries)
+            while self._size > self.max_entries:
+                _, evicted = self._trees.popitem(last=False)
+                self._size -= len(evicted)
+                self.evicted += 1
+
+    def get_root(self, key: TreeKey) -> Optional[str]:
+        """Look up the root tree SHA of a commit.
+
+        Args:
+            key: Key from ``make_key`` for the commit SHA
+
+        Returns:
+            Tree SHA, or None if unknown
+        """
+        with self._lock:
+            return self._roots.get(key)
+
+    def put_root(self, key: TreeKey, tree_sha: str) -> None:
+        """Remember the root tree SHA of a commit.
+
+        Args:
+            key: Key from ``make_key`` for the commit SHA
+            tree_sha: Root tree SHA of the commit
+        """
+        with self._lock:
+            self._roots[key] = tree_sha
+            while len(self._roots) > self.max_entries // 100:
+                self._roots.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics.
+
+        Returns:
+            Dictionary with cached trees, entries and hit/miss/eviction counters
+        """
+        with self._lock:
+            return {
+                "trees": len(self._trees),
+                "entries": self._size,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evicted": self.evicted,
+            }
+
+
+def _entry(item: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    entry = {
+        "path": prefix + item["path"],
+        "type": item["type"],
+        "mode": item["mode"],
+        "sha": item["sha"],
+    }
+    if item["type"] == "blob":
+        entry["size"] = item.get("size")
+    return entry
+
+
+def fetch_tree(
+    repository: Repository,
+    ref: str,
+    cache: Optional[TreeCache] = None,
+    max_workers: int = DEFAULT_TREE_WORKERS,
+    snapshot: Optional[Snapshot] = None,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """List every entry below the root tree of a ref.
+
+    The ref is resolved with one small non-recursive tree request, which
+    is skipped for commit SHAs seen before; a cached listing of the
+    resulting tree SHA is returned as is. Otherwise the tree is fetched
+    with ``recursive=1`` in a single request. When GitHub truncates that
+    response, the tree is split into its subtrees, which are fetched
+    concurrently the same way, level by level. With a local snapshot of
+    the commit the listing is taken from its index without any request.
+
+    Args:
+        repository: Repository to read
+        ref: Branch, tag, commit SHA or tree SHA
+        cache: Tree cache to consult and fill (optional)
+        max_workers: Concurrent requests while walking a truncated tree
+        snapshot: Local snapshot of the commit ``ref`` names (optional)
+
+    Returns:
+        Tuple of the root tree SHA and its entries with full paths
+    """
+    if snapshot is not None:
+        if cache is not None:
+            cache.put_root(cache.make_key(repository, snapshot.sha), snapshot.tree_sha)
+        return snapshot.tree_sha, snapshot.entries
+
+    root_key = None
+    if cache is not None and is_commit_sha(ref):
+        root_key = cache.make_key(repository, ref)
+    root_sha = cache.get_root(root_key) if root_key is not None else None
+    if root_sha is None:
+        root_sha = repository.get_git_tree(ref).sha
+        if root_key is not None:
+            cache.put_root(root_key, root_sha)
+    if cache is not None:
+        cached = cache.get(cache.make_key(repository, root_sha))
+        if cached is not None:
+            return root_sha, cached
+
+    def fetch(sha: str) -> Tuple[bool, List[Dict[str, Any]]]:
+        data = repository.get_git_tree(sha, recursive=True).raw_data
+        if not data.get("truncated"):
+            entries = [_entry(item) for item in data["tree"]]
+            if cache is not None:
+                cache.put(cache.make_key(repository, sha), entries)
+            return True, entries
+        # 잘린 응답은 버리고 바로 아래 단계만 받아 하위 트리로 나눔
+        shallow = repository.get_git_tree(sha).raw_data["tree"]
+        return False, [_entry(item) for item in shallow]
+
+    entries: List[Dict[str, Any]] = []
+    frontier = [(root_sha, "")]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while frontier:
+            # contextvars(API 호출 집계)를 작업 스레드로 전달
+            futures = [
+                (prefix, executor.submit(contextvars.copy_context().run, fetch, sha))
+                for sha, prefix in frontier
+            ]
+            frontier = []
+            for prefix, future in futures:
+                complete, listed = future.result()
+                for entry in listed:
+                    entries.append({**entry, "path": prefix + entry["path"]} if prefix else entry)
+                    if not complete and entry["type"] == "tree":
+                        frontier.append((entry["sha"], prefix + entry["path"] + "/"))
+
+    if cache is not None:
+        cache.put(cache.make_key(repository, root_sha), entries)
+    return root_sha, entries
+
+
+def filter_tree(
+    entries: List[Dict[str, Any]],
+    path: str = "",
+    pattern: Optional[str] = None,
+    depth: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Select tree entries below a directory.
+
+    Args:
+        entries: Entries with full paths as returned by ``fetch_tree``
+        path: Directory to list (empty for the repository root)
+        pattern: Glob matched against the full path; ``*`` also matches ``/``
+        depth: Maximum depth below ``path`` (1 = direct children only)
+
+    Returns:
+        Matching entries sorted by path
+
+    Raises:
+        ValueError: If depth is smaller than 1 or ``path`` is not a directory
+    """
+    if depth is not None and depth < 1:
+        raise ValueError("depth must be 1 or greater")
+    directory = path.strip("/")
+    if directory and not any(
+        entry["path"] == directory and entry["type"] == "tree" for entry in entries
+    ):
+        raise ValueError(f"Directory not found: {directory}")
+    prefix = directory + "/" if directory else ""
+
+    selected = []
+    for entry in entries:
+        full_path = entry["path"]
+        if not full_path.startswith(prefix):
+            continue
+        if depth is not None and full_path.count("/", len(prefix)) >= depth:
+            continue
+        if pattern and not fnmatch.fnmatchcase(full_path, pattern):
+            continue
+        selected.append(entry)
+    selected.sort(key=lambda entry: entry["path"])
+    return selected
+
+
+_cache: Optional[TreeCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tree_cache() -> TreeCache:
+    """Get the process-wide tree cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TreeCache.from_env()
+    return _cache
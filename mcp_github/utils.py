@@ -1,7 +1,100 @@
 """Utility functions for GitHub MCP server."""
 
+import asyncio
+import base64
+import binascii
+import functools
+import json
 import re
-from typing import Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar, Union
+
+T = TypeVar("T")
+
+
+def run_in_thread(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """Turn a blocking tool body into a coroutine that runs in a worker thread.
+
+    PyGithub calls block, so running them directly inside an ``async def``
+    tool freezes every other in-flight request on the event loop.
+
+    Args:
+        func: Blocking function
+
+    Returns:
+        Async function awaiting ``func`` in a worker thread
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
+def encode_cursor(query: Dict[str, Any], position: Any) -> str:
+    """Encode an opaque continuation cursor for a paginated tool.
+
+    Args:
+        query: Parameters the listing was made with (bound into the cursor)
+        position: Where the next page starts (offset, GraphQL cursor, ...)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"q": query, "p": position}, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, query: Dict[str, Any]) -> Any:
+    """Decode a cursor made by ``encode_cursor`` for the same query.
+
+    Args:
+        cursor: Cursor returned by a previous call
+        query: Parameters of the current call
+
+    Returns:
+        Position stored in the cursor
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to a different query
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        stored_query, position = payload["q"], payload["p"]
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor")
+    if stored_query != query:
+        raise ValueError("Cursor does not match the request parameters")
+    return position
+
+
+def select_fields(
+    fields: Optional[Union[str, Sequence[str]]], available: Sequence[str]
+) -> List[str]:
+    """Resolve a ``fields`` projection against the fields a tool can return.
+
+    Args:
+        fields: Requested field names, as a list or comma separated string.
+            None or empty selects every field.
+        available: Field names the tool supports, in output order
+
+    Returns:
+        Selected field names in output order
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if isinstance(fields, str):
+        fields = [name.strip() for name in fields.split(",") if name.strip()]
+    if not fields:
+        return list(available)
+    unknown = sorted(set(fields) - set(available))
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(available)}"
+        )
+    return [name for name in available if name in fields]
 
 
 def is_text(data: Union[bytes, str]) -> bool:
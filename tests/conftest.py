@@ -8,6 +8,18 @@ import pytest
 from mcp_github.github_client import GitHubClient
 
 
+@pytest.fixture(autouse=True)
+def no_blob_store(monkeypatch):
+    """Keep tools from reading or filling the blob store, SHA-keyed cache, snapshots and path index."""
+    for module in ("mcp_github.tools_read", "mcp_github.tools_write", "mcp_github.resources"):
+        monkeypatch.setattr(f"{module}.get_blob_store", lambda: None)
+        monkeypatch.setattr(f"{module}.get_sha_cache", lambda: None)
+    for module in ("mcp_github.tools_read", "mcp_github.resources"):
+        monkeypatch.setattr(f"{module}.get_snapshot_store", lambda: None)
+    for module in ("mcp_github.tools_read", "mcp_github.tools_write"):
+        monkeypatch.setattr(f"{module}.get_path_index", lambda: None)
+
+
 @pytest.fixture
 def mock_github_client():
     """Mock GitHub client for testing."""
@@ -150,3 +162,26 @@ def mock_env_vars(monkeypatch):
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")
     monkeypatch.setenv("ENABLE_WRITE", "false")
     return {"GITHUB_TOKEN": "test-token", "ENABLE_WRITE": "false"}
+
+
+@pytest.fixture
+def fake_github(monkeypatch):
+    """Local fake GitHub server with the client environment pointed at it."""
+    from benchmarks.fake_github import FakeGitHub
+
+    with FakeGitHub() as fake:
+        monkeypatch.setenv("GITHUB_API_URL", fake.base_url)
+        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+        monkeypatch.setenv("GITHUB_HTTP_CACHE", "0")
+        monkeypatch.delenv("GITHUB_TOKENS", raising=False)
+        yield fake
+
+
+@pytest.fixture
+def fake_client(fake_github):
+    """Pooled GitHubClient talking to the fake GitHub server."""
+    from mcp_github.client_pool import ClientRegistry
+
+    registry = ClientRegistry()
+    yield registry.get()
+    registry.close_all()
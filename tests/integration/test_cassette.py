@@ -0,0 +1,94 @@
+"""카세트 기록/재생 테스트."""
+
+import gzip
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.cassette import Cassette, CassetteServer
+from benchmarks.fake_github import FakeGitHub
+from mcp_github.client_pool import ClientRegistry
+from mcp_github.tools_read import get_file, get_pr_diff, list_pull_requests
+
+
+async def run_session(base_url):
+    registry = ClientRegistry()
+    client = registry.get("test-token", base_url=base_url)
+    with patch("mcp_github.tools_read.get_github_client", return_value=client):
+        results = [
+            await list_pull_requests("owner", "repo", "all", backend="rest"),
+            await list_pull_requests("owner", "repo", "all"),
+            await get_pr_diff("owner", "repo", 1),
+            await get_file("owner", "repo", "README.md"),
+            await get_file("owner", "repo", "src"),
+        ]
+    registry.close_all()
+    return results
+
+
+class TestCassette:
+    """CassetteServer 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_replay_matches_recording(self, monkeypatch, tmp_path):
+        """기록한 세션을 네트워크 없이 동일하게 재생."""
+        monkeypatch.setenv("GITHUB_HTTP_CACHE", "0")
+        path = str(tmp_path / "session.json.gz")
+
+        with FakeGitHub(pulls=40, latency=0.002) as fake:
+            with CassetteServer(Cassette(), upstream=fake.base_url) as recorder:
+                recorded_url = recorder.base_url
+                recorded = await run_session(recorded_url)
+            recorder.cassette.save(path)
+
+        with CassetteServer(Cassette.load(path), time_scale=0) as replay:
+            replayed_url = replay.base_url
+            replayed = await run_session(replayed_url)
+
+        assert all(result["success"] for result in recorded)
+        assert replay.misses == 0
+        for before, after in zip(recorded, replayed):
+            # API URL은 재생 서버 주소로 바뀌어 나옴
+            assert before["summary"] == after["summary"]
+            assert before["data"].replace(recorded_url, "") == after["data"].replace(replayed_url, "")
+
+    def test_bodies_are_deduplicated(self, tmp_path):
+        """같은 응답 본문은 한 번만 저장."""
+        cassette = Cassette()
+        for path in ("/a", "/b", "/c"):
+            cassette.record(("GET", path, "", ""), 200, {}, b'{"same": true}', 0.01)
+        cassette.save(str(tmp_path / "c.json.gz"))
+
+        with gzip.open(tmp_path / "c.json.gz", "rt") as f:
+            document = json.load(f)
+        assert len(document["interactions"]) == 3
+        assert len(document["bodies"]) == 1
+
+    def test_identical_requests_replay_in_order(self):
+        """같은 요청은 기록 순서대로, 소진되면 마지막 응답 반복."""
+        cassette = Cassette()
+        key = ("GET", "/repos/o/r/git/ref/heads/main", "", "")
+        cassette.record(key, 200, {}, b"1", 0)
+        cassette.record(key, 200, {}, b"2", 0)
+
+        bodies = [cassette.bodies[cassette.match(key)["body"]] for _ in range(3)]
+
+        assert bodies == [b"1", b"2", b"2"]
+        assert cassette.match(("GET", "/other", "", "")) is None
+
+    def test_time_scale(self, tmp_path):
+        """time_scale만큼 기록된 지연을 재현."""
+        import requests
+
+        cassette = Cassette()
+        cassette.record(("GET", "/slow", "*/*", ""), 200, {}, b"{}", 0.2)
+
+        with CassetteServer(cassette, time_scale=0.5) as replay:
+            started = time.perf_counter()
+            response = requests.get(replay.base_url + "/slow")
+            elapsed = time.perf_counter() - started
+
+        assert response.status_code == 200
+        assert 0.1 <= elapsed < 0.2
@@ -0,0 +1,757 @@
+"""Fake GitHub 서버를 이용한 end-to-end 테스트."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.fake_github import BLOB_MODE, FakeGitHub, git_hash
+from mcp_github.client_pool import ClientRegistry
+from mcp_github.http_cache import ConditionalCache
+from mcp_github.blob_store import BlobStore
+from mcp_github.diff_store import DiffStore
+from mcp_github.github_client import PER_PAGE
+from mcp_github.path_index import PathIndex
+from mcp_github.ref_resolver import ShaCache
+from mcp_github.snapshot_store import SnapshotStore
+from mcp_github.tree_cache import TreeCache
+from mcp_github.resources import get_file_resource, get_tree_resource
+from mcp_github.tools_read import (
+    get_file,
+    get_files,
+    get_pr_diff,
+    get_pr_full_diff,
+    get_repo,
+    get_tree,
+    list_pull_requests,
+)
+from mcp_github.tools_write import (
+    MAX_INLINE_CONTENT_BYTES,
+    copy_files,
+    create_commit_with_multiple_files,
+    create_or_update_file,
+    delete_file,
+    get_repository_status,
+    move_files,
+    sync_directory,
+)
+
+
+class TestFakeGitHub:
+    """Fake 서버 동작 테스트."""
+
+    def test_blob_sha_matches_git(self, fake_github):
+        """blob SHA는 git hash-object와 동일."""
+        data = fake_github.repo("owner", "repo").blobs
+        content = next(iter(data.values()))
+        try:
+            expected = subprocess.run(
+                ["git", "hash-object", "--stdin"], input=content,
+                capture_output=True, check=True,
+            ).stdout.decode().strip()
+        except (OSError, subprocess.CalledProcessError):
+            pytest.skip("git not available")
+
+        assert git_hash("blob", content) == expected
+
+    def test_repository_and_contents(self, fake_client):
+        """PyGithub으로 저장소/파일 조회."""
+        repository = fake_client.get_repository("owner", "repo")
+        readme = repository.get_contents("README.md")
+
+        assert repository.full_name == "owner/repo"
+        assert readme.decoded_content.startswith(b"# repo")
+
+    def test_missing_repository(self, fake_client):
+        """없는 저장소는 404."""
+        with pytest.raises(ValueError, match="not found"):
+            fake_client.get_repository("owner", "missing")
+
+    def test_conditional_request_not_modified(self, fake_github, tmp_path):
+        """ETag 재검증은 304로 응답하고 rate limit을 차감하지 않음."""
+        registry = ClientRegistry(cache=ConditionalCache(str(tmp_path / "cache.sqlite3")))
+        client = registry.get()
+        client.github.get_repo("owner/repo")
+        remaining = client.transport.scheduler.remaining("core")
+        client.github.get_repo("owner/repo")
+
+        assert registry.cache.stats()["not_modified"] == 1
+        assert client.transport.scheduler.remaining("core") == remaining
+        registry.close_all()
+
+    def test_git_data_write_flow(self, fake_client, fake_github):
+        """blob/tree/commit/ref 쓰기 흐름과 fast-forward 검사."""
+        repository = fake_client.get_repository("owner", "repo")
+        head = repository.get_git_ref("heads/main")
+        base = repository.get_git_commit(head.object.sha)
+        blob = repository.create_git_blob("hello\n", "utf-8")
+
+        from github.InputGitTreeElement import InputGitTreeElement
+
+        tree = repository.create_git_tree(
+            [InputGitTreeElement("docs/hello.txt", "100644", "blob", sha=blob.sha)],
+            base.tree,
+        )
+        commit = repository.create_git_commit("Add hello", tree, [base])
+        head.edit(commit.sha)
+
+        fake_repo = fake_github.repo("owner", "repo")
+        assert blob.sha == git_hash("blob", b"hello\n")
+        assert fake_repo.refs["heads/main"] == commit.sha
+        assert fake_repo.lookup(tree.sha, "docs/hello.txt")["sha"] == blob.sha
+
+        from github.GithubException import GithubException
+
+        with pytest.raises(GithubException) as exc_info:
+            head.edit(base.sha)
+        assert exc_info.value.status == 422
+
+
+class TestToolsAgainstFake:
+    """도구 함수 end-to-end 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_list_pull_requests_backends_agree(self, fake_client, fake_github):
+        """GraphQL/REST backend 결과가 같고 GraphQL은 요청 수가 적음."""
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client):
+            before = fake_github.requests
+            graphql = await list_pull_requests("owner", "repo", "all")
+            graphql_requests = fake_github.requests - before
+
+            before = fake_github.requests
+            rest = await list_pull_requests("owner", "repo", "all", backend="rest")
+            rest_requests = fake_github.requests - before
+
+        assert graphql["success"] is True
+        assert json.loads(graphql["data"]) == json.loads(rest["data"])
+        assert graphql_requests == 1
+        assert rest_requests > graphql_requests
+
+    @pytest.mark.asyncio
+    async def test_output_formats(self, fake_client, fake_github):
+        """출력 형식만 다르고 같은 PR 목록을 표현하며 compact/columnar가 더 작음."""
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client):
+            results = {
+                output: await list_pull_requests("owner", "repo", "all", output=output)
+                for output in ("json", "compact", "native", "columnar")
+            }
+            invalid = await list_pull_requests("owner", "repo", output="yaml")
+
+        prs = json.loads(results["json"]["data"])
+        assert json.loads(results["compact"]["data"]) == prs
+        assert results["native"]["data"] == prs
+        columnar = results["columnar"]["data"]
+        assert [dict(zip(columnar["columns"], row)) for row in columnar["rows"]] == prs
+        sizes = {output: len(json.dumps(result["data"])) for output, result in results.items()}
+        assert sizes["columnar"] < sizes["native"] < sizes["compact"] < sizes["json"]
+        assert invalid["success"] is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["graphql", "rest"])
+    async def test_list_pull_requests_pages(self, fake_client, fake_github, backend):
+        """cursor로 나눠 조회한 결과가 한 번에 조회한 결과와 같음."""
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client):
+            everything = await list_pull_requests("owner", "repo", "all", backend=backend)
+            pages, cursor = [], None
+            while True:
+                result = await list_pull_requests(
+                    "owner", "repo", "all", backend=backend, limit=2, cursor=cursor
+                )
+                assert result["count"] <= 2
+                pages.extend(json.loads(result["data"]))
+                cursor = result["next_cursor"]
+                if cursor is None:
+                    break
+
+            oldest = await list_pull_requests(
+                "owner", "repo", "all", backend=backend, limit=1, direction="asc"
+            )
+
+        assert pages == json.loads(everything["data"])
+        assert json.loads(oldest["data"])[0] == pages[-1]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["graphql", "rest"])
+    async def test_list_pull_requests_ends_on_full_page(self, monkeypatch, backend):
+        """마지막 페이지가 가득 차도 빈 페이지로 이어지는 cursor를 주지 않음."""
+        with FakeGitHub(pulls=PER_PAGE) as fake:
+            monkeypatch.setenv("GITHUB_API_URL", fake.base_url)
+            monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+            registry = ClientRegistry()
+            with patch("mcp_github.tools_read.get_github_client", return_value=registry.get()):
+                whole = await list_pull_requests(
+                    "owner", "repo", "all", backend=backend, limit=PER_PAGE, fields=["number"]
+                )
+                half = await list_pull_requests(
+                    "owner", "repo", "all", backend=backend, limit=PER_PAGE // 2, fields=["number"]
+                )
+                rest = await list_pull_requests(
+                    "owner", "repo", "all", backend=backend, limit=PER_PAGE // 2,
+                    cursor=half["next_cursor"], fields=["number"],
+                )
+            registry.close_all()
+
+        assert whole["count"] == PER_PAGE
+        assert whole["next_cursor"] is None
+        assert half["next_cursor"] is not None
+        assert rest["count"] == PER_PAGE // 2
+        assert rest["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_field_projection_skips_requests(self, fake_client, fake_github):
+        """요청하지 않은 필드는 API 요청을 만들지 않음."""
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client):
+            repo = await get_repo("owner", "repo", fields=["full_name", "default_branch"])
+            with_topics = await get_repo("owner", "repo", fields="full_name,topics")
+            projected = await list_pull_requests(
+                "owner", "repo", "all", backend="rest", fields=["number", "title", "state"]
+            )
+            full = await list_pull_requests("owner", "repo", "all", backend="rest")
+            graphql = await list_pull_requests("owner", "repo", "all", fields=["number"])
+            unknown = await get_repo("owner", "repo", fields=["stars"])
+
+        # 첫 호출만 저장소를 조회하고 이후는 저장소 캐시 사용
+        assert json.loads(repo["data"]) == {"full_name": "owner/repo", "default_branch": "main"}
+        assert repo["api_calls"] == 1
+        assert with_topics["api_calls"] == 1
+        assert set(json.loads(with_topics["data"])) == {"full_name", "topics"}
+        assert projected["api_calls"] == 1
+        assert set(json.loads(projected["data"])[0]) == {"number", "title", "state"}
+        assert full["api_calls"] == 1 + projected["count"]
+        assert graphql["api_calls"] == 1
+        assert json.loads(graphql["data"])[0] == {"number": json.loads(projected["data"])[0]["number"]}
+        assert unknown["success"] is False
+        assert unknown["api_calls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pr_diff_projection(self, fake_client, fake_github):
+        """getPRDiff fields 지정 시 PR 상세를 조회하지 않음."""
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client):
+            full = await get_pr_diff("owner", "repo", 1)
+            projected = await get_pr_diff("owner", "repo", 1, fields=["filename", "status"])
+
+        assert full["api_calls"] == 3  # 저장소, PR, 파일 목록
+        assert projected["api_calls"] == 1
+        assert projected["total_additions"] == full["total_additions"]
+        assert set(json.loads(projected["data"])[0]) == {"filename", "status"}
+
+    @pytest.mark.asyncio
+    async def test_full_pr_diff(self, fake_client, fake_github, tmp_path):
+        """전체 diff를 한 번 내려받고 이후에는 파일/hunk 범위만 읽음."""
+        store = DiffStore(str(tmp_path))
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client), \
+                patch("mcp_github.tools_read.get_diff_store", return_value=store):
+            listing = await get_pr_full_diff("owner", "repo", 1)
+            section = await get_pr_full_diff("owner", "repo", 1, file=1)
+            path = json.loads(listing["data"])[1]["path"]
+            hunk = await get_pr_full_diff("owner", "repo", 1, file=path, hunk_start=0)
+            cut = await get_pr_full_diff("owner", "repo", 1, file=0, max_bytes=100)
+            missing = await get_pr_full_diff("owner", "repo", 1, file=99)
+
+        files = json.loads(listing["data"])
+        changed = fake_github.repo("owner", "repo").pull_files[1]
+        assert [f["path"] for f in files] == [f["filename"] for f in changed]
+        assert listing["total_additions"] == sum(f["additions"] for f in changed)
+        assert listing["api_calls"] == 1
+        # 매 호출 재검증하지만 전체 diff는 처음 한 번만 받고 이후는 304
+        assert fake_github.hits["pull"] == 5
+        assert store.stats()["stored"] == 1
+        assert store.stats()["reused"] == 4
+
+        assert section["data"].startswith(f"diff --git a/{files[1]['path']}")
+        assert section["data"].endswith(changed[1]["patch"])
+        assert len(section["data"]) == files[1]["length"]
+        assert hunk["data"] == changed[1]["patch"]
+        assert cut["truncated"] is True
+        assert cut["data"].endswith("\n") and len(cut["data"]) <= 100
+        assert missing["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_large_file_range(self, fake_client, fake_github):
+        """1MB가 넘는 파일은 raw blob에서 요청한 범위만 읽음."""
+        fake_repo = fake_github.repo("owner", "repo")
+        data = b"".join(b"row %d\n" % i for i in range(1, 300001))
+        head = fake_repo.refs["heads/main"]
+        change = {"path": "big.txt", "mode": BLOB_MODE, "type": "blob", "sha": fake_repo.put_blob(data)}
+        tree = fake_repo.apply_tree(fake_repo.commits[head]["tree"], [change])
+        fake_repo.refs["heads/main"] = fake_repo.commit(tree, [head], "Add big.txt")
+
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client), \
+                patch("mcp_github.resources.get_github_client", return_value=fake_client):
+            whole = await get_file("owner", "repo", "big.txt")
+            lines = await get_file("owner", "repo", "big.txt", start_line=1000, end_line=1002)
+            tail = await get_file("owner", "repo", "big.txt", offset=len(data) - 11, length=100)
+            resource = get_file_resource("owner", "repo", "big.txt", "main", start_line=7, end_line=7)
+
+        assert json.loads(whole["data"])["content"] is None
+        assert "start_line" in json.loads(whole["data"])["content_note"]
+        assert json.loads(lines["data"])["content"] == "row 1000\nrow 1001\nrow 1002\n"
+        tail_data = json.loads(tail["data"])
+        assert tail_data["content"] == "row 300000\n"
+        assert tail_data["eof"] is True
+        resource_data = json.loads(resource["content"])["data"]
+        assert resource_data["content"] == "row 7\n"
+        assert resource["metadata"]["uri"].endswith("?ref=main&start_line=7&end_line=7")
+        assert fake_github.hits["blob"] == 3
+
+    @pytest.mark.asyncio
+    async def test_blob_store_serves_repeated_range_reads(self, fake_client, fake_github, tmp_path):
+        """큰 파일 blob은 한 번만 내려받고 이후 범위 읽기는 저장소에서 처리."""
+        fake_repo = fake_github.repo("owner", "repo")
+        data = b"".join(b"row %d\n" % i for i in range(1, 300001))
+        head = fake_repo.refs["heads/main"]
+        change = {"path": "big.txt", "mode": BLOB_MODE, "type": "blob", "sha": fake_repo.put_blob(data)}
+        tree = fake_repo.apply_tree(fake_repo.commits[head]["tree"], [change])
+        fake_repo.refs["heads/main"] = fake_repo.commit(tree, [head], "Add big.txt")
+        store = BlobStore(str(tmp_path), mmap_threshold=1024)
+
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client), \
+                patch("mcp_github.tools_read.get_blob_store", return_value=store):
+            first = await get_file("owner", "repo", "big.txt", start_line=5, end_line=5)
+            second = await get_file("owner", "repo", "big.txt", start_line=299999)
+            readme = await get_file("owner", "repo", "README.md")
+            readme_again = await get_file("owner", "repo", "README.md")
+
+        assert json.loads(first["data"])["content"] == "row 5\n"
+        assert json.loads(second["data"])["content"] == "row 299999\nrow 300000\n"
+        assert fake_github.hits["blob"] == 1
+        assert json.loads(readme_again["data"])["content"] == json.loads(readme["data"])["content"]
+        assert store.stats()["entries"] == 2
+        assert store.stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_cached_under_resolved_sha(self, fake_client, fake_github, tmp_path):
+        """브랜치를 커밋 SHA로 고정해 반복 읽기는 요청 없이 처리하고 쓰기 후엔 새 SHA를 읽음."""
+        fake_repo = fake_github.repo("owner", "repo")
+        head = fake_repo.refs["heads/main"]
+        sha_cache = ShaCache()
+        store = BlobStore(str(tmp_path))
+
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client), \
+                patch("mcp_github.tools_read.get_sha_cache", return_value=sha_cache), \
+                patch("mcp_github.tools_read.get_blob_store", return_value=store), \
+                patch("mcp_github.tools_write.get_github_client", return_value=fake_client), \
+                patch("mcp_github.tools_write.get_sha_cache", return_value=sha_cache):
+            first = await get_file("owner", "repo", "README.md", ref="main")
+            second = await get_file("owner", "repo", "README.md", ref="main")
+            pinned = await get_repository_status("owner", "repo", head)
+            pinned_again = await get_repository_status("owner", "repo", head)
+            await create_or_update_file("owner", "repo", "README.md", "changed\n", "Edit README")
+            after = await get_file("owner", "repo", "README.md", ref="main")
+
+        assert first["resolved_sha"] == second["resolved_sha"] == head
+        # main 조회 2회 + 상태 커밋 조회 1회
+        assert fake_github.hits["rest_commit"] == 3
+        assert fake_github.hits["get_contents"] == 3  # 첫 읽기 + 쓰기 전 확인 + 쓰기 후 읽기
+        assert json.loads(second["data"])["content"] == json.loads(first["data"])["content"]
+        assert pinned_again["data"] == pinned["data"]
+        assert pinned["resolved_sha"] == head
+        assert fake_github.hits["branch"] == 0
+        assert after["resolved_sha"] == fake_repo.refs["heads/main"] != head
+        assert json.loads(after["data"])["content"] == "changed\n"
+
+    @pytest.mark.asyncio
+    async def test_get_files(self, fake_client, fake_github):
+        """여러 경로를 한 번의 ref 조회로 받고 경로별 오류는 항목에만 기록."""
+        fake_repo = fake_github.repo("owner", "repo")
+        tree = fake_repo.commits[fake_repo.refs["heads/main"]]["tree"]
+        files = [e["path"] for e in fake_repo.walk(tree) if e["type"] == "blob"][:5]
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client):
+            result = await get_files("owner", "repo", files + ["src", "missing.txt"], ref="main")
+
+        entries = json.loads(result["data"])
+        assert result["success"] is True
+        assert result["resolved_sha"] == fake_repo.refs["heads/main"]
+        assert [e["path"] for e in entries] == files + ["src", "missing.txt"]
+        for entry in entries[:5]:
+            sha = fake_repo.lookup(tree, entry["path"])["sha"]
+            assert entry["content"].encode() == fake_repo.blobs[sha]
+        assert entries[5] == {"path": "src", "success": False, "error": "Path is a directory"}
+        assert entries[6]["error"] == "File not found: missing.txt"
+        assert result["error_count"] == 2
+        # 저장소 + ref 조회 + 경로별 contents 요청
+        assert result["api_calls"] == 2 + 7
+        assert fake_github.hits["rest_commit"] == 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_serves_reads(self, fake_client, fake_github, tmp_path):
+        """허용된 저장소는 커밋 tarball 한 번으로 파일·디렉터리·트리 조회를 처리."""
+        fake_repo = fake_github.repo("owner", "repo")
+        tree = fake_repo.commits[fake_repo.refs["heads/main"]]["tree"]
+        files = [e["path"] for e in fake_repo.walk(tree) if e["type"] == "blob"]
+        snapshots = SnapshotStore(str(tmp_path), ["owner/*"])
+
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client):
+            from_api = await get_file("owner", "repo", files[0])
+            listing_api = await get_file("owner", "repo", "src")
+            contents_requests = fake_github.hits["get_contents"]
+            with patch("mcp_github.tools_read.get_snapshot_store", return_value=snapshots):
+                local = await get_file("owner", "repo", files[0])
+                listing = await get_file("owner", "repo", "src")
+                batch = await get_files("owner", "repo", files)
+                line = await get_file("owner", "repo", files[0], start_line=1, end_line=1)
+                listed = await get_tree("owner", "repo")
+
+        assert fake_github.hits["tarball"] == 1
+        assert fake_github.hits["get_contents"] == contents_requests
+        assert json.loads(local["data"])["content"] == json.loads(from_api["data"])["content"]
+        assert [f["path"] for f in json.loads(listing["data"])] == [
+            f["path"] for f in json.loads(listing_api["data"])
+        ]
+        for entry in json.loads(batch["data"]):
+            assert entry["content"].encode() == fake_repo.blobs[fake_repo.lookup(tree, entry["path"])["sha"]]
+        assert json.loads(line["data"])["start_line"] == 1
+        assert listed["tree_sha"] == tree
+        assert listed["api_calls"] == 0
+        assert sorted(e["sha"] for e in json.loads(listed["data"])) == sorted(
+            e["sha"] for e in fake_repo.walk(tree)
+        )
+
+    def test_resolve_ref(self, fake_client, fake_github):
+        """브랜치·태그·짧은 SHA를 전체 커밋 SHA로 변환."""
+        head = fake_github.repo("owner", "repo").refs["heads/main"]
+        assert fake_client.resolve_ref("owner", "repo", "main") == head
+        assert fake_client.resolve_ref("owner", "repo", head[:7]) == head
+        assert fake_client.resolve_ref("owner", "repo", head.upper()) == head
+        with pytest.raises(ValueError):
+            fake_client.resolve_ref("owner", "repo", "no-such-branch")
+
+    @pytest.mark.asyncio
+    async def test_get_tree(self, fake_client, fake_github):
+        """재귀 트리를 한 번 받아 캐시하고 필터만 바꿔 재사용."""
+        cache = TreeCache()
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client), \
+                patch("mcp_github.tools_read.get_tree_cache", return_value=cache), \
+                patch("mcp_github.resources.get_github_client", return_value=fake_client), \
+                patch("mcp_github.resources.get_tree_cache", return_value=cache):
+            full = await get_tree("owner", "repo")
+            python = await get_tree("owner", "repo", path="src/pkg1", pattern="*.py")
+            top = await get_tree("owner", "repo", depth=1)
+            missing = await get_tree("owner", "repo", path="nope")
+            resource = get_tree_resource("owner", "repo", "src", "main", depth=1)
+            missing_resource = get_tree_resource("owner", "repo", "nope", "main")
+
+        fake_repo = fake_github.repo("owner", "repo")
+        walked = list(fake_repo.walk(fake_repo.commits[fake_repo.refs["heads/main"]]["tree"]))
+        assert [e["path"] for e in json.loads(full["data"])] == sorted(e["path"] for e in walked)
+        # 저장소 조회 + 커밋 SHA 조회 + 루트 트리 조회 + 재귀 트리
+        assert full["api_calls"] == 4
+        # 커밋 SHA와 루트 트리가 캐시되어 요청 없음
+        assert python["api_calls"] == 0
+        assert full["resolved_sha"] == fake_repo.refs["heads/main"]
+        assert python["entry_count"] == 5
+        assert all(e["path"].startswith("src/pkg1/") for e in json.loads(python["data"]))
+        assert [e["path"] for e in json.loads(top["data"])] == ["README.md", "src"]
+        assert missing["success"] is False
+        # 리소스도 도구와 같이 없는 디렉터리는 에러
+        assert json.loads(missing_resource["content"])["error"] == missing["error"]
+        assert [e["path"] for e in json.loads(resource["content"])["data"]] == [
+            f"src/pkg{i}" for i in range(4)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_tree_truncated(self, fake_client, fake_github):
+        """잘린 재귀 응답은 하위 트리를 나눠 받아 같은 결과를 만듦."""
+        fake_github.tree_limit = 10
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client), \
+                patch("mcp_github.tools_read.get_tree_cache", return_value=TreeCache()):
+            result = await get_tree("owner", "repo")
+
+        fake_repo = fake_github.repo("owner", "repo")
+        walked = list(fake_repo.walk(fake_repo.commits[fake_repo.refs["heads/main"]]["tree"]))
+        assert result["entry_count"] == len(walked) > 10
+        # 저장소 + 커밋 SHA + ref 조회 + 루트/src 재귀·단일 단계 4 + pkg 4개
+        assert result["api_calls"] == 11
+
+    @pytest.mark.asyncio
+    async def test_create_file(self, fake_client, fake_github):
+        """파일 생성 커밋이 브랜치에 반영."""
+        with patch("mcp_github.tools_write.get_github_client", return_value=fake_client):
+            result = await create_or_update_file("owner", "repo", "new.txt", "hi", "Add new.txt")
+
+        fake_repo = fake_github.repo("owner", "repo")
+        tree = fake_repo.commits[fake_repo.refs["heads/main"]]["tree"]
+        assert result["success"] is True
+        assert fake_repo.blobs[fake_repo.lookup(tree, "new.txt")["sha"]] == b"hi"
+
+    @pytest.mark.asyncio
+    async def test_blind_writes_with_path_index(self, fake_client, fake_github):
+        """색인된 경로는 파일 조회 없이 바로 PUT/DELETE하고 SHA가 어긋나면 다시 조회."""
+        fake_repo = fake_github.repo("owner", "repo")
+        index = PathIndex()
+        head = fake_repo.refs["heads/main"]
+        paths = sorted(p for p in fake_repo.files(fake_repo.commits[head]["tree"]) if p.startswith("src/"))
+
+        def contents_requests():
+            return sum(fake_github.hits[name] for name in ("get_contents", "put_contents", "delete_contents"))
+
+        async def requests_for(coroutine):
+            before = contents_requests()
+            result = await coroutine
+            assert result["success"] is True
+            return result, contents_requests() - before
+
+        with patch("mcp_github.tools_read.get_github_client", return_value=fake_client), \
+                patch("mcp_github.tools_write.get_github_client", return_value=fake_client), \
+                patch("mcp_github.tools_read.get_path_index", return_value=index), \
+                patch("mcp_github.tools_write.get_path_index", return_value=index):
+            await get_tree("owner", "repo", ref="main")
+            updated, update_requests = await requests_for(
+                create_or_update_file("owner", "repo", paths[0], "one\n", "Update")
+            )
+            _, again_requests = await requests_for(
+                create_or_update_file("owner", "repo", paths[0], "two\n", "Update again")
+            )
+            _, delete_requests = await requests_for(delete_file("owner", "repo", paths[1], "Delete"))
+
+            # 다른 클라이언트가 같은 파일을 바꿔 색인의 SHA가 오래된 상황
+            head = fake_repo.refs["heads/main"]
+            tree = fake_repo.apply_tree(
+                fake_repo.commits[head]["tree"], [{"path": paths[0], "content": "theirs\n"}]
+            )
+            fake_repo.refs["heads/main"] = fake_repo.commit(tree, [head], "Other client")
+            _, stale_requests = await requests_for(
+                create_or_update_file("owner", "repo", paths[0], "mine\n", "Update stale")
+            )
+
+            index.invalidate("owner", "repo", "main")
+            _, cold_requests = await requests_for(
+                create_or_update_file("owner", "repo", "src/new.txt", "new\n", "Create")
+            )
+
+        files = fake_repo.files(fake_repo.commits[fake_repo.refs["heads/main"]]["tree"])
+        assert updated["data"]["operation"] == "updated"
+        assert fake_repo.blobs[files[paths[0]][1]] == b"mine\n"
+        assert paths[1] not in files
+        assert fake_repo.blobs[files["src/new.txt"][1]] == b"new\n"
+        assert update_requests == again_requests == delete_requests == 1
+        # 409 + 파일 조회 + 재시도
+        assert stale_requests == 3
+        # 상위 디렉터리 목록 + PUT
+        assert cold_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_multi_file_commit(self, fake_client, fake_github):
+        """존재 확인 없이 생성·수정·삭제를 한 커밋에 반영하고 큰 파일만 blob 생성."""
+        fake_repo = fake_github.repo("owner", "repo")
+        head = fake_repo.refs["heads/main"]
+        existing = [e["path"] for e in fake_repo.walk(fake_repo.commits[head]["tree"]) if e["type"] == "blob"]
+        large = "x" * (MAX_INLINE_CONTENT_BYTES + 1)
+        files = [
+            {"path": "docs/new.txt", "content": "new\n", "operation": "create"},
+            {"path": existing[0], "content": "updated\n", "operation": "update"},
+            {"path": existing[1], "operation": "delete"},
+            {"path": "data/large.txt", "content": large, "operation": "create"},
+        ]
+        with patch("mcp_github.tools_write.get_github_client", return_value=fake_client):
+            result = await create_commit_with_multiple_files("owner", "repo", files, "Batch")
+
+        commit = fake_repo.commits[fake_repo.refs["heads/main"]]
+        assert result["success"] is True
+        assert result["data"]["commit_sha"] == fake_repo.refs["heads/main"]
+        assert commit["parents"] == [head]
+        assert fake_repo.blobs[fake_repo.lookup(commit["tree"], "docs/new.txt")["sha"]] == b"new\n"
+        assert fake_repo.blobs[fake_repo.lookup(commit["tree"], existing[0])["sha"]] == b"updated\n"
+        assert fake_repo.lookup(commit["tree"], existing[1]) is None
+        assert fake_repo.blobs[fake_repo.lookup(commit["tree"], "data/large.txt")["sha"]] == large.encode()
+        assert set(result["data"]["timings_ms"]) == {"blobs", "tree", "commit", "ref_update"}
+        assert result["data"]["blobs_created"] == 1
+        assert fake_github.hits["get_contents"] == 0
+        assert fake_github.hits["create_blob"] == 1
+
+    @pytest.mark.asyncio
+    async def test_multi_file_commit_rejects_unknown_operation(self, fake_client, fake_github):
+        """알 수 없는 operation은 요청 전에 실패."""
+        files = [{"path": "a.txt", "content": "a", "operation": "rename"}]
+        with patch("mcp_github.tools_write.get_github_client", return_value=fake_client):
+            result = await create_commit_with_multiple_files("owner", "repo", files, "Bad")
+
+        assert result["success"] is False
+        assert "Invalid operation" in result["error"]
+        assert fake_github.hits["create_tree"] == 0
+
+    @pytest.mark.asyncio
+    async def test_multi_file_commit_retries_non_fast_forward(self, fake_client, fake_github, monkeypatch):
+        """브랜치가 먼저 움직이면 blob을 다시 올리지 않고 새 head 위에 재커밋."""
+        from mcp_github import tools_write
+
+        fake_repo = fake_github.repo("owner", "repo")
+        head = fake_repo.refs["heads/main"]
+        update_branch = tools_write._update_branch
+        raced = []
+
+        def racing_update(repository, branch, sha):
+            if not raced:
+                # 다른 에이전트의 커밋이 먼저 반영된 상황
+                tree = fake_repo.apply_tree(
+                    fake_repo.commits[head]["tree"], [{"path": "other.txt", "content": "other\n"}]
+                )
+                raced.append(fake_repo.commit(tree, [head], "Other agent"))
+                fake_repo.refs["heads/main"] = raced[0]
+            update_branch(repository, branch, sha)
+
+        monkeypatch.setattr(tools_write, "_update_branch", racing_update)
+        monkeypatch.setattr(tools_write, "COMMIT_RETRY_BACKOFF", 0)
+        large = "y" * (MAX_INLINE_CONTENT_BYTES + 1)
+        files = [
+            {"path": "mine.txt", "content": "mine\n", "operation": "create"},
+            {"path": "large.txt", "content": large, "operation": "create"},
+        ]
+        with patch("mcp_github.tools_write.get_github_client", return_value=fake_client):
+            result = await create_commit_with_multiple_files("owner", "repo", files, "Mine")
+
+        commit = fake_repo.commits[fake_repo.refs["heads/main"]]
+        assert result["success"] is True
+        assert result["data"]["attempts"] == 2
+        assert commit["parents"] == raced
+        assert fake_repo.lookup(commit["tree"], "other.txt") is not None
+        assert fake_repo.blobs[fake_repo.lookup(commit["tree"], "mine.txt")["sha"]] == b"mine\n"
+        assert fake_repo.lookup(commit["tree"], "large.txt")["sha"] == git_hash("blob", large.encode())
+        assert fake_github.hits["create_blob"] == 1
+        assert fake_github.hits["create_commit"] == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_directory(self, fake_client, fake_github, tmp_path):
+        """git blob SHA가 같은 파일은 보내지 않고 바뀐 파일만 한 커밋으로 반영."""
+        fake_repo = fake_github.repo("owner", "repo")
+        head = fake_repo.refs["heads/main"]
+        remote = {
+            path[len("src/"):]: sha
+            for path, (_, sha) in fake_repo.files(fake_repo.commits[head]["tree"]).items()
+            if path.startswith("src/")
+        }
+        for path, sha in remote.items():
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / path).write_bytes(fake_repo.blobs[sha])
+        edited, removed = sorted(remote)[:2]
+        (tmp_path / edited).write_bytes(b"edited\n")
+        (tmp_path / removed).unlink()
+        (tmp_path / "assets").mkdir()
+        (tmp_path / "assets" / "logo.bin").write_bytes(b"\x89PNG\x00\xff")
+
+        with patch("mcp_github.tools_write.get_github_client", return_value=fake_client), \
+                patch("mcp_github.tools_write.get_tree_cache", return_value=TreeCache()):
+            fake_client.get_repository("owner", "repo")
+            before = fake_github.requests
+            result = await sync_directory(
+                "owner", "repo", str(tmp_path), "src", delete_missing=True
+            )
+            requests = fake_github.requests - before
+            again = await sync_directory("owner", "repo", str(tmp_path), "src", delete_missing=True)
+
+        tree = fake_repo.commits[fake_repo.refs["heads/main"]]["tree"]
+        assert result["success"] is True
+        assert result["data"]["commit_sha"] == fake_repo.refs["heads/main"] != head
+        assert result["data"]["files_changed"] == 2
+        assert result["data"]["files_deleted"] == 1
+        assert fake_repo.blobs[fake_repo.lookup(tree, f"src/{edited}")["sha"]] == b"edited\n"
+        assert fake_repo.lookup(tree, f"src/{removed}") is None
+        assert fake_repo.blobs[fake_repo.lookup(tree, "src/assets/logo.bin")["sha"]] == b"\x89PNG\x00\xff"
+        # 브랜치 + 재귀 트리 + 바이너리 blob + 트리·커밋 생성 + ref 갱신
+        assert requests == 6
+        assert fake_github.hits["get_contents"] == 0
+        assert again["success"] is True
+        assert again["data"]["commit_sha"] is None
+        assert again["data"]["files_changed"] == again["data"]["files_deleted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_move_and_copy_files(self, fake_client, fake_github):
+        """기존 blob/트리 SHA를 재사용해 내용 전송 없이 이동·복사."""
+        fake_repo = fake_github.repo("owner", "repo")
+        head = fake_repo.refs["heads/main"]
+        before_files = fake_repo.files(fake_repo.commits[head]["tree"])
+        src_files = {p: v for p, v in before_files.items() if p.startswith("src/")}
+
+        with patch("mcp_github.tools_write.get_github_client", return_value=fake_client), \
+                patch("mcp_github.tools_write.get_tree_cache", return_value=TreeCache()):
+            fake_client.get_repository("owner", "repo")
+            requests = fake_github.requests
+            moved = await move_files(
+                "owner", "repo",
+                [{"source": "src", "destination": "lib"},
+                 {"source": "README.md", "destination": "docs/README.md"}],
+                "Move sources",
+            )
+            requests = fake_github.requests - requests
+            copied = await copy_files(
+                "owner", "repo", [{"source": "docs/README.md", "destination": "README.md"}], "Copy readme"
+            )
+            missing = await move_files(
+                "owner", "repo", [{"source": "nope.txt", "destination": "x.txt"}], "Move"
+            )
+
+        after = fake_repo.files(fake_repo.commits[fake_repo.refs["heads/main"]]["tree"])
+        assert moved["success"] is True and copied["success"] is True
+        assert not any(p.startswith("src/") for p in after)
+        assert {p: v for p, v in after.items() if p.startswith("lib/")} == {
+            "lib/" + p[len("src/"):]: v for p, v in src_files.items()
+        }
+        assert after["README.md"] == after["docs/README.md"] == before_files["README.md"]
+        # 브랜치 + 재귀 트리 + 트리·커밋 생성 + ref 갱신 (경로 수와 무관)
+        assert requests == 5
+        assert fake_github.hits["create_blob"] == fake_github.hits["get_contents"] == 0
+        assert missing["success"] is False
+        assert "File not found: nope.txt" in missing["error"]
+
+    @pytest.mark.asyncio
+    async def test_move_retry_uses_new_head(self, fake_client, fake_github, monkeypatch):
+        """재시도 시 새 head 기준으로 이동 항목을 다시 만들고 대상 경로도 다시 확인."""
+        from mcp_github import tools_write
+
+        fake_repo = fake_github.repo("owner", "repo")
+        src_files = sorted(p for p in fake_repo.files(fake_repo.commits[fake_repo.refs["heads/main"]]["tree"])
+                           if p.startswith("src/"))
+        update_branch = tools_write._update_branch
+        pending = []
+
+        def other_agent(changes):
+            head = fake_repo.refs["heads/main"]
+            tree = fake_repo.apply_tree(fake_repo.commits[head]["tree"], changes)
+            fake_repo.refs["heads/main"] = fake_repo.commit(tree, [head], "Other agent")
+
+        def racing_update(repository, branch, sha):
+            if pending:
+                other_agent(pending.pop())
+            update_branch(repository, branch, sha)
+
+        monkeypatch.setattr(tools_write, "_update_branch", racing_update)
+        monkeypatch.setattr(tools_write, "COMMIT_RETRY_BACKOFF", 0)
+        with patch("mcp_github.tools_write.get_github_client", return_value=fake_client), \
+                patch("mcp_github.tools_write.get_tree_cache", return_value=TreeCache()):
+            pending.append([
+                {"path": src_files[0], "content": "edited by other\n"},
+                {"path": "src/added.txt", "content": "added by other\n"},
+            ])
+            moved = await move_files(
+                "owner", "repo", [{"source": "src", "destination": "lib"}], "Move sources"
+            )
+            pending.append([{"path": "docs/README.md", "content": "taken\n"}])
+            rejected = await move_files(
+                "owner", "repo", [{"source": "README.md", "destination": "docs/README.md"}], "Move readme"
+            )
+
+        after = fake_repo.files(fake_repo.commits[fake_repo.refs["heads/main"]]["tree"])
+        assert moved["success"] is True and moved["data"]["attempts"] == 2
+        assert not any(p.startswith("src/") for p in after)
+        assert fake_repo.blobs[after["lib/" + src_files[0][len("src/"):]][1]] == b"edited by other\n"
+        assert fake_repo.blobs[after["lib/added.txt"][1]] == b"added by other\n"
+        assert rejected["success"] is False
+        assert "Destination already exists: docs/README.md" in rejected["error"]
+        assert fake_repo.blobs[after["docs/README.md"][1]] == b"taken\n"
+        assert "README.md" in after
+
+    @pytest.mark.asyncio
+    async def test_injected_errors(self, monkeypatch):
+        """error_rate=1이면 모든 요청이 실패."""
+        with FakeGitHub(error_rate=1.0) as fake:
+            monkeypatch.setenv("GITHUB_HTTP_CACHE", "0")
+            registry = ClientRegistry()
+            client = registry.get("test-token", base_url=fake.base_url)
+            # GithubRetry의 5xx 재시도 대기 없이 바로 실패하도록
+            client.transport.max_retries.total = 0
+            with patch("mcp_github.tools_read.get_github_client", return_value=client):
+                result = await get_repo("owner", "repo")
+            registry.close_all()
+
+        assert result["success"] is False
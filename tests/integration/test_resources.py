@@ -1,13 +1,33 @@
 """리소스 핸들러 통합 테스트."""
 
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import patch, MagicMock, Mock
+from mcp_github.diff_store import DiffStore
 from mcp_github.resources import (
     parse_gh_uri,
+    parse_gh_uri_range,
     get_pr_diff_resource,
-    get_file_resource
+    get_file_resource,
+    gh_uri,
+    read_gh_resource,
 )
 
+LONG_LINES = 100
+PR_DIFF = (
+    b"diff --git a/src/app.py b/src/app.py\n"
+    b"--- a/src/app.py\n"
+    b"+++ b/src/app.py\n"
+    b"@@ -1 +1 @@\n"
+    b"-old\n"
+    b"+new\n"
+    b"diff --git a/big.txt b/big.txt\n"
+    b"new file mode 100644\n"
+    b"--- /dev/null\n"
+    b"+++ b/big.txt\n"
+    b"@@ -0,0 +1,100 @@\n"
+    + b"+" + b"x" * 40 + b"\n"
+) + (b"+" + b"x" * 40 + b"\n") * (LONG_LINES - 1)
+
 
 class TestResourceHandlers:
     """리소스 핸들러 통합 테스트 클래스."""
@@ -33,6 +53,49 @@ class TestResourceHandlers:
         
         assert result == ("owner", "repo", "path/to/file", "HEAD")
 
+    def test_parse_gh_uri_file_with_range(self):
+        """파일 URI 파싱 테스트 (범위 포함)."""
+        uri = "gh-file://owner/repo/src/app.py?ref=main&start_line=10&end_line=20"
+
+        assert parse_gh_uri(uri) == ("owner", "repo", "src/app.py", "main")
+        assert parse_gh_uri_range(uri) == {"start_line": 10, "end_line": 20}
+        assert parse_gh_uri_range("gh-file://owner/repo/src/app.py") == {}
+        with pytest.raises(ValueError):
+            parse_gh_uri_range("gh-file://owner/repo/a?offset=x")
+
+    def test_read_gh_resource_passes_range(self):
+        """URI 쿼리의 ref와 줄 범위를 파일 리소스 핸들러로 전달."""
+        uri = gh_uri("gh-file", "owner", "repo", "src/app.py", ref="main", start_line="10", end_line=None)
+        assert uri == "gh-file://owner/repo/src/app.py?ref=main&start_line=10"
+        with patch("mcp_github.resources.get_file_resource", return_value={}) as handler:
+            read_gh_resource(uri)
+            read_gh_resource("gh-file://owner/repo/README.md")
+
+        handler.assert_any_call("owner", "repo", "src/app.py", "main", start_line=10)
+        handler.assert_any_call("owner", "repo", "README.md", "HEAD")
+        with pytest.raises(ValueError):
+            read_gh_resource("gh-file://owner/repo/a?offset=x")
+
+    def test_read_gh_resource_passes_tree_filters(self):
+        """gh-tree URI의 pattern/depth를 트리 리소스 핸들러로 전달."""
+        with patch("mcp_github.resources.get_tree_resource", return_value={}) as handler:
+            read_gh_resource("gh-tree://owner/repo/src?ref=main&pattern=*.py&depth=2")
+            read_gh_resource(gh_uri("gh-tree", "owner", "repo", "", ref="HEAD", pattern=None))
+
+        handler.assert_any_call("owner", "repo", "src", "main", pattern="*.py", depth=2)
+        handler.assert_any_call("owner", "repo", "", "HEAD")
+
+    def test_read_gh_resource_passes_diff_selection(self):
+        """gh-pr-diff URI의 file/hunk 범위를 PR diff 리소스 핸들러로 전달."""
+        with patch("mcp_github.resources.get_pr_diff_resource", return_value={}) as handler:
+            read_gh_resource("gh-pr-diff://owner/repo/7?file=src/app.py&hunk_start=1&hunk_end=2")
+            read_gh_resource("gh-pr-diff://owner/repo/7")
+
+        handler.assert_any_call("owner", "repo", "7", file="src/app.py", hunk_start=1, hunk_end=2)
+        handler.assert_any_call("owner", "repo", "7")
+        with pytest.raises(ValueError):
+            read_gh_resource("gh-pr-diff://owner/repo/7?hunk_start=x")
+
     def test_parse_gh_uri_invalid_format(self):
         """잘못된 URI 형식 테스트."""
         invalid_uris = [
@@ -46,69 +109,81 @@ class TestResourceHandlers:
             with pytest.raises(ValueError):
                 parse_gh_uri(uri)
 
-    def test_get_pr_diff_resource_success(self):
-        """PR diff 리소스 성공 테스트."""
-        with patch('mcp_github.resources.GitHubClient') as mock_client_class:
-            mock_client = Mock()
-            mock_repo = Mock()
-            mock_repo.full_name = "test-owner/test-repo"
-            
-            mock_pr = Mock()
-            mock_pr.title = "Test PR"
-            mock_pr.user.login = "test-user"
-            mock_pr.state = "open"
-            
-            mock_file = Mock()
-            mock_file.filename = "test.py"
-            mock_file.status = "modified"
-            mock_file.additions = 10
-            mock_file.deletions = 5
-            mock_file.changes = 15
-            mock_file.patch = "@@ -1,1 +1,1 @@\n-old line\n+new line\n"
-            mock_file.raw_url = "https://github.com/test-owner/test-repo/raw/main/test.py"
-            
-            mock_repo.get_pull.return_value = mock_pr
-            mock_pr.get_files.return_value = [mock_file]
-            mock_client.get_repository.return_value = mock_repo
-            mock_client_class.return_value = mock_client
-            
+    def test_get_pr_diff_resource_success(self, tmp_path):
+        """PR diff 리소스는 전체 diff의 파일 인덱스를 반환."""
+        mock_client = self._diff_client(PR_DIFF)
+        with patch('mcp_github.resources.get_github_client', return_value=mock_client), \
+                patch('mcp_github.resources.get_diff_store', return_value=DiffStore(str(tmp_path))):
             result = get_pr_diff_resource("test-owner", "test-repo", "1")
-            
-            assert "content" in result
-            assert "metadata" in result
-            assert result["metadata"]["name"] == "PR #1 Diff"
-            assert result["metadata"]["mime_type"] == "application/json"
-            
-            # JSON 파싱 테스트
-            import json
-            content = json.loads(result["content"])
-            assert content["success"] is True
-            assert content["file_count"] == 1
-            assert content["total_additions"] == 10
-            assert content["total_deletions"] == 5
+
+        assert "content" in result
+        assert "metadata" in result
+        assert result["metadata"]["name"] == "PR #1 Diff"
+        assert result["metadata"]["mime_type"] == "application/json"
+
+        # JSON 파싱 테스트
+        import json
+        content = json.loads(result["content"])
+        assert content["success"] is True
+        assert content["file_count"] == 2
+        assert content["total_additions"] == 1 + LONG_LINES
+        assert content["total_deletions"] == 1
+        assert content["data"][1]["uri"] == "gh-pr-diff://test-owner/test-repo/1?file=1"
+
+    def test_get_pr_diff_resource_file_is_complete(self, tmp_path):
+        """파일별 diff는 잘리지 않고 hunk 범위로도 읽을 수 있음."""
+        mock_client = self._diff_client(PR_DIFF)
+        store = DiffStore(str(tmp_path))
+        with patch('mcp_github.resources.get_github_client', return_value=mock_client), \
+                patch('mcp_github.resources.get_diff_store', return_value=store):
+            whole = read_gh_resource("gh-pr-diff://test-owner/test-repo/1?file=big.txt")
+            hunk = read_gh_resource("gh-pr-diff://test-owner/test-repo/1?file=0&hunk_start=0&hunk_end=0")
+
+        big = PR_DIFF[PR_DIFF.index(b"diff --git a/big.txt"):].decode()
+        assert len(big) > 2000
+        assert whole["content"] == big
+        assert whole["metadata"]["mime_type"] == "text/x-diff"
+        assert hunk["content"] == "@@ -1 +1 @@\n-old\n+new\n"
+        assert store.stats()["stored"] == 1
 
     def test_get_pr_diff_resource_error(self):
         """PR diff 리소스 에러 테스트."""
-        with patch('mcp_github.resources.GitHubClient') as mock_client_class:
+        with patch('mcp_github.resources.get_github_client') as mock_client_class:
             mock_client = Mock()
-            mock_client.get_repository.side_effect = Exception("Repository not found")
+            mock_client.stream.side_effect = ValueError("Repository not found")
             mock_client_class.return_value = mock_client
-            
+
             result = get_pr_diff_resource("invalid-owner", "invalid-repo", "1")
-            
+
             assert "content" in result
             assert "metadata" in result
             assert result["metadata"]["error"] is True
-            
+
             # JSON 파싱 테스트
             import json
             content = json.loads(result["content"])
             assert content["success"] is False
             assert "Repository not found" in content["error"]
 
+    @staticmethod
+    def _diff_client(diff):
+        def stream(path, accept, headers=None):
+            # ETag으로 재검증하면 304
+            response = MagicMock()
+            response.status_code = 304 if headers else 200
+            response.headers = {"ETag": '"diff"'}
+            response.iter_content.return_value = [] if headers else [diff]
+            response.__enter__.return_value = response
+            return response
+
+        mock_client = Mock()
+        mock_client.base_url = "https://api.github.com"
+        mock_client.stream.side_effect = stream
+        return mock_client
+
     def test_get_file_resource_file_success(self):
         """파일 리소스 성공 테스트."""
-        with patch('mcp_github.resources.GitHubClient') as mock_client_class:
+        with patch('mcp_github.resources.get_github_client') as mock_client_class:
             mock_client = Mock()
             mock_repo = Mock()
             mock_repo.full_name = "test-owner/test-repo"
@@ -144,7 +219,7 @@ class TestResourceHandlers:
 
     def test_get_file_resource_directory_success(self):
         """디렉토리 리소스 성공 테스트."""
-        with patch('mcp_github.resources.GitHubClient') as mock_client_class:
+        with patch('mcp_github.resources.get_github_client') as mock_client_class:
             mock_client = Mock()
             mock_repo = Mock()
             mock_repo.full_name = "test-owner/test-repo"
@@ -186,7 +261,7 @@ class TestResourceHandlers:
 
     def test_get_file_resource_binary_file(self):
         """바이너리 파일 리소스 테스트."""
-        with patch('mcp_github.resources.GitHubClient') as mock_client_class:
+        with patch('mcp_github.resources.get_github_client') as mock_client_class:
             mock_client = Mock()
             mock_repo = Mock()
             mock_repo.full_name = "test-owner/test-repo"
@@ -217,7 +292,7 @@ class TestResourceHandlers:
 
     def test_get_file_resource_large_file(self):
         """큰 파일 리소스 테스트."""
-        with patch('mcp_github.resources.GitHubClient') as mock_client_class:
+        with patch('mcp_github.resources.get_github_client') as mock_client_class:
             mock_client = Mock()
             mock_repo = Mock()
             mock_repo.full_name = "test-owner/test-repo"
@@ -247,7 +322,7 @@ class TestResourceHandlers:
 
     def test_get_file_resource_error(self):
         """파일 리소스 에러 테스트."""
-        with patch('mcp_github.resources.GitHubClient') as mock_client_class:
+        with patch('mcp_github.resources.get_github_client') as mock_client_class:
             mock_client = Mock()
             mock_client.get_repository.side_effect = Exception("File not found")
             mock_client_class.return_value = mock_client
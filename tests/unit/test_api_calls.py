@@ -0,0 +1,84 @@
+"""API call counter unit tests."""
+
+import asyncio
+import threading
+
+import pytest
+
+from mcp_github.api_calls import count_api_calls, record_api_call
+
+
+class TestCountApiCalls:
+    """count_api_calls 데코레이터 테스트."""
+
+    def test_counts_calls_of_one_tool_call(self):
+        """도구 호출 중 기록된 요청 수를 결과에 추가."""
+
+        @count_api_calls
+        def tool(calls):
+            for _ in range(calls):
+                record_api_call()
+            return {"success": True}
+
+        assert tool(3) == {"success": True, "api_calls": 3}
+        assert tool(0)["api_calls"] == 0
+
+    def test_outside_tool_is_ignored(self):
+        """도구 밖에서 기록된 요청은 무시."""
+        record_api_call()
+
+        @count_api_calls
+        def tool():
+            return {}
+
+        assert tool()["api_calls"] == 0
+
+    def test_counter_reset_after_error(self):
+        """예외가 나도 카운터가 정리됨."""
+
+        @count_api_calls
+        def failing():
+            record_api_call()
+            raise RuntimeError("boom")
+
+        @count_api_calls
+        def tool():
+            return {}
+
+        with pytest.raises(RuntimeError):
+            failing()
+        assert tool()["api_calls"] == 0
+
+    def test_threads_are_counted_separately(self):
+        """동시에 실행되는 도구 호출은 각자 센다."""
+        barrier = threading.Barrier(2)
+        results = {}
+
+        @count_api_calls
+        def tool(calls):
+            barrier.wait()
+            for _ in range(calls):
+                record_api_call()
+            return {}
+
+        def run(calls):
+            results[calls] = tool(calls)["api_calls"]
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in (2, 5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {2: 2, 5: 5}
+
+    @pytest.mark.asyncio
+    async def test_worker_thread_inherits_counter(self):
+        """asyncio.to_thread로 실행해도 같은 카운터를 사용."""
+
+        @count_api_calls
+        def tool():
+            record_api_call()
+            return {}
+
+        assert (await asyncio.to_thread(tool))["api_calls"] == 1
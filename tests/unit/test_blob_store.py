@@ -0,0 +1,86 @@
+"""Blob store unit tests."""
+
+import subprocess
+
+import pytest
+
+from mcp_github.blob_store import BlobStore, git_blob_sha
+
+
+def test_git_blob_sha_matches_git():
+    """blob SHA는 git hash-object와 동일."""
+    data = b"hello\n"
+    try:
+        expected = subprocess.run(
+            ["git", "hash-object", "--stdin"], input=data, capture_output=True, check=True
+        ).stdout.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip("git not available")
+    assert git_blob_sha(data) == expected
+
+
+def test_put_and_read(tmp_path):
+    """저장한 blob을 SHA로 다시 읽음."""
+    store = BlobStore(str(tmp_path))
+    data = b"print('hi')\n"
+    sha = git_blob_sha(data)
+
+    assert store.read(sha) is None
+    assert store.put(sha, data) is True
+    assert store.read(sha) == data
+    assert store.stats()["hits"] == 1
+    assert store.stats()["misses"] == 1
+
+
+def test_rejects_content_not_matching_sha(tmp_path):
+    """SHA와 내용이 다르면 저장하지 않음."""
+    store = BlobStore(str(tmp_path))
+    assert store.put(git_blob_sha(b"a"), b"b") is False
+    assert store.stats()["rejected"] == 1
+    assert list(tmp_path.rglob("*")) == []
+
+
+def test_evicts_least_recently_used(tmp_path):
+    """용량을 넘으면 가장 오래 쓰지 않은 blob부터 제거."""
+    blobs = [bytes([65 + i]) * 240 for i in range(5)]
+    shas = [git_blob_sha(data) for data in blobs]
+    store = BlobStore(str(tmp_path), max_bytes=1000)
+    for sha, data in zip(shas[:4], blobs[:4]):
+        store.put(sha, data)
+    store.size(shas[0])
+    store.put(shas[4], blobs[4])
+
+    assert store.read(shas[1]) is None
+    assert store.read(shas[0]) == blobs[0]
+    assert store.stats()["evicted"] == 1
+
+
+def test_survives_restart(tmp_path):
+    """같은 디렉터리를 다시 열면 저장된 blob을 그대로 사용."""
+    data = b"persisted\n"
+    sha = git_blob_sha(data)
+    BlobStore(str(tmp_path)).put(sha, data)
+
+    reopened = BlobStore(str(tmp_path))
+    assert reopened.stats()["total_bytes"] == len(data)
+    assert reopened.read(sha) == data
+
+
+def test_large_blob_chunks_via_mmap(tmp_path):
+    """큰 blob은 mmap으로 청크 단위로 읽음."""
+    data = bytes(range(256)) * 1024
+    sha = git_blob_sha(data)
+    store = BlobStore(str(tmp_path), mmap_threshold=1024)
+    assert store.put_stream(sha, [data[:1000], data[1000:]], len(data)) is True
+
+    chunks = list(store.iter_chunks(sha, chunk_size=4096))
+    assert b"".join(chunks) == data
+    assert len(chunks) == len(data) // 4096
+
+
+def test_skips_blobs_over_entry_budget(tmp_path):
+    """저장소 용량의 1/4을 넘는 blob은 저장하지 않음."""
+    data = b"x" * 300
+    store = BlobStore(str(tmp_path), max_bytes=1000)
+    assert store.put(git_blob_sha(data), data) is False
+    assert store.stats()["entries"] == 0
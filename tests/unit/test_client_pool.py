@@ -0,0 +1,110 @@
+"""Client registry unit tests."""
+
+from unittest.mock import patch
+
+import pytest
+
+from mcp_github.client_pool import ClientRegistry, client_lease, lease_clients, parse_host_limits
+
+
+class TestParseHostLimits:
+    """Per-host limit parsing tests."""
+
+    def test_parse_pairs(self):
+        """host=limit 쌍 파싱 테스트."""
+        limits = parse_host_limits("api.github.com=20, GHE.local=4")
+
+        assert limits == {"api.github.com": 20, "ghe.local": 4}
+
+    def test_parse_empty(self):
+        """빈 설정 테스트."""
+        assert parse_host_limits(None) == {}
+        assert parse_host_limits("") == {}
+
+    def test_parse_invalid(self):
+        """잘못된 설정 테스트."""
+        with pytest.raises(ValueError):
+            parse_host_limits("api.github.com=many")
+
+
+class TestClientRegistry:
+    """Client registry tests."""
+
+    def test_reuses_client_per_token(self, mock_env_vars):
+        """같은 토큰은 같은 클라이언트를 재사용."""
+        registry = ClientRegistry()
+
+        first = registry.get()
+        second = registry.get()
+        other = registry.get("other-token")
+
+        assert first is second
+        assert other is not first
+        assert registry.stats()["created"] == 2
+        registry.close_all()
+
+    def test_transport_pool_size_capped_per_host(self, mock_env_vars):
+        """호스트별 커넥션 수 제한 테스트."""
+        registry = ClientRegistry(pool_size=10, host_limits={"ghe.local": 4})
+
+        client = registry.get(base_url="https://ghe.local/api/v3")
+
+        assert registry.pool_size_for("https://api.github.com") == 10
+        assert client.transport.pool_size == 4
+        registry.close_all()
+
+    def test_evicts_idle_clients(self, mock_env_vars):
+        """유휴 클라이언트 제거 테스트."""
+        registry = ClientRegistry(idle_timeout=60)
+
+        with patch("mcp_github.client_pool.time.monotonic", return_value=1000.0):
+            first = registry.get()
+        with patch("mcp_github.client_pool.time.monotonic", return_value=1100.0):
+            second = registry.get()
+
+        assert second is not first
+        assert registry.stats()["evicted"] == 1
+        registry.close_all()
+
+    def test_leased_client_is_not_evicted(self, mock_env_vars):
+        """lease 중인 클라이언트는 유휴 시간이 지나도 닫지 않음."""
+        registry = ClientRegistry(idle_timeout=60)
+
+        with patch("mcp_github.client_pool.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            with client_lease():
+                first = registry.get()
+                assert registry.stats()["pool"][0]["active"] == 1
+                clock.return_value = 1100.0
+                assert registry.get() is first
+                assert registry.evict_idle() == 0
+
+            # lease가 끝나면 그때부터 유휴 시간을 센다
+            assert registry.stats()["pool"][0]["active"] == 0
+            clock.return_value = 1150.0
+            assert registry.evict_idle() == 0
+            clock.return_value = 1200.0
+            assert registry.evict_idle() == 1
+        registry.close_all()
+
+    def test_lease_clients_releases_on_error(self, mock_env_vars):
+        """도구 본문이 예외로 끝나도 lease를 반납."""
+        registry = ClientRegistry()
+
+        @lease_clients
+        def body():
+            registry.get()
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            body()
+        assert registry.stats()["pool"][0]["active"] == 0
+        registry.close_all()
+
+    def test_requires_token(self, monkeypatch):
+        """토큰 없이 빌리면 에러."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        registry = ClientRegistry()
+
+        with pytest.raises(ValueError):
+            registry.get()
@@ -0,0 +1,178 @@
+"""Diff store unit tests."""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mcp_github.diff_store import MAX_HEADER_LINE, DiffIndexer, DiffStore, read_diff_section
+
+DIFF = (
+    b"diff --git a/src/app.py b/src/app.py\n"
+    b"index 1111111..2222222 100644\n"
+    b"--- a/src/app.py\n"
+    b"+++ b/src/app.py\n"
+    b"@@ -1,3 +1,3 @@ def main():\n"
+    b" keep\n"
+    b"-old\n"
+    b"+new\n"
+    b"@@ -10,2 +10,3 @@\n"
+    b" keep\n"
+    b"+--- not a header\n"
+    b"\\ No newline at end of file\n"
+    b"diff --git a/docs/a b.md b/docs/a b.md\n"
+    b"new file mode 100644\n"
+    b"--- /dev/null\n"
+    b"+++ b/docs/a b.md\n"
+    b"@@ -0,0 +1 @@\n"
+    b"+hello\n"
+    b"diff --git a/old.txt b/new.txt\n"
+    b"similarity index 100%\n"
+    b"rename from old.txt\n"
+    b"rename to new.txt\n"
+    b'diff --git "a/caf\\303\\251.bin" "b/caf\\303\\251.bin"\n'
+    b"deleted file mode 100644\n"
+    b"Binary files a/caf\xc3\xa9.bin and /dev/null differ\n"
+)
+
+
+def index(data, chunk_size=None):
+    indexer = DiffIndexer()
+    chunk_size = chunk_size or len(data) or 1
+    for start in range(0, len(data), chunk_size):
+        indexer.feed(data[start : start + chunk_size])
+    return indexer.close()
+
+
+class TestDiffIndexer:
+    """DiffIndexer 테스트."""
+
+    def test_files_and_offsets(self):
+        """파일별 경로, 상태, 바이트 범위를 색인."""
+        files = index(DIFF)
+
+        assert [f.path for f in files] == ["src/app.py", "docs/a b.md", "new.txt", "café.bin"]
+        assert [f.status for f in files] == ["modified", "added", "renamed", "removed"]
+        assert files[2].old_path == "old.txt"
+        assert files[3].binary is True
+        assert sum(f.length for f in files) == len(DIFF)
+        for f in files:
+            assert DIFF[f.offset : f.offset + f.length].startswith(b"diff --git ")
+
+    def test_hunks_and_counts(self):
+        """hunk 범위와 추가/삭제 줄 수를 계산."""
+        app = index(DIFF)[0]
+
+        assert (app.additions, app.deletions) == (2, 1)
+        assert [h.header for h in app.hunks] == ["@@ -1,3 +1,3 @@ def main():", "@@ -10,2 +10,3 @@"]
+        second = app.hunks[1]
+        assert DIFF[second.offset : second.offset + second.length].endswith(b"end of file\n")
+        assert app.hunks[0].offset + app.hunks[0].length == second.offset
+
+    def test_chunk_boundaries_do_not_matter(self):
+        """청크 크기와 상관없이 같은 색인."""
+        expected = [f.to_dict() for f in index(DIFF)]
+        for chunk_size in (1, 3, 7, 64):
+            assert [f.to_dict() for f in index(DIFF, chunk_size)] == expected
+
+    def test_long_lines_are_not_buffered(self):
+        """아주 긴 줄도 앞부분만 보관."""
+        line = b"+" + b"x" * (MAX_HEADER_LINE * 10) + b"\n"
+        data = b"diff --git a/min.js b/min.js\n@@ -1 +1 @@\n" + line
+        indexer = DiffIndexer()
+        indexer.feed(data)
+
+        assert len(indexer._line) == 0
+        files = indexer.close()
+        assert files[0].additions == 1
+        assert files[0].length == len(data)
+
+    def test_no_trailing_newline(self):
+        """마지막 줄에 줄바꿈이 없어도 끝까지 색인."""
+        data = b"diff --git a/x b/x\n@@ -1 +1 @@\n-a\n+b"
+        files = index(data)
+
+        assert (files[0].additions, files[0].deletions) == (1, 1)
+        assert files[0].hunks[0].offset + files[0].hunks[0].length == len(data)
+
+
+class TestDiffStore:
+    """DiffStore 테스트."""
+
+    def test_write_and_read(self, tmp_path):
+        """디스크에 저장하고 범위만 읽기."""
+        store = DiffStore(str(tmp_path))
+        stored = store.write("pr", [DIFF[:10], DIFF[10:]], etag='"abc"')
+
+        app = stored.find_file("src/app.py")
+        assert store.read(stored, app.offset, app.length) == DIFF[: app.length]
+        assert stored.find_file(2) is stored.find_file("old.txt")
+        assert stored.etag == '"abc"'
+        assert store.get("pr") is stored
+        with pytest.raises(ValueError):
+            stored.find_file(9)
+        with pytest.raises(ValueError):
+            stored.find_file("missing.py")
+
+    def test_eviction(self, tmp_path):
+        """최대 크기를 넘으면 오래된 diff부터 삭제."""
+        store = DiffStore(str(tmp_path), max_bytes=len(DIFF) * 2)
+        first = store.write(1, [DIFF])
+        store.write(2, [DIFF])
+        store.get(1)
+        store.write(3, [DIFF])
+
+        assert store.get(2) is None
+        assert store.get(1) is first
+        assert store.stats()["evicted"] == 1
+        assert len(os.listdir(store.directory)) == 2
+
+    def test_rewrite_replaces_file(self, tmp_path):
+        """같은 키로 다시 저장하면 이전 파일을 삭제."""
+        store = DiffStore(str(tmp_path))
+        store.write("pr", [DIFF])
+        store.write("pr", [DIFF[:40]])
+
+        assert len(os.listdir(store.directory)) == 1
+        assert store.stats()["bytes"] == 40
+
+    def test_processes_keep_separate_directories(self, tmp_path):
+        """같은 디렉터리를 쓰는 다른 store의 파일은 건드리지 않고, close 시 자기 디렉터리만 삭제."""
+        first = DiffStore(str(tmp_path))
+        stored = first.write("pr", [DIFF])
+        second = DiffStore(str(tmp_path))
+
+        assert first.directory != second.directory
+        assert os.path.exists(stored.path)
+        second.close()
+        assert os.path.exists(stored.path)
+        assert not os.path.exists(second.directory)
+        first.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_missing_file_is_fetched_again(self, tmp_path):
+        """사라진 diff 파일은 항목에서 빼고, 읽는 도중 사라지면 한 번 다시 받음."""
+        store = DiffStore(str(tmp_path))
+        stored = store.write("pr", [DIFF])
+        os.unlink(stored.path)
+        assert store.get("pr") is None
+        assert store.stats()["bytes"] == 0
+
+        client = Mock(base_url="https://api.github.com")
+        fetched = []
+
+        def fetch(*args):
+            # 첫 번째로 받은 파일은 읽기 전에 다른 호출이 지운 상황
+            fetched.append(store.write("pr", [DIFF]))
+            if len(fetched) == 1:
+                os.unlink(fetched[0].path)
+            return fetched[-1]
+
+        with patch("mcp_github.diff_store.fetch_diff", side_effect=fetch):
+            entry, offset, end, content = read_diff_section(
+                client, store, "o", "r", 1, "new.txt"
+            )
+
+        assert len(fetched) == 2
+        assert entry.path == "new.txt"
+        assert content == DIFF[offset:end]
@@ -0,0 +1,140 @@
+"""File range unit tests."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from mcp_github.file_range import read_file_range, slice_content
+
+CONTENT = b"".join(b"line %d\n" % i for i in range(1, 101))
+
+
+def chunked(data, size=7):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_byte_range_across_chunks():
+    """청크 경계에 걸친 바이트 범위."""
+    part = slice_content(chunked(CONTENT), offset=10, length=25)
+    assert part["content"] == CONTENT[10:35]
+    assert part["offset"] == 10
+    assert part["eof"] is False
+
+
+def test_byte_range_stops_reading():
+    """범위를 채우면 나머지 청크는 읽지 않음."""
+    consumed = []
+
+    def chunks():
+        for chunk in chunked(CONTENT):
+            consumed.append(chunk)
+            yield chunk
+
+    slice_content(chunks(), offset=0, length=20)
+    assert len(consumed) == 3
+
+
+def test_byte_range_past_end():
+    """파일 끝을 넘는 범위는 남은 부분만 반환."""
+    part = slice_content(chunked(CONTENT), offset=len(CONTENT) - 5, length=100)
+    assert part["content"] == CONTENT[-5:]
+    assert part["eof"] is True
+
+
+def test_byte_range_capped():
+    """max_bytes를 넘는 length는 잘림."""
+    part = slice_content([CONTENT], length=100, max_bytes=10)
+    assert part["content"] == CONTENT[:10]
+    assert part["truncated"] is True
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 4096])
+def test_line_range(size):
+    """청크 크기와 상관없이 같은 줄 범위."""
+    part = slice_content(chunked(CONTENT, size), start_line=10, end_line=12)
+    assert part["content"] == b"line 10\nline 11\nline 12\n"
+    assert part["offset"] == CONTENT.index(b"line 10\n")
+    assert (part["start_line"], part["end_line"]) == (10, 12)
+
+
+def test_line_range_to_end():
+    """end_line이 없으면 파일 끝까지."""
+    part = slice_content(chunked(CONTENT), start_line=99)
+    assert part["content"] == b"line 99\nline 100\n"
+    assert part["end_line"] == 100
+    assert part["eof"] is True
+
+
+def test_line_range_truncated_at_line_boundary():
+    """max_bytes를 넘으면 마지막 완전한 줄까지만."""
+    part = slice_content(chunked(CONTENT), start_line=1, max_bytes=20)
+    assert part["content"] == b"line 1\nline 2\n"
+    assert part["end_line"] == 2
+    assert part["truncated"] is True
+
+
+def test_invalid_ranges():
+    """잘못된 범위 인자는 ValueError."""
+    with pytest.raises(ValueError, match="not both"):
+        slice_content([CONTENT], offset=0, start_line=1)
+    with pytest.raises(ValueError, match="end_line"):
+        slice_content([CONTENT], start_line=5, end_line=4)
+    with pytest.raises(ValueError, match="beyond the end"):
+        slice_content([CONTENT], start_line=500)
+    with pytest.raises(ValueError, match="negative"):
+        slice_content([CONTENT], offset=-1)
+
+
+def test_read_file_range_small_file_uses_contents():
+    """1MB 미만 파일은 contents 응답에서 자르고 추가 요청 없음."""
+    client = Mock()
+    file_content = Mock(encoding="base64", size=len(CONTENT), decoded_content=CONTENT)
+
+    part = read_file_range(client, "owner", "repo", file_content, start_line=2, end_line=2)
+
+    assert part["content"] == "line 2\n"
+    assert part["content_encoding"] == "utf-8"
+    client.stream.assert_not_called()
+
+
+def test_read_file_range_large_binary_streams_blob():
+    """큰 파일은 raw blob을 스트리밍하고 바이너리는 base64로 반환."""
+    data = b"\x00\x01" * 1024 * 1024
+    response = MagicMock()
+    response.__enter__.return_value.iter_content.return_value = chunked(data, 65536)
+    client = Mock()
+    client.stream.return_value = response
+    file_content = Mock(encoding="none", size=len(data), sha="abc")
+
+    part = read_file_range(client, "owner", "repo", file_content, offset=1, length=3)
+
+    client.stream.assert_called_once_with(
+        "/repos/owner/repo/git/blobs/abc", "application/vnd.github.raw"
+    )
+    assert part["content"] == "AQAB"
+    assert part["content_encoding"] == "base64"
+    assert part["length"] == 3
+
+
+@pytest.mark.parametrize("inline", [True, False])
+def test_read_file_range_encoding_is_per_file(inline):
+    """바이너리 여부는 범위가 아니라 파일 앞부분으로 정해 모든 범위가 같은 인코딩."""
+    data = b"text\n" * 100 + b"\x00" + b"more text\n" * 100
+    response = MagicMock()
+    response.__enter__.return_value.iter_content.side_effect = lambda size: iter(chunked(data, 64))
+    client = Mock()
+    client.stream.return_value = response
+    file_content = Mock(
+        encoding="base64" if inline else "none", size=len(data), sha="abc", decoded_content=data
+    )
+
+    head = read_file_range(client, "owner", "repo", file_content, offset=0, length=10)
+    tail = read_file_range(client, "owner", "repo", file_content, start_line=150, end_line=150)
+    text = read_file_range(
+        client, "owner", "repo", Mock(encoding="base64", size=len(CONTENT), decoded_content=CONTENT),
+        offset=0, length=4,
+    )
+
+    assert head["content_encoding"] == tail["content_encoding"] == "base64"
+    assert head["content"] == "dGV4dAp0ZXh0Cg=="
+    assert text["content_encoding"] == "utf-8"
@@ -73,3 +73,28 @@ class TestGitHubClient:
             # 토큰 유효성 검사는 실제로는 GitHub API 호출 시점에 발생
             # 여기서는 기본적인 초기화만 테스트
             assert client.github is not None
+
+    def test_graphql_returns_data(self, mock_env_vars):
+        """GraphQL 응답의 data 반환 테스트."""
+        with patch('mcp_github.github_client.Github') as mock_github:
+            mock_github.return_value.requester.graphql_query.return_value = (
+                {}, {"data": {"viewer": {"login": "octocat"}}}
+            )
+
+            client = GitHubClient()
+
+            assert client.graphql("{ viewer { login } }") == {"viewer": {"login": "octocat"}}
+
+    def test_graphql_error(self, mock_env_vars):
+        """GraphQL 에러를 ValueError로 변환 테스트."""
+        from github.GithubException import GithubException
+
+        with patch('mcp_github.github_client.Github') as mock_github:
+            mock_github.return_value.requester.graphql_query.side_effect = GithubException(
+                400, {"errors": [{"message": "Field 'x' doesn't exist"}]}
+            )
+
+            client = GitHubClient()
+
+            with pytest.raises(ValueError, match="GitHub GraphQL error: Field 'x'"):
+                client.graphql("{ x }")
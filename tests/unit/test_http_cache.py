@@ -0,0 +1,104 @@
+"""Conditional-request cache unit tests."""
+
+from unittest.mock import patch
+
+import pytest
+from requests import Request, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from mcp_github.http_cache import ConditionalCache
+from mcp_github.transport import GitHubTransport
+
+
+def make_response(status, body=b"", headers=None):
+    """Build a requests.Response for the fake adapter."""
+    response = Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = body
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Empty on-disk cache."""
+    return ConditionalCache(str(tmp_path / "cache.sqlite3"), max_bytes=1024)
+
+
+class TestConditionalCache:
+    """ConditionalCache tests."""
+
+    def test_put_and_get(self, cache):
+        """ETag가 있는 응답 저장/조회 테스트."""
+        cache.put("k", {"ETag": '"abc"', "Content-Encoding": "gzip"}, b"body")
+
+        entry = cache.get("k")
+
+        assert entry.body == b"body"
+        assert entry.conditional_headers() == {"If-None-Match": '"abc"'}
+        assert "Content-Encoding" not in entry.headers
+
+    def test_skips_responses_without_validator(self, cache):
+        """검증자가 없는 응답은 저장하지 않음."""
+        cache.put("k", {"Content-Type": "application/json"}, b"body")
+
+        assert cache.get("k") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self, cache):
+        """크기 제한 초과 시 가장 오래 사용하지 않은 항목 제거."""
+        with patch("mcp_github.http_cache.time.time", side_effect=[1, 2, 3, 4]):
+            cache.put("a", {"ETag": "a"}, b"x" * 400)
+            cache.put("b", {"ETag": "b"}, b"x" * 400)
+            cache.get("a")
+            cache.put("c", {"ETag": "c"}, b"x" * 400)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evicted"] == 1
+
+    def test_key_depends_on_credentials(self):
+        """토큰별로 다른 캐시 키."""
+        url = "https://api.github.com/repos/o/r"
+
+        first = ConditionalCache.make_key("GET", url, {"Authorization": "token a"})
+        second = ConditionalCache.make_key("GET", url, {"Authorization": "token b"})
+
+        assert first != second
+
+
+class TestTransportConditionalRequests:
+    """GitHubTransport conditional GET tests."""
+
+    def test_not_modified_served_from_cache(self, cache):
+        """304 응답은 캐시된 본문으로 응답."""
+        transport = GitHubTransport(cache=cache)
+        request = Request("GET", "https://api.github.com/repos/o/r").prepare()
+        responses = [
+            make_response(200, b'{"id": 1}', {"ETag": '"v1"'}),
+            make_response(304, headers={"X-RateLimit-Remaining": "4999"}),
+        ]
+
+        with patch.object(HTTPAdapter, "send", side_effect=responses) as send:
+            first = transport.send(request)
+            second = transport.send(request.copy())
+
+        assert first.content == b'{"id": 1}'
+        assert second.status_code == 200
+        assert second.content == b'{"id": 1}'
+        assert second.headers["X-RateLimit-Remaining"] == "4999"
+        assert send.call_args_list[1][0][0].headers["If-None-Match"] == '"v1"'
+        assert cache.stats()["not_modified"] == 1
+
+    def test_writes_bypass_cache(self, cache):
+        """GET 이외의 요청은 캐시하지 않음."""
+        transport = GitHubTransport(cache=cache)
+        request = Request("POST", "https://api.github.com/repos/o/r/git/blobs").prepare()
+
+        with patch.object(
+            HTTPAdapter, "send", return_value=make_response(201, b"{}", {"ETag": "x"})
+        ):
+            transport.send(request)
+
+        assert cache.stats()["entries"] == 0
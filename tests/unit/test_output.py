@@ -0,0 +1,52 @@
+"""Output format unit tests."""
+
+import json
+
+import pytest
+
+from mcp_github.output import dumps_compact, format_data, resolve_output_format, to_columns
+
+ROWS = [
+    {"number": 1, "title": "첫 PR", "draft": False},
+    {"number": 2, "title": "Second", "merged_at": None},
+]
+
+
+def test_json_keeps_indented_string():
+    """json 형식은 기존과 같은 들여쓴 문자열."""
+    assert format_data(ROWS, "json") == json.dumps(ROWS, indent=2)
+
+
+def test_compact_has_no_whitespace():
+    """compact 형식은 공백 없이 같은 값을 표현."""
+    encoded = format_data(ROWS, "compact")
+    assert json.loads(encoded) == ROWS
+    assert "\n" not in encoded and ": " not in encoded
+    assert dumps_compact({"a": [1, 2]}) == '{"a":[1,2]}'
+
+
+def test_native_returns_data_as_is():
+    """native 형식은 데이터를 문자열로 감싸지 않음."""
+    assert format_data(ROWS, "native") is ROWS
+
+
+def test_columnar_lists():
+    """객체 목록은 columns/rows로 바꾸고 빠진 키는 None."""
+    assert format_data(ROWS, "columnar") == {
+        "columns": ["number", "title", "draft", "merged_at"],
+        "rows": [[1, "첫 PR", False, None], [2, "Second", None, None]],
+    }
+    assert to_columns([]) == {"columns": [], "rows": []}
+
+
+def test_columnar_leaves_objects_native():
+    """객체 목록이 아닌 데이터는 native와 동일."""
+    data = {"name": "repo"}
+    assert format_data(data, "columnar") is data
+
+
+def test_resolve_output_format():
+    """알 수 없는 형식은 ValueError."""
+    assert resolve_output_format("native") == "native"
+    with pytest.raises(ValueError):
+        resolve_output_format("xml")
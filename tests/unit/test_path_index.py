@@ -0,0 +1,67 @@
+"""Path index unit tests."""
+
+from mcp_github.path_index import PathIndex
+
+TREE = [
+    {"path": "README.md", "type": "blob", "sha": "a" * 40},
+    {"path": "src", "type": "tree", "sha": "b" * 40},
+    {"path": "src/app.py", "type": "blob", "sha": "c" * 40},
+]
+
+
+def test_unknown_until_listed():
+    """목록을 보기 전에는 경로를 모르고, 전체 목록 이후에는 없는 경로도 앎."""
+    index = PathIndex()
+    assert index.get("owner", "repo", "main", "README.md") == (False, None)
+
+    index.fill("Owner", "Repo", "main", TREE)
+    assert index.get("owner", "repo", "main", "src/app.py") == (True, "c" * 40)
+    assert index.get("owner", "repo", "main", "src/missing.py") == (True, None)
+    assert index.get("owner", "repo", "main", "src") == (True, None)
+    assert index.get("owner", "repo", "dev", "README.md") == (False, None)
+
+
+def test_directory_listing_covers_only_that_directory():
+    """디렉터리 목록은 그 디렉터리의 직접 하위 경로만 판단."""
+    index = PathIndex()
+    index.fill("owner", "repo", "main", [
+        {"path": "src/app.py", "type": "file", "sha": "c" * 40},
+        {"path": "src/lib", "type": "dir", "sha": "d" * 40},
+    ], directory="src")
+
+    assert index.get("owner", "repo", "main", "src/app.py") == (True, "c" * 40)
+    assert index.get("owner", "repo", "main", "src/new.py") == (True, None)
+    assert index.get("owner", "repo", "main", "src/lib/x.py") == (False, None)
+    assert index.get("owner", "repo", "main", "README.md") == (False, None)
+
+
+def test_writes_update_entries():
+    """쓰기 응답의 SHA로 갱신하고 삭제하면 제거."""
+    index = PathIndex()
+    index.fill("owner", "repo", "main", TREE)
+    index.put("owner", "repo", "main", "src/app.py", "e" * 40)
+    index.put("owner", "repo", "main", "README.md", None)
+
+    assert index.get("owner", "repo", "main", "src/app.py") == (True, "e" * 40)
+    assert index.get("owner", "repo", "main", "README.md") == (True, None)
+    index.invalidate("owner", "repo", "main")
+    assert index.get("owner", "repo", "main", "src/app.py") == (False, None)
+
+
+def test_evicts_least_recently_used_branch():
+    """브랜치 수를 넘으면 가장 오래 쓰지 않은 브랜치부터 제거."""
+    index = PathIndex(max_branches=2)
+    for branch in ("a", "b"):
+        index.fill("owner", "repo", branch, TREE)
+    index.get("owner", "repo", "a", "README.md")
+    index.fill("owner", "repo", "c", TREE)
+
+    assert index.get("owner", "repo", "b", "README.md") == (False, None)
+    assert index.get("owner", "repo", "a", "README.md") == (True, "a" * 40)
+    assert index.stats()["branches"] == 2
+
+
+def test_disabled_by_zero(monkeypatch):
+    """GITHUB_PATH_INDEX_BRANCHES=0이면 색인을 만들지 않음."""
+    monkeypatch.setenv("GITHUB_PATH_INDEX_BRANCHES", "0")
+    assert PathIndex.from_env() is None
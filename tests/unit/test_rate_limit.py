@@ -0,0 +1,132 @@
+"""Rate-limit scheduler unit tests."""
+
+from unittest.mock import patch
+
+from requests import Request, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from mcp_github.rate_limit import RateLimitScheduler
+from mcp_github.transport import GitHubTransport
+
+
+class FakeClock:
+    """Manually advanced clock used as both clock and sleep."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_scheduler(clock, **kwargs):
+    return RateLimitScheduler(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def rate_headers(remaining, limit=5000, reset=4600, resource="core"):
+    return {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Reset": str(reset),
+        "X-RateLimit-Resource": resource,
+    }
+
+
+class TestRateLimitScheduler:
+    """RateLimitScheduler tests."""
+
+    def test_resource_for(self):
+        """URL로 버킷 판별."""
+        assert RateLimitScheduler.resource_for("https://api.github.com/repos/o/r") == "core"
+        assert RateLimitScheduler.resource_for("https://api.github.com/search/code") == "search"
+        assert RateLimitScheduler.resource_for("https://api.github.com/graphql") == "graphql"
+        assert RateLimitScheduler.resource_for("https://ghe.local/api/v3/search/issues") == "search"
+
+    def test_no_delay_with_budget(self):
+        """예산이 충분하면 바로 전송."""
+        clock = FakeClock()
+        scheduler = make_scheduler(clock)
+        scheduler.update("core", rate_headers(4000))
+
+        assert scheduler.reserve_slot("core") == 0
+
+    def test_spreads_requests_when_budget_low(self):
+        """예산이 부족하면 reset까지 균등 분배."""
+        clock = FakeClock()
+        scheduler = make_scheduler(clock)
+        scheduler.update("core", rate_headers(100, reset=clock.now + 1000))
+
+        first = scheduler.reserve_slot("core")
+        second = scheduler.reserve_slot("core")
+
+        assert first == 0
+        assert second == 10
+
+    def test_waits_for_reset_when_exhausted(self):
+        """예산 소진 시 reset까지 대기."""
+        clock = FakeClock()
+        scheduler = make_scheduler(clock)
+        scheduler.update(
+            "search", rate_headers(0, limit=30, reset=clock.now + 30, resource="search")
+        )
+
+        assert scheduler.reserve_slot("search") == 30
+        assert scheduler.reserve_slot("core") == 0
+
+    def test_secondary_limit_pauses_all_buckets(self):
+        """secondary limit은 모든 버킷을 멈춤."""
+        clock = FakeClock()
+        scheduler = make_scheduler(clock)
+
+        delay = scheduler.retry_delay(403, {"Retry-After": "60"}, "", attempt=0)
+
+        assert delay == 60
+        assert scheduler.reserve_slot("core") == 60
+        assert scheduler.reserve_slot("graphql") == 60
+        assert scheduler.snapshot()["secondary_hits"] == 1
+
+    def test_plain_forbidden_not_retried(self):
+        """rate limit과 무관한 403은 재시도하지 않음."""
+        scheduler = make_scheduler(FakeClock())
+
+        assert scheduler.retry_delay(403, {}, '{"message": "Forbidden"}', 0) is None
+
+    def test_gives_up_after_max_wait(self):
+        """max_wait를 넘는 대기는 포기."""
+        clock = FakeClock()
+        scheduler = make_scheduler(clock, max_wait=10)
+
+        assert scheduler.retry_delay(429, {"Retry-After": "60"}, "", 0) is None
+
+
+class TestTransportScheduling:
+    """GitHubTransport retry tests."""
+
+    def test_secondary_limit_is_queued_and_retried(self):
+        """secondary limit 응답은 대기 후 재전송."""
+        clock = FakeClock()
+        transport = GitHubTransport(scheduler=make_scheduler(clock))
+        request = Request("GET", "https://api.github.com/repos/o/r").prepare()
+
+        limited = Response()
+        limited.status_code = 403
+        limited.headers = CaseInsensitiveDict({"Retry-After": "30"})
+        limited._content = b'{"message": "You have exceeded a secondary rate limit"}'
+        ok = Response()
+        ok.status_code = 200
+        ok.headers = CaseInsensitiveDict(rate_headers(4999))
+        ok._content = b"{}"
+
+        with patch.object(HTTPAdapter, "send", side_effect=[limited, ok]) as send:
+            response = transport.send(request)
+
+        assert response.status_code == 200
+        assert send.call_count == 2
+        assert clock.sleeps == [30]
+        assert transport.stats()["rate_limit"]["buckets"]["core"]["remaining"] == 4999
@@ -0,0 +1,78 @@
+"""Ref resolver cache unit tests."""
+
+from mcp_github.ref_resolver import RefCache, ShaCache, is_commit_sha
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_is_commit_sha():
+    """40자리 16진수만 커밋 SHA로 취급."""
+    assert is_commit_sha("a" * 40)
+    assert is_commit_sha("0123456789ABCDEF0123456789abcdef01234567")
+    assert not is_commit_sha("main")
+    assert not is_commit_sha("abc1234")
+    assert not is_commit_sha("g" * 40)
+
+
+def test_ref_cache_expires_after_ttl():
+    """TTL이 지나면 ref를 다시 조회."""
+    clock = FakeClock()
+    cache = RefCache(ttl=10, clock=clock)
+    cache.put("Owner", "Repo", "main", "a" * 40)
+
+    clock.now = 5
+    assert cache.get("owner", "repo", "main") == "a" * 40
+    clock.now = 11
+    assert cache.get("owner", "repo", "main") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ref_cache_invalidate_repository():
+    """쓰기 후에는 해당 저장소의 ref만 제거."""
+    cache = RefCache()
+    cache.put("owner", "repo", "main", "a" * 40)
+    cache.put("owner", "repo", "v1.0", "b" * 40)
+    cache.put("owner", "other", "main", "c" * 40)
+
+    cache.invalidate("owner", "repo")
+    assert cache.get("owner", "repo", "main") is None
+    assert cache.get("owner", "other", "main") == "c" * 40
+    assert cache.stats()["invalidated"] == 2
+
+
+def test_ref_cache_evicts_least_recently_used():
+    """항목 수를 넘으면 가장 오래 쓰지 않은 ref부터 제거."""
+    cache = RefCache(max_entries=2)
+    cache.put("owner", "repo", "a", "1" * 40)
+    cache.put("owner", "repo", "b", "2" * 40)
+    cache.get("owner", "repo", "a")
+    cache.put("owner", "repo", "c", "3" * 40)
+
+    assert cache.get("owner", "repo", "b") is None
+    assert cache.get("owner", "repo", "a") == "1" * 40
+
+
+def test_ref_cache_disabled_by_zero_ttl(monkeypatch):
+    """GITHUB_REF_CACHE_TTL=0이면 캐시를 만들지 않음."""
+    monkeypatch.setenv("GITHUB_REF_CACHE_TTL", "0")
+    assert RefCache.from_env() is None
+
+
+def test_sha_cache_lru():
+    """SHA 기준 캐시는 만료 없이 항목 수로만 제한."""
+    cache = ShaCache(max_entries=2)
+    cache.put(("commit", "x", "1"), {"sha": "1"})
+    cache.put(("commit", "x", "2"), {"sha": "2"})
+    cache.get(("commit", "x", "1"))
+    cache.put(("commit", "x", "3"), {"sha": "3"})
+
+    assert cache.get(("commit", "x", "2")) is None
+    assert cache.get(("commit", "x", "1")) == {"sha": "1"}
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,100 @@
+"""Repository cache unit tests."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mcp_github.github_client import GitHubClient
+from mcp_github.repo_cache import RepositoryCache
+from mcp_github.tools_write import create_branch
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestRepositoryCache:
+    """RepositoryCache tests."""
+
+    def test_hit_is_case_insensitive(self):
+        """owner/repo 대소문자와 무관하게 히트."""
+        cache = RepositoryCache()
+        repository = Mock()
+        cache.put("Owner", "Repo", repository)
+
+        assert cache.get("owner", "repo") is repository
+        assert cache.stats()["hits"] == 1
+
+    def test_entry_expires_after_ttl(self):
+        """TTL이 지나면 미스."""
+        clock = FakeClock()
+        cache = RepositoryCache(ttl=60, clock=clock)
+        cache.put("o", "r", Mock())
+
+        clock.now = 61
+        assert cache.get("o", "r") is None
+        assert cache.stats()["expired"] == 1
+
+    def test_least_recently_used_is_evicted(self):
+        """가득 차면 가장 오래 사용되지 않은 항목 제거."""
+        cache = RepositoryCache(max_entries=2)
+        cache.put("o", "a", Mock())
+        cache.put("o", "b", Mock())
+        cache.get("o", "a")
+        cache.put("o", "c", Mock())
+
+        assert cache.get("o", "b") is None
+        assert cache.get("o", "a") is not None
+        assert cache.stats()["evicted"] == 1
+
+    def test_from_env_disabled(self, monkeypatch):
+        """TTL 0이면 캐시 비활성화."""
+        monkeypatch.setenv("GITHUB_REPO_CACHE_TTL", "0")
+        assert RepositoryCache.from_env() is None
+
+
+class TestClientRepositoryCache:
+    """GitHubClient repository caching tests."""
+
+    def test_second_lookup_skips_api(self, mock_env_vars):
+        """두 번째 조회는 API를 호출하지 않음."""
+        with patch("mcp_github.github_client.Github") as mock_github:
+            client = GitHubClient(repo_cache=RepositoryCache())
+
+            first = client.get_repository("o", "r")
+            second = client.get_repository("o", "r")
+
+            assert first is second
+            mock_github.return_value.get_repo.assert_called_once_with("o/r")
+
+    def test_invalidate_refetches(self, mock_env_vars):
+        """무효화 후에는 다시 조회."""
+        with patch("mcp_github.github_client.Github") as mock_github:
+            client = GitHubClient(repo_cache=RepositoryCache())
+
+            client.get_repository("o", "r")
+            client.invalidate_repository("o", "r")
+            client.get_repository("o", "r")
+
+            assert mock_github.return_value.get_repo.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_tool_invalidates(self, mock_env_vars):
+        """쓰기 도구는 대상 저장소 캐시를 무효화."""
+        with patch("mcp_github.github_client.Github"), patch(
+            "mcp_github.tools_write.get_github_client"
+        ) as mock_get_client:
+            client = GitHubClient(repo_cache=RepositoryCache())
+            mock_get_client.return_value = client
+            client.get_repository("o", "r")
+
+            result = await create_branch("o", "r", "feature")
+
+            assert result["success"] is True
+            assert client.repo_cache.stats()["invalidated"] == 1
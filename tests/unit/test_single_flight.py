@@ -0,0 +1,116 @@
+"""Request coalescing unit tests."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from requests import Request, Response
+from requests.adapters import HTTPAdapter
+
+from mcp_github.single_flight import SingleFlight
+from mcp_github.transport import GitHubTransport
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def run_threads(count, target):
+    results = [None] * count
+
+    def worker(index):
+        try:
+            results[index] = target()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+    """Thread-based SingleFlight tests."""
+
+    def test_concurrent_calls_share_one_result(self):
+        """동시에 들어온 같은 호출은 한 번만 실행."""
+        flight = SingleFlight()
+        calls = []
+
+        def func():
+            calls.append(1)
+            wait_for(lambda: flight.stats()["collapsed"] == 4)
+            return "result"
+
+        results = run_threads(5, lambda: flight.do("key", func))
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+        assert all(value == "result" for value, _ in results)
+        assert flight.stats() == {"leaders": 1, "collapsed": 4, "in_flight": 0}
+
+    def test_error_is_shared(self):
+        """리더의 예외는 대기 중인 호출에도 전달."""
+        flight = SingleFlight()
+
+        def func():
+            wait_for(lambda: flight.stats()["collapsed"] == 2)
+            raise ValueError("boom")
+
+        results = run_threads(3, lambda: flight.do("key", func))
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """끝난 호출의 결과는 재사용하지 않음."""
+        flight = SingleFlight()
+
+        assert flight.do("key", lambda: 1) == (1, False)
+        assert flight.do("key", lambda: 2) == (2, False)
+
+
+class TestTransportSingleFlight:
+    """GitHubTransport request coalescing tests."""
+
+    def test_identical_gets_send_one_request(self):
+        """같은 GET을 동시에 보내면 요청 하나만 전송."""
+        transport = GitHubTransport(single_flight=SingleFlight())
+
+        def fake_send(request, **kwargs):
+            wait_for(lambda: transport.single_flight.stats()["collapsed"] == 3)
+            response = Response()
+            response.status_code = 200
+            response._content = b'{"number": 1}'
+            return response
+
+        def call():
+            request = Request("GET", "https://api.github.com/repos/o/r/pulls/1").prepare()
+            return transport.send(request)
+
+        with patch.object(HTTPAdapter, "send", side_effect=fake_send) as mock_send:
+            responses = run_threads(4, call)
+
+        assert mock_send.call_count == 1
+        assert all(response.json() == {"number": 1} for response in responses)
+        assert transport.stats()["single_flight"]["collapsed"] == 3
+
+    def test_writes_are_not_coalesced(self):
+        """쓰기 요청은 합치지 않음."""
+        transport = GitHubTransport(single_flight=SingleFlight())
+        response = Response()
+        response.status_code = 201
+        response._content = b"{}"
+
+        with patch.object(HTTPAdapter, "send", return_value=response) as mock_send:
+            for _ in range(2):
+                request = Request("POST", "https://api.github.com/repos/o/r/git/blobs").prepare()
+                transport.send(request)
+
+        assert mock_send.call_count == 2
+        assert transport.single_flight.stats()["leaders"] == 0
+
@@ -0,0 +1,128 @@
+"""Snapshot store unit tests."""
+
+import io
+import tarfile
+from contextlib import contextmanager
+from unittest.mock import Mock
+
+from benchmarks.fake_github import BLOB_MODE, FakeRepo
+from mcp_github.snapshot_store import SnapshotStore
+
+FILES = {
+    "README.md": b"# demo\n",
+    "src/app.py": b"print('app')\n",
+    "src/app-utils/helpers.py": b"x = 1\n",
+    "src/app.d/conf": b"on\n",
+}
+
+
+def tarball(files, prefix="owner-repo-abc1234/"):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for path, data in files.items():
+            info = tarfile.TarInfo(prefix + path)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def tree_sha(files):
+    repo = FakeRepo("owner", "repo")
+    return repo.build_tree({path: (BLOB_MODE, repo.put_blob(data)) for path, data in files.items()})
+
+
+def fake_client(archives):
+    client = Mock()
+
+    @contextmanager
+    def stream(path, accept):
+        sha = path.rsplit("/", 1)[-1]
+        response = Mock()
+        response.iter_content.return_value = [archives[sha]]
+        yield response
+
+    client.stream.side_effect = stream
+    return client
+
+
+def fake_repository(trees):
+    repository = Mock()
+    repository.get_git_commit.side_effect = lambda sha: Mock(tree=Mock(sha=trees[sha]))
+    return repository
+
+
+def test_snapshot_matches_git_tree(tmp_path):
+    """압축을 푼 스냅샷의 트리 SHA와 파일이 git과 동일."""
+    store = SnapshotStore(str(tmp_path), ["owner/repo"])
+    sha = "a" * 40
+    client = fake_client({sha: tarball(FILES)})
+    repository = fake_repository({sha: tree_sha(FILES)})
+
+    snapshot = store.snapshot(client, repository, "owner", "repo", sha)
+    again = store.snapshot(client, repository, "Owner", "Repo", sha)
+
+    assert snapshot is not None and again is snapshot
+    assert snapshot.tree_sha == tree_sha(FILES)
+    assert snapshot.file_path("src/app.py").read_bytes() == FILES["src/app.py"]
+    assert [e["path"] for e in snapshot.children("src")] == [
+        "src/app-utils", "src/app.d", "src/app.py",
+    ]
+    assert client.stream.call_count == 1
+    assert store.stats()["downloads"] == 1
+
+
+def test_only_allowlisted_repos(tmp_path):
+    """허용 목록(glob)에 있는 저장소만 미러링."""
+    store = SnapshotStore(str(tmp_path), ["org/*", "owner/repo"])
+    assert store.mirrors("ORG", "anything")
+    assert store.mirrors("owner", "repo")
+    assert not store.mirrors("owner", "other")
+    assert store.snapshot(Mock(), Mock(), "owner", "other", "a" * 40) is None
+
+
+def test_rejects_snapshot_not_matching_commit(tmp_path):
+    """트리 SHA가 커밋과 다르면 사용하지 않고 다시 받지 않음."""
+    store = SnapshotStore(str(tmp_path), ["owner/repo"])
+    sha = "b" * 40
+    client = fake_client({sha: tarball(FILES)})
+    repository = fake_repository({sha: "0" * 40})
+
+    assert store.snapshot(client, repository, "owner", "repo", sha) is None
+    assert store.snapshot(client, repository, "owner", "repo", sha) is None
+    assert client.stream.call_count == 1
+    assert store.stats()["rejected"] == 1
+    assert list(tmp_path.rglob("*.json")) == []
+
+
+def test_evicts_by_size_and_age(tmp_path):
+    """용량을 넘으면 오래 쓰지 않은 스냅샷부터, 기간이 지나면 사용하지 않은 스냅샷 제거."""
+    now = [1000.0]
+    versions = {c * 40: {"file.txt": c.encode() * 100} for c in "cde"}
+    client = fake_client({sha: tarball(files) for sha, files in versions.items()})
+    repository = fake_repository({sha: tree_sha(files) for sha, files in versions.items()})
+    store = SnapshotStore(str(tmp_path), ["owner/repo"], max_bytes=250, max_age=60, clock=lambda: now[0])
+
+    for sha in versions:
+        assert store.snapshot(client, repository, "owner", "repo", sha) is not None
+    assert store.get("owner", "repo", "c" * 40) is None
+    assert store.get("owner", "repo", "d" * 40) is not None
+    assert store.stats()["total_bytes"] == 200
+
+    now[0] += 61
+    assert store.get("owner", "repo", "e" * 40) is None
+    assert store.stats()["snapshots"] == 0
+    assert list(tmp_path.rglob("*.json")) == []
+
+
+def test_survives_restart(tmp_path):
+    """같은 디렉터리를 다시 열면 저장된 스냅샷을 그대로 사용."""
+    sha = "f" * 40
+    client = fake_client({sha: tarball(FILES)})
+    repository = fake_repository({sha: tree_sha(FILES)})
+    SnapshotStore(str(tmp_path), ["owner/repo"]).snapshot(client, repository, "owner", "repo", sha)
+
+    reopened = SnapshotStore(str(tmp_path), ["owner/repo"])
+    snapshot = reopened.get("owner", "repo", sha)
+    assert snapshot is not None
+    assert snapshot.entry("README.md")["size"] == len(FILES["README.md"])
+    assert reopened.stats()["total_bytes"] == sum(len(data) for data in FILES.values())
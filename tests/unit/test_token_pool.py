@@ -0,0 +1,125 @@
+"""Token pool unit tests."""
+
+from unittest.mock import patch
+
+import pytest
+from requests import Request, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from mcp_github.client_pool import ClientRegistry
+from mcp_github.token_pool import TokenPool, parse_tokens, token_label
+from mcp_github.transport import GitHubTransport
+
+
+def rate_headers(remaining, reset=9999999999):
+    return {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Reset": str(reset),
+        "X-RateLimit-Resource": "core",
+    }
+
+
+def make_response(status, headers):
+    response = Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = b"{}"
+    return response
+
+
+class TestTokenHelpers:
+    """Token parsing helpers."""
+
+    def test_parse_tokens(self):
+        """중복/공백 제거 테스트."""
+        assert parse_tokens(" a, b,,a ") == ["a", "b"]
+        assert parse_tokens(None) == []
+
+    def test_token_label_hides_secret(self):
+        """토큰 라벨에는 끝 4자리만 노출."""
+        assert token_label("ghp_abcdefgh1234") == "ghp_…1234"
+
+
+class TestTokenPool:
+    """TokenPool selection tests."""
+
+    def test_reads_go_to_token_with_most_budget(self):
+        """남은 예산이 가장 많은 토큰 선택."""
+        pool = TokenPool(["a", "b", "c"])
+        for state, remaining in zip(pool._states, [100, 4000, 2500]):
+            state.scheduler.update("core", rate_headers(remaining))
+
+        assert pool.select("core").token == "b"
+
+    def test_exhausted_token_is_parked(self):
+        """예산이 소진된 토큰은 reset까지 제외."""
+        pool = TokenPool(["a", "b"])
+        pool._states[0].scheduler.update("core", rate_headers(0))
+        pool._states[1].scheduler.update("core", rate_headers(10))
+
+        assert pool.select("core").token == "b"
+        assert pool.stats()[0]["parked"] is True
+
+    def test_writes_pinned_to_write_token(self):
+        """쓰기 요청은 고정된 토큰 사용."""
+        pool = TokenPool(["a", "b"], write_token="b")
+        pool._states[0].scheduler.update("core", rate_headers(5000))
+        pool._states[1].scheduler.update("core", rate_headers(10))
+
+        assert pool.select("core", write=True).token == "b"
+        assert pool.select("core").token == "a"
+
+    def test_from_env_requires_two_tokens(self, monkeypatch):
+        """토큰이 하나면 풀을 만들지 않음."""
+        monkeypatch.setenv("GITHUB_TOKEN", "a")
+        monkeypatch.delenv("GITHUB_TOKENS", raising=False)
+        monkeypatch.delenv("GITHUB_WRITE_TOKEN", raising=False)
+        assert TokenPool.from_env() is None
+
+        monkeypatch.setenv("GITHUB_TOKENS", "b,c")
+        pool = TokenPool.from_env()
+        assert len(pool) == 3
+        assert pool.write_state.token == "a"
+
+    def test_requires_a_token(self):
+        """빈 풀은 에러."""
+        with pytest.raises(ValueError):
+            TokenPool([])
+
+
+class TestTransportTokenRouting:
+    """GitHubTransport token routing tests."""
+
+    def test_rejected_read_retried_with_other_token(self):
+        """예산이 소진된 토큰의 읽기 요청은 다른 토큰으로 재시도."""
+        pool = TokenPool(["a", "b"])
+        transport = GitHubTransport(token_pool=pool)
+        request = Request("GET", "https://api.github.com/repos/o/r").prepare()
+        responses = [
+            make_response(403, rate_headers(0)),
+            make_response(200, rate_headers(4999)),
+        ]
+        sent_with = []
+
+        def fake_send(sent_request, **kwargs):
+            sent_with.append(sent_request.headers["Authorization"])
+            return responses.pop(0)
+
+        with patch.object(HTTPAdapter, "send", side_effect=fake_send):
+            response = transport.send(request)
+
+        assert response.status_code == 200
+        assert sent_with == ["token a", "token b"]
+        assert pool.stats()[0]["rejected"] == 1
+
+    def test_registry_default_client_uses_pool(self, mock_env_vars):
+        """기본 클라이언트는 토큰 풀의 쓰기 토큰으로 인증."""
+        registry = ClientRegistry(token_pool=TokenPool(["a", "b"], write_token="b"))
+
+        client = registry.get()
+
+        assert client.token == "b"
+        assert client.transport.token_pool is registry.token_pool
+        registry.close_all()
@@ -1,12 +1,15 @@
 """읽기 도구 함수들 단위 테스트."""
 
+import json
+
 import pytest
 from unittest.mock import patch, Mock
 from mcp_github.tools_read import (
     get_repo,
     list_pull_requests,
     get_pr_diff,
-    get_file
+    get_file,
+    get_files,
 )
 
 
@@ -16,7 +19,7 @@ class TestToolsRead:
     @pytest.mark.asyncio
     async def test_get_repo_success(self, mock_github_client, sample_repo_data):
         """get_repo 성공 테스트."""
-        with patch('mcp_github.tools_read.GitHubClient') as mock_client_class:
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
             mock_client_class.return_value = mock_github_client
             
             result = await get_repo("test-owner", "test-repo")
@@ -26,10 +29,23 @@ class TestToolsRead:
             assert "data" in result
             assert "test-repo" in result["summary"]
 
+    @pytest.mark.asyncio
+    async def test_get_repo_fields(self, mock_github_client):
+        """요청하지 않은 topics는 조회하지 않음."""
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
+            mock_client_class.return_value = mock_github_client
+
+            result = await get_repo("test-owner", "test-repo", fields=["name", "language"])
+
+            repository = mock_github_client.get_repository.return_value
+            assert set(json.loads(result["data"])) == {"name", "language"}
+            repository.get_topics.assert_not_called()
+            assert result["api_calls"] == 0
+
     @pytest.mark.asyncio
     async def test_get_repo_error(self):
         """get_repo 에러 테스트."""
-        with patch('mcp_github.tools_read.GitHubClient') as mock_client_class:
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
             mock_client = Mock()
             mock_client.get_repository.side_effect = Exception("Repository not found")
             mock_client_class.return_value = mock_client
@@ -43,10 +59,10 @@ class TestToolsRead:
     @pytest.mark.asyncio
     async def test_list_pull_requests_success(self, mock_github_client, sample_pr_data):
         """list_pull_requests 성공 테스트."""
-        with patch('mcp_github.tools_read.GitHubClient') as mock_client_class:
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
             mock_client_class.return_value = mock_github_client
             
-            result = await list_pull_requests("test-owner", "test-repo", "open")
+            result = await list_pull_requests("test-owner", "test-repo", "open", backend="rest")
             
             assert result["success"] is True
             assert "count" in result
@@ -56,21 +72,21 @@ class TestToolsRead:
     @pytest.mark.asyncio
     async def test_list_pull_requests_with_state_filter(self, mock_github_client):
         """상태별 PR 필터링 테스트."""
-        with patch('mcp_github.tools_read.GitHubClient') as mock_client_class:
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
             mock_client_class.return_value = mock_github_client
             
             # open 상태
-            result_open = await list_pull_requests("test-owner", "test-repo", "open")
+            result_open = await list_pull_requests("test-owner", "test-repo", "open", backend="rest")
             assert result_open["success"] is True
             
             # closed 상태
-            result_closed = await list_pull_requests("test-owner", "test-repo", "closed")
+            result_closed = await list_pull_requests("test-owner", "test-repo", "closed", backend="rest")
             assert result_closed["success"] is True
 
     @pytest.mark.asyncio
     async def test_get_pr_diff_success(self, mock_github_client, sample_pr_data):
         """get_pr_diff 성공 테스트."""
-        with patch('mcp_github.tools_read.GitHubClient') as mock_client_class:
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
             mock_client_class.return_value = mock_github_client
             
             result = await get_pr_diff("test-owner", "test-repo", 1)
@@ -84,7 +100,7 @@ class TestToolsRead:
     @pytest.mark.asyncio
     async def test_get_pr_diff_invalid_number(self, mock_github_client):
         """잘못된 PR 번호 테스트."""
-        with patch('mcp_github.tools_read.GitHubClient') as mock_client_class:
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
             mock_client_class.return_value = mock_github_client
             
             # PR 번호를 문자열로 전달해도 정수로 변환되어야 함
@@ -95,7 +111,7 @@ class TestToolsRead:
     @pytest.mark.asyncio
     async def test_get_file_success(self, mock_github_client, sample_file_data):
         """get_file 성공 테스트."""
-        with patch('mcp_github.tools_read.GitHubClient') as mock_client_class:
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
             mock_client_class.return_value = mock_github_client
             
             result = await get_file("test-owner", "test-repo", "test.py", "main")
@@ -108,7 +124,7 @@ class TestToolsRead:
     @pytest.mark.asyncio
     async def test_get_file_with_default_ref(self, mock_github_client):
         """기본 ref(HEAD)로 파일 가져오기 테스트."""
-        with patch('mcp_github.tools_read.GitHubClient') as mock_client_class:
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
             mock_client_class.return_value = mock_github_client
             
             result = await get_file("test-owner", "test-repo", "test.py")
@@ -118,7 +134,7 @@ class TestToolsRead:
     @pytest.mark.asyncio
     async def test_get_file_directory(self, mock_github_client):
         """디렉토리 가져오기 테스트."""
-        with patch('mcp_github.tools_read.GitHubClient') as mock_client_class:
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
             mock_client = Mock()
             mock_repo = Mock()
             mock_repo.full_name = "test-owner/test-repo"
@@ -153,7 +169,7 @@ class TestToolsRead:
     @pytest.mark.asyncio
     async def test_get_file_binary_file(self, mock_github_client):
         """바이너리 파일 테스트."""
-        with patch('mcp_github.tools_read.GitHubClient') as mock_client_class:
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
             mock_client = Mock()
             mock_repo = Mock()
             mock_repo.full_name = "test-owner/test-repo"
@@ -186,7 +202,7 @@ class TestToolsRead:
     @pytest.mark.asyncio
     async def test_get_file_large_file(self, mock_github_client):
         """큰 파일 테스트 (1MB 이상)."""
-        with patch('mcp_github.tools_read.GitHubClient') as mock_client_class:
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
             mock_client = Mock()
             mock_repo = Mock()
             mock_repo.full_name = "test-owner/test-repo"
@@ -215,3 +231,201 @@ class TestToolsRead:
             data = json.loads(result["data"])
             assert data["content"] is None
             assert "File too large" in data["content_note"]
+
+    @pytest.mark.asyncio
+    async def test_get_files_path_limit(self):
+        """getFiles 경로 수 제한 테스트."""
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
+            empty = await get_files("test-owner", "test-repo", [])
+            too_many = await get_files("test-owner", "test-repo", [f"f{i}" for i in range(101)])
+
+        assert empty["success"] is False
+        assert too_many["success"] is False
+        mock_client_class.assert_not_called()
+
+
+def graphql_pr_node(number, state="OPEN", **overrides):
+    node = {
+        "number": number,
+        "title": f"PR {number}",
+        "author": {"login": "test-user"},
+        "state": state,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "mergedAt": "2024-01-03T00:00:00Z" if state == "MERGED" else None,
+        "closedAt": "2024-01-03T00:00:00Z" if state != "OPEN" else None,
+        "isDraft": False,
+        "mergeable": "MERGEABLE",
+        "mergeStateStatus": "CLEAN",
+        "comments": {"totalCount": 2},
+        "commits": {"totalCount": 3},
+        "additions": 10,
+        "deletions": 5,
+        "changedFiles": 1,
+        "url": f"https://github.com/test-owner/test-repo/pull/{number}",
+    }
+    node.update(overrides)
+    return node
+
+
+def graphql_page(nodes, end_cursor=None):
+    return {
+        "repository": {
+            "nameWithOwner": "test-owner/test-repo",
+            "pullRequests": {
+                "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+                "nodes": nodes,
+            },
+        }
+    }
+
+
+class TestListPullRequestsGraphQL:
+    """GraphQL backend of list_pull_requests."""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_fetched_in_bulk(self):
+        """100개 단위 페이지를 cursor로 이어서 조회."""
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
+            mock_client = Mock()
+            mock_client.graphql.side_effect = [
+                graphql_page([graphql_pr_node(2)], end_cursor="c1"),
+                graphql_page([graphql_pr_node(1, state="MERGED", author=None)]),
+            ]
+            mock_client_class.return_value = mock_client
+
+            result = await list_pull_requests("test-owner", "test-repo", "all")
+
+            assert result["success"] is True
+            assert result["count"] == 2
+            assert mock_client.graphql.call_count == 2
+            assert mock_client.graphql.call_args_list[0].args[1]["states"] is None
+            assert mock_client.graphql.call_args_list[1].args[1]["after"] == "c1"
+            mock_client.get_repository.assert_not_called()
+
+            import json
+            prs = json.loads(result["data"])
+            assert prs[0]["mergeable"] is True
+            assert prs[0]["mergeable_state"] == "clean"
+            assert prs[0]["created_at"] == "2024-01-01T00:00:00+00:00"
+            assert prs[1]["state"] == "closed"
+            assert prs[1]["user"] == "ghost"
+            assert set(prs[0]) == {
+                "number", "title", "user", "state", "created_at", "updated_at",
+                "merged_at", "closed_at", "draft", "mergeable", "mergeable_state",
+                "comments", "commits", "additions", "deletions", "changed_files", "url",
+            }
+
+    @pytest.mark.asyncio
+    async def test_closed_state_includes_merged(self):
+        """closed 필터는 CLOSED와 MERGED를 함께 조회."""
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
+            mock_client = Mock()
+            mock_client.graphql.return_value = graphql_page([])
+            mock_client_class.return_value = mock_client
+
+            result = await list_pull_requests("test-owner", "test-repo", "closed")
+
+            assert result["success"] is True
+            assert mock_client.graphql.call_args.args[1]["states"] == ["CLOSED", "MERGED"]
+
+    @pytest.mark.asyncio
+    async def test_missing_repository(self):
+        """저장소가 없으면 에러 반환."""
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
+            mock_client = Mock()
+            mock_client.graphql.return_value = {"repository": None}
+            mock_client_class.return_value = mock_client
+
+            result = await list_pull_requests("test-owner", "missing")
+
+            assert result["success"] is False
+            assert "not found" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_backend(self):
+        """지원하지 않는 backend는 에러 반환."""
+        with patch('mcp_github.tools_read.get_github_client'):
+            result = await list_pull_requests("test-owner", "test-repo", backend="soap")
+
+            assert result["success"] is False
+            assert "Unknown backend" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_limit_and_cursor_continuation(self):
+        """limit만큼만 조회하고 next_cursor로 이어서 조회."""
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
+            mock_client = Mock()
+            mock_client.graphql.side_effect = [
+                graphql_page([graphql_pr_node(3), graphql_pr_node(2)], end_cursor="c1"),
+                graphql_page([graphql_pr_node(1)]),
+            ]
+            mock_client_class.return_value = mock_client
+
+            first = await list_pull_requests(
+                "test-owner", "test-repo", limit=2, sort="updated", direction="asc"
+            )
+
+            assert first["count"] == 2
+            assert first["has_more"] is True
+            assert mock_client.graphql.call_count == 1
+            variables = mock_client.graphql.call_args.args[1]
+            assert variables["first"] == 2
+            assert variables["after"] is None
+            assert variables["orderBy"] == {"field": "UPDATED_AT", "direction": "ASC"}
+
+            second = await list_pull_requests(
+                "test-owner", "test-repo", limit=2, cursor=first["next_cursor"],
+                sort="updated", direction="asc",
+            )
+
+            assert second["count"] == 1
+            assert second["has_more"] is False
+            assert second["next_cursor"] is None
+            assert mock_client.graphql.call_args.args[1]["after"] == "c1"
+
+    @pytest.mark.asyncio
+    async def test_cursor_bound_to_filters(self):
+        """다른 조건으로 만든 cursor는 에러 반환."""
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
+            mock_client = Mock()
+            mock_client.graphql.return_value = graphql_page([graphql_pr_node(2)], end_cursor="c1")
+            mock_client_class.return_value = mock_client
+
+            first = await list_pull_requests("test-owner", "test-repo", limit=1)
+            result = await list_pull_requests(
+                "test-owner", "test-repo", "closed", limit=1, cursor=first["next_cursor"]
+            )
+
+            assert result["success"] is False
+            assert "Cursor does not match" in result["error"]
+            assert mock_client.graphql.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_parameters(self):
+        """잘못된 limit/sort/direction은 요청 없이 에러 반환."""
+        with patch('mcp_github.tools_read.get_github_client') as mock_client_class:
+            for kwargs in ({"limit": 0}, {"sort": "popularity"}, {"direction": "up"}):
+                result = await list_pull_requests("test-owner", "test-repo", **kwargs)
+                assert result["success"] is False
+            mock_client_class.assert_not_called()
+
+
+class TestListPullRequestsRest:
+    """REST backend의 limit/cursor 처리."""
+
+    @pytest.mark.asyncio
+    async def test_limit_and_offset_cursor(self, mock_github_client):
+        """limit으로 자르고 offset cursor로 이어서 조회."""
+        repository = mock_github_client.get_repository.return_value
+        pr = next(iter(repository.get_pulls.return_value))
+        repository.get_pulls.return_value = [pr, pr, pr]
+        with patch('mcp_github.tools_read.get_github_client', return_value=mock_github_client):
+            first = await list_pull_requests("test-owner", "test-repo", backend="rest", limit=2)
+            second = await list_pull_requests(
+                "test-owner", "test-repo", backend="rest", limit=2, cursor=first["next_cursor"]
+            )
+
+        repository.get_pulls.assert_called_with(state="open", sort="created", direction="desc")
+        assert (first["count"], first["has_more"]) == (2, True)
+        assert (second["count"], second["has_more"]) == (1, False)
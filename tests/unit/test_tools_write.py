@@ -15,7 +15,7 @@ class TestCreateOrUpdateFile:
     """Test create_or_update_file function."""
 
     @pytest.mark.asyncio
-    @patch('mcp_github.tools_write.GitHubClient')
+    @patch('mcp_github.tools_write.get_github_client')
     @patch('mcp_github.tools_write.validate_file_path')
     async def test_create_file_success(self, mock_validate, mock_client_class):
         """Test successful file creation."""
@@ -47,7 +47,7 @@ class TestCreateOrUpdateFile:
         assert result["data"]["commit_sha"] == "abc123"
 
     @pytest.mark.asyncio
-    @patch('mcp_github.tools_write.GitHubClient')
+    @patch('mcp_github.tools_write.get_github_client')
     @patch('mcp_github.tools_write.validate_file_path')
     async def test_update_file_success(self, mock_validate, mock_client_class):
         """Test successful file update."""
@@ -101,7 +101,7 @@ class TestDeleteFile:
     """Test delete_file function."""
 
     @pytest.mark.asyncio
-    @patch('mcp_github.tools_write.GitHubClient')
+    @patch('mcp_github.tools_write.get_github_client')
     async def test_delete_file_success(self, mock_client_class):
         """Test successful file deletion."""
         # Setup
@@ -115,9 +115,10 @@ class TestDeleteFile:
         mock_file.sha = "abc123"
         mock_repo.get_contents.return_value = mock_file
         
-        mock_result = Mock()
-        mock_result.commit.sha = "def456"
-        mock_repo.delete_file.return_value = mock_result
+        # PyGithub의 delete_file은 딕셔너리를 반환: {'commit': Commit, 'content': NotSet}
+        mock_commit = Mock()
+        mock_commit.sha = "def456"
+        mock_repo.delete_file.return_value = {"commit": mock_commit}
         
         # Execute
         result = await delete_file(
@@ -135,7 +136,7 @@ class TestCreateBranch:
     """Test create_branch function."""
 
     @pytest.mark.asyncio
-    @patch('mcp_github.tools_write.GitHubClient')
+    @patch('mcp_github.tools_write.get_github_client')
     async def test_create_branch_success(self, mock_client_class):
         """Test successful branch creation."""
         # Setup
@@ -165,7 +166,7 @@ class TestCreateCommitWithMultipleFiles:
     """Test create_commit_with_multiple_files function."""
 
     @pytest.mark.asyncio
-    @patch('mcp_github.tools_write.GitHubClient')
+    @patch('mcp_github.tools_write.get_github_client')
     async def test_create_commit_success(self, mock_client_class):
         """Test successful multi-file commit creation."""
         # Setup
@@ -207,12 +208,36 @@ class TestCreateCommitWithMultipleFiles:
         assert result["data"]["commit_sha"] == "ghi789"
         assert result["data"]["files_processed"] == 2
 
+    @pytest.mark.asyncio
+    @patch('mcp_github.tools_write.COMMIT_RETRY_BACKOFF', 0)
+    @patch('mcp_github.tools_write.get_github_client')
+    async def test_create_commit_gives_up_after_max_attempts(self, mock_client_class):
+        """Test that a branch that keeps moving fails after bounded retries."""
+        from github.GithubException import GithubException
+        from mcp_github.tools_write import MAX_COMMIT_ATTEMPTS
+
+        mock_repo = Mock()
+        mock_client_class.return_value.get_repository.return_value = mock_repo
+        mock_repo.requester.requestJsonAndCheck.side_effect = GithubException(
+            422, {"message": "Update is not a fast forward"}
+        )
+
+        result = await create_commit_with_multiple_files(
+            "testowner", "testrepo",
+            [{"path": "file1.txt", "content": "content1", "operation": "create"}],
+            "multi-file commit"
+        )
+
+        assert result["success"] is False
+        assert mock_repo.create_git_commit.call_count == MAX_COMMIT_ATTEMPTS
+        assert mock_repo.create_git_blob.call_count == 0
+
 
 class TestGetRepositoryStatus:
     """Test get_repository_status function."""
 
     @pytest.mark.asyncio
-    @patch('mcp_github.tools_write.GitHubClient')
+    @patch('mcp_github.tools_write.get_github_client')
     async def test_get_status_success(self, mock_client_class):
         """Test successful repository status retrieval."""
         # Setup
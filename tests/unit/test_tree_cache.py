@@ -0,0 +1,87 @@
+"""Tree cache unit tests."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_github.tree_cache import TreeCache, fetch_tree, filter_tree
+
+ENTRIES = [
+    {"path": "README.md", "type": "blob", "mode": "100644", "sha": "a" * 40, "size": 10},
+    {"path": "src", "type": "tree", "mode": "040000", "sha": "b" * 40},
+    {"path": "src/app.py", "type": "blob", "mode": "100644", "sha": "c" * 40, "size": 20},
+    {"path": "src/lib", "type": "tree", "mode": "040000", "sha": "d" * 40},
+    {"path": "src/lib/util.py", "type": "blob", "mode": "100644", "sha": "e" * 40, "size": 30},
+]
+
+
+def test_filter_tree_path_and_depth():
+    """디렉터리와 깊이로 항목 선택."""
+    assert [e["path"] for e in filter_tree(ENTRIES, "src", depth=1)] == ["src/app.py", "src/lib"]
+    assert [e["path"] for e in filter_tree(ENTRIES, depth=1)] == ["README.md", "src"]
+    assert len(filter_tree(ENTRIES, "/src/")) == 3
+    with pytest.raises(ValueError, match="Directory not found"):
+        filter_tree(ENTRIES, "docs")
+    with pytest.raises(ValueError, match="Directory not found"):
+        filter_tree(ENTRIES, "README.md")
+
+
+def test_filter_tree_pattern():
+    """glob은 전체 경로에 적용되고 *는 /도 포함."""
+    assert [e["path"] for e in filter_tree(ENTRIES, pattern="*.py")] == ["src/app.py", "src/lib/util.py"]
+    assert [e["path"] for e in filter_tree(ENTRIES, pattern="src/lib/*")] == ["src/lib/util.py"]
+    with pytest.raises(ValueError, match="depth"):
+        filter_tree(ENTRIES, depth=0)
+
+
+def test_cache_evicts_by_entry_count():
+    """항목 수 예산을 넘으면 오래된 트리부터 제거."""
+    cache = TreeCache(max_entries=6)
+    cache.put(("repo", "t1"), ENTRIES[:3])
+    cache.put(("repo", "t2"), ENTRIES[:3])
+    cache.get(("repo", "t1"))
+    cache.put(("repo", "t3"), ENTRIES[:2])
+
+    assert cache.get(("repo", "t2")) is None
+    assert cache.get(("repo", "t1")) is not None
+    assert cache.stats()["entries"] == 5
+    assert cache.stats()["evicted"] == 1
+
+
+def test_cache_skips_oversized_listing():
+    """예산보다 큰 목록은 저장하지 않음."""
+    cache = TreeCache(max_entries=2)
+    cache.put(("repo", "t1"), ENTRIES)
+    assert cache.stats()["trees"] == 0
+
+
+def tree(sha, items, truncated=False):
+    return Mock(sha=sha, raw_data={"sha": sha, "tree": items, "truncated": truncated})
+
+
+def test_fetch_tree_walks_truncated_subtrees():
+    """잘린 재귀 응답은 하위 트리별로 다시 받아 합침."""
+    root_items = [
+        {"path": "README.md", "type": "blob", "mode": "100644", "sha": "a" * 40, "size": 10},
+        {"path": "src", "type": "tree", "mode": "040000", "sha": "s" * 40},
+    ]
+    src_items = [{"path": "app.py", "type": "blob", "mode": "100644", "sha": "c" * 40, "size": 20}]
+
+    def get_git_tree(sha, recursive=False):
+        if sha in ("main", "r" * 40):
+            return tree("r" * 40, root_items, truncated=recursive)
+        return tree(sha, src_items)
+
+    repository = Mock(url="https://api.github.com/repos/Owner/Repo")
+    repository.get_git_tree.side_effect = get_git_tree
+    cache = TreeCache()
+
+    sha, entries = fetch_tree(repository, "main", cache)
+
+    assert sha == "r" * 40
+    assert [e["path"] for e in entries] == ["README.md", "src", "src/app.py"]
+    assert cache.get(cache.make_key(repository, "s" * 40))[0]["path"] == "app.py"
+
+    calls = repository.get_git_tree.call_count
+    assert fetch_tree(repository, "main", cache)[1] is entries
+    assert repository.get_git_tree.call_count == calls + 1
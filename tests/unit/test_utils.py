@@ -2,7 +2,10 @@
 
 import pytest
 from mcp_github.utils import (
+    decode_cursor,
+    encode_cursor,
     is_text,
+    select_fields,
     summarize_diff,
     format_file_size,
     is_binary_file,
@@ -191,3 +194,35 @@ def test_sanitize_commit_message_whitespace():
     message = "   Add new feature   "
     result = sanitize_commit_message(message)
     assert result == "Add new feature"
+
+
+def test_cursor_round_trip():
+    """cursor에 저장한 위치를 같은 조건으로 복원."""
+    query = {"repo": "owner/repo", "state": "open"}
+    cursor = encode_cursor(query, 30)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, query) == 30
+
+
+def test_cursor_rejects_other_query():
+    """다른 조회 조건의 cursor는 거부."""
+    cursor = encode_cursor({"state": "open"}, 30)
+    with pytest.raises(ValueError, match="does not match"):
+        decode_cursor(cursor, {"state": "closed"})
+
+
+def test_cursor_rejects_garbage():
+    """형식이 잘못된 cursor는 거부."""
+    for cursor in ("not a cursor!", "e30", "W10"):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor, {})
+
+
+def test_select_fields():
+    """fields 지정 순서와 상관없이 출력 순서를 유지."""
+    available = ["number", "title", "user"]
+    assert select_fields(None, available) == available
+    assert select_fields(["user", "number"], available) == ["number", "user"]
+    assert select_fields(" title , number", available) == ["number", "title"]
+    with pytest.raises(ValueError, match="Unknown fields: stars"):
+        select_fields(["stars", "title"], available)